@@ -21,13 +21,17 @@ from annotator import AnnotationWidget
 
 # Import camera capture function
 try:
-    from camera import AutoCaptureFlow
+    from camera import AutoCaptureFlow, release_camera_session, get_camera_session
+    from camera_roi import SensorRoi, load_roi, save_roi, roi_sidecar_path
 
     CAMERA_AVAILABLE = True
 except ImportError as e:
     CAMERA_AVAILABLE = False
     print(f"Warning: camera module not found. Camera button will be disabled. Error: {e}")
 
+# Pixels kept around the box when the camera ROI is taken from it, so the part may shift
+ROI_MARGIN = 64
+
 
 class CameraSignals(QObject):
     """Signals for camera thread communication"""
@@ -125,6 +129,7 @@ class MainWindow(QMainWindow):
         self.capture_image_path = f"{self.base_path}\\Capture Image"
         self.labeling_path = f"{self.base_path}\\Labeling"
         self.boxes_json_path = f"{self.base_path}\\BoxesData"  # Folder for JSON files
+        self.roi_config_path = f"{self.base_path}\\roi_config.json"  # Camera ROI, full frame if missing
         self.image_boxes = {}
 
         # Start with 0 as the first label
@@ -137,6 +142,12 @@ class MainWindow(QMainWindow):
         self.pending_box = None  # Store the most recently drawn box waiting for confirmation
         self.pending_box_label = None  # Store the label of the pending box
         self.box_saved = False  # Flag to track if a box has been saved
+        self.image_roi = None  # Sensor ROI the current image was captured with, None for full frame
+
+        # Configured camera ROI, applied when the camera opens
+        self.camera_roi = load_roi(self.roi_config_path) if CAMERA_AVAILABLE else None
+        if self.camera_roi is not None:
+            get_camera_session().roi = self.camera_roi
 
         # Add calibration object
         self.calibration = Calibration()
@@ -203,7 +214,17 @@ class MainWindow(QMainWindow):
         top_bar.addWidget(self.capture_btn)
         top_bar.addWidget(undo_btn)
         top_bar.addWidget(delete_btn)
+        # Read out only the area around the box
+        self.roi_btn = QPushButton("🎯 ROI from Box")
+        self.roi_btn.setCheckable(True)
+        self.roi_btn.setChecked(self.camera_roi is not None)
+        self.roi_btn.setToolTip("Capture only the region around the current box (uncheck for full frame)")
+        self.roi_btn.toggled.connect(self.toggle_camera_roi)
+        if not CAMERA_AVAILABLE:
+            self.roi_btn.setEnabled(False)
+
         top_bar.addWidget(self.save_box_btn)
+        top_bar.addWidget(self.roi_btn)
         top_bar.addStretch()
 
         # ---------- Calibration Status Bar (no progress bar) ----------
@@ -438,6 +459,9 @@ class MainWindow(QMainWindow):
                 (x2, y2),  # bottom-right
                 (x1, y2)  # bottom-left
             ]
+            # Images captured with a camera ROI: calibration is in full-frame pixels
+            if self.image_roi is not None:
+                corners_pixel = [self.image_roi.to_full(corner) for corner in corners_pixel]
 
             world_corners = []
             world_coordinate_strings = []
@@ -655,6 +679,8 @@ class MainWindow(QMainWindow):
                         count += 1
 
                     os.rename(image_path, save_path)
+                    if os.path.exists(roi_sidecar_path(image_path)):
+                        os.rename(roi_sidecar_path(image_path), roi_sidecar_path(save_path))
                     image_path = save_path
 
                     # Add to image files list
@@ -700,6 +726,39 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Capture Failed",
                                  f"Camera capture failed!\n{message}")
 
+    def toggle_camera_roi(self, checked):
+        """Restrict the camera readout to the area around the current box, or go back to full frame"""
+        session = get_camera_session()
+        if checked:
+            if self.pending_box is None:
+                QMessageBox.warning(self, "No Box", "Draw a box around the part first.")
+                self.roi_btn.blockSignals(True)
+                self.roi_btn.setChecked(False)
+                self.roi_btn.blockSignals(False)
+                return
+
+            box = self.pending_box
+            top_left = (box.x(), box.y())
+            bottom_right = (box.x() + box.width(), box.y() + box.height())
+            if self.image_roi is not None:
+                top_left = self.image_roi.to_full(top_left)
+                bottom_right = self.image_roi.to_full(bottom_right)
+            roi = SensorRoi.from_box(*top_left, *bottom_right, margin=ROI_MARGIN)
+
+            success, message = session.set_roi(roi)
+            if success:
+                self.camera_roi = roi
+                save_roi(self.roi_config_path, roi)
+        else:
+            success, message = session.set_roi(None)
+            self.camera_roi = None
+            if os.path.exists(self.roi_config_path):
+                os.remove(self.roi_config_path)
+
+        self.status_label.setText(message)
+        if not success:
+            QMessageBox.critical(self, "Camera ROI", message)
+
     def get_label_color(self, label):
         return self.label_colors.get(label, QColor(255, 255, 255))
 
@@ -721,6 +780,7 @@ class MainWindow(QMainWindow):
         self.viewer.boxes.clear()
         self.viewer.load_image(path)
         self.image_path = path
+        self.image_roi = load_roi(roi_sidecar_path(path)) if CAMERA_AVAILABLE else None
 
         if path in self.image_boxes:
             self.viewer.boxes = self.image_boxes[path].copy()
@@ -778,6 +838,11 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event):
         """Handle window close event"""
         self.save_current()
+
+        # Close the shared camera session
+        if CAMERA_AVAILABLE:
+            release_camera_session()
+
         event.accept()
 
 
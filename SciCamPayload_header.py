@@ -24,8 +24,16 @@ from enum import IntEnum
 # 	SciCamCtrlDll = ctypes.CDLL(lib_path)
 
 
+## @~chinese
+#  @brief 设置环境变量SCICAM_SIMULATE=1时不加载SDK库，由SciCam_sim.py提供模拟相机
+#  @~english
+#  @brief With SCICAM_SIMULATE=1 the SDK library is not loaded and SciCam_sim.py provides a simulated camera
+SCICAM_SIMULATE = os.environ.get('SCICAM_SIMULATE', '0').lower() not in ('', '0', 'false', 'no')
+
 system = platform.system()
-if(system == "Windows"):
+if SCICAM_SIMULATE:
+	SciCamCtrlDll = None
+elif(system == "Windows"):
 	# Windows
 	if platform.architecture()[0] == "64bit":
 		sdk_path = os.environ.get('OPTMV_COMMON_RUNENV64')
@@ -1179,6 +1187,40 @@ class _SCI_CAM_ACC_BLOB_META_(ctypes.Structure):
 SCI_CAM_ACC_BLOB_META = _SCI_CAM_ACC_BLOB_META_
 PSCI_CAM_ACC_BLOB_META = ctypes.POINTER(_SCI_CAM_ACC_BLOB_META_)
 
+## @~chinese
+#  @brief 绑定SDK函数原型（仅在导入时调用一次）
+#  @~english
+#  @brief Bind an SDK function prototype (called once at import)
+def _bind_prototype(name, argtypes, restype=ctypes.c_uint):
+	try:
+		fn = getattr(SciCamCtrlDll, name)
+	except AttributeError:
+		def missing(*args):
+			raise AttributeError(f"{name} is not exported by this SciCam SDK version")
+		return missing
+	fn.argtypes = argtypes
+	fn.restype = restype
+	return fn
+
+## @~chinese
+#  @brief 导入时一次性绑定的函数原型，避免每次调用重复设置argtypes/restype
+#  @~english
+#  @brief Function prototypes bound once at import instead of on every call
+_fnSciCam_Payload_GetAttribute = _bind_prototype("SciCam_Payload_GetAttribute", (ctypes.c_void_p, PSCI_CAM_PAYLOAD_ATTRIBUTE))
+_fnSciCam_Payload_GetAttributeEx = _bind_prototype("SciCam_Payload_GetAttributeEx", (ctypes.c_void_p, PSCI_CAM_PAYLOAD_ATTRIBUTE_EX))
+_fnSciCam_Payload_GetImage = _bind_prototype("SciCam_Payload_GetImage", (ctypes.c_void_p, ctypes.POINTER(ctypes.c_void_p)))
+_fnSciCam_Payload_GetChunkList = _bind_prototype("SciCam_Payload_GetChunkList", (ctypes.c_void_p, PSCI_CAM_CHUNK_LIST))
+_fnSciCam_Payload_ConvertImage = _bind_prototype("SciCam_Payload_ConvertImage", (PSCI_CAM_IMAGE_ATTRIBUTE, ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_bool))
+_fnSciCam_Payload_ConvertImageEx = _bind_prototype("SciCam_Payload_ConvertImageEx", (PSCI_CAM_IMAGE_ATTRIBUTE, ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_bool, ctypes.c_int))
+_fnSciCam_Payload_SaveImage = _bind_prototype("SciCam_Payload_SaveImage", (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_int64, ctypes.c_int64))
+_fnSciCam_Payload_LP3D_GetMeta = _bind_prototype("SciCam_Payload_LP3D_GetMeta", (ctypes.c_void_p, PSCI_CAM_LP3D_META))
+_fnSciCam_Payload_LP3D_GetImage = _bind_prototype("SciCam_Payload_LP3D_GetImage", (ctypes.c_void_p, ctypes.POINTER(ctypes.c_void_p)))
+_fnSciCam_Payload_LP3D_GetPointCounts = _bind_prototype("SciCam_Payload_LP3D_GetPointCounts", (ctypes.c_void_p, ctypes.c_void_p))
+_fnSciCam_Payload_LP3D_GetContour = _bind_prototype("SciCam_Payload_LP3D_GetContour", (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p))
+_fnSciCam_Payload_LP3D_GetGray = _bind_prototype("SciCam_Payload_LP3D_GetGray", (ctypes.c_void_p, ctypes.c_void_p))
+_fnSciCam_Payload_SL3D_GetMeta = _bind_prototype("SciCam_Payload_SL3D_GetMeta", (ctypes.c_void_p, PSCI_CAM_SL3D_META))
+_fnSciCam_Payload_SL3D_GetData = _bind_prototype("SciCam_Payload_SL3D_GetData", (ctypes.c_void_p, ctypes.c_int, PSCI_CAM_SL3D_DATA))
+
 ## @ingroup module_PayloadParsingInterface_Generic
 #  @~chinese
 #  @brief 获取payload数据属性
@@ -1195,14 +1237,10 @@ PSCI_CAM_ACC_BLOB_META = ctypes.POINTER(_SCI_CAM_ACC_BLOB_META_)
 #  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 #  @remarks NULL
 def SciCam_Payload_GetAttribute(payload, pAttr):
-	SciCamCtrlDll.SciCam_Payload_GetAttribute.argtypes = (ctypes.c_void_p, PSCI_CAM_PAYLOAD_ATTRIBUTE)
-	SciCamCtrlDll.SciCam_Payload_GetAttribute.restype = ctypes.c_uint
-	return SciCamCtrlDll.SciCam_Payload_GetAttribute(payload, ctypes.byref(pAttr))
+	return _fnSciCam_Payload_GetAttribute(payload, ctypes.byref(pAttr))
 
 def SciCam_Payload_GetAttributeEx(payload, pAttr):
-	SciCamCtrlDll.SciCam_Payload_GetAttributeEx.argtypes = (ctypes.c_void_p, PSCI_CAM_PAYLOAD_ATTRIBUTE_EX)
-	SciCamCtrlDll.SciCam_Payload_GetAttributeEx.restype = ctypes.c_uint
-	return SciCamCtrlDll.SciCam_Payload_GetAttributeEx(payload, ctypes.byref(pAttr))
+	return _fnSciCam_Payload_GetAttributeEx(payload, ctypes.byref(pAttr))
 
 ## @ingroup module_PayloadParsingInterface_Generic
 #  @~chinese
@@ -1220,9 +1258,7 @@ def SciCam_Payload_GetAttributeEx(payload, pAttr):
 #  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 #  @remarks The image data memory here is allocated by the SDK and will be destroyed with the payload.
 def SciCam_Payload_GetImage(payload, pImg):
-	SciCamCtrlDll.SciCam_Payload_GetImage.argtypes = (ctypes.c_void_p, ctypes.POINTER(ctypes.c_void_p))
-	SciCamCtrlDll.SciCam_Payload_GetImage.restype = ctypes.c_uint
-	return SciCamCtrlDll.SciCam_Payload_GetImage(payload, pImg)
+	return _fnSciCam_Payload_GetImage(payload, pImg)
 
 ## @ingroup module_PayloadParsingInterface_Generic
 #  @~chinese
@@ -1240,9 +1276,7 @@ def SciCam_Payload_GetImage(payload, pImg):
 #  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 #  @remarks NULL
 def SciCam_Payload_GetChunkList(payload, pChunkList):
-	SciCamCtrlDll.SciCam_Payload_GetChunkList.argtypes = (ctypes.c_void_p, PSCI_CAM_CHUNK_LIST)
-	SciCamCtrlDll.SciCam_Payload_GetChunkList.restype = ctypes.c_uint
-	return SciCamCtrlDll.SciCam_Payload_GetChunkList(payload, ctypes.byref(pChunkList))
+	return _fnSciCam_Payload_GetChunkList(payload, ctypes.byref(pChunkList))
 
 ## @ingroup module_PayloadParsingInterface_Convert
 #  @~chinese
@@ -1276,11 +1310,9 @@ def SciCam_Payload_GetChunkList(payload, pChunkList):
 #  			When dstImg is empty, you can obtain the size of the target image data. Based on the obtained dstImgSize, pre-allocate memory for dstImg, and then pass the dstImg pointer to retrieve the target image data.
 #  		Note that both RGB and BGR color images are converted to RGB arrangement here, and there may be a phenomenon that the B and R channels are reversed. To solve this problem, you can use the @ref SciCam_Payload_ConvertImage "SciCam_Payload_ConvertImage" interface;
 def SciCam_Payload_ConvertImage(imgAttr, srcImg, outType, dstImg, dstImgSize, zoom):
-	SciCamCtrlDll.SciCam_Payload_ConvertImage.argtypes = (PSCI_CAM_IMAGE_ATTRIBUTE, ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_bool)
-	SciCamCtrlDll.SciCam_Payload_ConvertImage.restype = ctypes.c_uint
-	if dstImg == None:
-		return SciCamCtrlDll.SciCam_Payload_ConvertImage(imgAttr, srcImg, ctypes.c_int(outType), dstImg, ctypes.byref(dstImgSize), ctypes.c_bool(zoom))
-	return SciCamCtrlDll.SciCam_Payload_ConvertImage(imgAttr, srcImg, ctypes.c_int(outType), ctypes.byref(dstImg), ctypes.byref(dstImgSize), ctypes.c_bool(zoom))
+	if dstImg is None:
+		return _fnSciCam_Payload_ConvertImage(imgAttr, srcImg, outType, dstImg, ctypes.byref(dstImgSize), zoom)
+	return _fnSciCam_Payload_ConvertImage(imgAttr, srcImg, outType, ctypes.byref(dstImg), ctypes.byref(dstImgSize), zoom)
 
 ## @ingroup module_PayloadParsingInterface_Convert
 #  @~chinese
@@ -1314,11 +1346,9 @@ def SciCam_Payload_ConvertImage(imgAttr, srcImg, outType, dstImg, dstImgSize, zo
 #  			When dstImg is empty, you can obtain the size of the target image data. Based on the obtained dstImgSize, pre-allocate memory for dstImg, and then pass the dstImg pointer to retrieve the target image data.
 #  		The default value of algorithmType is 0. For high-quality image conversion, you can choose "2(Best)" from the drop-down list. Please note that "0(Fast)" has the shortest processing time while "2(Best)" has the longest processing time.
 def SciCam_Payload_ConvertImageEx(imgAttr, srcImg, outType, dstImg, dstImgSize, zoom, algorithmType):
-	SciCamCtrlDll.SciCam_Payload_ConvertImageEx.argtypes = (PSCI_CAM_IMAGE_ATTRIBUTE, ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_bool, ctypes.c_int)
-	SciCamCtrlDll.SciCam_Payload_ConvertImageEx.restype = ctypes.c_uint
-	if dstImg == None:
-		return SciCamCtrlDll.SciCam_Payload_ConvertImageEx(imgAttr, srcImg, ctypes.c_int(outType), dstImg, ctypes.byref(dstImgSize), ctypes.c_bool(zoom), ctypes.c_int(algorithmType))
-	return SciCamCtrlDll.SciCam_Payload_ConvertImageEx(imgAttr, srcImg, ctypes.c_int(outType), ctypes.byref(dstImg), ctypes.byref(dstImgSize), ctypes.c_bool(zoom), ctypes.c_int(algorithmType))
+	if dstImg is None:
+		return _fnSciCam_Payload_ConvertImageEx(imgAttr, srcImg, outType, dstImg, ctypes.byref(dstImgSize), zoom, algorithmType)
+	return _fnSciCam_Payload_ConvertImageEx(imgAttr, srcImg, outType, ctypes.byref(dstImg), ctypes.byref(dstImgSize), zoom, algorithmType)
 
 ## @ingroup module_PayloadParsingInterface_Convert
 #  @~chinese
@@ -1343,9 +1373,7 @@ def SciCam_Payload_ConvertImageEx(imgAttr, srcImg, outType, dstImg, dstImgSize,
 #  @remarks The "zoom" parameter is effective when converting images with different pixel depths. When "zoom" is set to false, it means no pixel scaling is performed. When set to true, pixel scaling is applied, but the brightness values in the saved image are magnified and not the original data.
 def SciCam_Payload_SaveImage(filePath, pixelType, img, width, height):
 	# C prototype: SCI_CAM_API unsigned int SCICALL SciCam_Payload_SaveImage(IN const char* filePath, IN SciCamPixelType pixelType, IN void* img, IN uint64_t width, IN uint64_t height);
-	SciCamCtrlDll.SciCam_Payload_SaveImage.argtypes = (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_int64, ctypes.c_int64)
-	SciCamCtrlDll.SciCam_Payload_SaveImage.restype = ctypes.c_uint
-	return SciCamCtrlDll.SciCam_Payload_SaveImage(filePath.encode('ascii'), ctypes.c_int(pixelType), img, ctypes.c_int64(width), ctypes.c_int64(height))
+	return _fnSciCam_Payload_SaveImage(filePath.encode('ascii'), pixelType, img, width, height)
 
 ## @ingroup module_PayloadParsingInterface_LP3D
 #  @~chinese
@@ -1363,9 +1391,7 @@ def SciCam_Payload_SaveImage(filePath, pixelType, img, width, height):
 #  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 #  @remarks NULL
 def SciCam_Payload_LP3D_GetMeta(payload, pMeta):
-	SciCamCtrlDll.SciCam_Payload_LP3D_GetMeta.argtypes = (ctypes.c_void_p, PSCI_CAM_LP3D_META)
-	SciCamCtrlDll.SciCam_Payload_LP3D_GetMeta.restype = ctypes.c_uint
-	return SciCamCtrlDll.SciCam_Payload_LP3D_GetMeta(payload, ctypes.byref(pMeta))
+	return _fnSciCam_Payload_LP3D_GetMeta(payload, ctypes.byref(pMeta))
 
 ## @ingroup module_PayloadParsingInterface_LP3D
 #  @~chinese
@@ -1383,9 +1409,7 @@ def SciCam_Payload_LP3D_GetMeta(payload, pMeta):
 #  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 #  @remarks The memory for pImage is allocated by the SDK and is released upon the end of the payload's lifecycle.
 def SciCam_Payload_LP3D_GetImage(payload, pImage):
-	SciCamCtrlDll.SciCam_Payload_LP3D_GetImage.argtypes = (ctypes.c_void_p, ctypes.POINTER(ctypes.c_void_p))
-	SciCamCtrlDll.SciCam_Payload_LP3D_GetImage.restype = ctypes.c_uint
-	return SciCamCtrlDll.SciCam_Payload_LP3D_GetImage(payload, pImage)
+	return _fnSciCam_Payload_LP3D_GetImage(payload, pImage)
 
 ## @ingroup module_PayloadParsingInterface_LP3D
 #  @~chinese
@@ -1403,9 +1427,7 @@ def SciCam_Payload_LP3D_GetImage(payload, pImage):
 #  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 #  @remarks NULL
 def SciCam_Payload_LP3D_GetPointCounts(payload, pointCounts):
-	SciCamCtrlDll.SciCam_Payload_LP3D_GetPointCounts.argtypes = (ctypes.c_void_p, ctypes.c_void_p)
-	SciCamCtrlDll.SciCam_Payload_LP3D_GetPointCounts.restype = ctypes.c_uint
-	return SciCamCtrlDll.SciCam_Payload_LP3D_GetPointCounts(payload, ctypes.byref(pointCounts))
+	return _fnSciCam_Payload_LP3D_GetPointCounts(payload, ctypes.byref(pointCounts))
 
 ## @ingroup module_PayloadParsingInterface_LP3D
 #  @~chinese
@@ -1427,9 +1449,7 @@ def SciCam_Payload_LP3D_GetPointCounts(payload, pointCounts):
 #  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 #  @remarks NULL
 def SciCam_Payload_LP3D_GetContour(payload, dataType, pContour, invalidValue):
-	SciCamCtrlDll.SciCam_Payload_LP3D_GetContour.argtypes = (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p)
-	SciCamCtrlDll.SciCam_Payload_LP3D_GetContour.restype = ctypes.c_uint
-	return SciCamCtrlDll.SciCam_Payload_LP3D_GetContour(payload, ctypes.c_int(dataType), ctypes.byref(pContour), ctypes.byref(invalidValue))
+	return _fnSciCam_Payload_LP3D_GetContour(payload, dataType, ctypes.byref(pContour), ctypes.byref(invalidValue))
 
 ## @ingroup module_PayloadParsingInterface_LP3D
 #  @~chinese
@@ -1447,9 +1467,7 @@ def SciCam_Payload_LP3D_GetContour(payload, dataType, pContour, invalidValue):
 #  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 #  @remarks NULL
 def SciCam_Payload_LP3D_GetGray(payload, pGray):
-	SciCamCtrlDll.SciCam_Payload_LP3D_GetGray.argtypes = (ctypes.c_void_p, ctypes.c_void_p)
-	SciCamCtrlDll.SciCam_Payload_LP3D_GetGray.restype = ctypes.c_uint
-	return SciCamCtrlDll.SciCam_Payload_LP3D_GetGray(payload, ctypes.byref(pGray))
+	return _fnSciCam_Payload_LP3D_GetGray(payload, ctypes.byref(pGray))
 
 ## @ingroup module_PayloadParsingInterface_SL3D
 #  @~chinese
@@ -1467,9 +1485,7 @@ def SciCam_Payload_LP3D_GetGray(payload, pGray):
 #  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 #  @remarks NULL
 def SciCam_Payload_SL3D_GetMeta(payload, pMeta):
-	SciCamCtrlDll.SciCam_Payload_SL3D_GetMeta.argtypes = (ctypes.c_void_p, PSCI_CAM_SL3D_META)
-	SciCamCtrlDll.SciCam_Payload_SL3D_GetMeta.restype = ctypes.c_uint
-	return SciCamCtrlDll.SciCam_Payload_SL3D_GetMeta(payload, pMeta)
+	return _fnSciCam_Payload_SL3D_GetMeta(payload, pMeta)
 
 ## @ingroup module_PayloadParsingInterface_SL3D
 #  @~chinese
@@ -1489,6 +1505,4 @@ def SciCam_Payload_SL3D_GetMeta(payload, pMeta):
 #  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 #  @remarks "data" in "pData" is shallow copied and automatically released when the payload's lifecycle ends.
 def SciCam_Payload_SL3D_GetData(payload, tgDataType, pData):
-	SciCamCtrlDll.SciCam_Payload_SL3D_GetData.argtypes = (ctypes.c_void_p, ctypes.c_int, PSCI_CAM_SL3D_DATA)
-	SciCamCtrlDll.SciCam_Payload_SL3D_GetData.restype = ctypes.c_uint
-	return SciCamCtrlDll.SciCam_Payload_SL3D_GetData(payload, tgDataType, pData)
\ No newline at end of file
+	return _fnSciCam_Payload_SL3D_GetData(payload, tgDataType, pData)
\ No newline at end of file
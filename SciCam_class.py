@@ -1,6 +1,80 @@
 from SciCamErrorDefine_const import *
 from SciCamPayload_header import *
 from SciCamInfo_header import *
+from SciCamPayload_header import _bind_prototype
+
+## @~chinese
+#  @brief ʱһ԰󶨵ĺԭͣÿεظargtypes/restype
+#  @~english
+#  @brief Function prototypes bound once at import instead of on every call
+_fnSciCam_GetSDKVersion = _bind_prototype("SciCam_GetSDKVersion", ())
+_fnSciCam_SetSDKLogPath = _bind_prototype("SciCam_SetSDKLogPath", (ctypes.c_void_p,))
+_fnSciCam_DiscoveryDevices = _bind_prototype("SciCam_DiscoveryDevices", (PSCI_DEVICE_INFO_LIST, ctypes.c_uint))
+_fnSciCam_CreateDevice = _bind_prototype("SciCam_CreateDevice", (ctypes.c_void_p, PSCI_DEVICE_INFO))
+_fnSciCam_DeleteDevice = _bind_prototype("SciCam_DeleteDevice", (ctypes.c_void_p,))
+_fnSciCam_RegisterEventCallback = _bind_prototype("SciCam_RegisterEventCallback", (ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p))
+_fnSciCam_OpenDevice = _bind_prototype("SciCam_OpenDevice", (ctypes.c_void_p,))
+_fnSciCam_CloseDevice = _bind_prototype("SciCam_CloseDevice", (ctypes.c_void_p,))
+_fnSciCam_IsDeviceOpen = _bind_prototype("SciCam_IsDeviceOpen", (ctypes.c_void_p,), ctypes.c_bool)
+_fnSciCam_RegisterPayloadCallBack = _bind_prototype("SciCam_RegisterPayloadCallBack", (ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_bool))
+_fnSciCam_GetGrabStrategy = _bind_prototype("SciCam_GetGrabStrategy", (ctypes.c_void_p, ctypes.c_void_p))
+_fnSciCam_SetGrabStrategy = _bind_prototype("SciCam_SetGrabStrategy", (ctypes.c_void_p, ctypes.c_int))
+_fnSciCam_GetGrabTimeout = _bind_prototype("SciCam_GetGrabTimeout", (ctypes.c_void_p, ctypes.c_void_p))
+_fnSciCam_SetGrabTimeout = _bind_prototype("SciCam_SetGrabTimeout", (ctypes.c_void_p, ctypes.c_uint))
+_fnSciCam_GetGrabBufferCount = _bind_prototype("SciCam_GetGrabBufferCount", (ctypes.c_void_p, ctypes.c_void_p))
+_fnSciCam_SetGrabBufferCount = _bind_prototype("SciCam_SetGrabBufferCount", (ctypes.c_void_p, ctypes.c_uint))
+_fnSciCam_StartGrabbing = _bind_prototype("SciCam_StartGrabbing", (ctypes.c_void_p,))
+_fnSciCam_StopGrabbing = _bind_prototype("SciCam_StopGrabbing", (ctypes.c_void_p,))
+_fnSciCam_Grab = _bind_prototype("SciCam_Grab", (ctypes.c_void_p, ctypes.POINTER(ctypes.c_void_p)))
+_fnSciCam_FreePayload = _bind_prototype("SciCam_FreePayload", (ctypes.c_void_p, ctypes.c_void_p))
+_fnSciCam_ClearPayloadBuffer = _bind_prototype("SciCam_ClearPayloadBuffer", (ctypes.c_void_p,))
+_fnSciCam_GetIntValue = _bind_prototype("SciCam_GetIntValue", (ctypes.c_void_p, ctypes.c_void_p, PSCI_NODE_VAL_INT))
+_fnSciCam_SetIntValue = _bind_prototype("SciCam_SetIntValue", (ctypes.c_void_p, ctypes.c_void_p, ctypes.c_int64))
+_fnSciCam_GetFloatValue = _bind_prototype("SciCam_GetFloatValue", (ctypes.c_void_p, ctypes.c_void_p, PSCI_NODE_VAL_FLOAT))
+_fnSciCam_SetFloatValue = _bind_prototype("SciCam_SetFloatValue", (ctypes.c_void_p, ctypes.c_void_p, ctypes.c_double))
+_fnSciCam_GetBoolValue = _bind_prototype("SciCam_GetBoolValue", (ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p))
+_fnSciCam_SetBoolValue = _bind_prototype("SciCam_SetBoolValue", (ctypes.c_void_p, ctypes.c_void_p, ctypes.c_bool))
+_fnSciCam_GetStringValue = _bind_prototype("SciCam_GetStringValue", (ctypes.c_void_p, ctypes.c_void_p, PSCI_NODE_VAL_STRING))
+_fnSciCam_SetStringValue = _bind_prototype("SciCam_SetStringValue", (ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p))
+_fnSciCam_GetEnumValue = _bind_prototype("SciCam_GetEnumValue", (ctypes.c_void_p, ctypes.c_void_p, PSCI_NODE_VAL_ENUM))
+_fnSciCam_SetEnumValue = _bind_prototype("SciCam_SetEnumValue", (ctypes.c_void_p, ctypes.c_void_p, ctypes.c_int64))
+_fnSciCam_SetEnumValueByString = _bind_prototype("SciCam_SetEnumValueByString", (ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p))
+_fnSciCam_SetCommandValue = _bind_prototype("SciCam_SetCommandValue", (ctypes.c_void_p, ctypes.c_void_p))
+_fnSciCam_GetNodes = _bind_prototype("SciCam_GetNodes", (ctypes.c_void_p, PSCI_CAM_NODE, ctypes.c_void_p))
+_fnSciCam_GetNodeType = _bind_prototype("SciCam_GetNodeType", (ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p))
+_fnSciCam_GetNodeNameSpace = _bind_prototype("SciCam_GetNodeNameSpace", (ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p))
+_fnSciCam_GetNodeVisibility = _bind_prototype("SciCam_GetNodeVisibility", (ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p))
+_fnSciCam_GetNodeAccessMode = _bind_prototype("SciCam_GetNodeAccessMode", (ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p))
+_fnSciCam_FeatureSave = _bind_prototype("SciCam_FeatureSave", (ctypes.c_void_p, ctypes.c_void_p))
+_fnSciCam_FeatureLoad = _bind_prototype("SciCam_FeatureLoad", (ctypes.c_void_p, ctypes.c_void_p))
+_fnSciCam_GetIntValueEx = _bind_prototype("SciCam_GetIntValueEx", (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, PSCI_NODE_VAL_INT))
+_fnSciCam_SetIntValueEx = _bind_prototype("SciCam_SetIntValueEx", (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_int64))
+_fnSciCam_GetFloatValueEx = _bind_prototype("SciCam_GetFloatValueEx", (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, PSCI_NODE_VAL_FLOAT))
+_fnSciCam_SetFloatValueEx = _bind_prototype("SciCam_SetFloatValueEx", (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_double))
+_fnSciCam_GetBoolValueEx = _bind_prototype("SciCam_GetBoolValueEx", (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p))
+_fnSciCam_SetBoolValueEx = _bind_prototype("SciCam_SetBoolValueEx", (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_bool))
+_fnSciCam_GetStringValueEx = _bind_prototype("SciCam_GetStringValueEx", (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, PSCI_NODE_VAL_STRING))
+_fnSciCam_SetStringValueEx = _bind_prototype("SciCam_SetStringValueEx", (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p))
+_fnSciCam_GetEnumValueEx = _bind_prototype("SciCam_GetEnumValueEx", (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, PSCI_NODE_VAL_ENUM))
+_fnSciCam_SetEnumValueEx = _bind_prototype("SciCam_SetEnumValueEx", (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_int64))
+_fnSciCam_SetEnumValueByStringEx = _bind_prototype("SciCam_SetEnumValueByStringEx", (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p))
+_fnSciCam_SetCommandValueEx = _bind_prototype("SciCam_SetCommandValueEx", (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p))
+_fnSciCam_GetNodesEx = _bind_prototype("SciCam_GetNodesEx", (ctypes.c_void_p, ctypes.c_int, PSCI_CAM_NODE, ctypes.c_void_p))
+_fnSciCam_GetNodeTypeEx = _bind_prototype("SciCam_GetNodeTypeEx", (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p))
+_fnSciCam_GetNodeNameSpaceEx = _bind_prototype("SciCam_GetNodeNameSpaceEx", (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p))
+_fnSciCam_GetNodeVisibilityEx = _bind_prototype("SciCam_GetNodeVisibilityEx", (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p))
+_fnSciCam_GetNodeAccessModeEx = _bind_prototype("SciCam_GetNodeAccessModeEx", (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p))
+_fnSciCam_FeatureSaveEx = _bind_prototype("SciCam_FeatureSaveEx", (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p))
+_fnSciCam_FeatureLoadEx = _bind_prototype("SciCam_FeatureLoadEx", (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p))
+_fnSciCam_Gige_ModifyCamIp = _bind_prototype("SciCam_Gige_ModifyCamIp", (ctypes.c_void_p, ctypes.c_uint, ctypes.c_uint, ctypes.c_uint))
+_fnSciCam_Gige_ModifyCamIpEx = _bind_prototype("SciCam_Gige_ModifyCamIpEx", (ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p))
+_fnSciCam_CL_OpenCam = _bind_prototype("SciCam_CL_OpenCam", (ctypes.c_void_p,))
+_fnSciCam_CL_CloseCam = _bind_prototype("SciCam_CL_CloseCam", (ctypes.c_void_p,))
+_fnSciCam_CL_IsCamOpen = _bind_prototype("SciCam_CL_IsCamOpen", (ctypes.c_void_p,), ctypes.c_bool)
+_fnSciCam_LP3D_SetGrabType = _bind_prototype("SciCam_LP3D_SetGrabType", (ctypes.c_void_p, ctypes.c_int))
+_fnSciCam_StartRecord = _bind_prototype("SciCam_StartRecord", (ctypes.c_void_p, PSCI_RECORD_INFO))
+_fnSciCam_InputOneFrame = _bind_prototype("SciCam_InputOneFrame", (ctypes.c_void_p, ctypes.c_void_p))
+_fnSciCam_StopRecord = _bind_prototype("SciCam_StopRecord", (ctypes.c_void_p,))
 
 class SciCamera():
 	## @ingroup module_Other
@@ -53,8 +127,7 @@ class SciCamera():
 	#  @remarks For example, if the return value is 0x01000001, the SDK version is V1.0.0.1
 	@staticmethod
 	def SciCam_GetSDKVersion():
-		SciCamCtrlDll.SciCam_GetSDKVersion.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_GetSDKVersion()
+		return _fnSciCam_GetSDKVersion()
 	
 	## @ingroup module_Other
 	#  @~chinese
@@ -71,9 +144,7 @@ class SciCamera():
 	#  @remarks NULL
 	@staticmethod
 	def SciCam_SetSDKLogPath(logPath):
-		SciCamCtrlDll.SciCam_SetSDKLogPath.argtypes = ctypes.c_void_p
-		SciCamCtrlDll.SciCam_SetSDKLogPath.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_SetSDKLogPath(logPath.encode('ascii'))
+		return _fnSciCam_SetSDKLogPath(logPath.encode('ascii'))
 
 	## @ingroup module_DeviceInitAndDestr
 	#  @~chinese
@@ -92,9 +163,7 @@ class SciCamera():
 	#  @remarks When tlType is set to SciCam_TLType_CL_CAM_ONLY, it only searches for cameras under CL capture cards. SciCam_TLType_CL_CAM_ONLY cannot be combined with other tlType values using bitwise OR operations.
 	@staticmethod
 	def SciCam_DiscoveryDevices(devInfos, tlType):
-		SciCamCtrlDll.SciCam_DiscoveryDevices.argtypes = (PSCI_DEVICE_INFO_LIST, ctypes.c_uint)
-		SciCamCtrlDll.SciCam_DiscoveryDevices.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_DiscoveryDevices(ctypes.byref(devInfos), ctypes.c_uint(tlType))
+		return _fnSciCam_DiscoveryDevices(ctypes.byref(devInfos), tlType)
 
 	## @ingroup module_DeviceInitAndDestr
 	#  @~chinese
@@ -110,9 +179,7 @@ class SciCamera():
 	#  @retval Other references: @ref SciCamErrorDefine_const "Error Code List"
 	#  @remarks NULL
 	def SciCam_CreateDevice(self, devInfo):
-		SciCamCtrlDll.SciCam_CreateDevice.argtypes = (ctypes.c_void_p, PSCI_DEVICE_INFO)
-		SciCamCtrlDll.SciCam_CreateDevice.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_CreateDevice(ctypes.byref(self.handle), devInfo)
+		return _fnSciCam_CreateDevice(ctypes.byref(self.handle), devInfo)
 
 	## @ingroup module_DeviceInitAndDestr
 	#  @~chinese
@@ -126,9 +193,7 @@ class SciCamera():
 	#  @retval Other references: @ref SciCamErrorDefine_const "Error Code List"
 	#  @remarks NULL
 	def SciCam_DeleteDevice(self):
-		SciCamCtrlDll.SciCam_DeleteDevice.argtype = ctypes.c_void_p
-		SciCamCtrlDll.SciCam_DeleteDevice.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_DeleteDevice(self.handle)
+		return _fnSciCam_DeleteDevice(self.handle)
 
 	## @ingroup module_Other
 	#  @~chinese
@@ -146,9 +211,7 @@ class SciCamera():
 	#  @retval NULL
 	#  @remarks By registering a callback, you can receive real-time notification messages such as camera online/offline events.
 	def SciCam_RegisterEventCallback(self, CallBackFun, tag):
-		SciCamCtrlDll.SciCam_RegisterEventCallback.argtypes = (ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p)
-		SciCamCtrlDll.SciCam_RegisterEventCallback.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_RegisterEventCallback(self.handle, CallBackFun, tag)
+		return _fnSciCam_RegisterEventCallback(self.handle, CallBackFun, tag)
 
 	## @ingroup module_DeviceInitAndDestr
 	#  @~chinese
@@ -164,9 +227,7 @@ class SciCamera():
 	#  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 	#  @remarks For opening cameras with GigE and U3V devices, and for opening capture cards with CL devices, refer to SciCam_CL_OpenCam
 	def SciCam_OpenDevice(self):
-		SciCamCtrlDll.SciCam_OpenDevice.argtype = ctypes.c_void_p
-		SciCamCtrlDll.SciCam_OpenDevice.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_OpenDevice(self.handle)
+		return _fnSciCam_OpenDevice(self.handle)
 
 	## @ingroup module_DeviceInitAndDestr
 	#  @~chinese
@@ -182,9 +243,7 @@ class SciCamera():
 	#  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 	#  @remarks After connecting to the device through SciCam_OpenDevice, you can use this interface to disconnect the device and release resources. If it is a CL device, closing the capture card will also close all cameras under the capture card.
 	def SciCam_CloseDevice(self):
-		SciCamCtrlDll.SciCam_CloseDevice.argtype = ctypes.c_void_p
-		SciCamCtrlDll.SciCam_CloseDevice.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_CloseDevice(self.handle)
+		return _fnSciCam_CloseDevice(self.handle)
 
 	## @ingroup module_DeviceInitAndDestr
 	#  @~chinese
@@ -198,9 +257,7 @@ class SciCamera():
 	#  @retval true: Device connected; false: Device not connected
 	#  @remarks To check if the camera is connected for GigE and U3V devices, and to check if the capture card is connected for CL devices, refer to SciCam_CL_IsCamOpen.
 	def SciCam_IsDeviceOpen(self):
-		SciCamCtrlDll.SciCam_IsDeviceOpen.argtype = ctypes.c_void_p
-		SciCamCtrlDll.SciCam_IsDeviceOpen.restype = ctypes.c_bool
-		return SciCamCtrlDll.SciCam_IsDeviceOpen(self.handle)
+		return _fnSciCam_IsDeviceOpen(self.handle)
 
 	## @ingroup module_Grab
 	#  @~chinese
@@ -232,9 +289,7 @@ class SciCamera():
 	#  		When using Method 2 to obtain payload data, the application layer should control the frequency of calling this interface based on the frame rate. \n
 	#  		The obtained payload data can be converted into the desired data format by using the corresponding interfaces in SciCamPayload.h to access payload-related attributes.
 	def SciCam_RegisterPayloadCallBack(self, CallBackFun, tag, autoFree):
-		SciCamCtrlDll.SciCam_RegisterPayloadCallBack.argtypes = (ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_bool)
-		SciCamCtrlDll.SciCam_RegisterPayloadCallBack.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_RegisterPayloadCallBack(self.handle, CallBackFun, tag, ctypes.c_bool(autoFree))
+		return _fnSciCam_RegisterPayloadCallBack(self.handle, CallBackFun, tag, autoFree)
 
 	## @ingroup module_Grab
 	#  @~chinese
@@ -252,9 +307,7 @@ class SciCamera():
 	#  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 	#  @remarks NULL
 	def SciCam_GetGrabStrategy(self, pStrategy):
-		SciCamCtrlDll.SciCam_GetGrabStrategy.argtypes = (ctypes.c_void_p, ctypes.c_void_p)
-		SciCamCtrlDll.SciCam_GetGrabStrategy.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_GetGrabStrategy(self.handle, ctypes.byref(pStrategy))
+		return _fnSciCam_GetGrabStrategy(self.handle, ctypes.byref(pStrategy))
 
 	## @ingroup module_Grab
 	#  @~chinese
@@ -272,9 +325,7 @@ class SciCamera():
 	#  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 	#  @remarks NULL
 	def SciCam_SetGrabStrategy(self, grabStrategy):
-		SciCamCtrlDll.SciCam_SetGrabStrategy.argtypes = (ctypes.c_void_p, ctypes.c_int)
-		SciCamCtrlDll.SciCam_SetGrabStrategy.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_SetGrabStrategy(self.handle, ctypes.c_int(grabStrategy))
+		return _fnSciCam_SetGrabStrategy(self.handle, grabStrategy)
 
 	## @ingroup module_Grab
 	#  @~chinese
@@ -292,9 +343,7 @@ class SciCamera():
 	#  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 	#  @remarks During capture, a timeout waiting mechanism is used. If capturing a complete frame is not completed within the timeout waiting time or if no frame is captured within the specified timeout, an error code will be returned. Please set the timeout waiting time appropriately.
 	def SciCam_GetGrabTimeout(self, pTimeout):
-		SciCamCtrlDll.SciCam_GetGrabTimeout.argtypes = (ctypes.c_void_p, ctypes.c_void_p)
-		SciCamCtrlDll.SciCam_GetGrabTimeout.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_GetGrabTimeout(self.handle, ctypes.byref(pTimeout))
+		return _fnSciCam_GetGrabTimeout(self.handle, ctypes.byref(pTimeout))
 
 	## @ingroup module_Grab
 	#  @~chinese
@@ -312,9 +361,7 @@ class SciCamera():
 	#  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 	#  @remarks During capture, a timeout waiting mechanism is used. If capturing a complete frame is not completed within the timeout waiting time or if no frame is captured within the specified timeout, an error code will be returned. Please set the timeout waiting time appropriately.
 	def SciCam_SetGrabTimeout(self, timeout):
-		SciCamCtrlDll.SciCam_SetGrabTimeout.argtypes = (ctypes.c_void_p, ctypes.c_uint)
-		SciCamCtrlDll.SciCam_SetGrabTimeout.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_SetGrabTimeout(self.handle, ctypes.c_uint(timeout))
+		return _fnSciCam_SetGrabTimeout(self.handle, timeout)
 
 	## @ingroup module_Grab
 	#  @~chinese
@@ -332,9 +379,7 @@ class SciCamera():
 	#  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 	#  @remarks A larger buffer queue consumes more resources, but it can also reduce the probability of frame drops. Please allocate the buffer queue size judiciously.
 	def SciCam_GetGrabBufferCount(self, pBufferCount):
-		SciCamCtrlDll.SciCam_GetGrabBufferCount.argtypes = (ctypes.c_void_p, ctypes.c_void_p)
-		SciCamCtrlDll.SciCam_GetGrabBufferCount.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_GetGrabBufferCount(self.handle, ctypes.byref(pBufferCount))
+		return _fnSciCam_GetGrabBufferCount(self.handle, ctypes.byref(pBufferCount))
 
 	## @ingroup module_Grab
 	#  @~chinese
@@ -354,9 +399,7 @@ class SciCamera():
 	#  @remarks A larger buffer queue consumes more resources, but it can also reduce the probability of frame drops. Please allocate the buffer queue size judiciously. \n
 	#  			When bufferCount is set to 0, it indicates that no specific value is set, and the recommended caching strategy should be used.
 	def SciCam_SetGrabBufferCount(self, bufferCount):
-		SciCamCtrlDll.SciCam_SetGrabBufferCount.argtypes = (ctypes.c_void_p, ctypes.c_uint)
-		SciCamCtrlDll.SciCam_SetGrabBufferCount.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_SetGrabBufferCount(self.handle, ctypes.c_uint(bufferCount))
+		return _fnSciCam_SetGrabBufferCount(self.handle, bufferCount)
 
 	## @ingroup module_Grab
 	#  @~chinese
@@ -372,9 +415,7 @@ class SciCamera():
 	#  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 	#  @remarks NULL
 	def SciCam_StartGrabbing(self):
-		SciCamCtrlDll.SciCam_StartGrabbing.argtype = ctypes.c_void_p
-		SciCamCtrlDll.SciCam_StartGrabbing.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_StartGrabbing(self.handle)
+		return _fnSciCam_StartGrabbing(self.handle)
 
 	## @ingroup module_Grab
 	#  @~chinese
@@ -390,9 +431,7 @@ class SciCamera():
 	#  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 	#  @remarks NULL
 	def SciCam_StopGrabbing(self):
-		SciCamCtrlDll.SciCam_StopGrabbing.argtype = ctypes.c_void_p
-		SciCamCtrlDll.SciCam_StopGrabbing.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_StopGrabbing(self.handle)
+		return _fnSciCam_StopGrabbing(self.handle)
 
 	## @ingroup module_Grab
 	#  @~chinese
@@ -414,9 +453,7 @@ class SciCamera():
 	#  		The obtained payload data can be converted into the desired data format by using the corresponding interfaces in SciCamPayload.h to access payload-related attributes. \n
 	#  		After using the frame data, please call SciCam_FreePayload for release to avoid situations where the device cannot continue capturing.
 	def SciCam_Grab(self, ppayload):
-		SciCamCtrlDll.SciCam_Grab.argtypes = (ctypes.c_void_p, ctypes.POINTER(ctypes.c_void_p))
-		SciCamCtrlDll.SciCam_Grab.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_Grab(self.handle, ppayload)
+		return _fnSciCam_Grab(self.handle, ppayload)
 
 	## @ingroup module_Grab
 	#  @~chinese
@@ -434,9 +471,7 @@ class SciCamera():
 	#  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 	#  @remarks NULL
 	def SciCam_FreePayload(self, payload):
-		SciCamCtrlDll.SciCam_FreePayload.argtypes = (ctypes.c_void_p, ctypes.c_void_p)
-		SciCamCtrlDll.SciCam_FreePayload.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_FreePayload(self.handle, payload)
+		return _fnSciCam_FreePayload(self.handle, payload)
 
 	## @ingroup module_Grab
 	#  @~chinese
@@ -452,9 +487,7 @@ class SciCamera():
 	#  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 	#  @remarks NULL
 	def SciCam_ClearPayloadBuffer(self):
-		SciCamCtrlDll.SciCam_ClearPayloadBuffer.argtype = ctypes.c_void_p
-		SciCamCtrlDll.SciCam_ClearPayloadBuffer.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_ClearPayloadBuffer(self.handle)
+		return _fnSciCam_ClearPayloadBuffer(self.handle)
 
 	## @ingroup module_Node
 	#  @~chinese
@@ -476,9 +509,7 @@ class SciCamera():
 	#  @remarks You can call this API to get the value of camera node with integer type after connecting the device. For key value, refer to MvCameraNode. All the node values of "IInteger" in the list can be obtained via this API. Key corresponds to the Name column. \n
 	#  		This interface is only used to retrieve the values of "IInteger" type nodes in the camera device XML. For CL and CXP devices, please refer to the interface: SciCam_GetIntValueEx.
 	def SciCam_GetIntValue(self, key, pVal):
-		SciCamCtrlDll.SciCam_GetIntValue.argtypes = (ctypes.c_void_p, ctypes.c_void_p, PSCI_NODE_VAL_INT)
-		SciCamCtrlDll.SciCam_GetIntValue.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_GetIntValue(self.handle, key.encode('ascii'), ctypes.byref(pVal))
+		return _fnSciCam_GetIntValue(self.handle, key.encode('ascii'), ctypes.byref(pVal))
 
 	## @ingroup module_Node
 	#  @~chinese
@@ -500,9 +531,7 @@ class SciCamera():
 	#  @remarks You can call this API to get the value of camera node with integer type after connecting the device. For key value, refer to MvCameraNode. All the node values of "IInteger" in the list can be obtained via this API. Key corresponds to the Name column. \n
 	#  		This interface is only used to set the values of "IInteger" type nodes in the camera device XML. For CL and CXP devices, please refer to the interface: SciCam_SetIntValueEx.
 	def SciCam_SetIntValue(self, key, val):
-		SciCamCtrlDll.SciCam_SetIntValue.argtypes = (ctypes.c_void_p, ctypes.c_void_p, ctypes.c_int64)
-		SciCamCtrlDll.SciCam_SetIntValue.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_SetIntValue(self.handle, key.encode('ascii'), ctypes.c_int64(val))
+		return _fnSciCam_SetIntValue(self.handle, key.encode('ascii'), val)
 
 	## @ingroup module_Node
 	#  @~chinese
@@ -524,9 +553,7 @@ class SciCamera():
 	#  @remarks After the device is connected, call this interface to get specified float node. For detailed key value see: MvCameraNode. The node values of IFloat can be obtained through this interface, key value corresponds to the Name column. \n
 	#  		This interface is only used to retrieve the values of "IFloat" type nodes in the camera device XML. For CL and CXP devices, please refer to the interface: SciCam_GetFloatValueEx.
 	def SciCam_GetFloatValue(self, key, pVal):
-		SciCamCtrlDll.SciCam_GetFloatValue.argtypes = (ctypes.c_void_p, ctypes.c_void_p, PSCI_NODE_VAL_FLOAT)
-		SciCamCtrlDll.SciCam_GetFloatValue.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_GetFloatValue(self.handle, key.encode('ascii'), ctypes.byref(pVal))
+		return _fnSciCam_GetFloatValue(self.handle, key.encode('ascii'), ctypes.byref(pVal))
 		
 	## @ingroup module_Node
 	#  @~chinese
@@ -548,9 +575,7 @@ class SciCamera():
 	#  @remarks After the device is connected, call this interface to set specified float node. For detailed key value see: MvCameraNode. The node values of IFloat can be set through this interface, key value corresponds to the Name column. \n
 	#  		This interface is only used to set the values of "IFloat" type nodes in the camera device XML. For CL and CXP devices, please refer to the interface: SciCam_SetFloatValueEx.
 	def SciCam_SetFloatValue(self, key, val):
-		SciCamCtrlDll.SciCam_SetFloatValue.argtypes = (ctypes.c_void_p, ctypes.c_void_p, ctypes.c_double)
-		SciCamCtrlDll.SciCam_SetFloatValue.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_SetFloatValue(self.handle, key.encode('ascii'), ctypes.c_double(val))
+		return _fnSciCam_SetFloatValue(self.handle, key.encode('ascii'), val)
 
 	## @ingroup module_Node
 	#  @~chinese
@@ -572,9 +597,7 @@ class SciCamera():
 	#  @remarks After the device is connected, call this interface to get specified bool nodes. For value of key, see MvCameraNode. The node values of IBoolean can be obtained through this interface, key value corresponds to the Name column. \n
 	#  		This interface is only used to retrieve the values of "IBoolean" type nodes in the camera device XML. For CL and CXP devices, please refer to the interface: SciCam_GetBoolValueEx.
 	def SciCam_GetBoolValue(self, key, pVal):
-		SciCamCtrlDll.SciCam_GetBoolValue.argtypes = (ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p)
-		SciCamCtrlDll.SciCam_GetBoolValue.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_GetBoolValue(self.handle, key.encode('ascii'), ctypes.byref(pVal))
+		return _fnSciCam_GetBoolValue(self.handle, key.encode('ascii'), ctypes.byref(pVal))
 
 	## @ingroup module_Node
 	#  @~chinese
@@ -596,9 +619,7 @@ class SciCamera():
 	#  @remarks After the device is connected, call this interface to set specified bool nodes. For value of key, see MvCameraNode. The node values of IBoolean can be set through this interface, key value corresponds to the Name column. \n
 	#  		This interface is only used to set the values of "IBoolean" type nodes in the camera device XML. For CL and CXP devices, please refer to the interface: SciCam_SetBoolValueEx.
 	def SciCam_SetBoolValue(self, key, val):
-		SciCamCtrlDll.SciCam_SetBoolValue.argtypes = (ctypes.c_void_p, ctypes.c_void_p, ctypes.c_bool)
-		SciCamCtrlDll.SciCam_SetBoolValue.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_SetBoolValue(self.handle, key.encode('ascii'), ctypes.c_bool(val))
+		return _fnSciCam_SetBoolValue(self.handle, key.encode('ascii'), val)
 
 	## @ingroup module_Node
 	#  @~chinese
@@ -620,9 +641,7 @@ class SciCamera():
 	#  @remarks After the device is connected, call this interface to get specified string nodes. For value of key, see MvCameraNode. The node values of IString can be obtained through this interface, key value corresponds to the Name column. \n
 	#  		This interface is only used to retrieve the values of "IString" type nodes in the camera device XML. For CL and CXP devices, please refer to the interface: SciCam_GetStringValueEx.
 	def SciCam_GetStringValue(self, key, pVal):
-		SciCamCtrlDll.SciCam_GetStringValue.argtypes = (ctypes.c_void_p, ctypes.c_void_p, PSCI_NODE_VAL_STRING)
-		SciCamCtrlDll.SciCam_GetStringValue.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_GetStringValue(self.handle, key.encode('ascii'), ctypes.byref(pVal))
+		return _fnSciCam_GetStringValue(self.handle, key.encode('ascii'), ctypes.byref(pVal))
 
 	## @ingroup module_Node
 	#  @~chinese
@@ -644,9 +663,7 @@ class SciCamera():
 	#  @remarks After the device is connected, call this interface to set specified string nodes. For value of key, see MvCameraNode. The node values of IString can be set through this interface, key value corresponds to the Name column.
 	#  		This interface is only used to set the values of "IString" type nodes in the camera device XML. For CL and CXP devices, please refer to the interface: SciCam_SetStringValueEx.
 	def SciCam_SetStringValue(self, key, val):
-		SciCamCtrlDll.SciCam_SetStringValue.argtypes = (ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p)
-		SciCamCtrlDll.SciCam_SetStringValue.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_SetStringValue(self.handle, key.encode('ascii'), val.encode('ascii'))
+		return _fnSciCam_SetStringValue(self.handle, key.encode('ascii'), val.encode('ascii'))
 
 	## @ingroup module_Node
 	#  @~chinese
@@ -668,9 +685,7 @@ class SciCamera():
 	#  @remarks After the device is connected, call this interface to get specified Enum nodes. For value of key, see MvCameraNode, The node values of IEnumeration can be obtained through this interface, key value corresponds to the Name column. \n
 	#  		This interface is only used to retrieve the values of "IEnumeration" type nodes in the camera device XML. For CL and CXP devices, please refer to the interface: SciCam_GetEnumValueEx.
 	def SciCam_GetEnumValue(self, key, pVal):
-		SciCamCtrlDll.SciCam_GetEnumValue.argtypes = (ctypes.c_void_p, ctypes.c_void_p, PSCI_NODE_VAL_ENUM)
-		SciCamCtrlDll.SciCam_GetEnumValue.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_GetEnumValue(self.handle, key.encode('ascii'), ctypes.byref(pVal))
+		return _fnSciCam_GetEnumValue(self.handle, key.encode('ascii'), ctypes.byref(pVal))
 
 	## @ingroup module_Node
 	#  @~chinese
@@ -692,9 +707,7 @@ class SciCamera():
 	#  @remarks After the device is connected, call this interface to get specified Enum nodes. For value of key, see MvCameraNode, The node values of IEnumeration can be obtained through this interface, key value corresponds to the Name column. \n
 	#  		This interface is only used to set the values of "IEnumeration" type nodes in the camera device XML. For CL and CXP devices, please refer to the interface: SciCam_SetEnumValueEx.
 	def SciCam_SetEnumValue(self, key, val):
-		SciCamCtrlDll.SciCam_SetEnumValue.argtypes = (ctypes.c_void_p, ctypes.c_void_p, ctypes.c_int64)
-		SciCamCtrlDll.SciCam_SetEnumValue.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_SetEnumValue(self.handle, key.encode('ascii'), ctypes.c_int64(val))
+		return _fnSciCam_SetEnumValue(self.handle, key.encode('ascii'), val)
 
 	## @ingroup module_Node
 	#  @~chinese
@@ -716,9 +729,7 @@ class SciCamera():
 	#  @remarks After connecting to the device, calling this interface allows you to set the value of a specific node of Enum type. The possible values for the "key" parameter can be referenced from the list of XML node parameter types, where the nodes with data type "IEnumeration" can be set using this interface. The "key" parameter value corresponds to the "Name" column in the list. \n
 	#  		This interface is only used to set the values of "IEnumeration" type nodes in the camera device XML. For CL and CXP devices, please refer to the interface: SciCam_SetEnumValueByStringEx.
 	def SciCam_SetEnumValueByString(self, key, val):
-		SciCamCtrlDll.SciCam_SetEnumValueByString.argtypes = (ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p)
-		SciCamCtrlDll.SciCam_SetEnumValueByString.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_SetEnumValueByString(self.handle, key.encode('ascii'), val.encode('ascii'))
+		return _fnSciCam_SetEnumValueByString(self.handle, key.encode('ascii'), val.encode('ascii'))
 
 	## @ingroup module_Node
 	#  @~chinese
@@ -738,9 +749,7 @@ class SciCamera():
 	#  @remarks After the device is connected, call this interface to set specified Command nodes. For value of strKey, see MvCameraNode. The node values of ICommand can be set through this interface, strKey value corresponds to the Name column.
 	#  		This interface is only used to set the values of "ICommand" type nodes in the camera device XML. For CL and CXP devices, please refer to the interface: SciCam_SetCommandValueEx.
 	def SciCam_SetCommandValue(self, key):
-		SciCamCtrlDll.SciCam_SetCommandValue.argtypes = (ctypes.c_void_p, ctypes.c_void_p)
-		SciCamCtrlDll.SciCam_SetCommandValue.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_SetCommandValue(self.handle, key.encode('ascii'))
+		return _fnSciCam_SetCommandValue(self.handle, key.encode('ascii'))
 
 	## @ingroup module_Node
 	#  @~chinese
@@ -760,11 +769,9 @@ class SciCamera():
 	#  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 	#  @remarks Retrieve the collection of all nodes for the currently connected device. When the nodes parameter is empty, it defaults to only returning the current number of nodes.
 	def SciCam_GetNodes(self, nodes, nodesCount):
-		SciCamCtrlDll.SciCam_GetNodes.argtypes = (ctypes.c_void_p, PSCI_CAM_NODE, ctypes.c_void_p)
-		SciCamCtrlDll.SciCam_GetNodes.restype = ctypes.c_uint
-		if nodes == None:
-			return SciCamCtrlDll.SciCam_GetNodes(self.handle, nodes, ctypes.byref(nodesCount))
-		return SciCamCtrlDll.SciCam_GetNodes(self.handle, ctypes.byref(nodes), ctypes.byref(nodesCount))
+		if nodes is None:
+			return _fnSciCam_GetNodes(self.handle, nodes, ctypes.byref(nodesCount))
+		return _fnSciCam_GetNodes(self.handle, ctypes.byref(nodes), ctypes.byref(nodesCount))
 
 	## @ingroup module_Node
 	#  @~chinese
@@ -784,9 +791,7 @@ class SciCamera():
 	#  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 	#  @remarks NULL
 	def SciCam_GetNodeType(self, key, pType):
-		SciCamCtrlDll.SciCam_GetNodeType.argtypes = (ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p)
-		SciCamCtrlDll.SciCam_GetNodeType.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_GetNodeType(self.handle, key.encode('ascii'), ctypes.byref(pType))
+		return _fnSciCam_GetNodeType(self.handle, key.encode('ascii'), ctypes.byref(pType))
 
 	## @ingroup module_Node
 	#  @~chinese
@@ -806,9 +811,7 @@ class SciCamera():
 	#  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 	#  @remarks NULL
 	def SciCam_GetNodeNameSpace(self, key, pNameSpace):
-		SciCamCtrlDll.SciCam_GetNodeNameSpace.argtypes = (ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p)
-		SciCamCtrlDll.SciCam_GetNodeNameSpace.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_GetNodeNameSpace(self.handle, key.encode('ascii'), ctypes.byref(pNameSpace))
+		return _fnSciCam_GetNodeNameSpace(self.handle, key.encode('ascii'), ctypes.byref(pNameSpace))
 
 	## @ingroup module_Node
 	#  @~chinese
@@ -828,9 +831,7 @@ class SciCamera():
 	#  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 	#  @remarks NULL
 	def SciCam_GetNodeVisibility(self, key, pVisibility):
-		SciCamCtrlDll.SciCam_GetNodeVisibility.argtypes = (ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p)
-		SciCamCtrlDll.SciCam_GetNodeVisibility.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_GetNodeVisibility(self.handle, key.encode('ascii'), ctypes.byref(pVisibility))
+		return _fnSciCam_GetNodeVisibility(self.handle, key.encode('ascii'), ctypes.byref(pVisibility))
 
 	## @ingroup module_Node
 	#  @~chinese
@@ -850,9 +851,7 @@ class SciCamera():
 	#  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 	#  @remarks NULL
 	def SciCam_GetNodeAccessMode(self, key, pAccessMode):
-		SciCamCtrlDll.SciCam_GetNodeAccessMode.argtypes = (ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p)
-		SciCamCtrlDll.SciCam_GetNodeAccessMode.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_GetNodeAccessMode(self.handle, key.encode('ascii'), ctypes.byref(pAccessMode))
+		return _fnSciCam_GetNodeAccessMode(self.handle, key.encode('ascii'), ctypes.byref(pAccessMode))
 	
 	## @ingroup module_DeviceAttributeManipulation
 	#  @~chinese
@@ -870,9 +869,7 @@ class SciCamera():
 	#  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 	#  @remarks After connecting the device, call this interface to export the device attribute to a local XML file. strFileName is the path and name of the exported XML.
 	def SciCam_FeatureSave(self, strFileName):
-		SciCamCtrlDll.SciCam_FeatureSave.argtypes = (ctypes.c_void_p, ctypes.c_void_p)
-		SciCamCtrlDll.SciCam_FeatureSave.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_FeatureSave(self.handle, strFileName.encode('ascii'))
+		return _fnSciCam_FeatureSave(self.handle, strFileName.encode('ascii'))
 	
 	## @ingroup module_DeviceAttributeManipulation
 	#  @~chinese
@@ -888,9 +885,7 @@ class SciCamera():
 	#  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 	#  @remarks After connecting the device, call this interface to import the device attribute from a local XML file. strFileName is the path and name of the imported XML.
 	def SciCam_FeatureLoad(self, strFileName):
-		SciCamCtrlDll.SciCam_FeatureLoad.argtypes = (ctypes.c_void_p, ctypes.c_void_p)
-		SciCamCtrlDll.SciCam_FeatureLoad.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_FeatureLoad(self.handle, strFileName.encode('ascii'))
+		return _fnSciCam_FeatureLoad(self.handle, strFileName.encode('ascii'))
 
 	## @ingroup module_Node
 	#  @~chinese
@@ -914,9 +909,7 @@ class SciCamera():
 	#  @remarks You can call this API to get the value of camera node with integer type after connecting the device. For key value, refer to MvCameraNode. All the node values of "IInteger" in the list can be obtained via this API. Key corresponds to the Name column. \n
 	#  		You can retrieve the values of "IInteger" type nodes in the device XML based on different XML types. For example, for a CL capture card, the xmlType would be SciCamDeviceXmlType::SciCam_DeviceXml_Card.
 	def SciCam_GetIntValueEx(self, xmlType, key, pVal):
-		SciCamCtrlDll.SciCam_GetIntValueEx.argtypes = (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, PSCI_NODE_VAL_INT)
-		SciCamCtrlDll.SciCam_GetIntValueEx.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_GetIntValueEx(self.handle, ctypes.c_int(xmlType), key.encode('ascii'), ctypes.byref(pVal))
+		return _fnSciCam_GetIntValueEx(self.handle, xmlType, key.encode('ascii'), ctypes.byref(pVal))
 
 	## @ingroup module_Node
 	#  @~chinese
@@ -940,9 +933,7 @@ class SciCamera():
 	#  @remarks You can call this API to get the value of camera node with integer type after connecting the device. For key value, refer to MvCameraNode. All the node values of "IInteger" in the list can be obtained via this API. Key corresponds to the Name column. \n
 	#  		You can set the values of "IInteger" type nodes in the device XML based on different XML types. For example, for a CL capture card, the xmlType would be SciCamDeviceXmlType::SciCam_DeviceXml_Card.
 	def SciCam_SetIntValueEx(self, xmlType, key, val):
-		SciCamCtrlDll.SciCam_SetIntValueEx.argtypes = (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_int64)
-		SciCamCtrlDll.SciCam_SetIntValueEx.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_SetIntValueEx(self.handle, ctypes.c_int(xmlType), key.encode('ascii'), ctypes.c_int64(val))
+		return _fnSciCam_SetIntValueEx(self.handle, xmlType, key.encode('ascii'), val)
 
 	## @ingroup module_Node
 	#  @~chinese
@@ -966,9 +957,7 @@ class SciCamera():
 	#  @remarks After the device is connected, call this interface to get specified float node. For detailed key value see: MvCameraNode. The node values of IFloat can be obtained through this interface, key value corresponds to the Name column. \n
 	#  		You can retrieve the values of "IFloat" type nodes in the device XML based on different XML types. For example, for a CL capture card, the xmlType would be SciCamDeviceXmlType::SciCam_DeviceXml_Card.
 	def SciCam_GetFloatValueEx(self, xmlType, key, pVal):
-		SciCamCtrlDll.SciCam_GetFloatValueEx.argtypes = (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, PSCI_NODE_VAL_FLOAT)
-		SciCamCtrlDll.SciCam_GetFloatValueEx.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_GetFloatValueEx(self.handle, ctypes.c_int(xmlType), key.encode('ascii'), ctypes.byref(pVal))
+		return _fnSciCam_GetFloatValueEx(self.handle, xmlType, key.encode('ascii'), ctypes.byref(pVal))
 
 	## @ingroup module_Node
 	#  @~chinese
@@ -992,9 +981,7 @@ class SciCamera():
 	#  @remarks After the device is connected, call this interface to set specified float node. For detailed key value see: MvCameraNode. The node values of IFloat can be set through this interface, key value corresponds to the Name column. \n
 	#  		You can set the values of "IFloat" type nodes in the device XML based on different XML types. For example, for a CL capture card, the xmlType would be SciCamDeviceXmlType::SciCam_DeviceXml_Card.
 	def SciCam_SetFloatValueEx(self, xmlType, key, val):
-		SciCamCtrlDll.SciCam_SetFloatValueEx.argtypes = (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_double)
-		SciCamCtrlDll.SciCam_SetFloatValueEx.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_SetFloatValueEx(self.handle, ctypes.c_int(xmlType), key.encode('ascii'), ctypes.c_double(val))
+		return _fnSciCam_SetFloatValueEx(self.handle, xmlType, key.encode('ascii'), val)
 
 	## @ingroup module_Node
 	#  @~chinese
@@ -1018,9 +1005,7 @@ class SciCamera():
 	#  @remarks After the device is connected, call this interface to get specified bool nodes. For value of key, see MvCameraNode. The node values of IBoolean can be obtained through this interface, key value corresponds to the Name column. \n
 	#  		You can retrieve the values of "IFloat" type nodes in the device XML based on different XML types. For example, for a CL capture card, the xmlType would be SciCamDeviceXmlType::SciCam_DeviceXml_Card.
 	def SciCam_GetBoolValueEx(self, xmlType, key, pVal):
-		SciCamCtrlDll.SciCam_GetBoolValueEx.argtypes = (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p)
-		SciCamCtrlDll.SciCam_GetBoolValueEx.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_GetBoolValueEx(self.handle, ctypes.c_int(xmlType), key.encode('ascii'), ctypes.byref(pVal))
+		return _fnSciCam_GetBoolValueEx(self.handle, xmlType, key.encode('ascii'), ctypes.byref(pVal))
 
 	## @ingroup module_Node
 	#  @~chinese
@@ -1044,9 +1029,7 @@ class SciCamera():
 	#  @remarks After the device is connected, call this interface to set specified bool nodes. For value of key, see MvCameraNode. The node values of IBoolean can be set through this interface, key value corresponds to the Name column. \n
 	#  		You can set the values of "IBoolean" type nodes in the device XML based on different XML types. For example, for a CL capture card, the xmlType would be SciCamDeviceXmlType::SciCam_DeviceXml_Card.
 	def SciCam_SetBoolValueEx(self, xmlType, key, val):
-		SciCamCtrlDll.SciCam_SetBoolValueEx.argtypes = (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_bool)
-		SciCamCtrlDll.SciCam_SetBoolValueEx.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_SetBoolValueEx(self.handle, ctypes.c_int(xmlType), key.encode('ascii'), ctypes.c_bool(val))
+		return _fnSciCam_SetBoolValueEx(self.handle, xmlType, key.encode('ascii'), val)
 
 	## @ingroup module_Node
 	#  @~chinese
@@ -1070,9 +1053,7 @@ class SciCamera():
 	#  @remarks After the device is connected, call this interface to get specified string nodes. For value of key, see MvCameraNode. The node values of IString can be obtained through this interface, key value corresponds to the Name column. \n
 	#  		You can retrieve the values of "IString" type nodes in the device XML based on different XML types. For example, for a CL capture card, the xmlType would be SciCamDeviceXmlType::SciCam_DeviceXml_Card.
 	def SciCam_GetStringValueEx(self, xmlType, key, pVal):
-		SciCamCtrlDll.SciCam_GetStringValueEx.argtypes = (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, PSCI_NODE_VAL_STRING)
-		SciCamCtrlDll.SciCam_GetStringValueEx.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_GetStringValueEx(self.handle, ctypes.c_int(xmlType), key.encode('ascii'), ctypes.byref(pVal))
+		return _fnSciCam_GetStringValueEx(self.handle, xmlType, key.encode('ascii'), ctypes.byref(pVal))
 
 	## @ingroup module_Node
 	#  @~chinese
@@ -1096,9 +1077,7 @@ class SciCamera():
 	#  @remarks After the device is connected, call this interface to set specified string nodes. For value of key, see MvCameraNode. The node values of IString can be set through this interface, key value corresponds to the Name column.
 	#  		You can set the values of "IString" type nodes in the device XML based on different XML types. For example, for a CL capture card, the xmlType would be SciCamDeviceXmlType::SciCam_DeviceXml_Card.
 	def SciCam_SetStringValueEx(self, xmlType, key, val):
-		SciCamCtrlDll.SciCam_SetStringValueEx.argtypes = (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p)
-		SciCamCtrlDll.SciCam_SetStringValueEx.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_SetStringValueEx(self.handle, ctypes.c_int(xmlType), key.encode('ascii'), val.encode('ascii'))
+		return _fnSciCam_SetStringValueEx(self.handle, xmlType, key.encode('ascii'), val.encode('ascii'))
 
 	## @ingroup module_Node
 	#  @~chinese
@@ -1122,9 +1101,7 @@ class SciCamera():
 	#  @remarks After the device is connected, call this interface to get specified Enum nodes. For value of key, see MvCameraNode, The node values of IEnumeration can be obtained through this interface, key value corresponds to the Name column. \n
 	#  		You can retrieve the values of "IEnumeration" type nodes in the device XML based on different XML types. For example, for a CL capture card, the xmlType would be SciCamDeviceXmlType::SciCam_DeviceXml_Card.
 	def SciCam_GetEnumValueEx(self, xmlType, key, pVal):
-		SciCamCtrlDll.SciCam_GetEnumValueEx.argtypes = (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, PSCI_NODE_VAL_ENUM)
-		SciCamCtrlDll.SciCam_GetEnumValueEx.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_GetEnumValueEx(self.handle, ctypes.c_int(xmlType), key.encode('ascii'), ctypes.byref(pVal))
+		return _fnSciCam_GetEnumValueEx(self.handle, xmlType, key.encode('ascii'), ctypes.byref(pVal))
 
 	## @ingroup module_Node
 	#  @~chinese
@@ -1148,9 +1125,7 @@ class SciCamera():
 	#  @remarks After the device is connected, call this interface to get specified Enum nodes. For value of key, see MvCameraNode, The node values of IEnumeration can be obtained through this interface, key value corresponds to the Name column. \n
 	#  		You can set the values of "IEnumeration" type nodes in the device XML based on different XML types. For example, for a CL capture card, the xmlType would be SciCamDeviceXmlType::SciCam_DeviceXml_Card.
 	def SciCam_SetEnumValueEx(self, xmlType, key, val):
-		SciCamCtrlDll.SciCam_SetEnumValueEx.argtypes = (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_int64)
-		SciCamCtrlDll.SciCam_SetEnumValueEx.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_SetEnumValueEx(self.handle, ctypes.c_int(xmlType), key.encode('ascii'), ctypes.c_int64(val))
+		return _fnSciCam_SetEnumValueEx(self.handle, xmlType, key.encode('ascii'), val)
 
 	## @ingroup module_Node
 	#  @~chinese
@@ -1174,9 +1149,7 @@ class SciCamera():
 	#  @remarks After connecting to the device, calling this interface allows you to set the value of a specific node of Enum type. The possible values for the "key" parameter can be referenced from the list of XML node parameter types, where the nodes with data type "IEnumeration" can be set using this interface. The "key" parameter value corresponds to the "Name" column in the list. \n
 	#  		You can set the values of "IEnumeration" type nodes in the device XML based on different XML types. For example, for a CL capture card, the xmlType would be SciCamDeviceXmlType::SciCam_DeviceXml_Card.
 	def SciCam_SetEnumValueByStringEx(self, xmlType, key, val):
-		SciCamCtrlDll.SciCam_SetEnumValueByStringEx.argtypes = (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p)
-		SciCamCtrlDll.SciCam_SetEnumValueByStringEx.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_SetEnumValueByStringEx(self.handle, ctypes.c_int(xmlType), key.encode('ascii'), val.encode('ascii'))
+		return _fnSciCam_SetEnumValueByStringEx(self.handle, xmlType, key.encode('ascii'), val.encode('ascii'))
 
 	## @ingroup module_Node
 	#  @~chinese
@@ -1198,9 +1171,7 @@ class SciCamera():
 	#  @remarks After the device is connected, call this interface to set specified Command nodes. For value of strKey, see MvCameraNode. The node values of ICommand can be set through this interface, strKey value corresponds to the Name column.
 	#  		You can set the values of "ICommand" type nodes in the device XML based on different XML types. For example, for a CL capture card, the xmlType would be SciCamDeviceXmlType::SciCam_DeviceXml_Card.
 	def SciCam_SetCommandValueEx(self, xmlType, key):
-		SciCamCtrlDll.SciCam_SetCommandValueEx.argtypes = (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p)
-		SciCamCtrlDll.SciCam_SetCommandValueEx.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_SetCommandValueEx(self.handle, ctypes.c_int(xmlType), key.encode('ascii'))
+		return _fnSciCam_SetCommandValueEx(self.handle, xmlType, key.encode('ascii'))
 
 	## @ingroup module_Node
 	#  @~chinese
@@ -1222,11 +1193,9 @@ class SciCamera():
 	#  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 	#  @remarks Retrieve the collection of all nodes for the currently connected device.
 	def SciCam_GetNodesEx(self, xmlType, nodes, nodesCount):
-		SciCamCtrlDll.SciCam_GetNodesEx.argtypes = (ctypes.c_void_p, ctypes.c_int, PSCI_CAM_NODE, ctypes.c_void_p)
-		SciCamCtrlDll.SciCam_GetNodesEx.restype = ctypes.c_uint
-		if nodes == None:
-			return SciCamCtrlDll.SciCam_GetNodesEx(self.handle, ctypes.c_int(xmlType), nodes, ctypes.byref(nodesCount))
-		return SciCamCtrlDll.SciCam_GetNodesEx(self.handle, ctypes.c_int(xmlType), ctypes.byref(nodes), ctypes.byref(nodesCount))
+		if nodes is None:
+			return _fnSciCam_GetNodesEx(self.handle, xmlType, nodes, ctypes.byref(nodesCount))
+		return _fnSciCam_GetNodesEx(self.handle, xmlType, ctypes.byref(nodes), ctypes.byref(nodesCount))
 
 	## @ingroup module_Node
 	#  @~chinese
@@ -1248,9 +1217,7 @@ class SciCamera():
 	#  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 	#  @remarks NULL
 	def SciCam_GetNodeTypeEx(self, xmlType, key, pType):
-		SciCamCtrlDll.SciCam_GetNodeTypeEx.argtypes = (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p)
-		SciCamCtrlDll.SciCam_GetNodeTypeEx.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_GetNodeTypeEx(self.handle, ctypes.c_int(xmlType), key.encode('ascii'), ctypes.byref(pType))
+		return _fnSciCam_GetNodeTypeEx(self.handle, xmlType, key.encode('ascii'), ctypes.byref(pType))
 
 	## @ingroup module_Node
 	#  @~chinese
@@ -1272,9 +1239,7 @@ class SciCamera():
 	#  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 	#  @remarks NULL
 	def SciCam_GetNodeNameSpaceEx(self, xmlType, key, pNameSpace):
-		SciCamCtrlDll.SciCam_GetNodeNameSpaceEx.argtypes = (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p)
-		SciCamCtrlDll.SciCam_GetNodeNameSpaceEx.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_GetNodeNameSpaceEx(self.handle, ctypes.c_int(xmlType), key.encode('ascii'), ctypes.byref(pNameSpace))
+		return _fnSciCam_GetNodeNameSpaceEx(self.handle, xmlType, key.encode('ascii'), ctypes.byref(pNameSpace))
 
 	## @ingroup module_Node
 	#  @~chinese
@@ -1296,9 +1261,7 @@ class SciCamera():
 	#  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 	#  @remarks NULL
 	def SciCam_GetNodeVisibilityEx(self, xmlType, key, pVisibility):
-		SciCamCtrlDll.SciCam_GetNodeVisibilityEx.argtypes = (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p)
-		SciCamCtrlDll.SciCam_GetNodeVisibilityEx.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_GetNodeVisibilityEx(self.handle, ctypes.c_int(xmlType), key.encode('ascii'), ctypes.byref(pVisibility))
+		return _fnSciCam_GetNodeVisibilityEx(self.handle, xmlType, key.encode('ascii'), ctypes.byref(pVisibility))
 
 	## @ingroup module_Node
 	#  @~chinese
@@ -1320,9 +1283,7 @@ class SciCamera():
 	#  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 	#  @remarks NULL
 	def SciCam_GetNodeAccessModeEx(self, xmlType, key, pAccessMode):
-		SciCamCtrlDll.SciCam_GetNodeAccessModeEx.argtypes = (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p)
-		SciCamCtrlDll.SciCam_GetNodeAccessModeEx.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_GetNodeAccessModeEx(self.handle, ctypes.c_int(xmlType), key.encode('ascii'), ctypes.byref(pAccessMode))
+		return _fnSciCam_GetNodeAccessModeEx(self.handle, xmlType, key.encode('ascii'), ctypes.byref(pAccessMode))
 
 	## @ingroup module_DeviceAttributeManipulation
 	#  @~chinese
@@ -1343,9 +1304,7 @@ class SciCamera():
 	#  @remarks After connecting the device, call this interface to export the device attribute to a local XML file. strFileName is the path and name of the exported XML.
 	#           xmlType is the type of the exported XML file, supporting CL and CXP devices.
 	def SciCam_FeatureSaveEx(self, xmlType, strFileName):
-		SciCamCtrlDll.SciCam_FeatureSaveEx.argtypes = (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p)
-		SciCamCtrlDll.SciCam_FeatureSaveEx.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_FeatureSaveEx(self.handle, ctypes.c_int(xmlType), strFileName.encode('ascii'))
+		return _fnSciCam_FeatureSaveEx(self.handle, xmlType, strFileName.encode('ascii'))
 	
 	## @ingroup module_DeviceAttributeManipulation
 	#  @~chinese
@@ -1366,9 +1325,7 @@ class SciCamera():
 	#  @remarks After connecting the device, call this interface to import the device attribute from a local XML file. strFileName is the path and name of the imported XML.
 	#           xmlType is the type of the imported XML file, supporting CL and CXP devices.
 	def SciCam_FeatureLoadEx(self, xmlType, strFileName):
-		SciCamCtrlDll.SciCam_FeatureLoadEx.argtypes = (ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p)
-		SciCamCtrlDll.SciCam_FeatureLoadEx.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_FeatureLoadEx(self.handle, ctypes.c_int(xmlType), strFileName.encode('ascii'))
+		return _fnSciCam_FeatureLoadEx(self.handle, xmlType, strFileName.encode('ascii'))
 
 	## @ingroup module_Other
 	#  @~chinese
@@ -1391,9 +1348,7 @@ class SciCamera():
 	#  @remarks
 	@staticmethod
 	def SciCam_Gige_ModifyCamIp(sn, ip, mask, gateway):
-		SciCamCtrlDll.SciCam_Gige_ModifyCamIp.argtypes = (ctypes.c_void_p, ctypes.c_uint, ctypes.c_uint, ctypes.c_uint)
-		SciCamCtrlDll.SciCam_Gige_ModifyCamIp.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_Gige_ModifyCamIp(sn.encode('ascii'), ctypes.c_uint(ip), ctypes.c_uint(mask), ctypes.c_uint(gateway))
+		return _fnSciCam_Gige_ModifyCamIp(sn.encode('ascii'), ip, mask, gateway)
 
 	## @ingroup module_Other
 	#  @~chinese
@@ -1416,9 +1371,7 @@ class SciCamera():
 	#  @remarks
 	@staticmethod
 	def SciCam_Gige_ModifyCamIpEx(sn, ip, mask, gateway):
-		SciCamCtrlDll.SciCam_Gige_ModifyCamIpEx.argtypes = (ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p)
-		SciCamCtrlDll.SciCam_Gige_ModifyCamIpEx.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_Gige_ModifyCamIpEx(sn.encode('ascii'), ip.encode('ascii'), mask.encode('ascii'), gateway.encode('ascii'))
+		return _fnSciCam_Gige_ModifyCamIpEx(sn.encode('ascii'), ip.encode('ascii'), mask.encode('ascii'), gateway.encode('ascii'))
 
 	## @ingroup module_DeviceInitAndDestr
 	#  @~chinese
@@ -1434,9 +1387,7 @@ class SciCamera():
 	#  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 	#  @remarks Operations can only be performed on cameras connected to the CL capture card.
 	def SciCam_CL_OpenCam(self):
-		SciCamCtrlDll.SciCam_CL_OpenCam.argtype = ctypes.c_void_p
-		SciCamCtrlDll.SciCam_CL_OpenCam.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_CL_OpenCam(self.handle)
+		return _fnSciCam_CL_OpenCam(self.handle)
 
 	## @ingroup module_DeviceInitAndDestr
 	#  @~chinese
@@ -1452,9 +1403,7 @@ class SciCamera():
 	#  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 	#  @remarks Operations can only be performed on cameras connected to the CL capture card.
 	def SciCam_CL_CloseCam(self):
-		SciCamCtrlDll.SciCam_CL_CloseCam.argtype = ctypes.c_void_p
-		SciCamCtrlDll.SciCam_CL_CloseCam.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_CL_CloseCam(self.handle)
+		return _fnSciCam_CL_CloseCam(self.handle)
 
 	## @ingroup module_DeviceInitAndDestr
 	#  @~chinese
@@ -1470,9 +1419,7 @@ class SciCamera():
 	#  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 	#  @remarks Operations can only be performed on cameras connected to the CL capture card.
 	def SciCam_CL_IsCamOpen(self):
-		SciCamCtrlDll.SciCam_CL_IsCamOpen.argtype = ctypes.c_void_p
-		SciCamCtrlDll.SciCam_CL_IsCamOpen.restype = ctypes.c_bool
-		return SciCamCtrlDll.SciCam_CL_IsCamOpen(self.handle)
+		return _fnSciCam_CL_IsCamOpen(self.handle)
 
 	## @ingroup module_Grab
 	#  @~chinese
@@ -1490,9 +1437,7 @@ class SciCamera():
 	#  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 	#  @remarks NULL
 	def SciCam_LP3D_SetGrabType(self, mode):
-		SciCamCtrlDll.SciCam_LP3D_SetGrabType.argtypes = (ctypes.c_void_p, ctypes.c_int)
-		SciCamCtrlDll.SciCam_LP3D_SetGrabType.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_LP3D_SetGrabType(self.handle, ctypes.c_int(mode))
+		return _fnSciCam_LP3D_SetGrabType(self.handle, mode)
 
 	## @ingroup module_Grab
 	#  @~chinese
@@ -1510,9 +1455,7 @@ class SciCamera():
 	#  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 	#  @remarks NULL
 	def SciCam_StartRecord(self, recordInfo):
-		SciCamCtrlDll.SciCam_StartRecord.argtypes = (ctypes.c_void_p, PSCI_RECORD_INFO)
-		SciCamCtrlDll.SciCam_StartRecord.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_StartRecord(self.handle, ctypes.byref(recordInfo))
+		return _fnSciCam_StartRecord(self.handle, ctypes.byref(recordInfo))
 
 	## @ingroup module_Grab
 	#  @~chinese
@@ -1530,9 +1473,7 @@ class SciCamera():
 	#  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 	#  @remarks NULL
 	def SciCam_InputOneFrame(self, payload):
-		SciCamCtrlDll.SciCam_InputOneFrame.argtypes = (ctypes.c_void_p, ctypes.c_void_p)
-		SciCamCtrlDll.SciCam_InputOneFrame.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_InputOneFrame(self.handle, payload)
+		return _fnSciCam_InputOneFrame(self.handle, payload)
 
 	## @ingroup module_Grab
 	#  @~chinese
@@ -1548,9 +1489,7 @@ class SciCamera():
 	#  @retval Other references: @ref SciCamErrorDefine.h "Error Code List"
 	#  @remarks NULL
 	def SciCam_StopRecord(self):
-		SciCamCtrlDll.SciCam_StopRecord.argtype = ctypes.c_void_p
-		SciCamCtrlDll.SciCam_StopRecord.restype = ctypes.c_uint
-		return SciCamCtrlDll.SciCam_StopRecord(self.handle)
+		return _fnSciCam_StopRecord(self.handle)
 
 class CameraOperation:
 	def __init__(self, obj_cam, currentCam):
@@ -1565,3 +1504,10 @@ class CameraOperation:
 		#SciCam_Grab
 	def Start_Grabbing(self):
 		reVal = self.obj_cam.SciCam_StartGrabbing()
+
+## @~chinese
+#  @brief ģģʽʹSciCam_simеSciCameraSciCam_Payload_*ʵ
+#  @~english
+#  @brief In simulation mode SciCamera and the SciCam_Payload_* functions come from SciCam_sim
+if SCICAM_SIMULATE:
+	from SciCam_sim import *
@@ -0,0 +1,1434 @@
+"""Simulated SciCam backend for running without a camera or the SDK library.
+
+Set SCICAM_SIMULATE=1 and SciCam_class exports the SciCamera class and the
+SciCam_Payload_* functions from this module instead of the ctypes wrappers,
+so camera.py, camera_setting.py and everything above them run unchanged on a
+plain machine. The simulated devices stream synthetic 2D frames generated
+from a moving test pattern.
+
+Configuration (environment, or configure_simulation() before opening):
+    SCICAM_SIM_WIDTH, SCICAM_SIM_HEIGHT  sensor size (default 2448 x 2048)
+    SCICAM_SIM_PIXEL_FORMAT              Mono8, Mono12p, BayerRG8/GR8/GB8/BG8 or RGB8
+    SCICAM_SIM_FPS                       frame rate in free-run mode (default 30)
+    SCICAM_SIM_JITTER_MS                 standard deviation of frame timing jitter
+    SCICAM_SIM_DROP_RATE                 probability that a frame is lost (0..1)
+    SCICAM_SIM_DEVICES                   number of discovered devices (default 1)
+    SCICAM_SIM_RECORD_MS                 time SciCam_InputOneFrame takes per frame
+    SCICAM_SIM_SL3D                      1: payloads also carry SL3D striped targets
+
+With ChunkModeActive set, each payload carries Timestamp, ExposureTime,
+Gain and LineStatusAll chunks (IDs in SIM_CHUNK_IDS) for the enabled
+ChunkSelector entries.
+
+The recorder writes the raw frames back to back instead of an AVI, so
+recording can be exercised but the file is not playable.
+
+With SL3D on, every payload also carries a striped-light point cloud
+(Width x Height XYZ float32, invalid points zero) and the left 2D image
+for SciCam_Payload_SL3D_GetMeta/GetData.
+
+After SciCam_LP3D_SetGrabType(Contour) each payload is one laser profile
+of Width points across a synthetic surface with periodic dropouts;
+BatchContour payloads carry Height profiles at once. Profiles are grouped
+into frames of SIM_LP3D_FRAME_LINES (LP3D meta index/finished).
+
+Lost frames still consume a frameID, so consumers see the same gaps a real
+link would produce. CameraLink and LP3D image calls return
+SCI_ERR_CAMERA_NOT_SUPPORT.
+"""
+import os
+import time
+import random
+import struct
+import threading
+import collections
+import ctypes
+import numpy as np
+
+from SciCamErrorDefine_const import *
+from SciCamPayload_header import *
+from SciCamInfo_header import *
+
+__all__ = [
+    'SciCamera',
+    'SciCam_Payload_GetAttribute', 'SciCam_Payload_GetAttributeEx', 'SciCam_Payload_GetImage',
+    'SciCam_Payload_GetChunkList', 'SciCam_Payload_ConvertImage', 'SciCam_Payload_ConvertImageEx',
+    'SciCam_Payload_SaveImage', 'SciCam_Payload_LP3D_GetMeta', 'SciCam_Payload_LP3D_GetImage',
+    'SciCam_Payload_LP3D_GetPointCounts', 'SciCam_Payload_LP3D_GetContour', 'SciCam_Payload_LP3D_GetGray',
+    'SciCam_Payload_SL3D_GetMeta', 'SciCam_Payload_SL3D_GetData',
+    'SimulationConfig', 'sim_config', 'configure_simulation', 'SIM_CHUNK_IDS',
+]
+
+SIM_SDK_VERSION = 0x01000000
+SIM_MODEL_NAME = "SciCam-Sim"
+
+# Raw formats the simulated sensor can stream
+SUPPORTED_PIXEL_TYPES = [
+    SciCamPixelType.Mono8, SciCamPixelType.Mono12p, SciCamPixelType.RGB8,
+    SciCamPixelType.BayerRG8, SciCamPixelType.BayerGR8,
+    SciCamPixelType.BayerGB8, SciCamPixelType.BayerBG8,
+]
+
+# Chunk IDs the simulated camera uses, and how each value is packed
+SIM_CHUNK_IDS = {
+    "Timestamp": 0x0001,
+    "ExposureTime": 0x0002,
+    "Gain": 0x0003,
+    "LineStatusAll": 0x0004,
+}
+SIM_CHUNK_FORMATS = {
+    "Timestamp": "<Q",
+    "ExposureTime": "<d",
+    "Gain": "<d",
+    "LineStatusAll": "<I",
+}
+
+# Profiles per LP3D frame in contour mode
+SIM_LP3D_FRAME_LINES = 256
+
+# NumPy type of each LP3D contour data type
+_CONTOUR_DTYPES = {
+    SciCamPayloadDataType.SciCam_Payload_DataType_UCHAR: np.uint8,
+    SciCamPayloadDataType.SciCam_Payload_DataType_CHAR: np.int8,
+    SciCamPayloadDataType.SciCam_Payload_DataType_USHORT: np.uint16,
+    SciCamPayloadDataType.SciCam_Payload_DataType_SHORT: np.int16,
+    SciCamPayloadDataType.SciCam_Payload_DataType_INT: np.int32,
+    SciCamPayloadDataType.SciCam_Payload_DataType_FLOAT: np.float32,
+    SciCamPayloadDataType.SciCam_Payload_DataType_DOUBLE: np.float64,
+}
+
+# Bayer layouts as ((red row, red col), (blue row, blue col)) inside a 2x2 cell
+BAYER_LAYOUTS = {
+    SciCamPixelType.BayerRG8: ((0, 0), (1, 1)),
+    SciCamPixelType.BayerGR8: ((0, 1), (1, 0)),
+    SciCamPixelType.BayerGB8: ((1, 0), (0, 1)),
+    SciCamPixelType.BayerBG8: ((1, 1), (0, 0)),
+}
+
+# Distinct pattern frames cycled through while streaming
+PATTERN_PHASES = 8
+
+
+class SimulationConfig:
+    """Parameters of the simulated devices"""
+
+    def __init__(self, width=2448, height=2048, pixel_format="Mono8", fps=30.0,
+                 jitter_ms=0.0, drop_rate=0.0, devices=1, record_ms=0.0, sl3d=False):
+        self.width = width
+        self.height = height
+        self.pixel_format = pixel_format
+        self.fps = fps
+        self.jitter_ms = jitter_ms
+        self.drop_rate = drop_rate
+        self.devices = devices
+        self.record_ms = record_ms
+        self.sl3d = sl3d
+
+    @classmethod
+    def from_env(cls):
+        env = os.environ
+        return cls(
+            width=int(env.get('SCICAM_SIM_WIDTH', 2448)),
+            height=int(env.get('SCICAM_SIM_HEIGHT', 2048)),
+            pixel_format=env.get('SCICAM_SIM_PIXEL_FORMAT', "Mono8"),
+            fps=float(env.get('SCICAM_SIM_FPS', 30.0)),
+            jitter_ms=float(env.get('SCICAM_SIM_JITTER_MS', 0.0)),
+            drop_rate=float(env.get('SCICAM_SIM_DROP_RATE', 0.0)),
+            devices=int(env.get('SCICAM_SIM_DEVICES', 1)),
+            record_ms=float(env.get('SCICAM_SIM_RECORD_MS', 0.0)),
+            sl3d=env.get('SCICAM_SIM_SL3D', "0") == "1",
+        )
+
+    @property
+    def pixel_type(self):
+        pixel_type = getattr(SciCamPixelType, self.pixel_format, None)
+        if pixel_type not in SUPPORTED_PIXEL_TYPES:
+            raise ValueError(f"Unsupported simulated pixel format: {self.pixel_format}")
+        return pixel_type
+
+
+sim_config = SimulationConfig.from_env()
+
+
+def configure_simulation(**kwargs):
+    """Change the simulation parameters; devices opened afterwards pick them up"""
+    for name, value in kwargs.items():
+        if not hasattr(sim_config, name):
+            raise AttributeError(f"Unknown simulation parameter: {name}")
+        setattr(sim_config, name, value)
+
+
+# ---------------------------------------------------------------------- pixels
+
+def _pixel_size(pixel_type, width, height):
+    """Raw payload size in bytes"""
+    if pixel_type == SciCamPixelType.Mono12p:
+        return width * height * 3 // 2
+    if pixel_type in (SciCamPixelType.RGB8, SciCamPixelType.BGR8):
+        return width * height * 3
+    return width * height
+
+
+def _render_pattern(width, height, offset_x, offset_y, phase, seed):
+    """RGB test pattern in sensor coordinates, so ROI crops line up with full frames"""
+    ax = np.arange(offset_x, offset_x + width, dtype=np.int32)
+    ay = np.arange(offset_y, offset_y + height, dtype=np.int32)
+    shift = phase * 32 + seed * 64
+    r = ((ax[None, :] + shift) % 256 * 3 // 4 + ay[:, None] % 256 // 4).astype(np.uint8)
+    g = np.broadcast_to(((ay[:, None] // 64 + ax[None, :] // 64 + phase) % 2 * 160 + 48).astype(np.uint8),
+                        (height, width))
+    b = (255 - r).astype(np.uint8)
+    return np.dstack((r, g, b))
+
+
+def _encode(rgb, pixel_type):
+    """Raw sensor bytes for an RGB image"""
+    if pixel_type == SciCamPixelType.RGB8:
+        return np.ascontiguousarray(rgb).reshape(-1)
+
+    if pixel_type in BAYER_LAYOUTS:
+        (ry, rx), (by, bx) = BAYER_LAYOUTS[pixel_type]
+        raw = np.empty(rgb.shape[:2], dtype=np.uint8)
+        raw[ry::2, rx::2] = rgb[ry::2, rx::2, 0]
+        raw[ry::2, bx::2] = rgb[ry::2, bx::2, 1]
+        raw[by::2, rx::2] = rgb[by::2, rx::2, 1]
+        raw[by::2, bx::2] = rgb[by::2, bx::2, 2]
+        return raw.reshape(-1)
+
+    mono = _luma(rgb)
+    if pixel_type == SciCamPixelType.Mono12p:
+        # 12-bit samples, two pixels packed LSB first into three bytes
+        p = mono.reshape(-1).astype(np.uint16)
+        p = (p << 4) | (p >> 4)
+        p0, p1 = p[0::2], p[1::2]
+        packed = np.empty((p0.size, 3), dtype=np.uint8)
+        packed[:, 0] = p0 & 0xFF
+        packed[:, 1] = (p0 >> 8) | ((p1 & 0x0F) << 4)
+        packed[:, 2] = p1 >> 4
+        return packed.reshape(-1)
+    return mono.reshape(-1)
+
+
+def _luma(rgb):
+    r, g, b = (rgb[..., i].astype(np.uint16) for i in range(3))
+    return ((r * 77 + g * 150 + b * 29) >> 8).astype(np.uint8)
+
+
+def _decode(src, width, height, pixel_type):
+    """Raw bytes to ('mono', HxW) or ('rgb', HxWx3). Returns None for unknown formats."""
+    if pixel_type == SciCamPixelType.Mono8:
+        return 'mono', src.reshape(height, width)
+
+    if pixel_type == SciCamPixelType.Mono12p:
+        b = src.reshape(-1, 3).astype(np.uint16)
+        mono = np.empty(b.shape[0] * 2, dtype=np.uint16)
+        mono[0::2] = b[:, 0] | ((b[:, 1] & 0x0F) << 8)
+        mono[1::2] = (b[:, 1] >> 4) | (b[:, 2] << 4)
+        return 'mono', (mono >> 4).astype(np.uint8).reshape(height, width)
+
+    if pixel_type in BAYER_LAYOUTS:
+        # Nearest-neighbour demosaic over 2x2 cells
+        (ry, rx), (by, bx) = BAYER_LAYOUTS[pixel_type]
+        raw = src.reshape(height, width)
+        cell = np.empty((height // 2, width // 2, 3), dtype=np.uint8)
+        cell[..., 0] = raw[ry::2, rx::2]
+        cell[..., 1] = ((raw[ry::2, bx::2].astype(np.uint16) + raw[by::2, rx::2]) >> 1).astype(np.uint8)
+        cell[..., 2] = raw[by::2, bx::2]
+        return 'rgb', cell.repeat(2, axis=0).repeat(2, axis=1)
+
+    if pixel_type == SciCamPixelType.RGB8:
+        return 'rgb', src.reshape(height, width, 3)
+    if pixel_type == SciCamPixelType.BGR8:
+        return 'rgb', src.reshape(height, width, 3)[..., ::-1]
+    return None
+
+
+def _as_address(buffer):
+    """Address of a ctypes array, c_void_p or plain int"""
+    if buffer is None:
+        return 0
+    if isinstance(buffer, int):
+        return buffer
+    if isinstance(buffer, ctypes.c_void_p):
+        return buffer.value or 0
+    return ctypes.addressof(buffer)
+
+
+def _view(address, size):
+    return np.frombuffer((ctypes.c_ubyte * size).from_address(address), dtype=np.uint8)
+
+
+def _write_text(array, text):
+    data = text.encode('ascii')[:len(array) - 1]
+    for i, ch in enumerate(data):
+        array[i] = ch
+    array[len(data)] = 0
+
+
+# -------------------------------------------------------------------- payloads
+
+class _SimPayload:
+    """A delivered frame; its address is what SciCam_Grab hands out"""
+
+    def __init__(self, camera, buffer, size, attr):
+        self.camera = camera
+        self.buffer = buffer
+        self.size = size
+        self.attr = attr
+        self.address = ctypes.addressof(attr)
+        self.chunks = []  # (chunk id, ctypes buffer)
+        self.lp3d = None  # (z float32 with NaN for invalid points, gray uint8, meta) of a contour payload
+        self.sl3d = None  # target data type -> (array, SCI_CAM_SL3D_DATA)
+
+
+_payloads = {}
+_payloads_lock = threading.Lock()
+
+
+def _register(payload):
+    with _payloads_lock:
+        _payloads[payload.address] = payload
+    return payload.address
+
+
+def _lookup(payload):
+    with _payloads_lock:
+        return _payloads.get(_as_address(payload))
+
+
+def _unregister(payload):
+    with _payloads_lock:
+        return _payloads.pop(_as_address(payload), None)
+
+
+# ----------------------------------------------------------------------- nodes
+
+class _Node:
+    def __init__(self, name, node_type, value=None, access=SciCamNodeAccessMode.SciCam_NodeAccessMode_RW,
+                 level=2, minimum=None, maximum=None, inc=None, items=None, locked_while_grabbing=False):
+        self.name = name
+        self.type = node_type
+        self.value = value
+        self.access = access
+        self.level = level
+        self.min = minimum
+        self.max = maximum
+        self.inc = inc
+        self.items = items or []
+        self.locked_while_grabbing = locked_while_grabbing
+
+
+def _build_nodes(serial, config):
+    """Node map of a simulated area-scan camera, in GetNodes order"""
+    T = SciCamNodeType
+    RO = SciCamNodeAccessMode.SciCam_NodeAccessMode_RO
+    WO = SciCamNodeAccessMode.SciCam_NodeAccessMode_WO
+    pixel_items = [(int(pt), pt.name) for pt in SUPPORTED_PIXEL_TYPES]
+    width, height = config.width, config.height
+    return [
+        _Node("Root", T.SciCam_NodeType_Category, level=0),
+        _Node("DeviceControl", T.SciCam_NodeType_Category, level=1),
+        _Node("DeviceModelName", T.SciCam_NodeType_String, SIM_MODEL_NAME, RO),
+        _Node("DeviceSerialNumber", T.SciCam_NodeType_String, serial, RO),
+        _Node("DeviceUserID", T.SciCam_NodeType_String, ""),
+        _Node("ImageFormatControl", T.SciCam_NodeType_Category, level=1),
+        _Node("SensorWidth", T.SciCam_NodeType_Int, width, RO, minimum=width, maximum=width, inc=1),
+        _Node("SensorHeight", T.SciCam_NodeType_Int, height, RO, minimum=height, maximum=height, inc=1),
+        _Node("Width", T.SciCam_NodeType_Int, width, minimum=8, maximum=width, inc=8, locked_while_grabbing=True),
+        _Node("Height", T.SciCam_NodeType_Int, height, minimum=8, maximum=height, inc=8, locked_while_grabbing=True),
+        _Node("OffsetX", T.SciCam_NodeType_Int, 0, minimum=0, maximum=width - 8, inc=8, locked_while_grabbing=True),
+        _Node("OffsetY", T.SciCam_NodeType_Int, 0, minimum=0, maximum=height - 8, inc=8, locked_while_grabbing=True),
+        _Node("PixelFormat", T.SciCam_NodeType_Enum, int(config.pixel_type), items=pixel_items,
+              locked_while_grabbing=True),
+        # Width/Height/Offset stay in sensor pixels; the delivered image is divided by the binning
+        _Node("BinningHorizontal", T.SciCam_NodeType_Int, 1, minimum=1, maximum=4, inc=1, locked_while_grabbing=True),
+        _Node("BinningVertical", T.SciCam_NodeType_Int, 1, minimum=1, maximum=4, inc=1, locked_while_grabbing=True),
+        _Node("AcquisitionControl", T.SciCam_NodeType_Category, level=1),
+        _Node("AcquisitionFrameRate", T.SciCam_NodeType_Float, float(config.fps),
+              minimum=0.1, maximum=1000.0, inc=0.0),
+        _Node("ExposureTime", T.SciCam_NodeType_Float, 10000.0, minimum=10.0, maximum=1000000.0, inc=0.0),
+        _Node("TriggerMode", T.SciCam_NodeType_Enum, 0, items=[(0, "Off"), (1, "On")]),
+        _Node("TriggerSource", T.SciCam_NodeType_Enum, 0, items=[(0, "Software"), (1, "Line0")]),
+        _Node("TriggerSoftware", T.SciCam_NodeType_Cmd, access=WO),
+        _Node("AnalogControl", T.SciCam_NodeType_Category, level=1),
+        _Node("Gain", T.SciCam_NodeType_Float, 0.0, minimum=0.0, maximum=24.0, inc=0.0),
+        _Node("ChunkDataControl", T.SciCam_NodeType_Category, level=1),
+        _Node("ChunkModeActive", T.SciCam_NodeType_Bool, False, locked_while_grabbing=True),
+        _Node("ChunkSelector", T.SciCam_NodeType_Enum, 0, items=list(enumerate(SIM_CHUNK_IDS))),
+        _Node("ChunkEnable", T.SciCam_NodeType_Bool, False),
+        _Node("TimestampLatch", T.SciCam_NodeType_Cmd, access=WO),
+        _Node("TimestampLatchValue", T.SciCam_NodeType_Int, 0, RO, minimum=0, maximum=2 ** 63 - 1, inc=1),
+    ]
+
+
+# ---------------------------------------------------------------------- camera
+
+class SciCamera():
+    """Simulated counterpart of SciCam_class.SciCamera (same method surface)"""
+
+    fnOnPayload = ctypes.CFUNCTYPE(None, ctypes.c_void_p, ctypes.c_void_p)
+
+    def __init__(self):
+        self._handle = ctypes.c_void_p()
+        self.handle = ctypes.pointer(self._handle)
+
+        self._device_index = None
+        self._serial = None
+        self._opened = False
+        self._grabbing = False
+        self._nodes = {}
+        self._node_order = []
+        self._cond = threading.Condition()
+        self._queue = collections.deque()
+        self._free_buffers = []
+        self._strategy = SciCamGrabStrategy.SciCam_GrabStrategy_OneByOne
+        self._timeout = 1000
+        self._buffer_count = 8
+        self._payload_callback = None
+        self._payload_tag = None
+        self._auto_free = True
+        self._event_callback = None
+        self._thread = None
+        self._stop = threading.Event()
+        self._triggers = 0
+        self._frame_id = 0
+        self._patterns = {}
+        self._chunk_enabled = set()  # ChunkSelector entries with ChunkEnable set
+        self._record_file = None
+        self._record_size = None
+        self._lp3d_mode = SciCamLp3dGrabMode.SciCam_GrabMode_LP3D_None
+        self._lp3d_line = 0
+
+        # Link-level counters for load tests
+        self.frames_generated = 0
+        self.frames_lost = 0
+        self.frames_overwritten = 0
+
+    # ------------------------------------------------------------ device setup
+
+    @staticmethod
+    def SciCam_GetSDKVersion():
+        return SIM_SDK_VERSION
+
+    @staticmethod
+    def SciCam_SetSDKLogPath(logPath):
+        return SCI_CAMERA_OK
+
+    @staticmethod
+    def SciCam_DiscoveryDevices(devInfos, tlType):
+        devInfos.count = 0
+        if tlType and not tlType & SciCamTLType.SciCam_TLType_Gige:
+            return SCI_CAMERA_OK
+
+        for i in range(min(sim_config.devices, 256)):
+            dev = devInfos.pDevInfo[i]
+            ctypes.memset(ctypes.addressof(dev), 0, ctypes.sizeof(dev))
+            dev.tlType = SciCamTLType.SciCam_TLType_Gige
+            dev.devType = SciCamDeviceType.SciCam_DeviceType_2D
+            gige = dev.info.gigeInfo
+            _write_text(gige.name, f"{SIM_MODEL_NAME}-{i}")
+            _write_text(gige.manufactureName, "Simulated")
+            _write_text(gige.modelName, SIM_MODEL_NAME)
+            _write_text(gige.version, "1.0.0")
+            _write_text(gige.serialNumber, f"SIM{i:05d}")
+            # 192.168.1.(100 + i) in the byte order the SDK reports
+            gige.ip = struct.unpack("<I", bytes((192, 168, 1, 100 + i % 150)))[0]
+            gige.mask = struct.unpack("<I", bytes((255, 255, 255, 0)))[0]
+            for j, b in enumerate((0x02, 0x53, 0x49, 0x4D, 0x00, i % 256)):
+                gige.mac[j] = b
+        devInfos.count = min(sim_config.devices, 256)
+        return SCI_CAMERA_OK
+
+    def SciCam_CreateDevice(self, devInfo):
+        serial = bytes(devInfo.info.gigeInfo.serialNumber).split(b'\0', 1)[0].decode('ascii', 'ignore')
+        if not serial.startswith("SIM") or not serial[3:].isdigit():
+            return SCI_ERR_CAMERA_NOT_FOUND
+        index = int(serial[3:])
+        if index >= sim_config.devices:
+            return SCI_ERR_CAMERA_NOT_FOUND
+        self._device_index = index
+        self._serial = serial
+        self._handle.value = 0x5C1C0000 + index
+        return SCI_CAMERA_OK
+
+    def SciCam_DeleteDevice(self):
+        if self._opened:
+            self.SciCam_CloseDevice()
+        self._device_index = None
+        self._serial = None
+        self._handle.value = None
+        return SCI_CAMERA_OK
+
+    def SciCam_RegisterEventCallback(self, CallBackFun, tag):
+        self._event_callback = (CallBackFun, tag)
+        return SCI_CAMERA_OK
+
+    def SciCam_OpenDevice(self):
+        if self._device_index is None:
+            return SCI_ERR_CAMERA_INCORRECT_INIT_OBJECT
+        if self._opened:
+            return SCI_ERR_CAMERA_ALLREADY_OPEN
+        nodes = _build_nodes(self._serial, sim_config)
+        self._nodes = {node.name: node for node in nodes}
+        self._node_order = nodes
+        self._frame_id = 0
+        self._patterns = {}
+        self._chunk_enabled = set()
+        self._opened = True
+        return SCI_CAMERA_OK
+
+    def SciCam_CloseDevice(self):
+        if not self._opened:
+            return SCI_ERR_CAMERA_NOT_OPEN
+        if self._grabbing:
+            self.SciCam_StopGrabbing()
+        if self._record_file is not None:
+            self.SciCam_StopRecord()
+        self._opened = False
+        self._free_buffers = []
+        self._patterns = {}
+        return SCI_CAMERA_OK
+
+    def SciCam_IsDeviceOpen(self):
+        return self._opened
+
+    # ---------------------------------------------------------------- grabbing
+
+    def SciCam_RegisterPayloadCallBack(self, CallBackFun, tag, autoFree):
+        with self._cond:
+            self._payload_callback = CallBackFun
+            self._payload_tag = tag
+            self._auto_free = bool(autoFree)
+        return SCI_CAMERA_OK
+
+    def SciCam_GetGrabStrategy(self, pStrategy):
+        pStrategy.value = int(self._strategy)
+        return SCI_CAMERA_OK
+
+    def SciCam_SetGrabStrategy(self, grabStrategy):
+        self._strategy = SciCamGrabStrategy(grabStrategy)
+        return SCI_CAMERA_OK
+
+    def SciCam_GetGrabTimeout(self, pTimeout):
+        pTimeout.value = self._timeout
+        return SCI_CAMERA_OK
+
+    def SciCam_SetGrabTimeout(self, timeout):
+        self._timeout = int(timeout)
+        return SCI_CAMERA_OK
+
+    def SciCam_GetGrabBufferCount(self, pBufferCount):
+        pBufferCount.value = self._buffer_count
+        return SCI_CAMERA_OK
+
+    def SciCam_SetGrabBufferCount(self, bufferCount):
+        if bufferCount < 1:
+            return SCI_ERR_CAMERA_PARAM_INVALID
+        if self._grabbing:
+            return SCI_ERR_CAMERA_GRABBING
+        self._buffer_count = int(bufferCount)
+        return SCI_CAMERA_OK
+
+    def SciCam_StartGrabbing(self):
+        if not self._opened:
+            return SCI_ERR_CAMERA_NOT_OPEN
+        if self._grabbing:
+            return SCI_ERR_CAMERA_GRABBING
+        self._stop.clear()
+        self._grabbing = True
+        self._thread = threading.Thread(target=self._stream, name=f"{self._serial}-stream", daemon=True)
+        self._thread.start()
+        return SCI_CAMERA_OK
+
+    def SciCam_StopGrabbing(self):
+        if not self._grabbing:
+            return SCI_ERR_CAMERA_NOT_GRABBING
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+        self._grabbing = False
+        self.SciCam_ClearPayloadBuffer()
+        return SCI_CAMERA_OK
+
+    def SciCam_Grab(self, ppayload):
+        if not self._opened:
+            return SCI_ERR_CAMERA_NOT_OPEN
+        if not self._grabbing:
+            return SCI_ERR_CAMERA_NOT_GRABBING
+
+        with self._cond:
+            if self._strategy == SciCamGrabStrategy.SciCam_GrabStrategy_Upcoming:
+                self._discard_queued()
+
+            self._cond.wait_for(lambda: self._queue or self._stop.is_set(), self._timeout / 1000.0)
+            if not self._queue:
+                if self._stop.is_set():
+                    return SCI_ERR_CAMERA_NOT_GRABBING
+                return SCI_ERR_CAMERA_GRAB_TIMEOUT
+
+            if self._strategy == SciCamGrabStrategy.SciCam_GrabStrategy_Latest:
+                payload = self._queue.pop()
+                self._discard_queued()
+            else:
+                payload = self._queue.popleft()
+
+        ppayload.value = payload.address
+        return SCI_CAMERA_OK
+
+    def SciCam_FreePayload(self, payload):
+        sim_payload = _unregister(payload)
+        if sim_payload is None:
+            return SCI_ERR_CAMERA_PARAM_INVALID
+        sim_payload.camera._recycle(sim_payload)
+        return SCI_CAMERA_OK
+
+    def SciCam_ClearPayloadBuffer(self):
+        with self._cond:
+            self._discard_queued()
+        return SCI_CAMERA_OK
+
+    # ------------------------------------------------------------------- nodes
+
+    def _node(self, xmlType, key, node_type=None):
+        if not self._opened:
+            return SCI_ERR_CAMERA_NOT_OPEN, None
+        if xmlType != SciCamDeviceXmlType.SciCam_DeviceXml_Camera:
+            return SCI_ERR_CAMERA_NODE_XML_TYPE, None
+        node = self._nodes.get(key)
+        if node is None or node.type == SciCamNodeType.SciCam_NodeType_Category:
+            return SCI_ERR_CAMERA_NODE_NAME_INVALID, None
+        if node_type is not None and node.type != node_type:
+            return SCI_ERR_CAMERA_NODE_TYPE_UNMATCH, None
+        return SCI_CAMERA_OK, node
+
+    def _readable(self, xmlType, key, node_type):
+        reVal, node = self._node(xmlType, key, node_type)
+        if reVal == SCI_CAMERA_OK and node.access == SciCamNodeAccessMode.SciCam_NodeAccessMode_WO:
+            return SCI_ERR_CAMERA_NODE_READ_FORBIDDEN, None
+        return reVal, node
+
+    def _writable(self, xmlType, key, node_type):
+        reVal, node = self._node(xmlType, key, node_type)
+        if reVal != SCI_CAMERA_OK:
+            return reVal, None
+        if node.access not in (SciCamNodeAccessMode.SciCam_NodeAccessMode_RW,
+                               SciCamNodeAccessMode.SciCam_NodeAccessMode_WO):
+            return SCI_ERR_CAMERA_NODE_WRITE_FORBIDDEN, None
+        if node.locked_while_grabbing and self._grabbing:
+            return SCI_ERR_CAMERA_NODE_WRITE_FORBIDDEN, None
+        return SCI_CAMERA_OK, node
+
+    def _check_roi(self, key, val):
+        """Keep the ROI inside the sensor"""
+        sensor = {'X': self._nodes['SensorWidth'].value, 'Y': self._nodes['SensorHeight'].value}
+        if key in ('Width', 'OffsetX'):
+            axis, size, offset = 'X', 'Width', 'OffsetX'
+        elif key in ('Height', 'OffsetY'):
+            axis, size, offset = 'Y', 'Height', 'OffsetY'
+        else:
+            return True
+        size_val = val if key == size else self._nodes[size].value
+        offset_val = val if key == offset else self._nodes[offset].value
+        return size_val + offset_val <= sensor[axis]
+
+    def SciCam_GetIntValueEx(self, xmlType, key, pVal):
+        reVal, node = self._readable(xmlType, key, SciCamNodeType.SciCam_NodeType_Int)
+        if reVal != SCI_CAMERA_OK:
+            return reVal
+        pVal.nVal, pVal.nMin, pVal.nMax, pVal.nInc = node.value, node.min, node.max, node.inc
+        return SCI_CAMERA_OK
+
+    def SciCam_SetIntValueEx(self, xmlType, key, val):
+        reVal, node = self._writable(xmlType, key, SciCamNodeType.SciCam_NodeType_Int)
+        if reVal != SCI_CAMERA_OK:
+            return reVal
+        val = int(val)
+        if not node.min <= val <= node.max or (val - node.min) % node.inc or not self._check_roi(key, val):
+            return SCI_ERR_CAMERA_NODE_VALUE
+        node.value = val
+        return SCI_CAMERA_OK
+
+    def SciCam_GetFloatValueEx(self, xmlType, key, pVal):
+        reVal, node = self._readable(xmlType, key, SciCamNodeType.SciCam_NodeType_Float)
+        if reVal != SCI_CAMERA_OK:
+            return reVal
+        pVal.dVal, pVal.dMin, pVal.dMax, pVal.dInc = node.value, node.min, node.max, node.inc
+        return SCI_CAMERA_OK
+
+    def SciCam_SetFloatValueEx(self, xmlType, key, val):
+        reVal, node = self._writable(xmlType, key, SciCamNodeType.SciCam_NodeType_Float)
+        if reVal != SCI_CAMERA_OK:
+            return reVal
+        if not node.min <= val <= node.max:
+            return SCI_ERR_CAMERA_NODE_VALUE
+        node.value = float(val)
+        return SCI_CAMERA_OK
+
+    def SciCam_GetBoolValueEx(self, xmlType, key, pVal):
+        reVal, node = self._readable(xmlType, key, SciCamNodeType.SciCam_NodeType_Bool)
+        if reVal != SCI_CAMERA_OK:
+            return reVal
+        if key == "ChunkEnable":
+            pVal.value = self._chunk_selector() in self._chunk_enabled
+        else:
+            pVal.value = bool(node.value)
+        return SCI_CAMERA_OK
+
+    def SciCam_SetBoolValueEx(self, xmlType, key, val):
+        reVal, node = self._writable(xmlType, key, SciCamNodeType.SciCam_NodeType_Bool)
+        if reVal != SCI_CAMERA_OK:
+            return reVal
+        if key == "ChunkEnable":
+            # ChunkEnable is indexed by ChunkSelector
+            if val:
+                self._chunk_enabled.add(self._chunk_selector())
+            else:
+                self._chunk_enabled.discard(self._chunk_selector())
+        else:
+            node.value = bool(val)
+        return SCI_CAMERA_OK
+
+    def _chunk_selector(self):
+        node = self._nodes['ChunkSelector']
+        return dict(node.items)[node.value]
+
+    def SciCam_GetStringValueEx(self, xmlType, key, pVal):
+        reVal, node = self._readable(xmlType, key, SciCamNodeType.SciCam_NodeType_String)
+        if reVal != SCI_CAMERA_OK:
+            return reVal
+        pVal.val = node.value.encode('ascii')
+        return SCI_CAMERA_OK
+
+    def SciCam_SetStringValueEx(self, xmlType, key, val):
+        reVal, node = self._writable(xmlType, key, SciCamNodeType.SciCam_NodeType_String)
+        if reVal != SCI_CAMERA_OK:
+            return reVal
+        node.value = val
+        return SCI_CAMERA_OK
+
+    def SciCam_GetEnumValueEx(self, xmlType, key, pVal):
+        reVal, node = self._readable(xmlType, key, SciCamNodeType.SciCam_NodeType_Enum)
+        if reVal != SCI_CAMERA_OK:
+            return reVal
+        pVal.nVal = node.value
+        pVal.itemCount = len(node.items)
+        for i, (value, desc) in enumerate(node.items):
+            pVal.items[i].val = value
+            pVal.items[i].desc = desc.encode('ascii')
+        return SCI_CAMERA_OK
+
+    def SciCam_SetEnumValueEx(self, xmlType, key, val):
+        reVal, node = self._writable(xmlType, key, SciCamNodeType.SciCam_NodeType_Enum)
+        if reVal != SCI_CAMERA_OK:
+            return reVal
+        if int(val) not in [value for value, _ in node.items]:
+            return SCI_ERR_CAMERA_NODE_VALUE
+        node.value = int(val)
+        return SCI_CAMERA_OK
+
+    def SciCam_SetEnumValueByStringEx(self, xmlType, key, val):
+        reVal, node = self._writable(xmlType, key, SciCamNodeType.SciCam_NodeType_Enum)
+        if reVal != SCI_CAMERA_OK:
+            return reVal
+        for value, desc in node.items:
+            if desc == val:
+                node.value = value
+                return SCI_CAMERA_OK
+        return SCI_ERR_CAMERA_NODE_VALUE
+
+    def SciCam_SetCommandValueEx(self, xmlType, key):
+        reVal, node = self._writable(xmlType, key, SciCamNodeType.SciCam_NodeType_Cmd)
+        if reVal != SCI_CAMERA_OK:
+            return reVal
+        if key == "TriggerSoftware":
+            with self._cond:
+                self._triggers += 1
+                self._cond.notify_all()
+        elif key == "TimestampLatch":
+            self._nodes['TimestampLatchValue'].value = time.perf_counter_ns()
+        return SCI_CAMERA_OK
+
+    def SciCam_GetNodesEx(self, xmlType, nodes, nodesCount):
+        if not self._opened:
+            return SCI_ERR_CAMERA_NOT_OPEN
+        if xmlType != SciCamDeviceXmlType.SciCam_DeviceXml_Camera:
+            return SCI_ERR_CAMERA_NODE_XML_TYPE
+        if nodes is None:
+            nodesCount.value = len(self._node_order)
+            return SCI_CAMERA_OK
+        if nodesCount.value < len(self._node_order):
+            return SCI_ERR_CAMERA_INSUFFICIENT_MEMORY_LENGTH
+
+        array = (SCI_CAM_NODE * len(self._node_order)).from_address(ctypes.addressof(nodes))
+        for dst, node in zip(array, self._node_order):
+            dst.type = node.type
+            dst.nameSpace = SciCamNodeNameSpace.SciCam_NodeNameSpace_Standard
+            dst.visibility = SciCamNodeVisibility.SciCam_NodeVisibility_Beginner
+            dst.accessMode = node.access
+            dst.level = node.level
+            dst.name = node.name.encode('ascii')
+            dst.desc = node.name.encode('ascii')
+        nodesCount.value = len(self._node_order)
+        return SCI_CAMERA_OK
+
+    def SciCam_GetNodeTypeEx(self, xmlType, key, pType):
+        reVal, node = self._node(xmlType, key)
+        if reVal == SCI_CAMERA_OK:
+            pType.value = node.type
+        return reVal
+
+    def SciCam_GetNodeNameSpaceEx(self, xmlType, key, pNameSpace):
+        reVal, node = self._node(xmlType, key)
+        if reVal == SCI_CAMERA_OK:
+            pNameSpace.value = SciCamNodeNameSpace.SciCam_NodeNameSpace_Standard
+        return reVal
+
+    def SciCam_GetNodeVisibilityEx(self, xmlType, key, pVisibility):
+        reVal, node = self._node(xmlType, key)
+        if reVal == SCI_CAMERA_OK:
+            pVisibility.value = SciCamNodeVisibility.SciCam_NodeVisibility_Beginner
+        return reVal
+
+    def SciCam_GetNodeAccessModeEx(self, xmlType, key, pAccessMode):
+        reVal, node = self._node(xmlType, key)
+        if reVal == SCI_CAMERA_OK:
+            pAccessMode.value = node.access
+        return reVal
+
+    def SciCam_FeatureSaveEx(self, xmlType, strFileName):
+        if not self._opened:
+            return SCI_ERR_CAMERA_NOT_OPEN
+        try:
+            with open(strFileName, 'w') as f:
+                for node in self._node_order:
+                    if node.access == SciCamNodeAccessMode.SciCam_NodeAccessMode_RW and node.value is not None:
+                        f.write(f"{node.name}\t{node.value}\n")
+        except OSError:
+            return SCI_ERR_CAMERA_FILE_OPEN_FAILED
+        return SCI_CAMERA_OK
+
+    def SciCam_FeatureLoadEx(self, xmlType, strFileName):
+        if not self._opened:
+            return SCI_ERR_CAMERA_NOT_OPEN
+        try:
+            with open(strFileName) as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return SCI_ERR_CAMERA_FILE_OPEN_FAILED
+
+        setters = {
+            SciCamNodeType.SciCam_NodeType_Int: lambda key, v: self.SciCam_SetIntValueEx(xmlType, key, int(v)),
+            SciCamNodeType.SciCam_NodeType_Float: lambda key, v: self.SciCam_SetFloatValueEx(xmlType, key, float(v)),
+            SciCamNodeType.SciCam_NodeType_Bool: lambda key, v: self.SciCam_SetBoolValueEx(xmlType, key, v == "True"),
+            SciCamNodeType.SciCam_NodeType_Enum: lambda key, v: self.SciCam_SetEnumValueEx(xmlType, key, int(v)),
+            SciCamNodeType.SciCam_NodeType_String: lambda key, v: self.SciCam_SetStringValueEx(xmlType, key, v),
+        }
+        result = SCI_CAMERA_OK
+        for line in lines:
+            key, _, value = line.partition('\t')
+            node = self._nodes.get(key)
+            if node is None or node.type not in setters:
+                continue
+            reVal = setters[node.type](key, value)
+            if reVal != SCI_CAMERA_OK:
+                result = reVal
+        return result
+
+    # Non-Ex node accessors address the camera XML, as in the SDK
+    def SciCam_GetIntValue(self, key, pVal):
+        return self.SciCam_GetIntValueEx(SciCamDeviceXmlType.SciCam_DeviceXml_Camera, key, pVal)
+
+    def SciCam_SetIntValue(self, key, val):
+        return self.SciCam_SetIntValueEx(SciCamDeviceXmlType.SciCam_DeviceXml_Camera, key, val)
+
+    def SciCam_GetFloatValue(self, key, pVal):
+        return self.SciCam_GetFloatValueEx(SciCamDeviceXmlType.SciCam_DeviceXml_Camera, key, pVal)
+
+    def SciCam_SetFloatValue(self, key, val):
+        return self.SciCam_SetFloatValueEx(SciCamDeviceXmlType.SciCam_DeviceXml_Camera, key, val)
+
+    def SciCam_GetBoolValue(self, key, pVal):
+        return self.SciCam_GetBoolValueEx(SciCamDeviceXmlType.SciCam_DeviceXml_Camera, key, pVal)
+
+    def SciCam_SetBoolValue(self, key, val):
+        return self.SciCam_SetBoolValueEx(SciCamDeviceXmlType.SciCam_DeviceXml_Camera, key, val)
+
+    def SciCam_GetStringValue(self, key, pVal):
+        return self.SciCam_GetStringValueEx(SciCamDeviceXmlType.SciCam_DeviceXml_Camera, key, pVal)
+
+    def SciCam_SetStringValue(self, key, val):
+        return self.SciCam_SetStringValueEx(SciCamDeviceXmlType.SciCam_DeviceXml_Camera, key, val)
+
+    def SciCam_GetEnumValue(self, key, pVal):
+        return self.SciCam_GetEnumValueEx(SciCamDeviceXmlType.SciCam_DeviceXml_Camera, key, pVal)
+
+    def SciCam_SetEnumValue(self, key, val):
+        return self.SciCam_SetEnumValueEx(SciCamDeviceXmlType.SciCam_DeviceXml_Camera, key, val)
+
+    def SciCam_SetEnumValueByString(self, key, val):
+        return self.SciCam_SetEnumValueByStringEx(SciCamDeviceXmlType.SciCam_DeviceXml_Camera, key, val)
+
+    def SciCam_SetCommandValue(self, key):
+        return self.SciCam_SetCommandValueEx(SciCamDeviceXmlType.SciCam_DeviceXml_Camera, key)
+
+    def SciCam_GetNodes(self, nodes, nodesCount):
+        return self.SciCam_GetNodesEx(SciCamDeviceXmlType.SciCam_DeviceXml_Camera, nodes, nodesCount)
+
+    def SciCam_GetNodeType(self, key, pType):
+        return self.SciCam_GetNodeTypeEx(SciCamDeviceXmlType.SciCam_DeviceXml_Camera, key, pType)
+
+    def SciCam_GetNodeNameSpace(self, key, pNameSpace):
+        return self.SciCam_GetNodeNameSpaceEx(SciCamDeviceXmlType.SciCam_DeviceXml_Camera, key, pNameSpace)
+
+    def SciCam_GetNodeVisibility(self, key, pVisibility):
+        return self.SciCam_GetNodeVisibilityEx(SciCamDeviceXmlType.SciCam_DeviceXml_Camera, key, pVisibility)
+
+    def SciCam_GetNodeAccessMode(self, key, pAccessMode):
+        return self.SciCam_GetNodeAccessModeEx(SciCamDeviceXmlType.SciCam_DeviceXml_Camera, key, pAccessMode)
+
+    def SciCam_FeatureSave(self, strFileName):
+        return self.SciCam_FeatureSaveEx(SciCamDeviceXmlType.SciCam_DeviceXml_Camera, strFileName)
+
+    def SciCam_FeatureLoad(self, strFileName):
+        return self.SciCam_FeatureLoadEx(SciCamDeviceXmlType.SciCam_DeviceXml_Camera, strFileName)
+
+    # ------------------------------------------------------------ unsupported
+
+    @staticmethod
+    def SciCam_Gige_ModifyCamIp(sn, ip, mask, gateway):
+        return SCI_CAMERA_OK
+
+    @staticmethod
+    def SciCam_Gige_ModifyCamIpEx(sn, ip, mask, gateway):
+        return SCI_CAMERA_OK
+
+    def SciCam_CL_OpenCam(self):
+        return SCI_ERR_CAMERA_NOT_SUPPORT
+
+    def SciCam_CL_CloseCam(self):
+        return SCI_ERR_CAMERA_NOT_SUPPORT
+
+    def SciCam_CL_IsCamOpen(self):
+        return False
+
+    def SciCam_LP3D_SetGrabType(self, mode):
+        if not self._opened:
+            return SCI_ERR_CAMERA_NOT_OPEN
+        if self._grabbing:
+            return SCI_ERR_CAMERA_GRABBING
+        if mode not in (SciCamLp3dGrabMode.SciCam_GrabMode_LP3D_None,
+                        SciCamLp3dGrabMode.SciCam_GrabMode_LP3D_Contour,
+                        SciCamLp3dGrabMode.SciCam_GrabMode_LP3D_BatchContour):
+            return SCI_ERR_CAMERA_NOT_SUPPORT
+        self._lp3d_mode = mode
+        self._lp3d_line = 0
+        return SCI_CAMERA_OK
+
+    def SciCam_StartRecord(self, recordInfo):
+        if not self._opened:
+            return SCI_ERR_CAMERA_NOT_OPEN
+        if self._record_file is not None:
+            return SCI_ERR_CAMERA_FUNCTION_CONFLICT
+        if (recordInfo.formatType != SciRecordFormatType.SciRecordFormatType_AVI or not recordInfo.strFilePath
+                or recordInfo.width == 0 or recordInfo.height == 0 or recordInfo.frameRate <= 0):
+            return SCI_ERR_CAMERA_PARAM_INVALID
+        try:
+            self._record_file = open(recordInfo.strFilePath.decode('utf-8'), 'wb')
+        except OSError:
+            return SCI_ERR_CAMERA_PARAM_INVALID
+        self._record_size = (recordInfo.width, recordInfo.height, recordInfo.pixelType)
+        return SCI_CAMERA_OK
+
+    def SciCam_InputOneFrame(self, payload):
+        if self._record_file is None:
+            return SCI_ERR_CAMERA_FUNCTION_CONFLICT
+        sim_payload = _lookup(payload)
+        if sim_payload is None:
+            return SCI_ERR_CAMERA_PARAM_INVALID
+        imgAttr = sim_payload.attr.imgAttr
+        if (imgAttr.width, imgAttr.height, imgAttr.pixelType) != self._record_size:
+            return SCI_ERR_CAMERA_PARAM_INVALID
+        if sim_config.record_ms > 0:
+            time.sleep(sim_config.record_ms / 1000.0)
+        self._record_file.write(memoryview(sim_payload.buffer)[:sim_payload.size])
+        return SCI_CAMERA_OK
+
+    def SciCam_StopRecord(self):
+        if self._record_file is None:
+            return SCI_ERR_CAMERA_FUNCTION_CONFLICT
+        self._record_file.close()
+        self._record_file = None
+        return SCI_CAMERA_OK
+
+    # -------------------------------------------------------------- streaming
+
+    def _stream(self):
+        """Producer thread: paces frames like the device and hands them out"""
+        next_time = time.perf_counter()
+        while not self._stop.is_set():
+            if self._nodes['TriggerMode'].value:
+                with self._cond:
+                    if not self._cond.wait_for(lambda: self._triggers or self._stop.is_set(), 0.1):
+                        next_time = time.perf_counter()
+                        continue
+                    if self._stop.is_set():
+                        break
+                    self._triggers -= 1
+                # The frame is read out once the exposure has finished
+                if self._stop.wait(self._nodes['ExposureTime'].value / 1e6):
+                    break
+            else:
+                fps = max(self._nodes['AcquisitionFrameRate'].value, 0.1)
+                next_time += 1.0 / fps
+                jitter = random.gauss(0.0, sim_config.jitter_ms / 1000.0) if sim_config.jitter_ms > 0 else 0.0
+                delay = next_time + jitter - time.perf_counter()
+                if delay > 0 and self._stop.wait(delay):
+                    break
+                if delay < -1.0:
+                    # Consumer stalled the process; do not burst to catch up
+                    next_time = time.perf_counter()
+
+            self._frame_id += 1
+            self.frames_generated += 1
+            if sim_config.drop_rate > 0 and random.random() < sim_config.drop_rate:
+                self.frames_lost += 1
+                continue
+
+            if self._lp3d_mode == SciCamLp3dGrabMode.SciCam_GrabMode_LP3D_None:
+                payload = self._make_payload()
+            else:
+                payload = self._make_contour_payload()
+            self._deliver(payload)
+
+    def _make_payload(self):
+        nodes = self._nodes
+        bin_x, bin_y = nodes['BinningHorizontal'].value, nodes['BinningVertical'].value
+        width, height = nodes['Width'].value // bin_x, nodes['Height'].value // bin_y
+        offset_x, offset_y = nodes['OffsetX'].value // bin_x, nodes['OffsetY'].value // bin_y
+        pixel_type = nodes['PixelFormat'].value
+        raw = self._pattern(width, height, offset_x, offset_y, pixel_type, self._frame_id % PATTERN_PHASES)
+        size = raw.size
+
+        with self._cond:
+            buffer = None
+            while self._free_buffers:
+                candidate = self._free_buffers.pop()
+                if len(candidate) >= size:
+                    buffer = candidate
+                    break
+        if buffer is None:
+            buffer = (ctypes.c_ubyte * size)()
+        ctypes.memmove(buffer, raw.ctypes.data, size)
+
+        attr = SCI_CAM_PAYLOAD_ATTRIBUTE()
+        attr.frameID = self._frame_id
+        attr.isComplete = True
+        attr.timeStamp = time.perf_counter_ns()
+        attr.payloadMode = SciCamPayloadMode.SciCam_PayloadMode_2D
+        attr.imgAttr.width = width
+        attr.imgAttr.height = height
+        attr.imgAttr.offsetX = offset_x
+        attr.imgAttr.offsetY = offset_y
+        attr.imgAttr.pixelType = pixel_type
+
+        payload = _SimPayload(self, buffer, size, attr)
+        if nodes['ChunkModeActive'].value:
+            values = {
+                "Timestamp": attr.timeStamp,
+                "ExposureTime": nodes['ExposureTime'].value,
+                "Gain": nodes['Gain'].value,
+                "LineStatusAll": 1 if nodes['TriggerMode'].value else 0,
+            }
+            for name in SIM_CHUNK_IDS:
+                if name in self._chunk_enabled:
+                    data = struct.pack(SIM_CHUNK_FORMATS[name], values[name])
+                    payload.chunks.append((SIM_CHUNK_IDS[name], ctypes.create_string_buffer(data, len(data))))
+        attr.hasChunk = bool(payload.chunks)
+        if sim_config.sl3d:
+            payload.sl3d = self._sl3d_targets(width, height, offset_x, offset_y, raw, pixel_type)
+        _register(payload)
+        return payload
+
+    def _sl3d_targets(self, width, height, offset_x, offset_y, raw, pixel_type):
+        """Striped-light point cloud of a tilted wavy plate, in mm, plus the left camera image"""
+        u = np.arange(offset_x, offset_x + width, dtype=np.float32)
+        v = np.arange(offset_y, offset_y + height, dtype=np.float32)[:, None]
+        x = np.broadcast_to((u - 1224.0) * 0.1, (height, width))
+        y = np.broadcast_to((v - 1024.0) * 0.1, (height, width))
+        z = 500.0 + 0.02 * x + 3.0 * np.sin(x / 15.0) * np.cos(y / 15.0) + (self._frame_id % 10) * 0.01
+        points = np.ascontiguousarray(np.dstack((x, y, z)), dtype=np.float32)
+        points[((u.astype(np.int64) // 16 + v.astype(np.int64) // 16) % 11 == 0)] = 0.0  # shadowed areas
+
+        targets = {}
+        data = SCI_CAM_SL3D_DATA()
+        data.deviceType = SciCamPayloadSL3DDeviceType.SciCam_payload_SL_DeviceType_Striped
+        data.imageType = SciCamPayloadSL3DTargetDataType.SciCam_payload_SL_Striped_3D
+        data.imageNum = 1
+        data.calculated = 1
+        data.width, data.height, data.channel = width, height, 3
+        data.step = width * 3 * 4
+        data.dataType = SciCamPayloadDataType.SciCam_Payload_DataType_FLOAT
+        valid_z = z[points[..., 2] != 0]
+        data.RangeImageInfo.minValue = float(valid_z.min()) if valid_z.size else 0.0
+        data.RangeImageInfo.maxValue = float(valid_z.max()) if valid_z.size else 0.0
+        data.RangeImageInfo.resolutionX = data.RangeImageInfo.resolutionY = 0.1
+        data.RangeImageInfo.resolutionZ = 1.0
+        data.data = points.ctypes.data
+        targets[data.imageType] = (points, data)
+
+        decoded = _decode(raw, width, height, pixel_type)
+        if decoded is not None:
+            kind, image = decoded
+            left = np.ascontiguousarray(image if kind == 'mono' else _luma(image))
+            data = SCI_CAM_SL3D_DATA()
+            data.deviceType = SciCamPayloadSL3DDeviceType.SciCam_payload_SL_DeviceType_Striped
+            data.imageType = SciCamPayloadSL3DTargetDataType.SciCam_payload_SL_Striped_2D_Left
+            data.imageNum = 1
+            data.pixelFormat = SciCamPixelType.Mono8
+            data.width, data.height, data.channel = width, height, 1
+            data.step = width
+            data.dataType = SciCamPayloadDataType.SciCam_Payload_DataType_UCHAR
+            data.data = left.ctypes.data
+            targets[data.imageType] = (left, data)
+        return targets
+
+    def _make_contour_payload(self):
+        nodes = self._nodes
+        width = nodes['Width'].value
+        batch = self._lp3d_mode == SciCamLp3dGrabMode.SciCam_GrabMode_LP3D_BatchContour
+        lines = nodes['Height'].value if batch else 1
+
+        # Surface height in mm over x and the travel direction, with dropouts where the laser is lost
+        x = np.arange(nodes['OffsetX'].value, nodes['OffsetX'].value + width, dtype=np.float32)
+        y = np.arange(self._lp3d_line, self._lp3d_line + lines, dtype=np.float32)[:, None]
+        z = 5.0 + 2.0 * np.sin(x / 40.0 + y / 25.0) + 0.5 * ((x // 64 + y // 64) % 2)
+        invalid = (x.astype(np.int64) * 7 + y.astype(np.int64) * 3) % 97 < 3
+        z = np.where(invalid, np.nan, z).astype(np.float32)
+        gray = np.where(invalid, 0, 128 + (z - 5.0) * 40).astype(np.uint8)
+
+        meta = SCI_CAM_LP3D_META()
+        meta.version = 1
+        if batch:
+            meta.frameId = self._frame_id
+            meta.index = 0
+            meta.finished = True
+        else:
+            meta.frameId = self._lp3d_line // SIM_LP3D_FRAME_LINES
+            meta.index = self._lp3d_line % SIM_LP3D_FRAME_LINES
+            meta.finished = meta.index == SIM_LP3D_FRAME_LINES - 1
+        self._lp3d_line += lines
+
+        attr = SCI_CAM_PAYLOAD_ATTRIBUTE()
+        attr.frameID = self._frame_id
+        attr.isComplete = True
+        attr.timeStamp = time.perf_counter_ns()
+        attr.payloadMode = (SciCamPayloadMode.SciCam_PayloadMode_LP3D_BatchContour if batch
+                            else SciCamPayloadMode.SciCam_PayloadMode_LP3D_Contour)
+        attr.imgAttr.width = width
+        attr.imgAttr.height = lines
+        attr.imgAttr.pixelType = SciCamPixelType.Mono8
+
+        buffer = (ctypes.c_ubyte * z.nbytes).from_buffer_copy(z)
+        payload = _SimPayload(self, buffer, z.nbytes, attr)
+        payload.lp3d = (z.reshape(-1), np.ascontiguousarray(gray.reshape(-1)), meta)
+        _register(payload)
+        return payload
+
+    def _pattern(self, width, height, offset_x, offset_y, pixel_type, phase):
+        key = (width, height, offset_x, offset_y, pixel_type, phase)
+        raw = self._patterns.get(key)
+        if raw is None:
+            if len(self._patterns) >= PATTERN_PHASES:
+                self._patterns.clear()
+            rgb = _render_pattern(width, height, offset_x, offset_y, phase, self._device_index or 0)
+            raw = np.ascontiguousarray(_encode(rgb, SciCamPixelType(pixel_type)))
+            self._patterns[key] = raw
+        return raw
+
+    def _deliver(self, payload):
+        callback = self._payload_callback
+        if callback is not None:
+            callback(payload.address, self._payload_tag)
+            if self._auto_free:
+                self.SciCam_FreePayload(payload.address)
+            return
+
+        with self._cond:
+            while len(self._queue) >= self._buffer_count:
+                self._release(self._queue.popleft())
+                self.frames_overwritten += 1
+            self._queue.append(payload)
+            self._cond.notify_all()
+
+    def _discard_queued(self):
+        while self._queue:
+            self._release(self._queue.popleft())
+
+    def _release(self, payload):
+        _unregister(payload.address)
+        self._recycle(payload)
+
+    def _recycle(self, payload):
+        with self._cond:
+            if len(self._free_buffers) < self._buffer_count:
+                self._free_buffers.append(payload.buffer)
+
+
+# -------------------------------------------------------------- payload parsing
+
+def SciCam_Payload_GetAttribute(payload, pAttr):
+    sim_payload = _lookup(payload)
+    if sim_payload is None:
+        return SCI_ERR_CAMERA_PARAM_INVALID
+    ctypes.pointer(pAttr)[0] = sim_payload.attr
+    return SCI_CAMERA_OK
+
+
+def SciCam_Payload_GetAttributeEx(payload, pAttr):
+    sim_payload = _lookup(payload)
+    if sim_payload is None:
+        return SCI_ERR_CAMERA_PARAM_INVALID
+    attr = sim_payload.attr
+    nodes = sim_payload.camera._nodes
+    pAttr.frameID = attr.frameID
+    pAttr.isComplete = attr.isComplete
+    pAttr.hasChunk = attr.hasChunk
+    pAttr.payloadMode = attr.payloadMode
+    pAttr.width = attr.imgAttr.width
+    pAttr.height = attr.imgAttr.height
+    pAttr.offsetX = attr.imgAttr.offsetX
+    pAttr.offsetY = attr.imgAttr.offsetY
+    pAttr.paddingX = 0
+    pAttr.paddingY = 0
+    pAttr.pixelType = attr.imgAttr.pixelType
+    pAttr.timeStamp = attr.timeStamp & 0xFFFFFFFF
+    pAttr.counter = attr.frameID & 0xFFFFFFFF
+    pAttr.framecounter = attr.frameID & 0xFFFFFFFF
+    if nodes:
+        pAttr.exposure = nodes['ExposureTime'].value
+        pAttr.gain = nodes['Gain'].value
+    return SCI_CAMERA_OK
+
+
+def SciCam_Payload_GetImage(payload, pImg):
+    sim_payload = _lookup(payload)
+    if sim_payload is None:
+        return SCI_ERR_CAMERA_PARAM_INVALID
+    pImg.value = ctypes.addressof(sim_payload.buffer)
+    return SCI_CAMERA_OK
+
+
+def SciCam_Payload_GetChunkList(payload, pChunkList):
+    sim_payload = _lookup(payload)
+    if sim_payload is None:
+        return SCI_ERR_CAMERA_PARAM_INVALID
+    pChunkList.count = len(sim_payload.chunks)
+    if not sim_payload.chunks:
+        return SCI_ERR_CAMERA_CHUNKDATA_EMPTY
+    for i, (chunk_id, data) in enumerate(sim_payload.chunks):
+        pChunkList.chunk[i].id = chunk_id
+        pChunkList.chunk[i].len = len(data)
+        pChunkList.chunk[i].data = ctypes.addressof(data)
+    return SCI_CAMERA_OK
+
+
+def SciCam_Payload_ConvertImage(imgAttr, srcImg, outType, dstImg, dstImgSize, zoom):
+    return SciCam_Payload_ConvertImageEx(imgAttr, srcImg, outType, dstImg, dstImgSize, zoom, 0)
+
+
+def SciCam_Payload_ConvertImageEx(imgAttr, srcImg, outType, dstImg, dstImgSize, zoom, algorithmType):
+    width, height = int(imgAttr.width), int(imgAttr.height)
+    if outType == SciCamPixelType.Mono8:
+        channels = 1
+    elif outType in (SciCamPixelType.RGB8, SciCamPixelType.BGR8):
+        channels = 3
+    else:
+        return SCI_ERR_CAMERA_IMAGE_TYPE_NOT_SUPPORT
+
+    required = width * height * channels
+    if dstImg is None:
+        dstImgSize.value = required
+        return SCI_CAMERA_OK
+    if dstImgSize.value < required:
+        return SCI_ERR_CAMERA_INSUFFICIENT_MEMORY_LENGTH
+
+    src_address = _as_address(srcImg)
+    if not src_address:
+        return SCI_ERR_CAMERA_PARAM_INVALID
+    decoded = _decode(_view(src_address, _pixel_size(imgAttr.pixelType, width, height)),
+                      width, height, imgAttr.pixelType)
+    if decoded is None:
+        return SCI_ERR_CAMERA_IMAGE_TYPE_NOT_SUPPORT
+
+    kind, image = decoded
+    dst = _view(_as_address(dstImg), required)
+    if channels == 1:
+        dst.reshape(height, width)[...] = image if kind == 'mono' else _luma(image)
+    else:
+        rgb = image[..., None] if kind == 'mono' else image
+        if outType == SciCamPixelType.BGR8 and kind == 'rgb':
+            rgb = rgb[..., ::-1]
+        dst.reshape(height, width, 3)[...] = rgb
+    dstImgSize.value = required
+    return SCI_CAMERA_OK
+
+
+def SciCam_Payload_SaveImage(filePath, pixelType, img, width, height):
+    """Write a Mono8/RGB8/BGR8 image as an uncompressed BMP"""
+    if pixelType == SciCamPixelType.Mono8:
+        channels = 1
+    elif pixelType in (SciCamPixelType.RGB8, SciCamPixelType.BGR8):
+        channels = 3
+    else:
+        return SCI_ERR_CAMERA_IMAGE_TYPE_NOT_SUPPORT
+    if not filePath.lower().endswith('.bmp'):
+        return SCI_ERR_CAMERA_IMAGE_TYPE_NOT_SUPPORT
+
+    width, height = int(width), int(height)
+    pixels = _view(_as_address(img), width * height * channels).reshape(height, width, channels)
+    if channels == 3 and pixelType == SciCamPixelType.RGB8:
+        pixels = pixels[..., ::-1]  # BMP rows are BGR
+
+    row = width * channels
+    stride = (row + 3) & ~3
+    palette = b''.join(struct.pack('<BBBB', i, i, i, 0) for i in range(256)) if channels == 1 else b''
+    offset = 14 + 40 + len(palette)
+    rows = np.zeros((height, stride), dtype=np.uint8)
+    rows[:, :row] = pixels[::-1].reshape(height, row)
+
+    try:
+        with open(filePath, 'wb') as f:
+            f.write(struct.pack('<2sIHHI', b'BM', offset + rows.nbytes, 0, 0, offset))
+            f.write(struct.pack('<IiiHHIIiiII', 40, width, height, 1, channels * 8, 0, rows.nbytes,
+                                2835, 2835, 256 if channels == 1 else 0, 0))
+            f.write(palette)
+            f.write(rows.tobytes())
+    except OSError:
+        return SCI_ERR_CAMERA_IMAGE_SAVE_FAILED
+    return SCI_CAMERA_OK
+
+
+def _lp3d_payload(payload):
+    sim_payload = _lookup(payload)
+    if sim_payload is None:
+        return SCI_ERR_CAMERA_PARAM_INVALID, None
+    if sim_payload.lp3d is None:
+        return SCI_ERR_CAMERA_NOT_SUPPORT, None
+    return SCI_CAMERA_OK, sim_payload.lp3d
+
+
+def SciCam_Payload_LP3D_GetMeta(payload, pMeta):
+    reVal, lp3d = _lp3d_payload(payload)
+    if reVal != SCI_CAMERA_OK:
+        return reVal
+    ctypes.pointer(pMeta)[0] = lp3d[2]
+    return SCI_CAMERA_OK
+
+
+def SciCam_Payload_LP3D_GetImage(payload, pImage):
+    return SCI_ERR_CAMERA_NOT_SUPPORT
+
+
+def SciCam_Payload_LP3D_GetPointCounts(payload, pointCounts):
+    reVal, lp3d = _lp3d_payload(payload)
+    if reVal != SCI_CAMERA_OK:
+        return reVal
+    pointCounts.value = len(lp3d[0])
+    return SCI_CAMERA_OK
+
+
+def SciCam_Payload_LP3D_GetContour(payload, dataType, pContour, invalidValue):
+    """Contour values converted to dataType into the caller's buffer, invalid points set to invalidValue"""
+    reVal, lp3d = _lp3d_payload(payload)
+    if reVal != SCI_CAMERA_OK:
+        return reVal
+    dtype = _CONTOUR_DTYPES.get(dataType)
+    address = _as_address(pContour)
+    if dtype is None or not address:
+        return SCI_ERR_CAMERA_PARAM_INVALID
+
+    z = lp3d[0]
+    dst = np.frombuffer((ctypes.c_ubyte * (len(z) * np.dtype(dtype).itemsize)).from_address(address), dtype=dtype)
+    if np.issubdtype(dtype, np.integer):
+        # Integer contours are in micrometres
+        dst[...] = np.nan_to_num(z * 1000.0, nan=0.0).clip(np.iinfo(dtype).min, np.iinfo(dtype).max)
+    else:
+        dst[...] = z
+    dst[np.isnan(z)] = invalidValue.value
+    return SCI_CAMERA_OK
+
+
+def SciCam_Payload_LP3D_GetGray(payload, pGray):
+    reVal, lp3d = _lp3d_payload(payload)
+    if reVal != SCI_CAMERA_OK:
+        return reVal
+    pGray.value = lp3d[1].ctypes.data
+    return SCI_CAMERA_OK
+
+
+def SciCam_Payload_SL3D_GetMeta(payload, pMeta):
+    sim_payload = _lookup(payload)
+    if sim_payload is None:
+        return SCI_ERR_CAMERA_PARAM_INVALID
+    if sim_payload.sl3d is None:
+        return SCI_ERR_CAMERA_NOT_SUPPORT
+    pMeta.deviceType = SciCamPayloadSL3DDeviceType.SciCam_payload_SL_DeviceType_Striped
+    pMeta.version = 1
+    pMeta.frameId = sim_payload.attr.frameID & 0xffffffff
+    pMeta.finished = True
+    return SCI_CAMERA_OK
+
+
+def SciCam_Payload_SL3D_GetData(payload, tgDataType, pData):
+    """Shallow copy: pData.data points into the payload, valid until it is freed"""
+    sim_payload = _lookup(payload)
+    if sim_payload is None:
+        return SCI_ERR_CAMERA_PARAM_INVALID
+    if sim_payload.sl3d is None or tgDataType not in sim_payload.sl3d:
+        return SCI_ERR_CAMERA_NOT_SUPPORT
+    ctypes.pointer(pData)[0] = sim_payload.sl3d[tgDataType][1]
+    return SCI_CAMERA_OK
+
+
+if __name__ == "__main__":
+    # Throughput check: stream through the regular capture path for a few seconds
+    import sys
+
+    if not SCICAM_SIMULATE:
+        print("Set SCICAM_SIMULATE=1 to run the simulated throughput check")
+        sys.exit(1)
+
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5.0
+    from camera import CameraSession
+
+    session = CameraSession()
+    success, message = session.open()
+    if not success:
+        print(message)
+        sys.exit(1)
+
+    frames = 0
+    last_id = None
+    gaps = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        reVal, frame = session.grab_frame()
+        if reVal != SCI_CAMERA_OK:
+            print(f"Grab failed, error code: {reVal}")
+            continue
+        if last_id is not None and frame.frame_id != last_id + 1:
+            gaps += frame.frame_id - last_id - 1
+        last_id = frame.frame_id
+        frame.release()
+        frames += 1
+    elapsed = time.perf_counter() - start
+
+    camera = session.camera
+    print(f"{sim_config.width}x{sim_config.height} {sim_config.pixel_format} @ {sim_config.fps} fps requested")
+    print(f"Grabbed {frames} frames in {elapsed:.2f}s ({frames / elapsed:.1f} fps), frameID gaps: {gaps}")
+    print(f"Generated {camera.frames_generated}, lost {camera.frames_lost}, "
+          f"overwritten {camera.frames_overwritten}")
+    session.release()
@@ -0,0 +1,253 @@
+import time
+import bisect
+import threading
+import collections
+from SciCam_class import *
+
+
+# Pipeline stages in frame order; any other name may be recorded as well
+PIPELINE_STAGES = (
+    "grab",  # SciCam_Grab call
+    "attribute",  # SciCam_Payload_GetAttribute
+    "convert",  # SciCam_Payload_ConvertImageEx into the frame buffer
+    "downsample",  # preview decimation in the worker
+    "copy",  # pixel copy into the display buffer or an owned frame
+    "deliver",  # frame waiting between worker and UI
+    "paint",  # scaling and pixmap update on the UI thread
+)
+
+# Upper bounds (ms) of the histogram buckets; the last bucket is open
+HISTOGRAM_BOUNDS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250)
+
+
+def _summarise(values, scale=1.0):
+    """mean/p50/p95/p99/max of a sample list (scaled), or None if empty"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    count = len(ordered)
+    return {
+        'mean': sum(ordered) / count * scale,
+        'p50': ordered[count // 2] * scale,
+        'p95': ordered[min(count - 1, int(count * 0.95))] * scale,
+        'p99': ordered[min(count - 1, int(count * 0.99))] * scale,
+        'max': ordered[-1] * scale,
+    }
+
+
+class AcquisitionMetrics:
+    """Rolling per-frame statistics for one camera stream.
+
+    Each delivered frame is recorded with its payload frameID and device
+    timestamp plus whatever was measured for it: the SciCam_Grab call time,
+    the conversion time and the depth of the queue it came through. Gaps in
+    frameID count frames the camera sent but we never received; a frameID
+    that goes backwards (restart or wrap-around) resets the sequence.
+
+    Buffer age estimates how long a frame waited between exposure and
+    delivery, relative to the freshest frame in the window: the host/device
+    clock offset is tracked per frame and the smallest recent offset taken
+    as zero wait, so the camera clock need not be synchronised to the host.
+    """
+
+    def __init__(self, window=300, timestamp_hz=1e9):
+        self.window = window
+        self.timestamp_hz = timestamp_hz  # device timestamp tick rate (1 GHz on most GigE Vision cameras)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Clear all counters, e.g. when grabbing (re)starts"""
+        with self._lock:
+            self.frames = 0
+            self.lost_frames = 0
+            self.gap_events = 0
+            self.restarts = 0
+            self.timeouts = 0
+            self.errors = 0
+            self.last_frame_id = None
+            self._grab_times = collections.deque(maxlen=self.window)
+            self._convert_times = collections.deque(maxlen=self.window)
+            self._queue_depths = collections.deque(maxlen=self.window)
+            self._clock_offsets = collections.deque(maxlen=self.window)
+            self._buffer_ages = collections.deque(maxlen=self.window)
+            self._arrivals = collections.deque(maxlen=self.window)
+
+    def record(self, frame_id, timestamp=None, grab_seconds=None, convert_seconds=None, queue_depth=None):
+        """Record one delivered frame"""
+        arrival = time.perf_counter()
+        with self._lock:
+            self.frames += 1
+            self._arrivals.append(arrival)
+
+            if self.last_frame_id is not None:
+                if frame_id > self.last_frame_id + 1:
+                    self.lost_frames += frame_id - self.last_frame_id - 1
+                    self.gap_events += 1
+                elif frame_id <= self.last_frame_id:
+                    self.restarts += 1
+                    self._clock_offsets.clear()
+            self.last_frame_id = frame_id
+
+            if grab_seconds is not None:
+                self._grab_times.append(grab_seconds)
+            if convert_seconds is not None:
+                self._convert_times.append(convert_seconds)
+            if queue_depth is not None:
+                self._queue_depths.append(queue_depth)
+
+            if timestamp:
+                offset = arrival - timestamp / self.timestamp_hz
+                self._clock_offsets.append(offset)
+                self._buffer_ages.append(offset - min(self._clock_offsets))
+
+    def record_failure(self, reVal):
+        """Record a grab that returned no frame"""
+        with self._lock:
+            if reVal == SCI_ERR_CAMERA_GRAB_TIMEOUT:
+                self.timeouts += 1
+            else:
+                self.errors += 1
+
+    def stats(self):
+        """Snapshot of the counters and rolling statistics (times in ms)"""
+        with self._lock:
+            received = self.frames
+            expected = received + self.lost_frames
+            arrivals = list(self._arrivals)
+            fps = 0.0
+            if len(arrivals) > 1 and arrivals[-1] > arrivals[0]:
+                fps = (len(arrivals) - 1) / (arrivals[-1] - arrivals[0])
+            return {
+                'frames': received,
+                'lost_frames': self.lost_frames,
+                'gap_events': self.gap_events,
+                'drop_rate': self.lost_frames / expected if expected else 0.0,
+                'restarts': self.restarts,
+                'timeouts': self.timeouts,
+                'errors': self.errors,
+                'last_frame_id': self.last_frame_id,
+                'fps': fps,
+                'grab_ms': _summarise(self._grab_times, 1000),
+                'convert_ms': _summarise(self._convert_times, 1000),
+                'buffer_age_ms': _summarise(self._buffer_ages, 1000),
+                'queue_depth': _summarise(self._queue_depths),
+            }
+
+    def summary(self):
+        """Multi-line text for status displays"""
+        stats = self.stats()
+        lines = [f"Frames: {stats['frames']}, lost {stats['lost_frames']} "
+                 f"({stats['drop_rate'] * 100:.2f}%) in {stats['gap_events']} gap(s), "
+                 f"timeouts {stats['timeouts']}, errors {stats['errors']}"]
+        for key, label in (('grab_ms', "Grab"), ('convert_ms', "Convert"), ('buffer_age_ms', "Buffer age")):
+            values = stats[key]
+            if values is not None:
+                lines.append(f"{label}: {values['mean']:.2f} ms mean, p95 {values['p95']:.2f}, "
+                             f"max {values['max']:.2f}")
+        depth = stats['queue_depth']
+        if depth is not None:
+            lines.append(f"Queue depth: {depth['mean']:.1f} mean, max {depth['max']:.0f}")
+        return "\n".join(lines)
+
+
+class PipelineMetrics:
+    """Per-stage timings and queue depths of a frame pipeline.
+
+    add(stage, seconds) records one measurement (see PIPELINE_STAGES);
+    gauge(queue, depth) samples a queue. stats() gives per stage the
+    count, event rate, mean/p50/p95/p99/max in ms and a histogram over
+    HISTOGRAM_BOUNDS_MS, all over the last `window` samples, so e.g. the
+    grab rate and the paint rate of the same stream can be compared.
+    """
+
+    def __init__(self, window=1000):
+        self.window = window
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._stages = {}  # stage -> deque of (time recorded, seconds)
+            self._queues = {}  # queue -> deque of depths
+            self._totals = collections.Counter()
+
+    def add(self, stage, seconds):
+        now = time.perf_counter()
+        with self._lock:
+            samples = self._stages.get(stage)
+            if samples is None:
+                samples = self._stages[stage] = collections.deque(maxlen=self.window)
+            samples.append((now, seconds))
+            self._totals[stage] += 1
+
+    def measure(self, stage):
+        """Context manager timing a block as one sample of stage"""
+        return _StageTimer(self, stage)
+
+    def gauge(self, queue, depth):
+        with self._lock:
+            samples = self._queues.get(queue)
+            if samples is None:
+                samples = self._queues[queue] = collections.deque(maxlen=self.window)
+            samples.append(depth)
+
+    def stats(self):
+        """{'stages': {stage: {...}}, 'queues': {queue: {...}}}, times in ms, stages in pipeline order"""
+        with self._lock:
+            stages = {name: list(samples) for name, samples in self._stages.items()}
+            queues = {name: list(samples) for name, samples in self._queues.items()}
+            totals = dict(self._totals)
+
+        order = [name for name in PIPELINE_STAGES if name in stages]
+        order += sorted(name for name in stages if name not in PIPELINE_STAGES)
+        stage_stats = {}
+        for name in order:
+            samples = stages[name]
+            seconds = [value for _, value in samples]
+            span = samples[-1][0] - samples[0][0]
+            entry = _summarise(seconds, 1000)
+            entry['count'] = totals[name]
+            entry['rate'] = (len(samples) - 1) / span if span > 0 else 0.0
+            entry['histogram'] = _histogram(seconds)
+            stage_stats[name] = entry
+
+        queue_stats = {}
+        for name, depths in queues.items():
+            entry = _summarise(depths)
+            entry['last'] = depths[-1]
+            queue_stats[name] = entry
+        return {'stages': stage_stats, 'queues': queue_stats}
+
+    def summary(self):
+        """Multi-line text, one line per stage and queue"""
+        stats = self.stats()
+        lines = []
+        for name, entry in stats['stages'].items():
+            lines.append(f"{name}: {entry['rate']:.1f}/s, p50 {entry['p50']:.2f} ms, p95 {entry['p95']:.2f}, "
+                         f"p99 {entry['p99']:.2f}, max {entry['max']:.2f}")
+        for name, entry in stats['queues'].items():
+            lines.append(f"{name} queue: {entry['last']} now, p95 {entry['p95']:.0f}, max {entry['max']:.0f}")
+        return "\n".join(lines)
+
+
+class _StageTimer:
+    def __init__(self, metrics, stage):
+        self.metrics = metrics
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.metrics.add(self.stage, time.perf_counter() - self.start)
+        return False
+
+
+def _histogram(seconds):
+    """Sample counts per HISTOGRAM_BOUNDS_MS bucket (one extra bucket for larger values)"""
+    counts = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+    for value in seconds:
+        counts[bisect.bisect_left(HISTOGRAM_BOUNDS_MS, value * 1000)] += 1
+    return counts
@@ -164,6 +164,15 @@ class AnnotationWidget(QWidget):
         # Load existing annotations
         self.load_existing_annotations(path)
 
+    def load_frame(self, frame, path):
+        """Show an in-memory CameraFrame; path is where it is (or will be) saved"""
+        self.pixmap = QPixmap.fromImage(frame.to_qimage())
+        self.current_image_path = path
+        self.update_scaled_pixmap()
+
+        # Load existing annotations
+        self.load_existing_annotations(path)
+
     def resizeEvent(self, event):
         self.update_scaled_pixmap()
 
@@ -0,0 +1,139 @@
+"""Micro-benchmark for the SciCam ctypes wrappers.
+
+Times the per-frame call sequence (grab -> attribute -> image -> convert ->
+free) through the wrappers, which use prototypes bound once at import, and
+through a copy of the old wrappers that reassign argtypes/restype on every
+call. With a camera attached the real sequence is timed; without one the
+same calls are made against a NULL handle so only the ctypes/SDK entry
+overhead is measured.
+
+Usage: python benchmark_sdk_calls.py [iterations]
+"""
+import sys
+import timeit
+
+try:
+    from SciCam_class import *
+except OSError as e:
+    print(f"SciCam SDK library not available, skipping benchmark: {e}")
+    sys.exit(0)
+
+
+def legacy_grab(handle, ppayload):
+    SciCamCtrlDll.SciCam_Grab.argtypes = (ctypes.c_void_p, ctypes.POINTER(ctypes.c_void_p))
+    SciCamCtrlDll.SciCam_Grab.restype = ctypes.c_uint
+    return SciCamCtrlDll.SciCam_Grab(handle, ppayload)
+
+
+def legacy_free_payload(handle, payload):
+    SciCamCtrlDll.SciCam_FreePayload.argtypes = (ctypes.c_void_p, ctypes.c_void_p)
+    SciCamCtrlDll.SciCam_FreePayload.restype = ctypes.c_uint
+    return SciCamCtrlDll.SciCam_FreePayload(handle, payload)
+
+
+def legacy_get_attribute(payload, pAttr):
+    SciCamCtrlDll.SciCam_Payload_GetAttribute.argtypes = (ctypes.c_void_p, PSCI_CAM_PAYLOAD_ATTRIBUTE)
+    SciCamCtrlDll.SciCam_Payload_GetAttribute.restype = ctypes.c_uint
+    return SciCamCtrlDll.SciCam_Payload_GetAttribute(payload, ctypes.byref(pAttr))
+
+
+def legacy_get_image(payload, pImg):
+    SciCamCtrlDll.SciCam_Payload_GetImage.argtypes = (ctypes.c_void_p, ctypes.POINTER(ctypes.c_void_p))
+    SciCamCtrlDll.SciCam_Payload_GetImage.restype = ctypes.c_uint
+    return SciCamCtrlDll.SciCam_Payload_GetImage(payload, pImg)
+
+
+def legacy_convert_image_ex(imgAttr, srcImg, outType, dstImg, dstImgSize, zoom, algorithmType):
+    SciCamCtrlDll.SciCam_Payload_ConvertImageEx.argtypes = (PSCI_CAM_IMAGE_ATTRIBUTE, ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_bool, ctypes.c_int)
+    SciCamCtrlDll.SciCam_Payload_ConvertImageEx.restype = ctypes.c_uint
+    return SciCamCtrlDll.SciCam_Payload_ConvertImageEx(imgAttr, srcImg, ctypes.c_int(outType), dstImg, ctypes.byref(dstImgSize), ctypes.c_bool(zoom), ctypes.c_int(algorithmType))
+
+
+def open_camera():
+    """Open the first device and start grabbing. Returns the camera or None."""
+    devInfos = SCI_DEVICE_INFO_LIST()
+    reVal = SciCamera.SciCam_DiscoveryDevices(devInfos, SciCamTLType.SciCam_TLType_Unkown)
+    if reVal != SCI_CAMERA_OK or devInfos.count == 0:
+        return None
+
+    camera = SciCamera()
+    if camera.SciCam_CreateDevice(devInfos.pDevInfo[0]) != SCI_CAMERA_OK:
+        return None
+    if camera.SciCam_OpenDevice() != SCI_CAMERA_OK:
+        camera.SciCam_DeleteDevice()
+        return None
+    if camera.SciCam_StartGrabbing() != SCI_CAMERA_OK:
+        camera.SciCam_CloseDevice()
+        camera.SciCam_DeleteDevice()
+        return None
+    return camera
+
+
+def close_camera(camera):
+    camera.SciCam_StopGrabbing()
+    camera.SciCam_CloseDevice()
+    camera.SciCam_DeleteDevice()
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+    camera = open_camera()
+    live = camera is not None
+    if not live:
+        print("No camera found, timing error-path calls on a NULL handle")
+        camera = SciCamera()
+        iterations *= 10
+
+    payloadAttribute = SCI_CAM_PAYLOAD_ATTRIBUTE()
+    imgData = ctypes.c_void_p()
+    dstImgSize = ctypes.c_int(0)
+    dst = None
+    if live:
+        # Size the destination once from a real frame
+        ppayload = ctypes.c_void_p()
+        if camera.SciCam_Grab(ppayload) == SCI_CAMERA_OK:
+            SciCam_Payload_GetAttribute(ppayload, payloadAttribute)
+            SciCam_Payload_GetImage(ppayload, imgData)
+            SciCam_Payload_ConvertImage(payloadAttribute.imgAttr, imgData, SciCamPixelType.RGB8, None, dstImgSize, True)
+            camera.SciCam_FreePayload(ppayload)
+        dst = (ctypes.c_ubyte * max(dstImgSize.value, 1))()
+
+    def bound_sequence():
+        ppayload = ctypes.c_void_p()
+        camera.SciCam_Grab(ppayload)
+        SciCam_Payload_GetAttribute(ppayload, payloadAttribute)
+        SciCam_Payload_GetImage(ppayload, imgData)
+        if dst is not None:
+            SciCam_Payload_ConvertImageEx(payloadAttribute.imgAttr, imgData, SciCamPixelType.RGB8, dst, dstImgSize, True, 0)
+        camera.SciCam_FreePayload(ppayload)
+
+    def legacy_sequence():
+        ppayload = ctypes.c_void_p()
+        legacy_grab(camera.handle, ppayload)
+        legacy_get_attribute(ppayload, payloadAttribute)
+        legacy_get_image(ppayload, imgData)
+        if dst is not None:
+            legacy_convert_image_ex(payloadAttribute.imgAttr, imgData, SciCamPixelType.RGB8, dst, dstImgSize, True, 0)
+        legacy_free_payload(camera.handle, ppayload)
+
+    try:
+        # Warm up both paths before timing
+        legacy_sequence()
+        bound_sequence()
+
+        legacy = min(timeit.repeat(legacy_sequence, number=iterations, repeat=3))
+        bound = min(timeit.repeat(bound_sequence, number=iterations, repeat=3))
+    finally:
+        if live:
+            close_camera(camera)
+
+    print(f"Mode: {'live camera' if live else 'NULL handle'}, {iterations} iterations")
+    print(f"  per-call rebinding : {legacy / iterations * 1e6:8.2f} us/frame")
+    print(f"  bound at import    : {bound / iterations * 1e6:8.2f} us/frame")
+    if bound > 0:
+        print(f"  speedup            : {legacy / bound:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
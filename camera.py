@@ -1,239 +1,588 @@
 import sys
-import socket
-import struct
+import time
+import atexit
+import threading
+import collections
 from SciCam_class import *
-
-m_currentCam = SciCamera()
-m_currentDeviceInfo = None
+from camera_frame import ConversionBufferPool, convert_payload
+from acquisition_metrics import AcquisitionMetrics, PipelineMetrics
+from frame_metadata import ChunkParser, DeviceClock, enable_chunks
+from image_writer import get_image_writer
+from camera_profiles import NodeValueCache, ProfileManager, PROFILE_DIR
+from frame_container import FrameContainerWriter
+from sl3d_frame import SL3DFrame
+from camera_roi import SensorRoi, apply_roi, roi_sidecar_path, save_roi
+from device_registry import get_device_registry
 
 from datetime import datetime
 
-def AutoCaptureFlow(callback=None):
-    # Step 1: Discovery devices
-    print("[Step 1/6] Discovering devices...")
-    devInfos = SCI_DEVICE_INFO_LIST()
-    reVal = SciCamera.SciCam_DiscoveryDevices(devInfos, SciCamTLType.SciCam_TLType_Unkown)
+# Errors after which the session drops the device and reconnects on the next grab
+RECONNECT_ERRORS = (
+    SCI_ERR_CAMERA_OFFLINE,
+    SCI_ERR_CAMERA_NOT_OPEN,
+    SCI_ERR_CAMERA_ROMOVED,
+    SCI_ERR_CAMERA_NOT_GRABBING,
+)
+
+# Acquisition modes of a CameraSession
+TRIGGER_OFF = "Off"  # free-run, each capture takes the next streamed frame
+TRIGGER_SOFTWARE = "Software"  # camera stays armed, each capture fires TriggerSoftware
+TRIGGER_HARDWARE = "Hardware"  # camera stays armed, each capture waits for the trigger line
+
+
+class CameraSession:
+    """Long-lived camera connection shared by every capture caller.
+
+    The device is looked up in the shared DeviceRegistry, opened and
+    started once; afterwards each capture is a single grab. Pass serial or
+    ip to pick a specific camera, otherwise device_index selects one in
+    discovery order. The session stays open until release() is called
+    explicitly or the process exits.
+
+    In trigger mode the camera only exposes on request, and the payload
+    buffer is cleared before each request, so a capture returns exactly the
+    frame exposed after it was asked for. Cameras without trigger support
+    fall back to free-run.
+
+    Parameters go through a node value cache, so only values that change
+    are written. With profile the named parameter profile is applied when
+    the device opens; apply_profile() switches profiles later.
+
+    With chunk_data the camera appends hardware timestamp, exposure, gain
+    and line status to every frame; grab_frame() parses them into
+    frame.metadata and device_clock maps the timestamps to host time.
+
+    With roi (a camera_roi.SensorRoi) the camera only reads out that part
+    of the sensor, grown to its increments; frames carry their offset
+    (frame.to_full() maps back to full-frame pixels). set_roi() changes it.
+    """
+
+    def __init__(self, device_index=0, exposure_time=10000, serial=None, ip=None,
+                 trigger_mode=TRIGGER_SOFTWARE, trigger_line="Line0", chunk_data=False, chunk_ids=None,
+                 profile=None, profile_dir=PROFILE_DIR, roi=None):
+        self.camera = SciCamera()
+        self.device_info = None
+        self.device_index = device_index
+        self.serial = serial
+        self.ip = ip
+        self.exposure_time = exposure_time
+        self.is_open = False
+        self.is_grabbing = False
+        self.conversion_pool = ConversionBufferPool()
+        self._lock = threading.RLock()
+
+        self.trigger_mode = trigger_mode
+        self.trigger_line = trigger_line
+        self.active_trigger_mode = TRIGGER_OFF
+        self.last_trigger_latency = None  # seconds from trigger request to frame
+        self.trigger_latencies = collections.deque(maxlen=100)
+
+        self.metrics = AcquisitionMetrics()
+        self.pipeline = PipelineMetrics()  # grab/attribute/convert/copy timings of the capture paths
+        self.last_grab_seconds = None
+
+        self.chunk_data = chunk_data
+        self.chunk_parser = ChunkParser(chunk_ids) if chunk_data else None
+        self.device_clock = DeviceClock()
+
+        self.profile = profile
+        self.node_cache = NodeValueCache(self.camera)
+        self.profiles = ProfileManager(self.camera, profile_dir, self.node_cache)
+
+        self.roi = roi
+        self.active_roi = None  # ROI as applied to the camera, None while full frame
+
+    def open(self):
+        """Discover, open and start grabbing. Returns (success, message)."""
+        with self._lock:
+            if self.is_open and self.is_grabbing:
+                return True, "Camera session already open"
+
+            # Step 1: Find the device (cached discovery, refreshed in the background)
+            print("[Step 1/3] Looking up device...")
+            registry = get_device_registry()
+            registry.start()
+            if self.serial is not None or self.ip is not None:
+                record = registry.lookup(serial=self.serial, ip=self.ip)
+                if record is None:
+                    return False, f"ERROR: Device not found (serial: {self.serial}, IP: {self.ip})"
+            else:
+                record = registry.get_index(self.device_index)
+                devices = registry.devices()
+                if not devices:
+                    return False, "ERROR: No devices found!"
+
+                print(f"Found {len(devices)} device(s)")
+                for i, dev in enumerate(devices):
+                    print(f"  [{i}] {dev.describe()}")
+
+                if record is None:
+                    return False, f"ERROR: Device index {self.device_index} out of range"
+                print(f"\nAuto-selecting device (Index: {self.device_index})\n")
+
+            self.device_info = record.info
+            # Reconnects reopen the same camera even if discovery order changes
+            self.serial = record.serial
+
+            # Show selected camera IP
+            if record.ip:
+                print(f"Selected Camera IP: {record.ip}")
+                print(f"Connecting to camera at {record.ip}...\n")
+
+            # Step 2: Open device
+            print("[Step 2/3] Opening device...")
+            reVal = self.camera.SciCam_CreateDevice(self.device_info)
+            if reVal != SCI_CAMERA_OK:
+                registry.invalidate()
+                return False, f"ERROR: Create device failed, error code: {reVal}"
+
+            reVal = self.camera.SciCam_OpenDevice()
+            if reVal != SCI_CAMERA_OK:
+                self.camera.SciCam_DeleteDevice()
+                registry.invalidate()
+                return False, f"ERROR: Open device failed, error code: {reVal}"
+            self.is_open = True
+            print("Device opened successfully!\n")
+
+            # A reopened device may have been changed meanwhile
+            self.node_cache.invalidate()
+            if self.profile:
+                success, message, _ = self.profiles.apply(self.profile)
+                print(message)
+            else:
+                self.node_cache.write("ExposureTime", SciCamNodeType.SciCam_NodeType_Float, self.exposure_time)
+
+            # A profile may carry its own ROI; an explicit one takes precedence
+            if self.roi is not None or self.active_roi is not None:
+                self._apply_roi()
+
+            self.active_trigger_mode = self._configure_trigger()
+            if self.active_trigger_mode == TRIGGER_OFF:
+                # The device keeps streaming between captures, so ask the SDK for
+                # the next frame rather than whatever is oldest in its buffer list.
+                self.camera.SciCam_SetGrabStrategy(SciCamGrabStrategy.SciCam_GrabStrategy_Upcoming)
+            else:
+                # One frame per trigger: take them in order
+                self.camera.SciCam_SetGrabStrategy(SciCamGrabStrategy.SciCam_GrabStrategy_OneByOne)
+
+            if self.chunk_data:
+                reVal, enabled = enable_chunks(self.camera)
+                if reVal != SCI_CAMERA_OK:
+                    print(f"WARNING: Chunk data not available ({reVal})")
+                else:
+                    print(f"Chunk data enabled: {', '.join(enabled)}")
+                if self.device_clock.sync(self.camera) != SCI_CAMERA_OK:
+                    print("WARNING: Device clock latch not available, frame latency unknown")
+
+            # Step 3: Start grabbing
+            print("[Step 3/3] Starting grabbing...")
+            reVal = self.camera.SciCam_StartGrabbing()
+            if reVal != SCI_CAMERA_OK:
+                self._close_device()
+                return False, f"ERROR: Start grabbing failed, error code: {reVal}"
+            self.is_grabbing = True
+            print(f"Grabbing started! (trigger: {self.active_trigger_mode})\n")
+
+            return True, "Camera session opened"
+
+    def _configure_trigger(self):
+        """Arm the requested trigger mode. Returns the mode actually in effect."""
+        if self.trigger_mode == TRIGGER_OFF:
+            self.camera.SciCam_SetEnumValueByString("TriggerMode", "Off")
+            return TRIGGER_OFF
+
+        source = "Software" if self.trigger_mode == TRIGGER_SOFTWARE else self.trigger_line
+        reVal = self.camera.SciCam_SetEnumValueByString("TriggerMode", "On")
+        if reVal == SCI_CAMERA_OK:
+            reVal = self.camera.SciCam_SetEnumValueByString("TriggerSource", source)
+        if reVal != SCI_CAMERA_OK:
+            print(f"WARNING: Trigger mode not available ({reVal}), using free-run")
+            self.camera.SciCam_SetEnumValueByString("TriggerMode", "Off")
+            return TRIGGER_OFF
+        return self.trigger_mode
+
+    def _grab_once(self):
+        ppayload = ctypes.c_void_p()
+        if self.active_trigger_mode == TRIGGER_OFF:
+            start = time.perf_counter()
+            reVal = self.camera.SciCam_Grab(ppayload)
+            self.last_grab_seconds = time.perf_counter() - start
+            return reVal, ppayload
+
+        # Drop frames from earlier triggers so the next one is ours
+        self.camera.SciCam_ClearPayloadBuffer()
+        start = time.perf_counter()
+        if self.active_trigger_mode == TRIGGER_SOFTWARE:
+            reVal = self.camera.SciCam_SetCommandValue("TriggerSoftware")
+            if reVal != SCI_CAMERA_OK:
+                return reVal, ppayload
+
+        grab_start = time.perf_counter()
+        reVal = self.camera.SciCam_Grab(ppayload)
+        self.last_grab_seconds = time.perf_counter() - grab_start
+        if reVal == SCI_CAMERA_OK:
+            self.last_trigger_latency = time.perf_counter() - start
+            self.trigger_latencies.append(self.last_trigger_latency)
+        return reVal, ppayload
+
+    def grab(self):
+        """Grab one payload from the running stream.
+
+        Returns (reVal, ppayload). The caller owns the payload and must hand
+        it back with free_payload(). The session is reopened transparently if
+        it was never opened or the device dropped since the last grab.
+        """
+        with self._lock:
+            if not (self.is_open and self.is_grabbing):
+                success, message = self.open()
+                if not success:
+                    print(message)
+                    return SCI_ERR_CAMERA_NOT_OPEN, None
+
+            reVal, ppayload = self._grab_once()
+            if reVal in RECONNECT_ERRORS:
+                print(f"WARNING: Grab failed ({reVal}), reconnecting camera...")
+                self.release()
+                success, message = self.open()
+                if not success:
+                    print(message)
+                    return reVal, None
+                reVal, ppayload = self._grab_once()
+
+            if reVal != SCI_CAMERA_OK:
+                self.metrics.record_failure(reVal)
+                return reVal, None
+            self.pipeline.add("grab", self.last_grab_seconds)
+            return reVal, ppayload
+
+    def free_payload(self, ppayload):
+        """Return a payload obtained from grab() to the SDK"""
+        if ppayload is not None:
+            self.camera.SciCam_FreePayload(ppayload)
+
+    def grab_sl3d(self):
+        """Grab one structured-light payload. Returns (reVal, SL3DFrame or None).
+
+        The frame holds the payload: call release() or detach() on it (or
+        use it in a with block) to hand the grab buffer back.
+        """
+        reVal, ppayload = self.grab()
+        if reVal != SCI_CAMERA_OK:
+            return reVal, None
+        reVal, frame = SL3DFrame.from_payload(ppayload, self.free_payload)
+        if reVal != SCI_CAMERA_OK:
+            self.free_payload(ppayload)
+        return reVal, frame
+
+    def grab_frame(self):
+        """Grab one frame converted to Mono8/RGB8. Returns (reVal, CameraFrame or None).
+
+        The frame borrows a buffer from the session's conversion pool; call
+        release() on it when done so the next grab can reuse the buffer.
+        """
+        with self._lock:
+            reVal, ppayload = self.grab()
+            if reVal != SCI_CAMERA_OK:
+                return reVal, None
+
+            try:
+                start = time.perf_counter()
+                reVal, frame = convert_payload(ppayload, self.conversion_pool, self.chunk_parser, self.pipeline)
+                convert_seconds = time.perf_counter() - start
+            finally:
+                self.free_payload(ppayload)
 
-    if reVal != SCI_CAMERA_OK:
-        msg = f"ERROR: Discovery devices failed, error code: {reVal}"
-        print(msg)
-        if callback:
-            callback(False, msg, None)
-        return False
+            if reVal == SCI_CAMERA_OK:
+                self.metrics.record(frame.frame_id, frame.timestamp,
+                                    grab_seconds=self.last_grab_seconds, convert_seconds=convert_seconds)
+            return reVal, frame
+
+    def capture_image(self, save_file_param):
+        """Grab one frame and save it as BMP. Returns (success, message)."""
+        reVal, frame = self.grab_frame()
+        if reVal != SCI_CAMERA_OK:
+            return False, f"ERROR: Capture failed, error code: {reVal}"
+
+        try:
+            success, message = save_frame_image(frame, save_file_param)
+        finally:
+            frame.release()
+
+        if success and self.active_trigger_mode != TRIGGER_OFF:
+            message += f" (trigger-to-frame latency: {self.last_trigger_latency * 1000:.1f} ms)"
+        return success, message
+
+    def capture_burst(self, path, count):
+        """Grab count frames into a raw frame container at path. Returns (success, message).
+
+        Payloads are appended unconverted, so the burst runs at the rate the
+        camera delivers; read it back with frame_container.FrameContainer.
+        """
+        start = time.perf_counter()
+        with self._lock, FrameContainerWriter(path) as writer:
+            for _ in range(count):
+                reVal, ppayload = self.grab()
+                if reVal != SCI_CAMERA_OK:
+                    return False, f"ERROR: Burst stopped after {writer.frames} frame(s), error code: {reVal}"
+                try:
+                    # Keep the frameID sequence continuous for the next grab_frame()
+                    payloadAttribute = SCI_CAM_PAYLOAD_ATTRIBUTE()
+                    if SciCam_Payload_GetAttribute(ppayload, payloadAttribute) == SCI_CAMERA_OK:
+                        self.metrics.record(payloadAttribute.frameID, payloadAttribute.timeStamp,
+                                            grab_seconds=self.last_grab_seconds)
+                    reVal = writer.append_payload(ppayload)
+                finally:
+                    self.free_payload(ppayload)
+                if reVal != SCI_CAMERA_OK:
+                    return False, f"ERROR: Storing frame failed, error code: {reVal}"
+
+        elapsed = time.perf_counter() - start
+        return True, (f"Burst of {count} frame(s) saved to {path} in {elapsed:.2f} s "
+                      f"({count / elapsed:.1f} fps)")
+
+    def trigger_stats(self):
+        """Trigger-to-frame latency over the recent captures, in milliseconds"""
+        with self._lock:
+            latencies = [t * 1000 for t in self.trigger_latencies]
+        if not latencies:
+            return {'count': 0}
+        return {
+            'count': len(latencies),
+            'last_ms': latencies[-1],
+            'mean_ms': sum(latencies) / len(latencies),
+            'min_ms': min(latencies),
+            'max_ms': max(latencies),
+        }
+
+    def set_exposure(self, exposure_time):
+        """Change the exposure time; no camera write if it is already set"""
+        with self._lock:
+            self.exposure_time = exposure_time
+            reVal, _ = self.node_cache.write("ExposureTime", SciCamNodeType.SciCam_NodeType_Float, exposure_time)
+            return reVal
+
+    def apply_profile(self, name, full=False):
+        """Switch to a saved parameter profile. Returns (success, message)."""
+        with self._lock:
+            self.profile = name
+            if not self.is_open:
+                return self.open()
+
+            success, message, written = self.profiles.apply(name, full)
+            if not success and self.is_grabbing:
+                # ROI and pixel format nodes are locked while grabbing
+                self.camera.SciCam_StopGrabbing()
+                success, message, _ = self.profiles.apply(name, full, changed=written)
+                reVal = self.camera.SciCam_StartGrabbing()
+                if reVal != SCI_CAMERA_OK:
+                    self.is_grabbing = False
+                    return False, f"ERROR: Restart grabbing failed, error code: {reVal}"
+            print(message)
+            return success, message
+
+    def _apply_roi(self):
+        reVal, applied = apply_roi(self.camera, self.roi, self.node_cache)
+        if reVal != SCI_CAMERA_OK:
+            print(f"WARNING: Setting ROI failed ({reVal}), keeping the current readout")
+            return reVal
+        self.active_roi = applied if self.roi is not None else None
+        self.conversion_pool.clear()
+        if self.active_roi is not None:
+            print(f"ROI: {applied.width}x{applied.height} at ({applied.x}, {applied.y})")
+        return reVal
+
+    def set_roi(self, roi):
+        """Read out only roi (None: full sensor). Returns (success, message).
+
+        Applied right away if the device is open (grabbing pauses while the
+        ROI nodes are written), otherwise when it opens.
+        """
+        with self._lock:
+            self.roi = roi
+            if not self.is_open:
+                return True, "ROI will be applied when the camera opens"
+
+            was_grabbing = self.is_grabbing
+            if was_grabbing:
+                self.camera.SciCam_StopGrabbing()
+            reVal = self._apply_roi()
+            if was_grabbing:
+                restart = self.camera.SciCam_StartGrabbing()
+                if restart != SCI_CAMERA_OK:
+                    self.is_grabbing = False
+                    return False, f"ERROR: Restart grabbing failed, error code: {restart}"
+            if reVal != SCI_CAMERA_OK:
+                return False, f"ERROR: Setting ROI failed, error code: {reVal}"
+            if self.active_roi is None:
+                return True, "Full frame readout"
+            roi = self.active_roi
+            return True, f"ROI set to {roi.width}x{roi.height} at ({roi.x}, {roi.y})"
+
+    def save_profile(self, name):
+        """Save the current parameters as a named profile. Returns (success, message)."""
+        with self._lock:
+            if not self.is_open:
+                return False, "ERROR: Camera not open"
+            return self.profiles.save(name)
+
+    def acquisition_stats(self):
+        """frameID gaps, grab/conversion times and buffer age over the recent grabs"""
+        return self.metrics.stats()
+
+    def pipeline_stats(self):
+        """Per-stage timings (p50/p95/p99, histograms) of the capture paths, see PipelineMetrics.stats()"""
+        return self.pipeline.stats()
+
+    def release(self):
+        """Stop grabbing and close the device"""
+        with self._lock:
+            if self.is_grabbing:
+                reVal = self.camera.SciCam_StopGrabbing()
+                if reVal != SCI_CAMERA_OK:
+                    print(f"WARNING: Stop grabbing failed, error code: {reVal}")
+                self.is_grabbing = False
+
+            if self.is_open:
+                # Leave the camera free-running for the next application
+                if self.active_trigger_mode != TRIGGER_OFF:
+                    self.camera.SciCam_SetEnumValueByString("TriggerMode", "Off")
+                    self.active_trigger_mode = TRIGGER_OFF
+                self._close_device()
+
+    def _close_device(self):
+        reVal = self.camera.SciCam_CloseDevice()
+        if reVal != SCI_CAMERA_OK:
+            print(f"WARNING: Close device failed, error code: {reVal}")
+        self.camera.SciCam_DeleteDevice()
+        self.conversion_pool.clear()
+        self.is_open = False
+        self.is_grabbing = False
+        print("Device closed!\n")
 
-    if devInfos.count == 0:
-        msg = "ERROR: No devices found!"
-        print(msg)
-        if callback:
-            callback(False, msg, None)
-        return False
 
-    print(f"Found {devInfos.count} device(s)")
-    for i in range(devInfos.count):
-        dev = devInfos.pDevInfo[i]
-        if dev.tlType == SciCamTLType.SciCam_TLType_Gige:
-            # Get camera IP
-            cam_ip = uint32_to_ipv4(dev.info.gigeInfo.ip)
-
-            # Get camera model name
-            cam_name = ''
-            for per in dev.info.gigeInfo.modelName:
-                if per == 0:
-                    break
-                cam_name = cam_name + chr(per)
-
-            print(f"  [{i}] {cam_name} - IP: {cam_ip}")
-        else:
-            cam_name = ''
-            if dev.tlType == SciCamTLType.SciCam_TLType_Usb3:
-                for per in dev.info.usb3Info.modelName:
-                    if per == 0:
-                        break
-                    cam_name = cam_name + chr(per)
-            elif dev.tlType == SciCamTLType.SciCam_TLType_CL:
-                for per in dev.info.clInfo.cameraModel:
-                    if per == 0:
-                        break
-                    cam_name = cam_name + chr(per)
-
-            tl_type = "USB3" if dev.tlType == SciCamTLType.SciCam_TLType_Usb3 else "CameraLink"
-            print(f"  [{i}] {cam_name} - Interface: {tl_type}")
-
-    print("\nAuto-selecting first device (Index: 0)\n")
-    global m_currentDeviceInfo
-    m_currentDeviceInfo = devInfos.pDevInfo[0]
-
-    # Show selected camera IP
-    if m_currentDeviceInfo.tlType == SciCamTLType.SciCam_TLType_Gige:
-        cam_ip = uint32_to_ipv4(m_currentDeviceInfo.info.gigeInfo.ip)
-        print(f"Selected Camera IP: {cam_ip}")
-        print(f"Connecting to camera at {cam_ip}...\n")
-
-    # Step 2: Open device
-
-    reVal = m_currentCam.SciCam_CreateDevice(m_currentDeviceInfo)
-    if reVal != SCI_CAMERA_OK:
-        msg = f"ERROR: Create device failed, error code: {reVal}"
-        print(msg)
-        if callback:
-            callback(False, msg, None)
-        return False
+_session = None
+_session_lock = threading.Lock()
 
-    reVal = m_currentCam.SciCam_OpenDevice()
-    if reVal != SCI_CAMERA_OK:
-        msg = f"ERROR: Open device failed, error code: {reVal}"
-        print(msg)
-        if callback:
-            callback(False, msg, None)
-        return False
-    print("Device opened successfully!\n")
 
-    #set parameter xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxvalue
-    m_currentCam.SciCam_SetFloatValueEx(0, "ExposureTime",10000)
+def get_camera_session():
+    """Return the process-wide camera session, creating it on first use"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = CameraSession()
+        return _session
 
-    # Step 3: Start grabbing
-    print("[Step 3/6] Starting grabbing...")
-    reVal = m_currentCam.SciCam_StartGrabbing()
-    if reVal != SCI_CAMERA_OK:
-        msg = f"ERROR: Start grabbing failed, error code: {reVal}"
-        print(msg)
-        m_currentCam.SciCam_CloseDevice()
-        m_currentCam.SciCam_DeleteDevice()
-        if callback:
-            callback(False, msg, None)
-        return False
-    print("Grabbing started!\n")
 
-    # Step 4: Grab and save image
-    print("[Step 4/6] Capturing and saving image as BMP...")
-    ppayload = ctypes.c_void_p()
-    reVal = m_currentCam.SciCam_Grab(ppayload)
-    if reVal != SCI_CAMERA_OK:
-        msg = f"ERROR: Grab failed, error code: {reVal}"
-        print(msg)
-        m_currentCam.SciCam_StopGrabbing()
-        m_currentCam.SciCam_CloseDevice()
-        m_currentCam.SciCam_DeleteDevice()
-        if callback:
-            callback(False, msg, None)
-        return False
+def release_camera_session():
+    """Close the shared camera session if one was opened"""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.release()
+            _session = None
+
+
+atexit.register(release_camera_session)
 
-    payloadAttribute = SCI_CAM_PAYLOAD_ATTRIBUTE()
-    reVal = SciCam_Payload_GetAttribute(ppayload, payloadAttribute)
+
+def save_frame_image(frame, save_file_param):
+    """Save a converted frame as BMP. Returns (success, message)."""
+    reVal = SciCam_Payload_SaveImage(save_file_param, frame.pixel_type, frame.buffer, frame.width, frame.height)
     if reVal != SCI_CAMERA_OK:
-        msg = f"ERROR: Get payload attribute failed, error code: {reVal}"
-        print(msg)
-        m_currentCam.SciCam_FreePayload(ppayload)
-        m_currentCam.SciCam_StopGrabbing()
-        m_currentCam.SciCam_CloseDevice()
-        m_currentCam.SciCam_DeleteDevice()
-        if callback:
-            callback(False, msg, None)
-        return False
+        return False, f"ERROR: Save image failed, error code: {reVal}"
+    return True, f"Image saved successfully: {save_file_param}"
 
-    imgWidth = payloadAttribute.imgAttr.width
-    imgHeight = payloadAttribute.imgAttr.height
-    framID = payloadAttribute.frameID
-    imgPixelType = payloadAttribute.imgAttr.pixelType
 
+def AutoCaptureFlow(callback=None, writer=None):
+    """Capture one BMP through the shared camera session.
+
+    The file is written by the background image writer, so the camera is
+    free again as soon as the frame is grabbed; callback runs once the
+    file is on disk. With an ROI active, its position is saved next to the
+    image (camera_roi.roi_sidecar_path).
+    """
+    session = get_camera_session()
+    writer = writer or get_image_writer()
+
+    print("Capturing and saving image as BMP...")
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")  # e.g., 20260126_151230
     save_file_param = f"Image_{timestamp}.bmp"
 
-    imgData = ctypes.c_void_p()
-    reVal = SciCam_Payload_GetImage(ppayload, imgData)
+    reVal, frame = session.grab_frame()
     if reVal != SCI_CAMERA_OK:
-        msg = f"ERROR: Get image data failed, error code: {reVal}"
-        print(msg)
-        m_currentCam.SciCam_FreePayload(ppayload)
-        m_currentCam.SciCam_StopGrabbing()
-        m_currentCam.SciCam_CloseDevice()
-        m_currentCam.SciCam_DeleteDevice()
+        msg = f"ERROR: Capture failed, error code: {reVal}"
+        print(msg + "\n")
         if callback:
             callback(False, msg, None)
         return False
 
-    dstImgSize = ctypes.c_int()
+    if session.active_trigger_mode != TRIGGER_OFF:
+        print(f"Trigger-to-frame latency: {session.last_trigger_latency * 1000:.1f} ms")
 
-    # Check if mono format
-    mono_formats = [
-        SciCamPixelType.Mono1p, SciCamPixelType.Mono2p, SciCamPixelType.Mono4p,
-        SciCamPixelType.Mono8s, SciCamPixelType.Mono8, SciCamPixelType.Mono10,
-        SciCamPixelType.Mono10p, SciCamPixelType.Mono12, SciCamPixelType.Mono12p,
-        SciCamPixelType.Mono14, SciCamPixelType.Mono16, SciCamPixelType.Mono10Packed,
-        SciCamPixelType.Mono12Packed, SciCamPixelType.Mono14p
-    ]
+    roi = None
+    if session.active_roi is not None:
+        roi = SensorRoi(frame.offset_x, frame.offset_y, frame.width, frame.height)
 
-    if imgPixelType in mono_formats:
-        reVal = SciCam_Payload_ConvertImage(payloadAttribute.imgAttr, imgData, SciCamPixelType.Mono8, None, dstImgSize,
-                                            True)
-        if reVal == SCI_CAMERA_OK:
-            pDstData = (ctypes.c_ubyte * dstImgSize.value)()
-            reVal = SciCam_Payload_ConvertImageEx(payloadAttribute.imgAttr, imgData, SciCamPixelType.Mono8, pDstData,
-                                                  dstImgSize, True, 0)
-            if reVal == SCI_CAMERA_OK:
-                reVal = SciCam_Payload_SaveImage(save_file_param, SciCamPixelType.Mono8, pDstData, imgWidth, imgHeight)
-    else:
-        reVal = SciCam_Payload_ConvertImage(payloadAttribute.imgAttr, imgData, SciCamPixelType.RGB8, None, dstImgSize,
-                                            True)
-        if reVal == SCI_CAMERA_OK:
-            pDstData = (ctypes.c_ubyte * dstImgSize.value)()
-            reVal = SciCam_Payload_ConvertImage(payloadAttribute.imgAttr, imgData, SciCamPixelType.RGB8, pDstData,
-                                                dstImgSize, True)
-            if reVal == SCI_CAMERA_OK:
-                reVal = SciCam_Payload_SaveImage(save_file_param, SciCamPixelType.RGB8, pDstData, imgWidth, imgHeight)
-
-    if reVal == SCI_CAMERA_OK:
-        msg = f"Image saved successfully: {save_file_param}"
+    def on_written(success, msg, path):
         print(msg + "\n")
-    else:
-        msg = f"ERROR: Save image failed, error code: {reVal}"
+        if success and roi is not None:
+            # Lets annotation tools map the cropped image back to full-frame pixels
+            save_roi(roi_sidecar_path(path), roi)
+        if callback:
+            if success:
+                callback(True, "Capture successful!", path)
+            else:
+                callback(False, msg, None)
+
+    try:
+        return writer.submit(frame, save_file_param, callback=on_written)
+    finally:
+        frame.release()
+
+
+def CaptureFrameFlow(callback=None, save_path=None, on_saved=None, writer=None):
+    """Capture one frame and hand it over in memory.
+
+    Calls callback(success, message, frame) with a CameraFrame that owns
+    its pixels (frame.array, plus frame.metadata when chunk data is on),
+    so it can go straight to a viewer or predictor without a file round
+    trip. With save_path the frame is also queued on the background image
+    writer; on_saved(success, message, path) reports when it is on disk.
+    """
+    session = get_camera_session()
+
+    reVal, frame = session.grab_frame()
+    if reVal != SCI_CAMERA_OK:
+        msg = f"ERROR: Capture failed, error code: {reVal}"
         print(msg + "\n")
-        m_currentCam.SciCam_FreePayload(ppayload)
-        m_currentCam.SciCam_StopGrabbing()
-        m_currentCam.SciCam_CloseDevice()
-        m_currentCam.SciCam_DeleteDevice()
         if callback:
             callback(False, msg, None)
         return False
 
-    m_currentCam.SciCam_FreePayload(ppayload)
+    try:
+        # Detach from the conversion pool so other threads can keep it
+        with session.pipeline.measure("copy"):
+            owned = frame.copy()
+    finally:
+        frame.release()
 
-    # Step 5: Stop grabbing
-    print("[Step 5/6] Stopping grabbing...")
-    reVal = m_currentCam.SciCam_StopGrabbing()
-    if reVal != SCI_CAMERA_OK:
-        print(f"WARNING: Stop grabbing failed, error code: {reVal}")
-    else:
-        print("Grabbing stopped!\n")
-
-    # Step 6: Close device
-    print("[Step 6/6] Closing device...")
-    reVal = m_currentCam.SciCam_CloseDevice()
-    if reVal != SCI_CAMERA_OK:
-        print(f"WARNING: Close device failed, error code: {reVal}")
-    else:
-        m_currentCam.SciCam_DeleteDevice()
-        print("Device closed!\n")
+    if save_path:
+        (writer or get_image_writer()).submit(owned, save_path, callback=on_saved)
 
+    msg = f"Captured frame {owned.frame_id} ({owned.width}x{owned.height})"
+    print(msg + "\n")
     if callback:
-        callback(True, "Capture successful!", save_file_param)
-
+        callback(True, msg, owned)
     return True
 
-def uint32_to_ipv4(ip_uint32):
-    """Convert uint32 IP address to dotted decimal format"""
-    network_order_ip = socket.htonl(ip_uint32)
-    packed_ip = struct.pack("!I", network_order_ip)
-    ipv4_address = socket.inet_ntoa(packed_ip)
-    return ipv4_address
-
-
 if __name__ == "__main__":
     success = AutoCaptureFlow()
+    success = get_image_writer().flush() and get_image_writer().failed == 0 and success
+    release_camera_session()
 
     if not success:
         print("\n[FAILED] Auto-capture encountered errors.")
         sys.exit(1)
     else:
         print("\n[SUCCESS] Image captured and saved!")
-        sys.exit(0)
\ No newline at end of file
+        sys.exit(0)
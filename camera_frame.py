@@ -0,0 +1,266 @@
+import time
+import threading
+import numpy as np
+from SciCam_class import *
+
+# Monochrome pixel formats (converted to Mono8, all others to RGB8)
+MONO_FORMATS = [
+    SciCamPixelType.Mono1p, SciCamPixelType.Mono2p, SciCamPixelType.Mono4p,
+    SciCamPixelType.Mono8s, SciCamPixelType.Mono8, SciCamPixelType.Mono10,
+    SciCamPixelType.Mono10p, SciCamPixelType.Mono12, SciCamPixelType.Mono12p,
+    SciCamPixelType.Mono14, SciCamPixelType.Mono16, SciCamPixelType.Mono10Packed,
+    SciCamPixelType.Mono12Packed, SciCamPixelType.Mono14p
+]
+
+
+def target_pixel_type(pixel_type):
+    """Display/save format for a sensor pixel type: Mono8 for mono, RGB8 otherwise"""
+    if pixel_type in MONO_FORMATS:
+        return SciCamPixelType.Mono8
+    return SciCamPixelType.RGB8
+
+
+class CameraFrame:
+    """A converted Mono8/RGB8 image viewed as a NumPy array without copying.
+
+    `array` is an (H, W) or (H, W, 3) uint8 view over `buffer`, the ctypes
+    array the SDK converted into. The frame keeps `buffer` alive for as long
+    as it exists.
+
+    Ownership: if `release_fn` is given the buffer is borrowed (a ring slot
+    or pool buffer) and must be handed back with release() once the consumer
+    is done; after that `array` is None because the memory may be reused.
+    Frames without `release_fn` own their buffer and stay valid after
+    release(). Use copy() to keep pixels beyond a borrowed frame's lifetime.
+
+    offset_x/offset_y give the position of the image on the sensor when the
+    camera reads out an ROI; to_full() maps pixel coordinates back.
+    """
+
+    def __init__(self, buffer, width, height, pixel_type, frame_id=0, timestamp=0, release_fn=None):
+        self.buffer = buffer
+        self.width = int(width)
+        self.height = int(height)
+        self.pixel_type = pixel_type
+        self.frame_id = frame_id
+        self.timestamp = timestamp
+        self._release_fn = release_fn
+        self.released = False
+        self.metadata = None  # FrameMetadata when chunk data was parsed
+        self.offset_x = 0
+        self.offset_y = 0
+        self.preview_factor = 1  # sensor pixels per pixel of a decimated preview
+
+        count = self.height * self.width * self.channels
+        array = np.frombuffer(buffer, dtype=np.uint8, count=count)
+        if self.channels == 1:
+            self.array = array.reshape(self.height, self.width)
+        else:
+            self.array = array.reshape(self.height, self.width, self.channels)
+
+    @property
+    def channels(self):
+        return 1 if self.pixel_type == SciCamPixelType.Mono8 else 3
+
+    @property
+    def bytes_per_line(self):
+        return self.width * self.channels
+
+    @property
+    def nbytes(self):
+        return self.height * self.bytes_per_line
+
+    @property
+    def owns_buffer(self):
+        return self._release_fn is None
+
+    def release(self):
+        """Hand a borrowed buffer back to its owner (no-op for owned frames)"""
+        if self.released:
+            return
+        self.released = True
+        if self._release_fn is not None:
+            self.array = None
+            release_fn, self._release_fn = self._release_fn, None
+            release_fn()
+
+    def copy(self):
+        """Detached frame that owns a private copy of the pixels"""
+        buffer = (ctypes.c_ubyte * self.nbytes)()
+        dst = np.frombuffer(buffer, dtype=np.uint8).reshape(self.array.shape)
+        np.copyto(dst, self.array)
+        frame = CameraFrame(buffer, self.width, self.height, self.pixel_type,
+                            self.frame_id, self.timestamp)
+        frame.metadata = self.metadata
+        frame.offset_x, frame.offset_y = self.offset_x, self.offset_y
+        frame.preview_factor = self.preview_factor
+        return frame
+
+    def to_full(self, points):
+        """Image pixel coordinates to full-frame sensor coordinates: (x, y) or an (..., 2) array"""
+        if isinstance(points, tuple):
+            return points[0] + self.offset_x, points[1] + self.offset_y
+        return np.asarray(points) + (self.offset_x, self.offset_y)
+
+    def to_qimage(self):
+        """QImage sharing this frame's memory (keep the frame alive while it is used)"""
+        from PySide6.QtGui import QImage
+
+        if self.channels == 1:
+            fmt = QImage.Format_Grayscale8
+        else:
+            fmt = QImage.Format_RGB888
+        return QImage(self.array.data, self.width, self.height, self.bytes_per_line, fmt)
+
+    def as_bgr(self):
+        """OpenCV/YOLO layout: a channel-reversed view for RGB, the plain view for mono"""
+        if self.channels == 1:
+            return self.array
+        return self.array[..., ::-1]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+
+class ConversionBufferPool:
+    """Recycled destination buffers for SciCam_Payload_ConvertImage.
+
+    Keyed by (width, height, source pixelType, target pixelType). The
+    converted size is asked from the SDK once per key and remembered, and
+    released buffers are kept for the next frame, so a steady stream does a
+    single conversion call per frame and no buffer allocations.
+    """
+
+    def __init__(self, max_free_per_key=4):
+        self.max_free_per_key = max_free_per_key
+        self._sizes = {}
+        self._free = {}
+        self._lock = threading.Lock()
+
+        self.size_queries = 0
+        self.allocations = 0
+        self.reuses = 0
+
+    def dst_size(self, key, imgAttr, imgData, target_type):
+        """Converted size in bytes for key. Returns (reVal, size)."""
+        size = self._sizes.get(key)
+        if size is not None:
+            return SCI_CAMERA_OK, size
+
+        dstImgSize = ctypes.c_int()
+        reVal = SciCam_Payload_ConvertImage(imgAttr, imgData, target_type, None, dstImgSize, True)
+        if reVal != SCI_CAMERA_OK:
+            return reVal, 0
+
+        with self._lock:
+            self.size_queries += 1
+            self._sizes[key] = dstImgSize.value
+        return reVal, dstImgSize.value
+
+    def acquire(self, key, size):
+        """A buffer of size bytes for key, recycled when one is free"""
+        with self._lock:
+            free = self._free.get(key)
+            if free:
+                self.reuses += 1
+                return free.pop()
+            self.allocations += 1
+        return (ctypes.c_ubyte * size)()
+
+    def release(self, key, buffer):
+        """Give a buffer back for reuse"""
+        with self._lock:
+            free = self._free.setdefault(key, [])
+            if len(free) < self.max_free_per_key:
+                free.append(buffer)
+
+    def clear(self):
+        """Drop cached sizes and free buffers (e.g. after ROI or pixel format changes)"""
+        with self._lock:
+            self._sizes.clear()
+            self._free.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'formats': len(self._sizes),
+                'free_buffers': sum(len(v) for v in self._free.values()),
+                'size_queries': self.size_queries,
+                'allocations': self.allocations,
+                'reuses': self.reuses,
+            }
+
+
+def convert_payload(ppayload, pool=None, chunk_parser=None, pipeline=None):
+    """Convert a grabbed payload to Mono8/RGB8. Returns (reVal, CameraFrame or None).
+
+    With a ConversionBufferPool the frame borrows a pooled buffer and must be
+    release()d to recycle it; without one it owns a freshly allocated buffer.
+    With a ChunkParser the frame's chunk data is parsed into frame.metadata.
+    With PipelineMetrics the attribute fetch and conversion are timed.
+    """
+    start = time.perf_counter()
+    payloadAttribute = SCI_CAM_PAYLOAD_ATTRIBUTE()
+    reVal = SciCam_Payload_GetAttribute(ppayload, payloadAttribute)
+    if reVal != SCI_CAMERA_OK:
+        return reVal, None
+    if pipeline is not None:
+        pipeline.add("attribute", time.perf_counter() - start)
+
+    imgData = ctypes.c_void_p()
+    reVal = SciCam_Payload_GetImage(ppayload, imgData)
+    if reVal != SCI_CAMERA_OK:
+        return reVal, None
+
+    imgAttr = payloadAttribute.imgAttr
+    target_type = target_pixel_type(imgAttr.pixelType)
+
+    if pool is not None:
+        key = (imgAttr.width, imgAttr.height, imgAttr.pixelType, target_type)
+        reVal, size = pool.dst_size(key, imgAttr, imgData, target_type)
+        if reVal != SCI_CAMERA_OK:
+            return reVal, None
+
+        buffer = pool.acquire(key, size)
+        dstImgSize = ctypes.c_int(size)
+        start = time.perf_counter()
+        reVal = SciCam_Payload_ConvertImageEx(imgAttr, imgData, target_type, buffer, dstImgSize, True, 0)
+        if reVal != SCI_CAMERA_OK:
+            pool.release(key, buffer)
+            return reVal, None
+        if pipeline is not None:
+            pipeline.add("convert", time.perf_counter() - start)
+
+        frame = CameraFrame(buffer, imgAttr.width, imgAttr.height, target_type,
+                            payloadAttribute.frameID, payloadAttribute.timeStamp,
+                            release_fn=lambda: pool.release(key, buffer))
+        frame.offset_x, frame.offset_y = imgAttr.offsetX, imgAttr.offsetY
+        if chunk_parser is not None:
+            frame.metadata = chunk_parser.parse(ppayload, payloadAttribute)
+        return reVal, frame
+
+    # Get the required buffer size
+    dstImgSize = ctypes.c_int()
+    reVal = SciCam_Payload_ConvertImage(payloadAttribute.imgAttr, imgData, target_type, None, dstImgSize, True)
+    if reVal != SCI_CAMERA_OK:
+        return reVal, None
+
+    pDstData = (ctypes.c_ubyte * dstImgSize.value)()
+    start = time.perf_counter()
+    reVal = SciCam_Payload_ConvertImageEx(payloadAttribute.imgAttr, imgData, target_type, pDstData,
+                                          dstImgSize, True, 0)
+    if reVal != SCI_CAMERA_OK:
+        return reVal, None
+    if pipeline is not None:
+        pipeline.add("convert", time.perf_counter() - start)
+
+    frame = CameraFrame(pDstData, payloadAttribute.imgAttr.width, payloadAttribute.imgAttr.height,
+                        target_type, payloadAttribute.frameID, payloadAttribute.timeStamp)
+    frame.offset_x, frame.offset_y = imgAttr.offsetX, imgAttr.offsetY
+    if chunk_parser is not None:
+        frame.metadata = chunk_parser.parse(ppayload, payloadAttribute)
+    return reVal, frame
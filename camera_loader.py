@@ -0,0 +1,73 @@
+import time
+import importlib
+import threading
+
+
+class CameraModuleLoader:
+    """Imports camera.py, and with it the SciCam SDK, off the GUI thread.
+
+    Loading the SDK means a ctypes.CDLL load plus a few thousand lines of
+    enum and Structure definitions, so the GUI starts without it and calls
+    start() once the window is up. Camera actions call get() from their
+    worker thread, which waits for a load in progress or starts one.
+    """
+
+    def __init__(self, module_name="camera"):
+        self.module_name = module_name
+        self.module = None
+        self.error = None
+        self.load_seconds = None
+        self._thread = None
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._listeners = []
+
+    def start(self):
+        """Begin loading in the background (no-op if already started)"""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._load, name="camera-sdk-loader", daemon=True)
+                self._thread.start()
+
+    def get(self, timeout=None):
+        """The loaded camera module, or None if it could not be loaded"""
+        self.start()
+        self._done.wait(timeout)
+        return self.module
+
+    def is_loaded(self):
+        return self._done.is_set() and self.module is not None
+
+    def add_listener(self, listener):
+        """Call listener(success, message, load_seconds) once loading finishes.
+
+        The listener runs on the loader thread (or immediately if already done).
+        """
+        with self._lock:
+            if not self._done.is_set():
+                self._listeners.append(listener)
+                return
+        listener(self.module is not None, self.message(), self.load_seconds)
+
+    def message(self):
+        if not self._done.is_set():
+            return "Camera SDK loading..."
+        if self.module is None:
+            return f"Camera module not available: {self.error}"
+        return f"Camera SDK loaded in {self.load_seconds * 1000:.0f} ms"
+
+    def _load(self):
+        start = time.perf_counter()
+        try:
+            self.module = importlib.import_module(self.module_name)
+        except (ImportError, OSError) as e:
+            self.error = e
+        self.load_seconds = time.perf_counter() - start
+
+        with self._lock:
+            self._done.set()
+            listeners, self._listeners = self._listeners, []
+
+        print(self.message())
+        for listener in listeners:
+            listener(self.module is not None, self.message(), self.load_seconds)
@@ -0,0 +1,302 @@
+import os
+import json
+import time
+import threading
+from SciCam_class import *
+from node_tree import NODE_DEPENDENTS
+
+# Default folder for saved profiles
+PROFILE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "camera_profiles")
+
+CAMERA_XML = SciCamDeviceXmlType.SciCam_DeviceXml_Camera
+
+# Node types a profile stores
+VALUE_NODE_TYPES = (
+    SciCamNodeType.SciCam_NodeType_Int,
+    SciCamNodeType.SciCam_NodeType_Float,
+    SciCamNodeType.SciCam_NodeType_Bool,
+    SciCamNodeType.SciCam_NodeType_Enum,
+    SciCamNodeType.SciCam_NodeType_String,
+)
+
+
+def read_node_value(camera, name, node_type):
+    """Read a node as a plain Python value. Returns (reVal, value)."""
+    if node_type == SciCamNodeType.SciCam_NodeType_Int:
+        val = SCI_NODE_VAL_INT()
+        reVal = camera.SciCam_GetIntValueEx(CAMERA_XML, name, val)
+        return reVal, val.nVal
+    if node_type == SciCamNodeType.SciCam_NodeType_Float:
+        val = SCI_NODE_VAL_FLOAT()
+        reVal = camera.SciCam_GetFloatValueEx(CAMERA_XML, name, val)
+        return reVal, val.dVal
+    if node_type == SciCamNodeType.SciCam_NodeType_Bool:
+        val = ctypes.c_bool()
+        reVal = camera.SciCam_GetBoolValueEx(CAMERA_XML, name, val)
+        return reVal, val.value
+    if node_type == SciCamNodeType.SciCam_NodeType_Enum:
+        val = SCI_NODE_VAL_ENUM()
+        reVal = camera.SciCam_GetEnumValueEx(CAMERA_XML, name, val)
+        return reVal, val.nVal
+    if node_type == SciCamNodeType.SciCam_NodeType_String:
+        val = SCI_NODE_VAL_STRING()
+        reVal = camera.SciCam_GetStringValueEx(CAMERA_XML, name, val)
+        return reVal, val.val.decode('ascii', 'ignore')
+    return SCI_ERR_CAMERA_NODE_TYPE_UNMATCH, None
+
+
+def write_node_value(camera, name, node_type, value):
+    """Write a plain Python value to a node. Returns reVal."""
+    if node_type == SciCamNodeType.SciCam_NodeType_Int:
+        return camera.SciCam_SetIntValueEx(CAMERA_XML, name, int(value))
+    if node_type == SciCamNodeType.SciCam_NodeType_Float:
+        return camera.SciCam_SetFloatValueEx(CAMERA_XML, name, float(value))
+    if node_type == SciCamNodeType.SciCam_NodeType_Bool:
+        return camera.SciCam_SetBoolValueEx(CAMERA_XML, name, bool(value))
+    if node_type == SciCamNodeType.SciCam_NodeType_Enum:
+        return camera.SciCam_SetEnumValueEx(CAMERA_XML, name, int(value))
+    if node_type == SciCamNodeType.SciCam_NodeType_String:
+        return camera.SciCam_SetStringValueEx(CAMERA_XML, name, str(value))
+    return SCI_ERR_CAMERA_NODE_TYPE_UNMATCH
+
+
+class NodeValueCache:
+    """Last known value of every writable node of an open camera.
+
+    refresh() reads all RW value nodes once; afterwards write() only talks
+    to the camera when the new value differs from the cached one. A write
+    drops the nodes it may change on the camera (NODE_DEPENDENTS), so they
+    are read or written through again next time. Writes that do not go
+    through the cache (another application, FeatureLoad) make it stale:
+    call refresh() or invalidate() after them.
+
+    Every camera node access of the cache holds `lock`; other threads
+    that read or write nodes of the same camera should hold it too, so
+    SDK node calls never run concurrently.
+    """
+
+    def __init__(self, camera):
+        self.camera = camera
+        self._values = {}  # name -> (node type, value), in GetNodes order
+        self._lock = threading.RLock()
+        self.last_refresh_seconds = None
+
+    @property
+    def lock(self):
+        """Lock serialising node access to the camera (reentrant)"""
+        return self._lock
+
+    def refresh(self):
+        """Read every RW value node. Returns reVal."""
+        with self._lock:
+            return self._refresh()
+
+    def _refresh(self):
+        start = time.perf_counter()
+        nodesCount = ctypes.c_uint(0)
+        reVal = self.camera.SciCam_GetNodes(None, nodesCount)
+        if reVal != SCI_CAMERA_OK:
+            return reVal
+
+        nodes = (SCI_CAM_NODE * nodesCount.value)()
+        if nodesCount.value:
+            reVal = self.camera.SciCam_GetNodes(ctypes.cast(nodes, PSCI_CAM_NODE).contents, nodesCount)
+            if reVal != SCI_CAMERA_OK:
+                return reVal
+
+        values = {}
+        for node in nodes:
+            if node.type not in VALUE_NODE_TYPES or node.accessMode != SciCamNodeAccessMode.SciCam_NodeAccessMode_RW:
+                continue
+            name = node.name.decode('ascii', 'ignore')
+            reVal, value = read_node_value(self.camera, name, node.type)
+            if reVal == SCI_CAMERA_OK:
+                values[name] = (node.type, value)
+
+        self._values = values
+        self.last_refresh_seconds = time.perf_counter() - start
+        return SCI_CAMERA_OK
+
+    def invalidate(self, name=None):
+        """Forget one node (re-read on next get) or everything"""
+        with self._lock:
+            if name is None:
+                self._values = {}
+                self.last_refresh_seconds = None
+            else:
+                self._values.pop(name, None)
+
+    def is_loaded(self):
+        """True once refresh() has read the full node map"""
+        return self.last_refresh_seconds is not None
+
+    def get(self, name):
+        """Cached value, reading the camera on a miss. Returns (reVal, value)."""
+        with self._lock:
+            cached = self._values.get(name)
+            if cached is not None:
+                return SCI_CAMERA_OK, cached[1]
+
+            node_type = ctypes.c_int()
+            reVal = self.camera.SciCam_GetNodeType(name, node_type)
+            if reVal != SCI_CAMERA_OK:
+                return reVal, None
+            # Only RW nodes are cached (refresh() decides), so a miss is read through
+            return read_node_value(self.camera, name, node_type.value)
+
+    def write(self, name, node_type, value):
+        """Write a node unless the cache already holds value. Returns (reVal, written)."""
+        with self._lock:
+            cached = self._values.get(name)
+            if cached is not None and _same_value(node_type, cached[1], value):
+                return SCI_CAMERA_OK, False
+
+            reVal = write_node_value(self.camera, name, node_type, value)
+            if reVal != SCI_CAMERA_OK:
+                return reVal, False
+            # Read back: the camera may round to its increment
+            reVal, actual = read_node_value(self.camera, name, node_type)
+            if reVal == SCI_CAMERA_OK:
+                self._values[name] = (node_type, actual)
+            else:
+                self._values.pop(name, None)
+            # Nodes the camera changes as a side effect (binning rescales Width, ...) are stale now
+            for dependent in NODE_DEPENDENTS.get(name, ()):
+                self._values.pop(dependent, None)
+            return SCI_CAMERA_OK, True
+
+    def snapshot(self):
+        """Copy of the cached values as [(name, node type, value)]"""
+        with self._lock:
+            return [(name, node_type, value) for name, (node_type, value) in self._values.items()]
+
+
+def _same_value(node_type, a, b):
+    if node_type == SciCamNodeType.SciCam_NodeType_Float:
+        return abs(float(a) - float(b)) <= 1e-9 * max(1.0, abs(float(a)), abs(float(b)))
+    return a == b
+
+
+class ProfileManager:
+    """Named camera parameter profiles.
+
+    save() writes two files per profile: the SDK's own FeatureSave file
+    and a JSON list of the node values. apply() writes only the nodes
+    whose cached value differs from the profile, so switching between
+    products touches a handful of nodes. Writes rejected because of
+    dependencies (e.g. Width before OffsetX) are retried after the rest.
+    apply(full=True), or a profile saved from another camera model, uses
+    SciCam_FeatureLoad instead, which also restores selector-indexed
+    features the JSON snapshot cannot represent.
+    """
+
+    def __init__(self, camera, directory=PROFILE_DIR, cache=None):
+        self.camera = camera
+        self.directory = directory
+        self.cache = cache or NodeValueCache(camera)
+        self.active = None
+
+    def _paths(self, name):
+        base = os.path.join(self.directory, name)
+        return base + ".cfg", base + ".json"
+
+    def list(self):
+        """Saved profile names"""
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(os.path.splitext(f)[0] for f in os.listdir(self.directory) if f.endswith(".json"))
+
+    def save(self, name):
+        """Save the camera's current parameters as a profile. Returns (success, message)."""
+        os.makedirs(self.directory, exist_ok=True)
+        feature_path, values_path = self._paths(name)
+
+        with self.cache.lock:
+            reVal = self.camera.SciCam_FeatureSave(feature_path)
+        if reVal != SCI_CAMERA_OK:
+            return False, f"ERROR: FeatureSave failed, error code: {reVal}"
+
+        # The snapshot must match the camera exactly, so read it fresh
+        reVal = self.cache.refresh()
+        if reVal != SCI_CAMERA_OK:
+            return False, f"ERROR: Reading nodes failed, error code: {reVal}"
+
+        model_reVal, model = self.cache.get("DeviceModelName")
+        with open(values_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "model": model if model_reVal == SCI_CAMERA_OK else None,
+                "nodes": [[node_name, int(node_type), value] for node_name, node_type, value in self.cache.snapshot()],
+            }, f, indent=1)
+
+        self.active = name
+        return True, f"Profile '{name}' saved"
+
+    def delete(self, name):
+        for path in self._paths(name):
+            if os.path.exists(path):
+                os.remove(path)
+        if self.active == name:
+            self.active = None
+
+    def apply(self, name, full=False, changed=0):
+        """Switch to a profile. Returns (success, message, nodes written).
+
+        changed: nodes an earlier, failed attempt already wrote; a retry
+        skips them as unchanged, so they are added to its count.
+        """
+        start = time.perf_counter()
+        feature_path, values_path = self._paths(name)
+        try:
+            with open(values_path, encoding="utf-8") as f:
+                profile = json.load(f)
+        except (OSError, ValueError) as e:
+            return False, f"ERROR: Cannot read profile '{name}': {e}", 0
+
+        if not full and profile.get("model") is not None:
+            reVal, model = self.cache.get("DeviceModelName")
+            if reVal == SCI_CAMERA_OK and model != profile["model"]:
+                full = True
+
+        if full:
+            return self._apply_full(name, feature_path, start)
+
+        if not self.cache.is_loaded():
+            reVal = self.cache.refresh()
+            if reVal != SCI_CAMERA_OK:
+                return False, f"ERROR: Reading nodes failed, error code: {reVal}", 0
+
+        pending = [(node_name, node_type, value) for node_name, node_type, value in profile["nodes"]]
+        written = changed
+        failures = {}
+        # Retry rejected writes while each pass makes progress
+        while pending:
+            retry = []
+            for node_name, node_type, value in pending:
+                reVal, did_write = self.cache.write(node_name, node_type, value)
+                if reVal != SCI_CAMERA_OK:
+                    retry.append((node_name, node_type, value))
+                    failures[node_name] = reVal
+                else:
+                    failures.pop(node_name, None)
+                    written += did_write
+            if len(retry) == len(pending):
+                break
+            pending = retry
+
+        elapsed = (time.perf_counter() - start) * 1000
+        if failures:
+            details = ", ".join(f"{node_name} ({reVal})" for node_name, reVal in failures.items())
+            return False, f"Profile '{name}' partly applied, failed: {details}", written
+
+        self.active = name
+        return True, f"Profile '{name}' applied: {written} node(s) changed in {elapsed:.1f} ms", written
+
+    def _apply_full(self, name, feature_path, start):
+        with self.cache.lock:
+            reVal = self.camera.SciCam_FeatureLoad(feature_path)
+        if reVal != SCI_CAMERA_OK:
+            return False, f"ERROR: FeatureLoad failed, error code: {reVal}", 0
+        self.cache.refresh()
+        self.active = name
+        elapsed = (time.perf_counter() - start) * 1000
+        return True, f"Profile '{name}' loaded in full in {elapsed:.1f} ms", len(self.cache.snapshot())
@@ -0,0 +1,183 @@
+import os
+import json
+import numpy as np
+from SciCam_class import *
+
+CAMERA_XML = SciCamDeviceXmlType.SciCam_DeviceXml_Camera
+INT_NODE = SciCamNodeType.SciCam_NodeType_Int
+
+
+class SensorRoi:
+    """Rectangle on the sensor in full-frame pixels.
+
+    Images grabbed with this ROI start at (x, y) of the full frame:
+    to_full() maps ROI image coordinates back, to_roi() the other way.
+    """
+
+    def __init__(self, x, y, width, height):
+        self.x = int(x)
+        self.y = int(y)
+        self.width = int(width)
+        self.height = int(height)
+
+    @classmethod
+    def from_box(cls, x1, y1, x2, y2, margin=0):
+        """ROI around a full-frame box, grown by margin pixels on each side"""
+        x1, x2 = sorted((x1, x2))
+        y1, y2 = sorted((y1, y2))
+        x = max(0, int(np.floor(x1)) - margin)
+        y = max(0, int(np.floor(y1)) - margin)
+        return cls(x, y, int(np.ceil(x2)) + margin - x, int(np.ceil(y2)) + margin - y)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['x'], data['y'], data['width'], data['height'])
+
+    def as_dict(self):
+        return {'x': self.x, 'y': self.y, 'width': self.width, 'height': self.height}
+
+    def to_full(self, points):
+        """ROI pixel coordinates to full-frame: an (x, y) tuple or an (..., 2) array"""
+        if isinstance(points, tuple):
+            return points[0] + self.x, points[1] + self.y
+        return np.asarray(points) + (self.x, self.y)
+
+    def to_roi(self, points):
+        """Full-frame pixel coordinates to ROI coordinates"""
+        if isinstance(points, tuple):
+            return points[0] - self.x, points[1] - self.y
+        return np.asarray(points) - (self.x, self.y)
+
+    def contains(self, other):
+        return (self.x <= other.x and self.y <= other.y and
+                other.x + other.width <= self.x + self.width and
+                other.y + other.height <= self.y + self.height)
+
+    def __eq__(self, other):
+        return isinstance(other, SensorRoi) and self.as_dict() == other.as_dict()
+
+    def __repr__(self):
+        return f"SensorRoi(x={self.x}, y={self.y}, width={self.width}, height={self.height})"
+
+
+def _int_node(camera, name):
+    val = SCI_NODE_VAL_INT()
+    reVal = camera.SciCam_GetIntValueEx(CAMERA_XML, name, val)
+    return reVal, val
+
+
+def sensor_size(camera):
+    """Full sensor size. Returns (reVal, (width, height))."""
+    for width_node, height_node in (("WidthMax", "HeightMax"), ("SensorWidth", "SensorHeight")):
+        reVal, width = _int_node(camera, width_node)
+        if reVal != SCI_CAMERA_OK:
+            continue
+        reVal, height = _int_node(camera, height_node)
+        if reVal == SCI_CAMERA_OK:
+            return SCI_CAMERA_OK, (width.nVal, height.nVal)
+    return reVal, None
+
+
+def read_roi(camera):
+    """Current ROI of the camera. Returns (reVal, SensorRoi)."""
+    values = []
+    for name in ("OffsetX", "OffsetY", "Width", "Height"):
+        reVal, val = _int_node(camera, name)
+        if reVal != SCI_CAMERA_OK:
+            return reVal, None
+        values.append(val.nVal)
+    return SCI_CAMERA_OK, SensorRoi(*values)
+
+
+def _align_axis(start, size, sensor, size_node, offset_node):
+    """Grow [start, start + size) outwards to the camera's increments, inside the sensor"""
+    size_inc = max(1, size_node.nInc)
+    offset_inc = max(1, offset_node.nInc)
+    offset = max(0, start) // offset_inc * offset_inc
+    end = min(sensor, start + size)
+    aligned = -(-(end - offset) // size_inc) * size_inc
+    aligned = max(aligned, size_node.nMin)
+    if offset + aligned > sensor:
+        aligned = min(aligned, (sensor - size_node.nMin) // size_inc * size_inc + size_node.nMin)
+        offset = (sensor - aligned) // offset_inc * offset_inc
+    return offset, aligned
+
+
+def align_roi(camera, roi):
+    """Smallest ROI the camera accepts that covers roi. Returns (reVal, SensorRoi)."""
+    reVal, sensor = sensor_size(camera)
+    if reVal != SCI_CAMERA_OK:
+        return reVal, None
+    nodes = {}
+    for name in ("Width", "Height", "OffsetX", "OffsetY"):
+        reVal, nodes[name] = _int_node(camera, name)
+        if reVal != SCI_CAMERA_OK:
+            return reVal, None
+
+    x, width = _align_axis(roi.x, roi.width, sensor[0], nodes["Width"], nodes["OffsetX"])
+    y, height = _align_axis(roi.y, roi.height, sensor[1], nodes["Height"], nodes["OffsetY"])
+    return SCI_CAMERA_OK, SensorRoi(x, y, width, height)
+
+
+def apply_roi(camera, roi, cache=None):
+    """Set Width/Height/OffsetX/OffsetY so the camera reads out roi (None: full sensor).
+
+    The camera must not be grabbing. The ROI is grown to the camera's
+    increments; writes go through the NodeValueCache when given, so an
+    unchanged ROI costs no camera writes. Returns (reVal, applied SensorRoi).
+    """
+    if roi is None:
+        reVal, sensor = sensor_size(camera)
+        if reVal != SCI_CAMERA_OK:
+            return reVal, None
+        roi = SensorRoi(0, 0, *sensor)
+
+    reVal, target = align_roi(camera, roi)
+    if reVal != SCI_CAMERA_OK:
+        return reVal, None
+    reVal, current = read_roi(camera)
+    if reVal != SCI_CAMERA_OK:
+        return reVal, None
+    reVal, sensor = sensor_size(camera)
+    if reVal != SCI_CAMERA_OK:
+        return reVal, None
+
+    def write(name, value):
+        if cache is not None:
+            return cache.write(name, INT_NODE, value)[0]
+        return camera.SciCam_SetIntValueEx(CAMERA_XML, name, int(value))
+
+    # Offset + size must stay inside the sensor after every single write
+    for offset_name, size_name, offset, size, cur_offset, cur_size, limit in (
+            ("OffsetX", "Width", target.x, target.width, current.x, current.width, sensor[0]),
+            ("OffsetY", "Height", target.y, target.height, current.y, current.height, sensor[1])):
+        if offset + cur_size <= limit:
+            order = ((offset_name, offset), (size_name, size))
+        elif cur_offset + size <= limit:
+            order = ((size_name, size), (offset_name, offset))
+        else:
+            order = ((offset_name, 0), (size_name, size), (offset_name, offset))
+        for name, value in order:
+            reVal = write(name, value)
+            if reVal != SCI_CAMERA_OK:
+                return reVal, None
+    return SCI_CAMERA_OK, target
+
+
+def roi_sidecar_path(image_path):
+    """File next to a saved image that records the ROI it was captured with"""
+    return os.path.splitext(image_path)[0] + ".roi.json"
+
+
+def save_roi(path, roi):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(roi.as_dict(), f)
+
+
+def load_roi(path):
+    """SensorRoi stored at path, None if there is none (full frame)"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return SensorRoi.from_dict(json.load(f))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
@@ -1,5 +1,8 @@
 import sys
 import time
+import threading
+import collections
+import numpy as np
 from datetime import datetime
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                                QHBoxLayout, QGroupBox, QPushButton, QLabel,
@@ -8,27 +11,50 @@ from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                                QLineEdit, QMessageBox, QSplitter, QScrollArea,
                                QProgressBar, QCheckBox, QFrame, QTreeWidget,
                                QTreeWidgetItem, QFileDialog, QDialog,
-                               QDialogButtonBox, QFormLayout, QSizePolicy)  # 添加 QSizePolicy
+                               QDialogButtonBox, QFormLayout, QSizePolicy,  # 添加 QSizePolicy
+                               QInputDialog)
 from PySide6.QtCore import Qt, QTimer, Signal, QThread, Slot
 from PySide6.QtGui import QFont, QColor, QPalette, QBrush
 
 from SciCam_class import *
+from frame_buffer import FrameRingBuffer, FrameMailbox
+from camera_frame import CameraFrame, ConversionBufferPool, convert_payload, target_pixel_type
+from device_registry import get_device_registry
+from acquisition_metrics import AcquisitionMetrics, PipelineMetrics, HISTOGRAM_BOUNDS_MS
+from image_writer import get_image_writer
+from camera_profiles import NodeValueCache, ProfileManager, VALUE_NODE_TYPES
+from stream_recorder import StreamRecorder, RECORD_QUALITY_DEFAULT
+from lp3d_stream import LP3DStream
+from live_preview import (PREVIEW_FULL, PREVIEW_DOWNSAMPLE, PREVIEW_BINNING, PREVIEW_MODES,
+                          downsample_factor, downsample_frame, set_sensor_binning)
+from camera_roi import read_roi, apply_roi
+from node_tree import node_parents, node_children, affected_nodes
 import socket
 import struct
 from ctypes import c_bool
 
 from PySide6.QtGui import QImage, QPixmap
 
-def show_image(self):
+# 采集模式
+ACQ_MODE_POLLING = "Polling"
+ACQ_MODE_CALLBACK = "Callback"
+ACQ_MODE_LP3D = "LP3D Contour"  # 激光轮廓相机: 轮廓流写入NumPy缓冲区, 显示高度图
+
+DISPLAY_INTERVAL_MS = 20  # 实时画面刷新周期
 
-    w = self.camera_worker.last_width
-    h = self.camera_worker.last_height
-    data = bytes(self.camera_worker.last_image_data)
+def show_image(self):
 
-    img = QImage(data, w, h, w, QImage.Format_Grayscale8)
+    img = self.camera_worker.last_frame.to_qimage()
     self.image_label.setPixmap(QPixmap.fromImage(img))
 
 
+def _histogram_bar(counts):
+    """Histogram as a row of block characters, one per bucket"""
+    blocks = " ▁▂▃▄▅▆▇█"
+    peak = max(counts) or 1
+    return "".join(blocks[(count * (len(blocks) - 1) + peak - 1) // peak] for count in counts)
+
+
 # Replicate the GetEnumName function from the console script
 def GetEnumName(enumCls, value):
     """Get enum name from value"""
@@ -209,7 +235,6 @@ class CameraWorker(QThread):
     """Worker thread for camera operations"""
     log_signal = Signal(str)
     device_list_signal = Signal(list)
-    image_grabbed_signal = Signal(bytes, int, int)  # 修改为发射图像数据和尺寸
     image_saved_signal = Signal(str)  # 添加图像保存信号
 
     def __init__(self):
@@ -220,8 +245,36 @@ class CameraWorker(QThread):
         self.is_grabbing = False
         self.continuous_grab = False  # 添加连续抓取标志
 
+        # 回调采集模式: SDK线程将帧写入预分配的环形缓冲区
+        self.acquisition_mode = ACQ_MODE_POLLING
+        self.deliver_every_frame = False  # False: 只取最新帧
+        self.frame_ring = FrameRingBuffer(capacity=8)
+        # 显示邮箱: 只保留最新一帧, 界面按自身刷新率取帧 (取走后负责release)
+        self.display_mailbox = FrameMailbox()
+        self.conversion_pool = ConversionBufferPool()  # 缓存转换尺寸并复用缓冲区
+        self._payload_callback = SciCamera.fnOnPayload(self._on_payload)  # 保持引用, 防止被回收
+        self.metrics = AcquisitionMetrics()  # 丢帧/延迟统计
+        self.pipeline = PipelineMetrics()  # 各阶段耗时: 抓取/属性/转换/复制/传递/绘制
+
+        # 参数缓存: 只写入变化的节点
+        self.node_cache = NodeValueCache(self.camera)
+        self.profiles = ProfileManager(self.camera, cache=self.node_cache)
+
+        # 录像: 采集线程把payload交给录像线程, 由其写入AVI后释放
+        self.recorder = StreamRecorder(self.camera)
+        self.grab_buffer_count = 10
+
+        self.lp3d_stream = None  # LP3D模式下的轮廓流
+
+        # 预览: 实时显示用降采样或传感器合并, 保存时取全分辨率
+        self.preview_mode = PREVIEW_FULL
+        self.preview_zoom = 1.0  # 界面当前缩放, 决定降采样倍数
+        self.preview_binning = 2
+        self.active_binning = 1
+        self._roi_before_binning = None
+
         # 图像相关属性
-        self.last_image_data = None
+        self.last_frame = None  # CameraFrame
         self.last_width = 0
         self.last_height = 0
         self.last_pixel_type = SciCamPixelType.Mono8
@@ -229,26 +282,30 @@ class CameraWorker(QThread):
         self.save_image_path = ""
 
     def discovery_devices(self):
-        """Discover available devices"""
+        """Discover available devices (refreshes the shared device registry)"""
         try:
             self.log_signal.emit("Discovering devices...")
-            devInfos = SCI_DEVICE_INFO_LIST()
-            reVal = SciCamera.SciCam_DiscoveryDevices(devInfos, SciCamTLType.SciCam_TLType_Unkown)
+            registry = get_device_registry()
+            reVal, records = registry.refresh()
 
             if reVal != SCI_CAMERA_OK:
                 self.log_signal.emit(f"Discovery failed: Error {reVal}")
                 return
 
             device_list = []
-            for index in range(devInfos.count):
+            for index, record in enumerate(records):
                 device_list.append({
                     'index': index,
-                    'info': devInfos.pDevInfo[index]
+                    'info': record.info,
+                    'model': record.model,
+                    'serial': record.serial,
+                    'ip': record.ip
                 })
 
             self.devices = device_list
             self.device_list_signal.emit(device_list)
-            self.log_signal.emit(f"Found {len(device_list)} device(s)")
+            self.log_signal.emit(f"Found {len(device_list)} device(s) in "
+                                 f"{registry.last_discovery_seconds * 1000:.0f} ms")
 
         except Exception as e:
             self.log_signal.emit(f"Error discovering devices: {str(e)}")
@@ -273,6 +330,8 @@ class CameraWorker(QThread):
 
             self.current_device = device_info
             self.is_grabbing = False
+            self.node_cache.invalidate()
+            self.profiles.active = None
             self.log_signal.emit("Device opened successfully")
             return True
 
@@ -293,6 +352,7 @@ class CameraWorker(QThread):
                     self.log_signal.emit(f"Close device failed: Error {reVal}")
                 else:
                     self.camera.SciCam_DeleteDevice()
+                    self.conversion_pool.clear()
                     self.current_device = None
                     self.is_grabbing = False
                     self.log_signal.emit("Device closed")
@@ -302,49 +362,287 @@ class CameraWorker(QThread):
 
     def run(self):
         """Continuous grabbing thread"""
+        if self.acquisition_mode == ACQ_MODE_CALLBACK:
+            self.run_callback_consumer()
+            return
+        if self.acquisition_mode == ACQ_MODE_LP3D:
+            self.run_lp3d_preview()
+            return
+
+        last_emit = 0.0
         while self.continuous_grab and self.is_grabbing:
             try:
                 # 抓取单帧
                 success = self.grab_single_image()
-                if success and self.last_image_data:
-                    # 确保图像数据是bytes类型
-                    if isinstance(self.last_image_data, ctypes.Array):
-                        image_bytes = bytes(self.last_image_data)
+                if success and self.last_frame is not None:
+                    # 如果触发了保存图像
+                    if self.save_image_triggered and self.save_image_path:
+                        self.save_current_image()
+
+                    # 录像时全速抓取, 界面仍按~30 FPS刷新
+                    now = time.perf_counter()
+                    if not self.recorder.is_recording or now - last_emit >= 0.033:
+                        last_emit = now
+                        # 交给界面（不复制数据, 未取走的旧帧被覆盖）
+                        self.display_mailbox.post(
+                            self._preview_frame(self.last_frame),
+                            self.last_width,
+                            self.last_height
+                        )
                     else:
-                        image_bytes = self.last_image_data
+                        self.last_frame.release()
+                        self.last_frame = None
 
-                    # 发送图像数据到UI
-                    self.image_grabbed_signal.emit(
-                        image_bytes,
-                        self.last_width,
-                        self.last_height
-                    )
+                # 控制帧率
+                if not self.recorder.is_recording:
+                    time.sleep(0.033)  # ~30 FPS
+
+            except Exception as e:
+                self.log_signal.emit(f"Error in continuous grabbing: {str(e)}")
+                time.sleep(1)
+
+    def run_callback_consumer(self):
+        """Drain the ring buffer filled by the SDK payload callback"""
+        while self.continuous_grab and self.is_grabbing:
+            frame = None
+            try:
+                if self.deliver_every_frame:
+                    slot = self.frame_ring.acquire_next(timeout=0.5)
+                else:
+                    slot = self.frame_ring.acquire_latest(timeout=0.5)
+                if slot is None:
+                    continue
+
+                # 帧直接引用环形缓冲区槽位, UI显示后调用release()归还
+                index, buffer, meta = slot
+                ring = self.frame_ring
+                frame = CameraFrame(buffer, meta['width'], meta['height'], meta['pixel_type'],
+                                    meta['frame_id'], release_fn=lambda index=index: ring.release(index))
+                frame.offset_x, frame.offset_y = meta['offset_x'], meta['offset_y']
+                self.last_frame = frame
+                self.last_width = frame.width
+                self.last_height = frame.height
+                self.last_pixel_type = frame.pixel_type
+
+                if self.save_image_triggered and self.save_image_path:
+                    self.save_current_image()
+
+                # 邮箱只保留最新一帧, 未取走的旧帧由post()归还, 显示端最多占用两个槽位
+                self.display_mailbox.post(
+                    self._preview_frame(frame),
+                    self.last_width,
+                    self.last_height
+                )
+                frame = None
+
+            except Exception as e:
+                # 未交给显示端的帧必须归还, 否则该槽位一直被占用, 生产者持续丢帧
+                if frame is not None:
+                    frame.release()
+                self.log_signal.emit(f"Error in callback acquisition: {str(e)}")
+                time.sleep(1)
+
+    def run_lp3d_preview(self):
+        """Show the newest laser profiles as a height image while the LP3D stream runs"""
+        while self.continuous_grab and self.is_grabbing:
+            try:
+                image = self.lp3d_stream.preview()
+                if image is not None:
+                    height, width = image.shape
+                    buffer = (ctypes.c_ubyte * image.size).from_buffer(image)
+                    frame = CameraFrame(buffer, width, height, SciCamPixelType.Mono8,
+                                        self.lp3d_stream.profiles.written)
+                    self.last_frame = frame
+                    self.last_width = width
+                    self.last_height = height
+                    self.last_pixel_type = frame.pixel_type
 
-                    # 如果触发了保存图像
                     if self.save_image_triggered and self.save_image_path:
                         self.save_current_image()
 
-                # 控制帧率
+                    self.display_mailbox.post(frame, width, height)
+
                 time.sleep(0.033)  # ~30 FPS
 
             except Exception as e:
-                self.log_signal.emit(f"Error in continuous grabbing: {str(e)}")
+                self.log_signal.emit(f"Error in LP3D preview: {str(e)}")
                 time.sleep(1)
 
-    def start_grabbing(self, timeout, buffer_count, strategy):
+    def _preview_frame(self, frame):
+        """Frame to display: decimated to the view in downsample mode, else frame itself"""
+        if self.active_binning > 1:
+            frame.preview_factor = self.active_binning
+            return frame
+        if self.preview_mode != PREVIEW_DOWNSAMPLE:
+            return frame
+        factor = downsample_factor(self.preview_zoom)
+        if factor == 1:
+            return frame
+        # 小图为独立副本, 大帧缓冲区立即归还
+        with self.pipeline.measure("downsample"):
+            small = downsample_frame(frame, factor)
+        frame.release()
+        # 大帧已归还, last_frame改指向独立的小图, 避免读取已复用的缓冲区
+        if self.last_frame is frame:
+            self.last_frame = small
+        return small
+
+    def _enable_binning(self):
+        """Switch the sensor to binned readout for live view (camera not grabbing)"""
+        reVal, roi = read_roi(self.camera)
+        self._roi_before_binning = roi if reVal == SCI_CAMERA_OK else None
+        reVal, family = set_sensor_binning(self.camera, self.preview_binning, self.node_cache)
+        if reVal != SCI_CAMERA_OK:
+            self.log_signal.emit(f"Sensor binning not available ({reVal}), showing full resolution")
+            return False
+        self.active_binning = self.preview_binning
+        self.conversion_pool.clear()
+        self.log_signal.emit(f"Live view with {family} x{self.active_binning}")
+        return True
+
+    def _disable_binning(self):
+        """Back to full-resolution readout (camera not grabbing)"""
+        reVal, _ = set_sensor_binning(self.camera, 1, self.node_cache)
+        if reVal != SCI_CAMERA_OK:
+            self.log_signal.emit(f"Failed to reset sensor binning: Error {reVal}")
+        # 部分相机合并时缩放Width/Height, 缓存中的ROI值已失效, 恢复原ROI时必须重新写入
+        for name in ("Width", "Height", "OffsetX", "OffsetY"):
+            self.node_cache.invalidate(name)
+        if self._roi_before_binning is not None:
+            apply_roi(self.camera, self._roi_before_binning, self.node_cache)
+            self._roi_before_binning = None
+        self.active_binning = 1
+        self.conversion_pool.clear()
+
+    def _grab_full_resolution(self):
+        """Pause the binned stream, grab one full-resolution frame, resume. Returns CameraFrame or None."""
+        callback = self.acquisition_mode == ACQ_MODE_CALLBACK
+        self.camera.SciCam_StopGrabbing()
+        if callback:
+            self.camera.SciCam_RegisterPayloadCallBack(None, None, True)
+        self._disable_binning()
+
+        frame = None
+        reVal = self.camera.SciCam_StartGrabbing()
+        if reVal == SCI_CAMERA_OK:
+            ppayload = ctypes.c_void_p()
+            reVal = self.camera.SciCam_Grab(ppayload)
+            if reVal == SCI_CAMERA_OK:
+                try:
+                    reVal, frame = convert_payload(ppayload)
+                finally:
+                    self.camera.SciCam_FreePayload(ppayload)
+            self.camera.SciCam_StopGrabbing()
+        if reVal != SCI_CAMERA_OK:
+            self.log_signal.emit(f"Full resolution grab failed: Error {reVal}")
+
+        self._enable_binning()
+        if callback:
+            self.camera.SciCam_RegisterPayloadCallBack(self._payload_callback, None, False)
+        reVal = self.camera.SciCam_StartGrabbing()
+        if reVal != SCI_CAMERA_OK:
+            self.is_grabbing = False
+            self.log_signal.emit(f"Failed to restart grabbing: Error {reVal}")
+        return frame
+
+    def _on_payload(self, payload, tag):
+        """SDK payload callback: convert straight into the next ring slot"""
+        try:
+            self._fill_ring_slot(payload)
+        finally:
+            # 回调以autoFree=False注册: 录像线程接手的payload由其释放
+            if not self.recorder.submit(payload):
+                self.camera.SciCam_FreePayload(payload)
+
+    def _fill_ring_slot(self, payload):
+        """Convert one payload into the next ring slot"""
+        try:
+            start = time.perf_counter()
+            payloadAttribute = SCI_CAM_PAYLOAD_ATTRIBUTE()
+            if SciCam_Payload_GetAttribute(payload, payloadAttribute) != SCI_CAMERA_OK:
+                self.frame_ring.drop()
+                return
+            self.pipeline.add("attribute", time.perf_counter() - start)
+
+            imgData = ctypes.c_void_p()
+            if SciCam_Payload_GetImage(payload, imgData) != SCI_CAMERA_OK:
+                self.frame_ring.drop()
+                return
+
+            imgAttr = payloadAttribute.imgAttr
+            target_type = target_pixel_type(imgAttr.pixelType)
+
+            # 转换尺寸每种格式只查询一次
+            key = (imgAttr.width, imgAttr.height, imgAttr.pixelType, target_type)
+            reVal, size = self.conversion_pool.dst_size(key, imgAttr, imgData, target_type)
+            if reVal != SCI_CAMERA_OK:
+                self.frame_ring.drop()
+                return
+
+            slot = self.frame_ring.begin_write(size)
+            if slot is None:
+                return
+            index, buffer = slot
+
+            dstImgSize = ctypes.c_int(size)
+            start = time.perf_counter()
+            reVal = SciCam_Payload_ConvertImageEx(imgAttr, imgData, target_type,
+                                                  buffer, dstImgSize, True, 0)
+            convert_seconds = time.perf_counter() - start
+            if reVal != SCI_CAMERA_OK:
+                self.frame_ring.abort_write(index)
+                return
+
+            self.frame_ring.commit_write(index, {
+                'size': size,
+                'width': imgAttr.width,
+                'height': imgAttr.height,
+                'pixel_type': target_type,
+                'frame_id': payloadAttribute.frameID,
+                'offset_x': imgAttr.offsetX,
+                'offset_y': imgAttr.offsetY,
+            })
+            queue_depth = self.frame_ring.pending()
+            self.metrics.record(payloadAttribute.frameID, payloadAttribute.timeStamp,
+                                convert_seconds=convert_seconds, queue_depth=queue_depth)
+            self.pipeline.add("convert", convert_seconds)
+            self.pipeline.gauge("ring", queue_depth)
+        except Exception as e:
+            print(f"Error in payload callback: {e}")
+
+    def start_grabbing(self, timeout, buffer_count, strategy, mode=ACQ_MODE_POLLING):
         """Start continuous grabbing"""
         try:
             # Apply settings
             self.camera.SciCam_SetGrabTimeout(timeout)
             self.camera.SciCam_SetGrabBufferCount(buffer_count)
             self.camera.SciCam_SetGrabStrategy(strategy)
+            self.grab_buffer_count = buffer_count
+
+            self.metrics.reset()
+            self.pipeline.reset()
+            self.display_mailbox.reset()
+
+            # 回调模式需在开始采集前注册回调, autoFree=False: 回调自行释放或交给录像线程
+            self.acquisition_mode = mode
+            if mode == ACQ_MODE_LP3D:
+                return self._start_lp3d()
+            if mode == ACQ_MODE_CALLBACK:
+                self.frame_ring.reset()
+                reVal = self.camera.SciCam_RegisterPayloadCallBack(self._payload_callback, None, False)
+                if reVal != SCI_CAMERA_OK:
+                    self.log_signal.emit(f"Failed to register payload callback: Error {reVal}")
+                    return False
+
+            if self.preview_mode == PREVIEW_BINNING:
+                self._enable_binning()
 
             # Start grabbing
             reVal = self.camera.SciCam_StartGrabbing()
             if reVal == SCI_CAMERA_OK:
                 self.is_grabbing = True
                 self.continuous_grab = True
-                self.log_signal.emit("Continuous grabbing started")
+                self.log_signal.emit(f"Continuous grabbing started ({mode})")
 
                 # 启动连续抓取线程
                 if not self.isRunning():
@@ -359,11 +657,38 @@ class CameraWorker(QThread):
             self.log_signal.emit(f"Error starting grabbing: {str(e)}")
             return False
 
+    def _start_lp3d(self):
+        """Start the LP3D contour stream (it grabs on its own thread)"""
+        self.lp3d_stream = LP3DStream(self.camera)
+        success, message = self.lp3d_stream.start()
+        self.log_signal.emit(message)
+        if not success:
+            return False
+
+        self.is_grabbing = True
+        self.continuous_grab = True
+        if not self.isRunning():
+            self.start()
+        return True
+
     def stop_grabbing(self):
         """Stop continuous grabbing"""
         try:
             self.continuous_grab = False
+            if self.acquisition_mode == ACQ_MODE_LP3D and self.lp3d_stream is not None:
+                self.lp3d_stream.stop()
+                self.is_grabbing = False
+                self.log_signal.emit("LP3D stream stopped")
+                return True
+
+            # 录像线程持有的payload须在停止采集前归还
+            if self.recorder.is_recording:
+                self.stop_recording()
             reVal = self.camera.SciCam_StopGrabbing()
+            if self.acquisition_mode == ACQ_MODE_CALLBACK:
+                self.camera.SciCam_RegisterPayloadCallBack(None, None, True)
+            if self.active_binning > 1:
+                self._disable_binning()
             if reVal == SCI_CAMERA_OK:
                 self.is_grabbing = False
                 self.log_signal.emit("Continuous grabbing stopped")
@@ -380,67 +705,35 @@ class CameraWorker(QThread):
         """Grab a single image"""
         try:
             ppayload = ctypes.c_void_p()
+            start = time.perf_counter()
             reVal = self.camera.SciCam_Grab(ppayload)
+            grab_seconds = time.perf_counter() - start
             if reVal != SCI_CAMERA_OK:
+                self.metrics.record_failure(reVal)
                 self.log_signal.emit(f"Grab failed: Error {reVal}")
                 return None
+            self.pipeline.add("grab", grab_seconds)
 
-            payloadAttribute = SCI_CAM_PAYLOAD_ATTRIBUTE()
-            SciCam_Payload_GetAttribute(ppayload, payloadAttribute)
-
-            imgWidth = payloadAttribute.imgAttr.width
-            imgHeight = payloadAttribute.imgAttr.height
-            imgPixelType = payloadAttribute.imgAttr.pixelType
-
-            imgData = ctypes.c_void_p()
-            SciCam_Payload_GetImage(ppayload, imgData)
-
-            dstImgSize = ctypes.c_int()
-
-            # 判断是否为单色图像
-            mono_formats = [
-                SciCamPixelType.Mono1p, SciCamPixelType.Mono2p, SciCamPixelType.Mono4p,
-                SciCamPixelType.Mono8s, SciCamPixelType.Mono8, SciCamPixelType.Mono10,
-                SciCamPixelType.Mono10p, SciCamPixelType.Mono12, SciCamPixelType.Mono12p,
-                SciCamPixelType.Mono14, SciCamPixelType.Mono16,
-                SciCamPixelType.Mono10Packed, SciCamPixelType.Mono12Packed
-            ]
-
-            if imgPixelType in mono_formats:
-                target_type = SciCamPixelType.Mono8
-            else:
-                target_type = SciCamPixelType.RGB8
-
-            # 获取所需缓冲区大小
-            SciCam_Payload_ConvertImage(
-                payloadAttribute.imgAttr,
-                imgData,
-                target_type,
-                None,
-                dstImgSize,
-                True
-            )
+            try:
+                start = time.perf_counter()
+                reVal, frame = convert_payload(ppayload, self.conversion_pool, pipeline=self.pipeline)
+                convert_seconds = time.perf_counter() - start
+            finally:
+                if not self.recorder.submit(ppayload):
+                    self.camera.SciCam_FreePayload(ppayload)
 
-            # 分配缓冲区
-            pDstData = (ctypes.c_ubyte * dstImgSize.value)()
-
-            SciCam_Payload_ConvertImageEx(
-                payloadAttribute.imgAttr,
-                imgData,
-                target_type,
-                pDstData,
-                dstImgSize,
-                True,
-                0
-            )
+            if reVal != SCI_CAMERA_OK:
+                self.log_signal.emit(f"Convert failed: Error {reVal}")
+                return False
 
-            # 存储图像数据
-            self.last_image_data = bytes(pDstData)
-            self.last_width = imgWidth
-            self.last_height = imgHeight
-            self.last_pixel_type = target_type
+            self.metrics.record(frame.frame_id, frame.timestamp,
+                                grab_seconds=grab_seconds, convert_seconds=convert_seconds)
 
-            self.camera.SciCam_FreePayload(ppayload)
+            # 存储图像（NumPy视图, 无额外复制）
+            self.last_frame = frame
+            self.last_width = frame.width
+            self.last_height = frame.height
+            self.last_pixel_type = frame.pixel_type
 
             return True
 
@@ -448,36 +741,74 @@ class CameraWorker(QThread):
             self.log_signal.emit(f"Error grabbing image: {str(e)}")
             return False
 
+    def acquisition_stats(self):
+        """frameID gaps, grab/conversion times, buffer age and queue depth of the current stream"""
+        return self.metrics.stats()
+
+    def pipeline_stats(self):
+        """Per-stage timings (p50/p95/p99, histograms) and queue depths, see PipelineMetrics.stats()"""
+        return self.pipeline.stats()
+
+    def start_recording(self, file_path, quality=RECORD_QUALITY_DEFAULT, max_fps=None):
+        """Record the stream to an AVI file while grabbing"""
+        if not self.is_grabbing:
+            self.log_signal.emit("Start grabbing before recording")
+            return False
+        if self.acquisition_mode == ACQ_MODE_LP3D:
+            self.log_signal.emit("Recording is not available for LP3D contours")
+            return False
+
+        # 录像积压占用SDK缓冲区, 至少留一半给采集
+        self.recorder.quality = quality
+        self.recorder.max_fps = max_fps
+        self.recorder.max_backlog = max(1, self.grab_buffer_count // 2)
+        success, message = self.recorder.start(file_path)
+        self.log_signal.emit(message)
+        return success
+
+    def stop_recording(self):
+        """Finish the current recording"""
+        success, message = self.recorder.stop()
+        stats = self.recorder.stats()
+        self.log_signal.emit(f"{message} (dropped {stats['dropped']}, skipped {stats['skipped']}, "
+                             f"failed {stats['failed']})")
+        return success
+
     def trigger_save_image(self, file_path):
         """Trigger saving of the current image"""
         self.save_image_triggered = True
         self.save_image_path = file_path
 
     def save_current_image(self):
-        """Save the current image to file"""
+        """Queue the current image for the background image writer"""
         try:
-            if not self.last_image_data or not self.save_image_path:
+            if self.last_frame is None or not self.save_image_path:
                 return False
 
-            reVal = SciCam_Payload_SaveImage(
-                self.save_image_path,
-                self.last_pixel_type,
-                self.last_image_data,
-                self.last_width,
-                self.last_height
-            )
+            frame = self.last_frame
+            if self.active_binning > 1 and self.is_grabbing:
+                # 实时视图为合并图像, 保存时单独抓取全分辨率帧
+                frame = self._grab_full_resolution()
+                if frame is None:
+                    self.save_image_triggered = False
+                    self.save_image_path = ""
+                    return False
+
+            def on_written(success, message, path):
+                if success:
+                    self.image_saved_signal.emit(f"Image saved to {path}")
+                    self.log_signal.emit(f"Image saved to {path}")
+                else:
+                    self.log_signal.emit(f"Save failed: {message}")
 
-            if reVal == SCI_CAMERA_OK:
-                self.image_saved_signal.emit(f"Image saved to {self.save_image_path}")
-                self.log_signal.emit(f"Image saved to {self.save_image_path}")
-            else:
-                self.log_signal.emit(f"Save failed: Error {reVal}")
+            # 写入线程保存副本, 采集线程不等待磁盘
+            queued = get_image_writer().submit(frame, self.save_image_path, callback=on_written)
 
             # 重置保存标志
             self.save_image_triggered = False
             self.save_image_path = ""
 
-            return reVal == SCI_CAMERA_OK
+            return queued
 
         except Exception as e:
             self.log_signal.emit(f"Error saving image: {str(e)}")
@@ -639,13 +970,110 @@ class DeviceInfoWidget(QWidget):
         return info_str
 
 
+class NodeValueLoader(QThread):
+    """Reads node values off the UI thread for NodeTreeWidget.
+
+    request() queues node indices of the current node array; the value
+    strings come back in batches through values_signal. reset() starts a
+    new generation for a new node array and drops the queued requests,
+    results of older generations are ignored by the receiver. Each read
+    holds the node lock given to reset() (NodeValueCache.lock), so it
+    never overlaps a node write from another thread.
+    """
+    values_signal = Signal(int, list)  # generation, [(node index, value string)]
+
+    BATCH_SIZE = 32
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._requests = collections.deque()
+        self._cond = threading.Condition()
+        self._running = True
+        self.camera = None
+        self.nodes = None
+        self.node_lock = None
+        self.generation = 0
+
+    def reset(self, camera, nodes, node_lock=None):
+        """Switch to a new node array. Returns the new generation."""
+        with self._cond:
+            self._requests.clear()
+            self.camera = camera
+            self.nodes = nodes
+            self.node_lock = node_lock or threading.RLock()
+            self.generation += 1
+            return self.generation
+
+    def request(self, indices, urgent=False):
+        """Queue node indices; urgent ones (after an edit) go before pending branches"""
+        indices = list(indices)
+        if not indices:
+            return
+        with self._cond:
+            if urgent:
+                self._requests.appendleft(indices)
+            else:
+                self._requests.append(indices)
+            self._cond.notify()
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._requests.clear()
+            self._cond.notify()
+        self.wait()
+
+    def run(self):
+        while True:
+            with self._cond:
+                while self._running and not self._requests:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                indices = self._requests.popleft()
+                camera, nodes, node_lock, generation = self.camera, self.nodes, self.node_lock, self.generation
+
+            results = []
+            for idx in indices:
+                if generation != self.generation:
+                    break
+                # One node per lock hold, so UI writes wait at most one read
+                with node_lock:
+                    value = GetNodeValueStr(camera, SciCamDeviceXmlType.SciCam_DeviceXml_Camera, nodes[idx])
+                results.append((idx, value))
+                if len(results) >= self.BATCH_SIZE:
+                    self.values_signal.emit(generation, results)
+                    results = []
+            if results:
+                self.values_signal.emit(generation, results)
+
+
 class NodeTreeWidget(QWidget):
-    """Widget to display and control device nodes"""
+    """Widget to display and control device nodes.
+
+    The tree is built from node metadata only; values are read by a
+    NodeValueLoader when their branch is expanded, and an edit re-reads
+    just the edited node, its siblings and its known dependents.
+    """
 
     def __init__(self, camera_worker):
         super().__init__()
         self.camera_worker = camera_worker
         self.current_nodes = []
+        self.node_items = []  # node index -> QTreeWidgetItem
+        self.node_parents = []
+        self.node_children = {}
+        self.node_index = {}  # node name -> node index
+        self.value_requested = []  # node index -> value read or queued
+        self.generation = 0
+
+        self.value_loader = NodeValueLoader(self)
+        self.value_loader.values_signal.connect(self.on_values_loaded)
+        self.value_loader.start()
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.value_loader.stop)
+
         self.setup_ui()
 
     def setup_ui(self):
@@ -667,6 +1095,33 @@ class NodeTreeWidget(QWidget):
 
         layout.addLayout(button_layout)
 
+        # Parameter profiles
+        profile_layout = QHBoxLayout()
+        profile_layout.addWidget(QLabel("Profile:"))
+
+        self.profile_combo = QComboBox()
+        self.profile_combo.setMinimumWidth(150)
+
+        self.save_profile_btn = QPushButton("Save As...")
+        self.save_profile_btn.clicked.connect(self.save_profile)
+
+        self.apply_profile_btn = QPushButton("Apply")
+        self.apply_profile_btn.setToolTip("Write only the nodes that differ from the profile")
+        self.apply_profile_btn.clicked.connect(lambda: self.apply_profile(full=False))
+
+        self.load_profile_btn = QPushButton("Full Load")
+        self.load_profile_btn.setToolTip("Load every feature from the profile file (FeatureLoad)")
+        self.load_profile_btn.clicked.connect(lambda: self.apply_profile(full=True))
+
+        profile_layout.addWidget(self.profile_combo)
+        profile_layout.addWidget(self.save_profile_btn)
+        profile_layout.addWidget(self.apply_profile_btn)
+        profile_layout.addWidget(self.load_profile_btn)
+        profile_layout.addStretch()
+
+        layout.addLayout(profile_layout)
+        self.update_profile_list()
+
         # Node tree
         self.node_tree = QTreeWidget()
         self.node_tree.setHeaderLabels(["Node", "Type", "Value", "Access"])
@@ -676,6 +1131,7 @@ class NodeTreeWidget(QWidget):
         self.node_tree.setColumnWidth(3, 80)
         self.node_tree.itemSelectionChanged.connect(self.on_selection_changed)
         self.node_tree.itemDoubleClicked.connect(self.on_item_double_clicked)
+        self.node_tree.itemExpanded.connect(self.on_item_expanded)
 
         layout.addWidget(self.node_tree)
 
@@ -714,17 +1170,20 @@ class NodeTreeWidget(QWidget):
             return
 
         try:
+            node_lock = self.camera_worker.node_cache.lock
             nodesCount = ctypes.c_uint(0)
-            reVal = self.camera_worker.camera.SciCam_GetNodes(None, nodesCount)
+            with node_lock:
+                reVal = self.camera_worker.camera.SciCam_GetNodes(None, nodesCount)
 
             if reVal != SCI_CAMERA_OK or nodesCount.value == 0:
-                self.node_tree.clear()
+                self.clear_nodes()
                 QMessageBox.information(self, "Info", "No nodes found or failed to get nodes")
                 return
 
             nodes = (SCI_CAM_NODE * nodesCount.value)()
-            reVal = self.camera_worker.camera.SciCam_GetNodes(
-                ctypes.cast(nodes, PSCI_CAM_NODE).contents, nodesCount)
+            with node_lock:
+                reVal = self.camera_worker.camera.SciCam_GetNodes(
+                    ctypes.cast(nodes, PSCI_CAM_NODE).contents, nodesCount)
 
             if reVal == SCI_CAMERA_OK:
                 self.current_nodes = nodes
@@ -735,29 +1194,75 @@ class NodeTreeWidget(QWidget):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to get nodes: {str(e)}")
 
-    def update_tree(self, nodes, count):
-        """Update the tree widget with nodes"""
-        self.node_tree.clear()
+    def update_profile_list(self):
+        """Reload the saved profile names"""
+        profiles = self.camera_worker.profiles
+        self.profile_combo.clear()
+        self.profile_combo.addItems(profiles.list())
+        if profiles.active:
+            self.profile_combo.setCurrentText(profiles.active)
+
+    def save_profile(self):
+        """Save the current camera parameters under a new name"""
+        if not self.camera_worker.current_device:
+            QMessageBox.warning(self, "Warning", "No camera connected")
+            return
+
+        name, ok = QInputDialog.getText(self, "Save Profile", "Profile name:",
+                                        text=self.profile_combo.currentText())
+        name = name.strip()
+        if not ok or not name:
+            return
 
-        # Build parent-child relationships
-        node_dict = {}
+        success, message = self.camera_worker.profiles.save(name)
+        self.camera_worker.log_signal.emit(message)
+        if success:
+            self.update_profile_list()
+        else:
+            QMessageBox.warning(self, "Error", message)
 
-        # First pass: create all items
+    def apply_profile(self, full=False):
+        """Switch the camera to the selected profile"""
+        name = self.profile_combo.currentText()
+        if not name:
+            return
+        if not self.camera_worker.current_device:
+            QMessageBox.warning(self, "Warning", "No camera connected")
+            return
+
+        success, message, _ = self.camera_worker.profiles.apply(name, full)
+        self.camera_worker.log_signal.emit(message)
+        if not success:
+            QMessageBox.warning(self, "Error", message)
+        # The node set stays the same, only values change
+        if self.node_items:
+            self.reload_values()
+        else:
+            self.refresh_nodes()
+
+    def update_tree(self, nodes, count):
+        """Update the tree widget with nodes; values are loaded as branches expand"""
+        self.node_tree.clear()
+        self.generation = self.value_loader.reset(self.camera_worker.camera, nodes,
+                                                  self.camera_worker.node_cache.lock)
+        self.node_parents = node_parents(nodes, count)
+        self.node_children = node_children(self.node_parents)
+        self.node_index = {}
+        self.node_items = []
+        self.value_requested = [False] * count
+
+        # First pass: create all items from the node metadata
         for i in range(count):
             node = nodes[i]
             try:
-                # Get node value using the camera instance
-                node_value = GetNodeValueStr(
-                    self.camera_worker.camera,
-                    SciCamDeviceXmlType.SciCam_DeviceXml_Camera,
-                    node
-                )
+                node_name = node.name.decode() if node.name else "Unknown"
+                self.node_index[node_name] = i
 
                 item = QTreeWidgetItem([
-                    node.name.decode() if node.name else "Unknown",
+                    node_name,
                     GetEnumName(SciCamNodeType, node.type) if GetEnumName(SciCamNodeType, node.type) else str(
                         node.type),
-                    node_value,
+                    "" if node.type in VALUE_NODE_TYPES else "N/A",
                     GetEnumName(SciCamNodeAccessMode, node.accessMode) if GetEnumName(SciCamNodeAccessMode,
                                                                                       node.accessMode) else str(
                         node.accessMode)
@@ -776,8 +1281,6 @@ class NodeTreeWidget(QWidget):
                 elif node.accessMode == SciCamNodeAccessMode.SciCam_NodeAccessMode_WO:
                     # Blue background for WO nodes
                     item.setBackground(3, QBrush(QColor(200, 200, 255)))
-
-                node_dict[i] = item
             except Exception as e:
                 print(f"Error processing node {i}: {e}")
                 # Create item with error info
@@ -787,30 +1290,65 @@ class NodeTreeWidget(QWidget):
                     f"Error: {str(e)}",
                     "Error"
                 ])
-                node_dict[i] = item
-
-        # Second pass: build hierarchy
-        for i in range(count):
-            if i >= len(nodes):
-                continue
-
-            node = nodes[i]
-            item = node_dict[i]
-
-            if node.level == 0:
-                self.node_tree.addTopLevelItem(item)
+                self.value_requested[i] = True
+            self.node_items.append(item)
+
+        # Second pass: build hierarchy on detached items, then add the top level at once
+        top_level = []
+        for i, parent_idx in enumerate(self.node_parents):
+            if parent_idx >= 0:
+                self.node_items[parent_idx].addChild(self.node_items[i])
             else:
-                # Find parent based on level
-                parent_idx = i - 1
-                while parent_idx >= 0 and nodes[parent_idx].level >= node.level:
-                    parent_idx -= 1
+                top_level.append(self.node_items[i])
+        self.node_tree.addTopLevelItems(top_level)
 
-                if parent_idx >= 0:
-                    parent_item = node_dict[parent_idx]
-                    parent_item.addChild(item)
+        # Expand the top level only; deeper branches load when the user opens them
+        for item in top_level:
+            item.setExpanded(True)
+        self.load_values(self.node_children.get(-1, []))
 
-        # Expand all items
-        self.node_tree.expandAll()
+    def clear_nodes(self):
+        """Forget the node tree, e.g. when the camera is closed"""
+        self.generation = self.value_loader.reset(None, None)
+        self.node_tree.clear()
+        self.current_nodes = []
+        self.node_items = []
+        self.node_parents = []
+        self.node_children = {}
+        self.node_index = {}
+        self.value_requested = []
+
+    def load_values(self, indices, force=False, urgent=False):
+        """Queue the values of the given nodes on the loader; already read ones only with force"""
+        queued = []
+        for idx in indices:
+            if self.current_nodes[idx].type not in VALUE_NODE_TYPES:
+                continue
+            if self.value_requested[idx] and not force:
+                continue
+            self.value_requested[idx] = True
+            self.node_items[idx].setText(2, "...")
+            queued.append(idx)
+        self.value_loader.request(queued, urgent)
+
+    def reload_values(self):
+        """Re-read every value shown so far, keeping the node metadata"""
+        loaded = [i for i, requested in enumerate(self.value_requested) if requested]
+        self.load_values(loaded, force=True)
+
+    def on_item_expanded(self, item):
+        """Load the values of a branch the first time it is opened"""
+        node_idx = item.data(0, Qt.UserRole)
+        if node_idx is not None and node_idx < len(self.node_items):
+            self.load_values(self.node_children.get(node_idx, []))
+
+    @Slot(int, list)
+    def on_values_loaded(self, generation, results):
+        """Show values read by the loader; results for an older node array are dropped"""
+        if generation != self.generation:
+            return
+        for node_idx, value in results:
+            self.node_items[node_idx].setText(2, value)
 
     def edit_selected_node(self):
         """Edit the selected node"""
@@ -828,40 +1366,29 @@ class NodeTreeWidget(QWidget):
         """Edit a specific node"""
         node = self.current_nodes[node_idx]
 
-        # Create edit dialog
-        dialog = EditNodeDialog(self.camera_worker.camera, node, self)
+        # Create edit dialog (reads the node's range and items, keep the value loader out meanwhile)
+        with self.camera_worker.node_cache.lock:
+            dialog = EditNodeDialog(self.camera_worker.camera, node, self)
         if dialog.exec() == QDialog.Accepted:
             new_value = dialog.get_value()
             if new_value is not None:
-                self.apply_node_value(node, new_value)
+                self.apply_node_value(node_idx, new_value)
 
-    def apply_node_value(self, node, new_value):
+    def apply_node_value(self, node_idx, new_value):
         """Apply new value to node"""
         try:
+            node = self.current_nodes[node_idx]
             node_name = node.name.decode() if node.name else ""
-            node_type = node.type
-            reVal = SCI_CAMERA_OK
-
-            if node_type == SciCamNodeType.SciCam_NodeType_Bool:
-                reVal = self.camera_worker.camera.SciCam_SetBoolValueEx(
-                    SciCamDeviceXmlType.SciCam_DeviceXml_Camera, node_name, new_value)
-            elif node_type == SciCamNodeType.SciCam_NodeType_Int:
-                reVal = self.camera_worker.camera.SciCam_SetIntValueEx(
-                    SciCamDeviceXmlType.SciCam_DeviceXml_Camera, node_name, new_value)
-            elif node_type == SciCamNodeType.SciCam_NodeType_Float:
-                reVal = self.camera_worker.camera.SciCam_SetFloatValueEx(
-                    SciCamDeviceXmlType.SciCam_DeviceXml_Camera, node_name, new_value)
-            elif node_type == SciCamNodeType.SciCam_NodeType_Enum:
-                reVal = self.camera_worker.camera.SciCam_SetEnumValueEx(
-                    SciCamDeviceXmlType.SciCam_DeviceXml_Camera, node_name, new_value)
-            elif node_type == SciCamNodeType.SciCam_NodeType_String:
-                reVal = self.camera_worker.camera.SciCam_SetStringValueEx(
-                    SciCamDeviceXmlType.SciCam_DeviceXml_Camera, node_name, new_value)
+            # Through the cache, so profile switches know the new value
+            reVal, _ = self.camera_worker.node_cache.write(node_name, node.type, new_value)
 
             if reVal == SCI_CAMERA_OK:
                 QMessageBox.information(self, "Success", f"Node {node_name} updated successfully")
-                # Refresh the node value in the tree
-                self.refresh_nodes()
+                # Re-read the node and the nodes it may have changed, not the whole tree
+                affected = affected_nodes(node_idx, self.node_parents, self.node_children,
+                                          self.node_index, node_name)
+                affected = affected[:1] + [i for i in affected[1:] if self.value_requested[i]]
+                self.load_values(affected, force=True, urgent=True)
             else:
                 QMessageBox.warning(self, "Error", f"Failed to update node {node_name}: Error {reVal}")
 
@@ -876,7 +1403,13 @@ class ImageDisplayWidget(QWidget):
         super().__init__()
         self.setup_ui()
         self.current_image = None
-        self.scale_factor = 1.0
+        self.scale_factor = 1.0  # 相对全分辨率图像
+        self.source_scale = 1  # 预览降采样倍数: 每个像素对应的传感器像素
+        self.streaming = False  # 实时流: 快速缩放
+        self._buffer = None  # current_image (QImage) 引用的持久像素缓冲区
+        self._source_size = None
+        self.render_times = collections.deque(maxlen=50)
+        self.pipeline = None  # PipelineMetrics: copy/paint耗时
 
     def setup_ui(self):
         layout = QVBoxLayout()
@@ -956,67 +1489,93 @@ class ImageDisplayWidget(QWidget):
         self.setLayout(layout)
 
     def display_image(self, image_data, width, height, pixel_type=SciCamPixelType.Mono8):
-        """Display image from raw data"""
-        try:
-            # 根据像素类型创建QImage
-            if pixel_type == SciCamPixelType.Mono8:
-                format = QImage.Format_Grayscale8
-                bytes_per_line = width
-            elif pixel_type == SciCamPixelType.RGB8:
-                format = QImage.Format_RGB888
-                bytes_per_line = width * 3
-            else:
-                self.info_label.setText(f"Unsupported pixel format: {pixel_type}")
-                return
+        """Display image from a CameraFrame or raw data.
 
-            # 确保图像数据是bytes类型
-            if isinstance(image_data, ctypes.Array):
-                image_data = bytes(image_data)
-            elif isinstance(image_data, bytes):
-                pass
+        The pixels are copied into a persistent NumPy buffer that a QImage
+        views, so the frame can be released right away and no image objects
+        are created per frame. width/height are the full-resolution size.
+        """
+        start = time.perf_counter()
+        try:
+            if isinstance(image_data, CameraFrame):
+                array = image_data.array
+                pixel_type = image_data.pixel_type
+                source_scale = image_data.preview_factor
             else:
-                image_data = bytes(image_data)
-
-            # 创建QImage
-            image = QImage(image_data, width, height, bytes_per_line, format)
+                # 根据像素类型解释原始数据
+                if pixel_type == SciCamPixelType.Mono8:
+                    shape = (height, width)
+                elif pixel_type == SciCamPixelType.RGB8:
+                    shape = (height, width, 3)
+                else:
+                    self.info_label.setText(f"Unsupported pixel format: {pixel_type}")
+                    return
+                array = np.frombuffer(image_data, dtype=np.uint8, count=int(np.prod(shape))).reshape(shape)
+                source_scale = 1
 
-            # 检查图像是否有效
-            if image.isNull():
+            if array is None:
                 self.info_label.setText("Error: Invalid image data")
                 return
 
-            # 转换为QPixmap并显示
-            pixmap = QPixmap.fromImage(image)
-            self.current_image = pixmap
-
-            # 重置缩放因子
-            self.scale_factor = 1.0
+            # 尺寸或格式变化时才重建缓冲区和QImage, 同时重置缩放
+            if self._buffer is None or self._buffer.shape != array.shape:
+                self._buffer = np.empty(array.shape, dtype=np.uint8)
+                fmt = QImage.Format_Grayscale8 if array.ndim == 2 else QImage.Format_RGB888
+                bytes_per_line = self._buffer.strides[0]
+                self.current_image = QImage(self._buffer.data, array.shape[1], array.shape[0], bytes_per_line, fmt)
+                if (width, height) != self._source_size:
+                    self.scale_factor = 1.0
+                self._source_size = (width, height)
+                self.size_label.setText(f"{width} × {height}")
+                pixel_type_name = GetEnumName(SciCamPixelType, pixel_type) or str(pixel_type)
+                self.info_label.setText(f"Image loaded: {width} × {height}, {pixel_type_name}")
+            copy_start = time.perf_counter()
+            np.copyto(self._buffer, array)
+            self.source_scale = source_scale
 
             # 更新显示
+            paint_start = time.perf_counter()
             self.update_display()
-
-            # 更新状态信息
-            self.size_label.setText(f"{width} × {height}")
-            pixel_type_name = GetEnumName(SciCamPixelType, pixel_type) or str(pixel_type)
-            self.info_label.setText(f"Image loaded: {width} × {height}, {pixel_type_name}")
+            if self.pipeline is not None:
+                self.pipeline.add("copy", paint_start - copy_start)
+                self.pipeline.add("paint", time.perf_counter() - paint_start)
 
         except Exception as e:
             self.info_label.setText(f"Error displaying image: {str(e)}")
+        finally:
+            self.render_times.append(time.perf_counter() - start)
+
+    def set_streaming(self, streaming):
+        """Fast scaling while frames stream in; one smooth re-render of the last frame when it stops"""
+        self.streaming = streaming
+        if not streaming:
+            self.update_display()
+
+    def render_ms(self):
+        """Mean display cost per frame over the recent frames, in milliseconds"""
+        if not self.render_times:
+            return 0.0
+        return sum(self.render_times) / len(self.render_times) * 1000
 
     def update_display(self):
         """Update the displayed image with current scale factor"""
         if self.current_image:
             # 计算缩放后的尺寸
-            scaled_width = int(self.current_image.width() * self.scale_factor)
-            scaled_height = int(self.current_image.height() * self.scale_factor)
-
-            # 缩放图像
-            scaled_pixmap = self.current_image.scaled(
-                scaled_width,
-                scaled_height,
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
+            scaled_width = int(self.current_image.width() * self.source_scale * self.scale_factor)
+            scaled_height = int(self.current_image.height() * self.source_scale * self.scale_factor)
+
+            # 先缩放QImage再转换, 只转换显示大小的像素; 实时流用快速缩放
+            if (scaled_width, scaled_height) == (self.current_image.width(), self.current_image.height()):
+                scaled_image = self.current_image
+            else:
+                transformation = Qt.FastTransformation if self.streaming else Qt.SmoothTransformation
+                scaled_image = self.current_image.scaled(
+                    scaled_width,
+                    scaled_height,
+                    Qt.KeepAspectRatio,
+                    transformation
+                )
+            scaled_pixmap = QPixmap.fromImage(scaled_image)
 
             # 设置图像
             self.image_label.setPixmap(scaled_pixmap)
@@ -1052,8 +1611,8 @@ class ImageDisplayWidget(QWidget):
 
             if viewport_width > 0 and viewport_height > 0:
                 # 计算适合窗口的缩放比例
-                scale_x = viewport_width / self.current_image.width()
-                scale_y = viewport_height / self.current_image.height()
+                scale_x = viewport_width / (self.current_image.width() * self.source_scale)
+                scale_y = viewport_height / (self.current_image.height() * self.source_scale)
 
                 self.scale_factor = min(scale_x, scale_y, 1.0)
                 self.update_display()
@@ -1061,12 +1620,15 @@ class ImageDisplayWidget(QWidget):
     def clear_image(self):
         """Clear the displayed image"""
         self.current_image = None
+        self._buffer = None
+        self._source_size = None
         self.image_label.clear()
         self.image_label.setText("No Image")
         self.size_label.setText("No image")
         self.info_label.setText("No image to display")
         self.zoom_label.setText("100%")
         self.scale_factor = 1.0
+        self.source_scale = 1
 
 
 class CameraControlWidget(QWidget):
@@ -1079,6 +1641,8 @@ class CameraControlWidget(QWidget):
         self.frame_count = 0
         self.fps_timer = QTimer()
         self.last_fps_time = time.time()
+        self.display_timer = QTimer()  # 按界面刷新率从邮箱取最新帧
+        self._last_info_str = None
 
         self.setup_ui()
         self.connect_signals()
@@ -1130,6 +1694,7 @@ class CameraControlWidget(QWidget):
 
         # 图像显示部件
         self.image_display = ImageDisplayWidget()
+        self.image_display.pipeline = self.camera_worker.pipeline
         right_layout.addWidget(self.image_display)
 
         # 快速操作按钮
@@ -1142,8 +1707,13 @@ class CameraControlWidget(QWidget):
         self.save_btn = QPushButton("Save Image")
         self.save_btn.clicked.connect(self.save_current_image)
 
+        self.record_btn = QPushButton("Record")
+        self.record_btn.setCheckable(True)
+        self.record_btn.clicked.connect(self.toggle_recording)
+
         quick_buttons_layout.addWidget(self.live_view_btn)
         quick_buttons_layout.addWidget(self.save_btn)
+        quick_buttons_layout.addWidget(self.record_btn)
         quick_buttons_layout.addStretch()
 
         right_layout.addLayout(quick_buttons_layout)
@@ -1258,9 +1828,60 @@ class CameraControlWidget(QWidget):
         strategy_layout.addStretch()
         settings_layout.addLayout(strategy_layout)
 
+        # Acquisition mode
+        mode_layout = QHBoxLayout()
+        mode_layout.addWidget(QLabel("Acquisition Mode:"))
+        self.acq_mode_combo = QComboBox()
+        self.acq_mode_combo.addItems([ACQ_MODE_POLLING, ACQ_MODE_CALLBACK, ACQ_MODE_LP3D])
+        self.acq_mode_combo.setToolTip("Callback: SDK pushes frames into a ring buffer, no polling delay\n"
+                                       "LP3D Contour: laser profiler contours, shown as a height image")
+        mode_layout.addWidget(self.acq_mode_combo)
+        self.every_frame_check = QCheckBox("Deliver every frame")
+        self.every_frame_check.setToolTip("Callback mode only: consume every buffered frame instead of the newest")
+        mode_layout.addWidget(self.every_frame_check)
+        mode_layout.addStretch()
+        settings_layout.addLayout(mode_layout)
+
         settings_group.setLayout(settings_layout)
         layout.addWidget(settings_group)
 
+        # Live preview settings
+        preview_group = QGroupBox("Live Preview")
+        preview_layout = QHBoxLayout()
+        preview_layout.addWidget(QLabel("Preview:"))
+        self.preview_mode_combo = QComboBox()
+        self.preview_mode_combo.addItems(PREVIEW_MODES)
+        self.preview_mode_combo.setToolTip("Downsample to View: decimate frames to the zoom level before display\n"
+                                           "Sensor Binning: camera bins while live, saving grabs one full-resolution frame")
+        preview_layout.addWidget(self.preview_mode_combo)
+        preview_layout.addWidget(QLabel("Binning:"))
+        self.preview_binning_spin = QSpinBox()
+        self.preview_binning_spin.setRange(2, 4)
+        self.preview_binning_spin.setValue(2)
+        preview_layout.addWidget(self.preview_binning_spin)
+        preview_layout.addStretch()
+        preview_group.setLayout(preview_layout)
+        layout.addWidget(preview_group)
+
+        # Recording settings
+        record_group = QGroupBox("Recording")
+        record_layout = QHBoxLayout()
+        record_layout.addWidget(QLabel("Quality:"))
+        self.record_quality_spin = QSpinBox()
+        self.record_quality_spin.setRange(1, 100)
+        self.record_quality_spin.setValue(RECORD_QUALITY_DEFAULT)
+        record_layout.addWidget(self.record_quality_spin)
+        record_layout.addWidget(QLabel("Max FPS:"))
+        self.record_fps_spin = QDoubleSpinBox()
+        self.record_fps_spin.setRange(0.0, 1000.0)
+        self.record_fps_spin.setDecimals(1)
+        self.record_fps_spin.setSpecialValueText("No limit")
+        self.record_fps_spin.setToolTip("Frames arriving faster are skipped; 0 records every frame")
+        record_layout.addWidget(self.record_fps_spin)
+        record_layout.addStretch()
+        record_group.setLayout(record_layout)
+        layout.addWidget(record_group)
+
         # Acquisition control buttons
         acq_button_layout = QHBoxLayout()
 
@@ -1354,9 +1975,47 @@ class CameraControlWidget(QWidget):
         self.frame_count_label = QLabel("Frames Grabbed: 0")
         stats_layout.addWidget(self.frame_count_label)
 
+        self.ring_stats_label = QLabel("Ring Buffer: -")
+        stats_layout.addWidget(self.ring_stats_label)
+
+        self.acq_stats_label = QLabel("Acquisition: -")
+        self.acq_stats_label.setWordWrap(True)
+        stats_layout.addWidget(self.acq_stats_label)
+
+        self.writer_stats_label = QLabel("Image Writer: idle")
+        stats_layout.addWidget(self.writer_stats_label)
+
+        self.recorder_stats_label = QLabel("Recorder: idle")
+        stats_layout.addWidget(self.recorder_stats_label)
+
+        self.display_stats_label = QLabel("Display: -")
+        stats_layout.addWidget(self.display_stats_label)
+
         stats_group.setLayout(stats_layout)
         layout.addWidget(stats_group)
 
+        # Pipeline metrics: where each frame spends its time
+        pipeline_group = QGroupBox("Pipeline")
+        pipeline_layout = QVBoxLayout()
+
+        self.pipeline_table = QTableWidget(0, 7)
+        self.pipeline_table.setHorizontalHeaderLabels(["Stage", "Rate/s", "p50 ms", "p95 ms", "p99 ms", "Max ms",
+                                                       "Histogram"])
+        self.pipeline_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.pipeline_table.horizontalHeader().setStretchLastSection(True)
+        self.pipeline_table.verticalHeader().setVisible(False)
+        self.pipeline_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.pipeline_table.setToolTip("Histogram buckets (ms): " +
+                                       ", ".join(f"≤{bound:g}" for bound in HISTOGRAM_BOUNDS_MS) + ", more")
+        pipeline_layout.addWidget(self.pipeline_table)
+
+        self.pipeline_reset_btn = QPushButton("Reset Metrics")
+        self.pipeline_reset_btn.clicked.connect(self.camera_worker.pipeline.reset)
+        pipeline_layout.addWidget(self.pipeline_reset_btn)
+
+        pipeline_group.setLayout(pipeline_layout)
+        layout.addWidget(pipeline_group)
+
         widget.setLayout(layout)
         return widget
 
@@ -1364,9 +2023,12 @@ class CameraControlWidget(QWidget):
         """Connect camera worker signals"""
         self.camera_worker.log_signal.connect(self.update_log)
         self.camera_worker.device_list_signal.connect(self.update_device_list)
-        self.camera_worker.image_grabbed_signal.connect(self.on_image_grabbed)
         self.camera_worker.image_saved_signal.connect(self.on_image_saved)
 
+        # Pull the newest frame at display rate; frames posted in between are skipped
+        self.display_timer.timeout.connect(self.show_latest_frame)
+        self.display_timer.start(DISPLAY_INTERVAL_MS)
+
         # Setup FPS timer
         self.fps_timer.timeout.connect(self.update_fps)
         self.fps_timer.start(1000)  # Update every second
@@ -1390,23 +2052,9 @@ class CameraControlWidget(QWidget):
             # Get device type
             dev_type = GetEnumName(SciCamDeviceType, info.devType) or "Unknown"
 
-            # Get model name based on transfer type
-            model_name = "Unknown"
-            if info.tlType == SciCamTLType.SciCam_TLType_Gige:
-                model_name = ''.join(chr(c) for c in info.info.gigeInfo.modelName if c != 0)
-            elif info.tlType == SciCamTLType.SciCam_TLType_Usb3:
-                model_name = ''.join(chr(c) for c in info.info.usb3Info.modelName if c != 0)
-            elif info.tlType == SciCamTLType.SciCam_TLType_CL:
-                model_name = ''.join(chr(c) for c in info.info.clInfo.cameraModel if c != 0)
-
-            # Get serial number
-            serial = "Unknown"
-            if info.tlType == SciCamTLType.SciCam_TLType_Gige:
-                serial = ''.join(chr(c) for c in info.info.gigeInfo.serialNumber if c != 0)
-            elif info.tlType == SciCamTLType.SciCam_TLType_Usb3:
-                serial = ''.join(chr(c) for c in info.info.usb3Info.serialNumber if c != 0)
-            elif info.tlType == SciCamTLType.SciCam_TLType_CL:
-                serial = ''.join(chr(c) for c in info.info.clInfo.cameraSerialNumber if c != 0)
+            # Model and serial are decoded once by the device registry
+            model_name = device['model'] or "Unknown"
+            serial = device['serial'] or "Unknown"
 
             self.device_table.setItem(i, 0, QTableWidgetItem(str(i)))
             self.device_table.setItem(i, 1, QTableWidgetItem(dev_type))
@@ -1445,6 +2093,7 @@ class CameraControlWidget(QWidget):
     def close_device(self):
         """Close current device"""
         self.update_log("Closing device...")
+        self.node_widget.clear_nodes()
         self.camera_worker.close_device()
         self.close_btn.setEnabled(False)
         self.open_btn.setEnabled(True)
@@ -1453,6 +2102,7 @@ class CameraControlWidget(QWidget):
         #self.single_grab_btn.setEnabled(False)
         self.live_view_btn.setEnabled(False)
         self.save_btn.setEnabled(False)
+        self.record_btn.setChecked(False)
         self.device_status_label.setText("Device: Not Connected")
         self.camera_status_label.setText("Camera: Not Open")
         self.grabbing_status_label.setText("Grabbing: Not Active")
@@ -1480,13 +2130,20 @@ class CameraControlWidget(QWidget):
             strategy_map = {"OneByOne": 0, "Latest": 1, "Upcoming": 2}
             strategy = strategy_map[self.strategy_combo.currentText()]
 
+            mode = self.acq_mode_combo.currentText()
+            self.camera_worker.deliver_every_frame = self.every_frame_check.isChecked()
+            self.camera_worker.preview_mode = self.preview_mode_combo.currentText()
+            self.camera_worker.preview_binning = self.preview_binning_spin.value()
+            self.camera_worker.preview_zoom = self.image_display.scale_factor
+
             # Start grabbing
-            success = self.camera_worker.start_grabbing(timeout, buffer_count, strategy)
+            success = self.camera_worker.start_grabbing(timeout, buffer_count, strategy, mode)
             if success:
                 #self.start_grab_btn.setEnabled(False)
                 #self.stop_grab_btn.setEnabled(True)
                 #self.single_grab_btn.setEnabled(False)
                 self.live_view_btn.setChecked(True)
+                self.image_display.set_streaming(True)
                 self.grabbing_status_label.setText("Grabbing: Active")
                 self.update_log("Continuous grabbing started")
             else:
@@ -1507,6 +2164,8 @@ class CameraControlWidget(QWidget):
                 #self.stop_grab_btn.setEnabled(False)
                 #self.single_grab_btn.setEnabled(True)
                 self.live_view_btn.setChecked(False)
+                self.record_btn.setChecked(False)
+                self.image_display.set_streaming(False)
                 self.grabbing_status_label.setText("Grabbing: Not Active")
                 self.update_log("Continuous grabbing stopped")
             else:
@@ -1526,10 +2185,9 @@ class CameraControlWidget(QWidget):
             success = self.camera_worker.grab_single_image()
             if success:
                 # 更新图像显示
-                if (hasattr(self.camera_worker, 'last_image_data') and
-                        self.camera_worker.last_image_data):
+                if self.camera_worker.last_frame is not None:
                     self.image_display.display_image(
-                        self.camera_worker.last_image_data,
+                        self.camera_worker.last_frame,
                         self.camera_worker.last_width,
                         self.camera_worker.last_height,
                         self.camera_worker.last_pixel_type
@@ -1544,33 +2202,43 @@ class CameraControlWidget(QWidget):
 
         #self.single_grab_btn.setEnabled(True)
 
-    def on_image_grabbed(self, image_data, width, height):
+    def show_latest_frame(self):
+        """Display the frame waiting in the worker's mailbox, if any"""
+        mailbox = self.camera_worker.display_mailbox
+        item = mailbox.take()
+        if item is not None:
+            self.camera_worker.pipeline.add("deliver", mailbox.last_wait)
+            self.on_image_grabbed(*item)
+
+    def on_image_grabbed(self, frame, width, height):
         """Handle grabbed image"""
         self.frame_count += 1
+        data_size = frame.nbytes
 
-        current_scale_factor = self.image_display.scale_factor
-
-        # 更新图像显示
-        self.image_display.display_image(
-            image_data,
-            width,
-            height,
-            self.camera_worker.last_pixel_type
-        )
+        # 更新图像显示, 显示后立即归还帧缓冲区
+        try:
+            self.image_display.display_image(
+                frame,
+                width,
+                height,
+                frame.pixel_type
+            )
+        finally:
+            frame.release()
 
-        # 恢复缩放因子（如果不是首次显示）
-        if hasattr(self.image_display, 'current_image') and self.image_display.current_image:
-            if current_scale_factor != 1.0:  # 如果不是默认缩放
-                self.image_display.scale_factor = current_scale_factor
-                self.image_display.update_display()
+        # 下一帧按当前缩放降采样
+        self.camera_worker.preview_zoom = self.image_display.scale_factor
 
         # 更新图像信息
         info_str = f"""
         <b>Resolution:</b> {width} × {height}<br>
         <b>Pixel Type:</b> {GetEnumName(SciCamPixelType, self.camera_worker.last_pixel_type) if GetEnumName(SciCamPixelType, self.camera_worker.last_pixel_type) else self.camera_worker.last_pixel_type}<br>
-        <b>Data Size:</b> {len(image_data)} bytes
+        <b>Data Size:</b> {data_size} bytes
         """
-        self.image_info_text.setText(info_str)
+        # 内容不变时不重新排版富文本
+        if info_str != self._last_info_str:
+            self._last_info_str = info_str
+            self.image_info_text.setText(info_str)
 
     def on_image_saved(self, message):
         """Handle image saved signal"""
@@ -1591,9 +2259,36 @@ class CameraControlWidget(QWidget):
                 self.stop_grabbing()
             self.live_view_btn.setText("Live View")
 
+    def toggle_recording(self):
+        """Start or stop recording the live stream"""
+        if not self.record_btn.isChecked():
+            self.camera_worker.stop_recording()
+            return
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Record Video",
+            f"camera_record_{timestamp}.avi",
+            "AVI Files (*.avi)"
+        )
+        if not file_path:
+            self.record_btn.setChecked(False)
+            return
+
+        # 录像需要连续采集
+        if not self.camera_worker.is_grabbing:
+            self.live_view_btn.setChecked(True)
+            self.toggle_live_view()
+
+        max_fps = self.record_fps_spin.value() or None
+        if not self.camera_worker.start_recording(file_path, self.record_quality_spin.value(), max_fps):
+            self.record_btn.setChecked(False)
+
     def save_current_image(self):
         """Save the current image"""
-        if not hasattr(self.camera_worker, 'last_image_data') or not self.camera_worker.last_image_data:
+        # 录像时未显示的帧会立即归还(last_frame为None), 采集中由工作线程保存下一帧
+        if self.camera_worker.last_frame is None and not self.camera_worker.is_grabbing:
             QMessageBox.warning(self, "Warning", "No image to save")
             return
 
@@ -1605,7 +2300,7 @@ class CameraControlWidget(QWidget):
             self,
             "Save Image",
             default_name,
-            "BMP Files (*.bmp);;All Files (*.*)"
+            "BMP Files (*.bmp);;PNG Files (*.png);;NumPy Files (*.npy)"
         )
 
         if file_path:
@@ -1619,10 +2314,76 @@ class CameraControlWidget(QWidget):
         elapsed = current_time - self.last_fps_time
         if elapsed > 0:
             fps = self.frame_count / elapsed
-            self.fps_label.setText(f"FPS: {fps:.1f}")
+            self.fps_label.setText(f"FPS: {fps:.1f} (render {self.image_display.render_ms():.1f} ms/frame)")
         self.last_fps_time = current_time
         self.frame_count = 0
 
+        if self.camera_worker.acquisition_mode == ACQ_MODE_CALLBACK:
+            stats = self.camera_worker.frame_ring.stats()
+            self.ring_stats_label.setText(
+                f"Ring Buffer: {stats['pending']}/{stats['capacity']} pending, "
+                f"written {stats['written']}, overruns {stats['overruns']}, "
+                f"drops {stats['drops']}, skipped {stats['skipped']}")
+
+        if self.camera_worker.is_grabbing and self.camera_worker.acquisition_mode == ACQ_MODE_LP3D:
+            stats = self.camera_worker.lp3d_stream.stats()
+            self.acq_stats_label.setText(
+                f"LP3D: {stats['profiles']} profiles ({stats['profiles_per_s']:.0f}/s), "
+                f"{stats['frames']} frames, valid {stats['valid_ratio'] * 100:.1f}%, errors {stats['errors']}")
+        elif self.camera_worker.is_grabbing:
+            self.acq_stats_label.setText(self.camera_worker.metrics.summary())
+
+        self.update_pipeline_table()
+
+        display_stats = self.camera_worker.display_mailbox.stats()
+        if display_stats['posted']:
+            self.display_stats_label.setText(
+                f"Display: {display_stats['taken']} shown, {display_stats['skipped']} skipped "
+                f"of {display_stats['posted']} frames")
+
+        writer_stats = get_image_writer().stats()
+        if writer_stats['submitted']:
+            self.writer_stats_label.setText(
+                f"Image Writer: {writer_stats['written']} written, {writer_stats['queued']} queued, "
+                f"dropped {writer_stats['dropped']}, spilled {writer_stats['spilled']}, "
+                f"{writer_stats['write_mb_s']:.1f} MB/s")
+
+        recorder_stats = self.camera_worker.recorder.stats()
+        if recorder_stats['recording']:
+            self.recorder_stats_label.setText(
+                f"Recorder: {recorder_stats['recorded']} frames ({recorder_stats['record_fps']:.1f} fps), "
+                f"backlog {recorder_stats['backlog']}/{recorder_stats['max_backlog']} "
+                f"(peak {recorder_stats['peak_backlog']}), dropped {recorder_stats['dropped']}, "
+                f"skipped {recorder_stats['skipped']}, {recorder_stats['input_ms_mean']:.1f} ms/frame")
+        elif recorder_stats['path']:
+            self.recorder_stats_label.setText(f"Recorder: stopped, {recorder_stats['recorded']} frames")
+
+    def update_pipeline_table(self):
+        """Refresh the pipeline panel; samples the queue depths first"""
+        pipeline = self.camera_worker.pipeline
+        if self.camera_worker.is_grabbing:
+            pipeline.gauge("writer", get_image_writer().stats()['queued'])
+            if self.camera_worker.recorder.is_recording:
+                pipeline.gauge("recorder", self.camera_worker.recorder.stats()['backlog'])
+
+        stats = pipeline.stats()
+        rows = []
+        for name, entry in stats['stages'].items():
+            rows.append([name, f"{entry['rate']:.1f}", f"{entry['p50']:.2f}", f"{entry['p95']:.2f}",
+                         f"{entry['p99']:.2f}", f"{entry['max']:.2f}", _histogram_bar(entry['histogram'])])
+        for name, entry in stats['queues'].items():
+            rows.append([f"{name} queue", f"now {entry['last']}", f"{entry['p50']:.0f}", f"{entry['p95']:.0f}",
+                         f"{entry['p99']:.0f}", f"{entry['max']:.0f}", ""])
+
+        self.pipeline_table.setRowCount(len(rows))
+        for row, values in enumerate(rows):
+            for column, value in enumerate(values):
+                item = self.pipeline_table.item(row, column)
+                if item is None:
+                    self.pipeline_table.setItem(row, column, QTableWidgetItem(value))
+                elif item.text() != value:
+                    item.setText(value)
+
     def get_sdk_version(self):
         """Get SDK version information"""
         try:
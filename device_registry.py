@@ -0,0 +1,190 @@
+import time
+import socket
+import struct
+import threading
+from SciCam_class import *
+
+
+def uint32_to_ipv4(ip_uint32):
+    """Convert uint32 IP address to dotted decimal format"""
+    network_order_ip = socket.htonl(ip_uint32)
+    packed_ip = struct.pack("!I", network_order_ip)
+    return socket.inet_ntoa(packed_ip)
+
+
+def _c_string(array):
+    """Decode a NUL-terminated c_ubyte array"""
+    return bytes(array).split(b'\0', 1)[0].decode('ascii', 'ignore')
+
+
+class DeviceRecord:
+    """A discovered camera: a private copy of its SCI_DEVICE_INFO plus decoded identity"""
+
+    def __init__(self, info, seen_at):
+        self.info = SCI_DEVICE_INFO.from_buffer_copy(info)
+        self.tl_type = info.tlType
+        self.ip = None
+        self.last_seen = seen_at
+
+        if info.tlType == SciCamTLType.SciCam_TLType_Gige:
+            self.model = _c_string(info.info.gigeInfo.modelName)
+            self.serial = _c_string(info.info.gigeInfo.serialNumber)
+            self.ip = uint32_to_ipv4(info.info.gigeInfo.ip)
+        elif info.tlType == SciCamTLType.SciCam_TLType_Usb3:
+            self.model = _c_string(info.info.usb3Info.modelName)
+            self.serial = _c_string(info.info.usb3Info.serialNumber)
+        elif info.tlType == SciCamTLType.SciCam_TLType_CL:
+            self.model = _c_string(info.info.clInfo.cameraModel)
+            self.serial = _c_string(info.info.clInfo.cameraSerialNumber)
+        else:
+            self.model = ""
+            self.serial = ""
+
+    @property
+    def key(self):
+        return self.tl_type, self.serial
+
+    @property
+    def transport(self):
+        if self.tl_type == SciCamTLType.SciCam_TLType_Gige:
+            return "GigE"
+        if self.tl_type == SciCamTLType.SciCam_TLType_Usb3:
+            return "USB3"
+        if self.tl_type == SciCamTLType.SciCam_TLType_CL:
+            return "CameraLink"
+        return "Unknown"
+
+    def describe(self):
+        """One-line description for logs"""
+        if self.ip:
+            return f"{self.model} - IP: {self.ip}"
+        return f"{self.model} - Interface: {self.transport}"
+
+
+class DeviceRegistry:
+    """Cache of discovered cameras keyed by (transport type, serial number).
+
+    Discovery over all transport layers is slow (GigE alone can take
+    hundreds of milliseconds), so it runs once up front and then on a
+    background thread every refresh_interval seconds. Callers look devices
+    up by serial number or IP and open them from the cached device info
+    without rediscovering.
+    """
+
+    def __init__(self, tl_type=SciCamTLType.SciCam_TLType_Unkown, refresh_interval=30.0):
+        self.tl_type = tl_type
+        self.refresh_interval = refresh_interval
+        self._records = {}  # (tlType, serial) -> DeviceRecord, in discovery order
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._thread = None
+        self._stop = threading.Event()
+
+        self.last_refresh = None
+        self.last_discovery_seconds = None
+        self.refresh_count = 0
+
+    def refresh(self, only_if_stale=False):
+        """Run discovery now and update the cache. Returns (reVal, records).
+
+        With only_if_stale a refresh that another thread finished while this
+        one waited for the lock is reused instead of discovering again.
+        """
+        with self._refresh_lock:
+            if only_if_stale and not self.is_stale():
+                return SCI_CAMERA_OK, self.devices()
+
+            start = time.perf_counter()
+            devInfos = SCI_DEVICE_INFO_LIST()
+            reVal = SciCamera.SciCam_DiscoveryDevices(devInfos, self.tl_type)
+            elapsed = time.perf_counter() - start
+            if reVal != SCI_CAMERA_OK:
+                return reVal, self.devices()
+
+            now = time.time()
+            records = {}
+            for i in range(devInfos.count):
+                record = DeviceRecord(devInfos.pDevInfo[i], now)
+                records[record.key] = record
+
+            with self._lock:
+                self._records = records
+                self.last_refresh = now
+                self.last_discovery_seconds = elapsed
+                self.refresh_count += 1
+            return reVal, list(records.values())
+
+    def devices(self):
+        """Cached devices in discovery order"""
+        with self._lock:
+            return list(self._records.values())
+
+    def is_stale(self):
+        return self.last_refresh is None or time.time() - self.last_refresh > self.refresh_interval
+
+    def invalidate(self):
+        """Force the next lookup to rediscover (e.g. after a cached device failed to open)"""
+        with self._lock:
+            self.last_refresh = None
+
+    def find(self, serial=None, ip=None, tl_type=None):
+        """Cached record matching serial and/or IP, or None"""
+        with self._lock:
+            for record in self._records.values():
+                if tl_type is not None and record.tl_type != tl_type:
+                    continue
+                if serial is not None and record.serial != serial:
+                    continue
+                if ip is not None and record.ip != ip:
+                    continue
+                return record
+        return None
+
+    def lookup(self, serial=None, ip=None, tl_type=None):
+        """Like find(), but rediscovers once if the device is not cached or the cache is stale"""
+        record = self.find(serial, ip, tl_type)
+        if record is None or self.is_stale():
+            self.refresh(only_if_stale=record is not None)
+            record = self.find(serial, ip, tl_type)
+        return record
+
+    def get_index(self, index):
+        """Cached record at a discovery index, discovering first if the cache is empty or stale"""
+        if self.is_stale():
+            self.refresh(only_if_stale=True)
+        devices = self.devices()
+        if 0 <= index < len(devices):
+            return devices[index]
+        return None
+
+    def start(self):
+        """Refresh in the background every refresh_interval seconds"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._refresh_loop, name="device-registry", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _refresh_loop(self):
+        while not self._stop.is_set():
+            self.refresh(only_if_stale=True)
+            self._stop.wait(max(self.refresh_interval / 4, 0.5))
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_device_registry():
+    """Return the process-wide device registry, creating it on first use"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = DeviceRegistry()
+        return _registry
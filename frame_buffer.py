@@ -0,0 +1,215 @@
+import time
+import ctypes
+import threading
+
+
+class FrameRingBuffer:
+    """Bounded ring of preallocated frame buffers.
+
+    One producer (the SDK payload callback thread) writes converted frames
+    straight into the slot buffers; consumers lease a slot, read it in place
+    and release it. Nothing is allocated per frame once the slots exist.
+
+    Counters:
+        written   frames committed by the producer
+        overruns  unread frames overwritten because consumers fell behind
+        drops     incoming frames discarded (slot leased, conversion failed)
+        skipped   unread frames passed over by acquire_latest()
+    """
+
+    def __init__(self, capacity=8):
+        if capacity < 2:
+            raise ValueError("FrameRingBuffer needs at least 2 slots")
+        self.capacity = capacity
+        self.slot_size = 0
+        self._slots = [None] * capacity
+        self._meta = [None] * capacity
+        self._leased = [False] * capacity
+        self._write_seq = 0  # sequence number of the next frame to write
+        self._read_seq = 0  # oldest unread sequence number
+        self._writing = None
+        self._cond = threading.Condition()
+
+        self.written = 0
+        self.overruns = 0
+        self.drops = 0
+        self.skipped = 0
+
+    def allocate(self, slot_size):
+        """Preallocate every slot with slot_size bytes. Returns False if slots are leased."""
+        with self._cond:
+            if slot_size <= self.slot_size and self._slots[0] is not None:
+                return True
+            if any(self._leased) or self._writing is not None:
+                return False
+            self._slots = [(ctypes.c_ubyte * slot_size)() for _ in range(self.capacity)]
+            self._meta = [None] * self.capacity
+            self.slot_size = slot_size
+            self._read_seq = self._write_seq
+            return True
+
+    def reset(self):
+        """Forget all queued frames and zero the counters (slots are kept)"""
+        with self._cond:
+            self._read_seq = self._write_seq
+            self.written = 0
+            self.overruns = 0
+            self.drops = 0
+            self.skipped = 0
+
+    # ------------------------------------------------------------------ producer
+
+    def begin_write(self, size):
+        """Reserve the next slot for a frame of size bytes.
+
+        Returns (index, buffer) to fill in place, or None if the frame has to
+        be dropped. Must be paired with commit_write() or abort_write().
+        """
+        if size > self.slot_size and not self.allocate(size):
+            with self._cond:
+                self.drops += 1
+            return None
+
+        with self._cond:
+            index = self._write_seq % self.capacity
+            if self._leased[index]:
+                self.drops += 1
+                return None
+
+            # The slot still holds the oldest unread frame: overwrite it
+            if self._write_seq - self._read_seq >= self.capacity:
+                self.overruns += 1
+                self._read_seq = self._write_seq - self.capacity + 1
+
+            self._meta[index] = None
+            self._writing = index
+            return index, self._slots[index]
+
+    def commit_write(self, index, meta):
+        """Publish the frame written into slot index"""
+        with self._cond:
+            self._meta[index] = meta
+            self._writing = None
+            self._write_seq += 1
+            self.written += 1
+            self._cond.notify_all()
+
+    def abort_write(self, index):
+        """Give back a reserved slot without publishing it"""
+        with self._cond:
+            self._writing = None
+            self.drops += 1
+
+    def drop(self):
+        """Count a frame the producer discarded before reserving a slot"""
+        with self._cond:
+            self.drops += 1
+
+    # ------------------------------------------------------------------ consumer
+
+    def acquire_next(self, timeout=None):
+        """Lease the oldest unread frame. Returns (index, buffer, meta) or None on timeout."""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._read_seq < self._write_seq, timeout):
+                return None
+            seq = self._read_seq
+            self._read_seq += 1
+            return self._lease(seq)
+
+    def acquire_latest(self, timeout=None):
+        """Lease the newest unread frame, skipping any older ones"""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._read_seq < self._write_seq, timeout):
+                return None
+            seq = self._write_seq - 1
+            self.skipped += seq - self._read_seq
+            self._read_seq = self._write_seq
+            return self._lease(seq)
+
+    def release(self, index):
+        """Return a leased slot to the producer"""
+        with self._cond:
+            self._leased[index] = False
+
+    def _lease(self, seq):
+        index = seq % self.capacity
+        self._leased[index] = True
+        return index, self._slots[index], self._meta[index]
+
+    def pending(self):
+        """Number of committed frames not yet read"""
+        with self._cond:
+            return self._write_seq - self._read_seq
+
+    def stats(self):
+        """Snapshot of the ring counters"""
+        with self._cond:
+            return {
+                'capacity': self.capacity,
+                'pending': self._write_seq - self._read_seq,
+                'written': self.written,
+                'overruns': self.overruns,
+                'drops': self.drops,
+                'skipped': self.skipped,
+            }
+
+
+class FrameMailbox:
+    """Single-slot handover of the newest frame from a worker to the UI.
+
+    The worker post()s every frame it wants shown; a frame that was not
+    taken yet is released and counted as skipped, so at most one frame
+    waits and a slow UI never builds up a queue. The UI take()s at its own
+    refresh rate and becomes responsible for releasing what it got.
+    """
+
+    def __init__(self):
+        self._item = None  # (frame, width, height)
+        self._posted_at = None
+        self._lock = threading.Lock()
+        self.last_wait = None  # seconds the last taken frame waited in the slot
+        self.posted = 0
+        self.taken = 0
+        self.skipped = 0
+
+    def post(self, frame, width, height):
+        with self._lock:
+            stale, self._item = self._item, (frame, width, height)
+            self._posted_at = time.perf_counter()
+            self.posted += 1
+            if stale is not None:
+                self.skipped += 1
+        if stale is not None:
+            stale[0].release()
+
+    def take(self):
+        """(frame, width, height) posted since the last take, or None"""
+        with self._lock:
+            item, self._item = self._item, None
+            if item is not None:
+                self.taken += 1
+                self.last_wait = time.perf_counter() - self._posted_at
+            return item
+
+    def clear(self):
+        """Release a frame nobody took (e.g. when grabbing stops)"""
+        with self._lock:
+            item, self._item = self._item, None
+        if item is not None:
+            item[0].release()
+
+    def reset(self):
+        self.clear()
+        with self._lock:
+            self.posted = 0
+            self.taken = 0
+            self.skipped = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                'posted': self.posted,
+                'taken': self.taken,
+                'skipped': self.skipped,
+                'pending': self._item is not None,
+            }
@@ -0,0 +1,336 @@
+import os
+import json
+import mmap
+import time
+import numpy as np
+from SciCam_class import *
+from camera_frame import CameraFrame, target_pixel_type
+
+CONTAINER_FORMAT = "scicam-raw"
+CONTAINER_VERSION = 1
+
+HEADER_NAME = "container.json"
+INDEX_NAME = "index.bin"
+SEGMENT_NAME = "segment_{:05d}.bin"
+
+SEGMENT_BYTES_DEFAULT = 1024 * 1024 * 1024  # size limit of each data segment file, 1 GiB
+FRAME_ALIGN = 64  # frame data starts on a cache-line boundary inside a segment
+
+# One record per frame, appended to index.bin after the frame data is written
+INDEX_DTYPE = np.dtype([
+    ('segment', '<u4'),
+    ('pixel_type', '<u4'),
+    ('offset', '<u8'),
+    ('nbytes', '<u8'),
+    ('frame_id', '<u8'),
+    ('timestamp', '<u8'),  # device ticks
+    ('width', '<u4'),
+    ('height', '<u4'),
+    ('host_time', '<f8'),  # time.time() when appended
+])
+
+
+def raw_image_size(imgAttr):
+    """Bytes of a raw payload image; the bit depth comes from the PFNC pixel type (bits 16-23)"""
+    bits = (int(imgAttr.pixelType) >> 16) & 0xff
+    line = (int(imgAttr.width) * bits + 7) // 8 + int(imgAttr.paddingX)
+    return line * int(imgAttr.height) + int(imgAttr.paddingY)
+
+
+class FrameContainerWriter:
+    """Append-only writer for a raw frame container.
+
+    A container is a directory with a JSON header, an index of fixed-size
+    INDEX_DTYPE records and the frame data split into segment files of at
+    most segment_bytes. append_payload() stores the sensor data exactly as
+    grabbed (no conversion, Bayer/packed formats stay small); append()
+    stores an already converted CameraFrame. Frames are written with plain
+    buffered writes, so a burst costs one copy into the page cache per
+    frame. An index record is only written after its frame data, so a
+    container cut short by a crash still reads back up to its last
+    complete frame.
+    """
+
+    def __init__(self, path, segment_bytes=SEGMENT_BYTES_DEFAULT):
+        self.path = path
+        self.segment_bytes = segment_bytes
+        os.makedirs(path, exist_ok=True)
+
+        header_path = os.path.join(path, HEADER_NAME)
+        if os.path.exists(header_path):
+            # Continue an existing container
+            header = _read_header(path)
+            self.segment_bytes = header['segment_bytes']
+            index = _read_index(path)
+            self.frames = len(index)
+            self._segment = int(index['segment'][-1]) if len(index) else 0
+            self._index_file = open(os.path.join(path, INDEX_NAME), 'r+b')
+            self._index_file.truncate(self.frames * INDEX_DTYPE.itemsize)  # drop a partial record
+            self._index_file.seek(0, os.SEEK_END)
+        else:
+            with open(header_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'format': CONTAINER_FORMAT,
+                    'version': CONTAINER_VERSION,
+                    'segment_bytes': segment_bytes,
+                    'index_dtype': INDEX_DTYPE.descr,
+                    'created': time.strftime("%Y-%m-%d %H:%M:%S"),
+                }, f, indent=1)
+            self.frames = 0
+            self._segment = 0
+            self._index_file = open(os.path.join(path, INDEX_NAME), 'wb')
+
+        self._data_file = open(os.path.join(path, SEGMENT_NAME.format(self._segment)), 'ab')
+        self._record = np.zeros(1, dtype=INDEX_DTYPE)
+
+        # Statistics
+        self.bytes_written = 0
+        self.write_seconds = 0.0
+
+    def append_payload(self, ppayload):
+        """Append the raw image of a grabbed payload. Returns reVal."""
+        payloadAttribute = SCI_CAM_PAYLOAD_ATTRIBUTE()
+        reVal = SciCam_Payload_GetAttribute(ppayload, payloadAttribute)
+        if reVal != SCI_CAMERA_OK:
+            return reVal
+
+        imgData = ctypes.c_void_p()
+        reVal = SciCam_Payload_GetImage(ppayload, imgData)
+        if reVal != SCI_CAMERA_OK:
+            return reVal
+
+        imgAttr = payloadAttribute.imgAttr
+        size = raw_image_size(imgAttr)
+        if not imgData.value or size <= 0:
+            return SCI_ERR_CAMERA_PARAM_INVALID
+
+        data = (ctypes.c_ubyte * size).from_address(imgData.value)
+        self._append(memoryview(data), imgAttr.pixelType, imgAttr.width, imgAttr.height,
+                     payloadAttribute.frameID, payloadAttribute.timeStamp)
+        return SCI_CAMERA_OK
+
+    def append(self, frame):
+        """Append a converted Mono8/RGB8 CameraFrame. Returns reVal."""
+        if frame.array is None:
+            return SCI_ERR_CAMERA_PARAM_INVALID
+        data = np.ascontiguousarray(frame.array)
+        self._append(memoryview(data).cast('B'), frame.pixel_type, frame.width, frame.height,
+                     frame.frame_id, frame.timestamp or 0)
+        return SCI_CAMERA_OK
+
+    def _append(self, data, pixel_type, width, height, frame_id, timestamp):
+        start = time.perf_counter()
+        nbytes = data.nbytes
+
+        offset = self._data_file.tell()
+        padding = -offset % FRAME_ALIGN
+        if offset and offset + padding + nbytes > self.segment_bytes:
+            self._next_segment()
+            offset, padding = 0, 0
+        if padding:
+            self._data_file.write(b'\0' * padding)
+            offset += padding
+        self._data_file.write(data)
+
+        record = self._record[0]
+        record['segment'] = self._segment
+        record['pixel_type'] = int(pixel_type)
+        record['offset'] = offset
+        record['nbytes'] = nbytes
+        record['frame_id'] = frame_id
+        record['timestamp'] = timestamp
+        record['width'] = width
+        record['height'] = height
+        record['host_time'] = time.time()
+        self._index_file.write(self._record.tobytes())
+
+        self.frames += 1
+        self.bytes_written += nbytes
+        self.write_seconds += time.perf_counter() - start
+
+    def _next_segment(self):
+        self._data_file.close()
+        self._segment += 1
+        self._data_file = open(os.path.join(self.path, SEGMENT_NAME.format(self._segment)), 'ab')
+
+    def flush(self):
+        """Hand buffered data and index records to the OS (readers see them afterwards)"""
+        self._data_file.flush()
+        self._index_file.flush()
+
+    def close(self):
+        if self._data_file is None:
+            return
+        self.flush()
+        self._data_file.close()
+        self._index_file.close()
+        self._data_file = None
+        self._index_file = None
+
+    def stats(self):
+        return {
+            'frames': self.frames,
+            'segments': self._segment + 1,
+            'bytes_written': self.bytes_written,
+            'write_mb_s': self.bytes_written / self.write_seconds / 1e6 if self.write_seconds > 0 else 0.0,
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def _read_header(path):
+    with open(os.path.join(path, HEADER_NAME), encoding='utf-8') as f:
+        header = json.load(f)
+    if header.get('format') != CONTAINER_FORMAT:
+        raise ValueError(f"Not a frame container: {path}")
+    if header.get('version', 0) > CONTAINER_VERSION:
+        raise ValueError(f"Unsupported frame container version {header['version']}: {path}")
+    return header
+
+
+def _read_index(path):
+    index_path = os.path.join(path, INDEX_NAME)
+    count = os.path.getsize(index_path) // INDEX_DTYPE.itemsize
+    return np.fromfile(index_path, dtype=INDEX_DTYPE, count=count)
+
+
+class FrameContainer:
+    """Random-access reader for a raw frame container.
+
+    `index` is the INDEX_DTYPE record array, so frames can be looked up by
+    frame_id or timestamp with NumPy. Segments are memory-mapped on first
+    use: raw() and frame() of Mono8/RGB8 entries are views into the
+    mapping without a copy, valid while the container is open. Raw sensor
+    formats are converted by the SDK on access. refresh() picks up frames
+    appended since the container was opened (replay while recording).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.header = _read_header(path)
+        self._maps = {}  # segment -> (file, mmap)
+        self.index = None
+        self.refresh()
+
+    def refresh(self):
+        """Re-read the index. Returns the number of frames."""
+        index = _read_index(self.path)
+        # Records whose data did not make it to disk are not frames yet
+        complete = np.ones(len(index), dtype=bool)
+        for segment in np.unique(index['segment']):
+            size = _file_size(os.path.join(self.path, SEGMENT_NAME.format(int(segment))))
+            rows = index['segment'] == segment
+            complete[rows] = index['offset'][rows] + index['nbytes'][rows] <= size
+        if not complete.all():
+            index = index[:int(np.argmin(complete))]
+        self.index = index
+        return len(index)
+
+    def __len__(self):
+        return len(self.index)
+
+    def find(self, frame_id):
+        """Position of the frame with this frameID, or None"""
+        positions = np.flatnonzero(self.index['frame_id'] == frame_id)
+        return int(positions[0]) if len(positions) else None
+
+    def _segment_map(self, segment, end):
+        entry = self._maps.get(segment)
+        if entry is None or len(entry[1]) < end:
+            if entry is not None:
+                self._close_map(entry)  # grown since it was mapped
+            f = open(os.path.join(self.path, SEGMENT_NAME.format(segment)), 'rb')
+            entry = (f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            self._maps[segment] = entry
+        return entry[1]
+
+    def raw(self, i):
+        """(uint8 view of the stored bytes, index record) of frame i"""
+        record = self.index[i]
+        offset, nbytes = int(record['offset']), int(record['nbytes'])
+        mapped = self._segment_map(int(record['segment']), offset + nbytes)
+        return np.frombuffer(mapped, dtype=np.uint8, count=nbytes, offset=offset), record
+
+    def frame(self, i):
+        """Frame i as a Mono8/RGB8 CameraFrame. Returns (reVal, CameraFrame or None)."""
+        data, record = self.raw(i)
+        pixel_type = int(record['pixel_type'])
+        width, height = int(record['width']), int(record['height'])
+
+        if pixel_type in (SciCamPixelType.Mono8, SciCamPixelType.RGB8):
+            frame = CameraFrame(data, width, height, pixel_type, int(record['frame_id']), int(record['timestamp']))
+            return SCI_CAMERA_OK, frame
+
+        imgAttr = SCI_CAM_IMAGE_ATTRIBUTE()
+        imgAttr.width = width
+        imgAttr.height = height
+        imgAttr.pixelType = pixel_type
+        target_type = target_pixel_type(pixel_type)
+        channels = 1 if target_type == SciCamPixelType.Mono8 else 3
+
+        buffer = (ctypes.c_ubyte * (width * height * channels))()
+        dstImgSize = ctypes.c_int(len(buffer))
+        reVal = SciCam_Payload_ConvertImageEx(imgAttr, ctypes.c_void_p(data.ctypes.data), target_type,
+                                              buffer, dstImgSize, True, 0)
+        if reVal != SCI_CAMERA_OK:
+            return reVal, None
+        return SCI_CAMERA_OK, CameraFrame(buffer, width, height, target_type,
+                                          int(record['frame_id']), int(record['timestamp']))
+
+    def __getitem__(self, i):
+        reVal, frame = self.frame(i)
+        if reVal != SCI_CAMERA_OK:
+            raise IOError(f"Converting frame {i} failed, error code: {reVal}")
+        return frame
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def export(self, i, path):
+        """Write frame i as BMP or .npy. Returns (success, message)."""
+        reVal, frame = self.frame(i)
+        if reVal != SCI_CAMERA_OK:
+            return False, f"ERROR: Converting frame {i} failed, error code: {reVal}"
+        if os.path.splitext(path)[1].lower() == '.npy':
+            np.save(path, frame.array)
+        else:
+            buffer = frame.buffer
+            if not isinstance(buffer, ctypes.Array):
+                buffer = (ctypes.c_ubyte * frame.nbytes).from_buffer_copy(frame.array)
+            reVal = SciCam_Payload_SaveImage(path, frame.pixel_type, buffer, frame.width, frame.height)
+            if reVal != SCI_CAMERA_OK:
+                return False, f"ERROR: Save image failed, error code: {reVal}"
+        return True, f"Frame {i} saved to {path}"
+
+    def _close_map(self, entry):
+        f, mapped = entry
+        try:
+            mapped.close()
+        except BufferError:
+            pass  # frames still reference the mapping; it closes when they are gone
+        f.close()
+
+    def close(self):
+        for entry in self._maps.values():
+            self._close_map(entry)
+        self._maps = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def _file_size(path):
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
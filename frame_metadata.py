@@ -0,0 +1,169 @@
+import time
+import struct
+from SciCam_class import *
+
+# ChunkSelector entries we enable, and the FrameMetadata field each one fills
+CHUNK_FIELDS = {
+    "Timestamp": 'timestamp',
+    "ExposureTime": 'exposure_time',
+    "Gain": 'gain',
+    "LineStatusAll": 'line_status',
+}
+
+# Chunk ID of each ChunkSelector entry. The IDs come from the camera's
+# GenICam XML (the ChunkID of each chunk port) and differ between models;
+# these are the ones SciCam_sim uses. Pass the camera's own to ChunkParser.
+DEFAULT_CHUNK_IDS = {
+    "Timestamp": 0x0001,
+    "ExposureTime": 0x0002,
+    "Gain": 0x0003,
+    "LineStatusAll": 0x0004,
+}
+
+_FLOAT_FORMATS = {4: '<f', 8: '<d'}
+_INT_FORMATS = {1: '<B', 2: '<H', 4: '<I', 8: '<Q'}
+
+
+def _decode(field, data):
+    """Unpack a chunk value by field kind and length, or None if the length is unexpected"""
+    formats = _FLOAT_FORMATS if field in ('exposure_time', 'gain') else _INT_FORMATS
+    fmt = formats.get(len(data))
+    if fmt is None:
+        return None
+    return struct.unpack(fmt, data)[0]
+
+
+class FrameMetadata:
+    """Per-frame record of the camera-side state that produced a frame.
+
+    timestamp is the hardware timestamp in device ticks (from the Timestamp
+    chunk, else the payload attribute), exposure_time is in microseconds,
+    line_status is the LineStatusAll bit mask latched at exposure and
+    host_time the perf_counter time the payload was parsed. Fields the
+    camera did not send are None. Chunks with unmapped IDs are kept raw in
+    `extra` (chunk id -> bytes).
+    """
+
+    __slots__ = ('frame_id', 'timestamp', 'exposure_time', 'gain', 'line_status', 'host_time', 'extra')
+
+    def __init__(self, frame_id, timestamp, host_time):
+        self.frame_id = frame_id
+        self.timestamp = timestamp
+        self.exposure_time = None
+        self.gain = None
+        self.line_status = None
+        self.host_time = host_time
+        self.extra = None
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return (f"FrameMetadata(frame_id={self.frame_id}, timestamp={self.timestamp}, "
+                f"exposure_time={self.exposure_time}, gain={self.gain}, line_status={self.line_status})")
+
+
+class ChunkParser:
+    """Turns a payload's chunk data into a FrameMetadata record.
+
+    The chunk list structure (256 entries) is allocated once and reused, so
+    a parser belongs to one acquisition thread.
+    """
+
+    def __init__(self, chunk_ids=None):
+        chunk_ids = DEFAULT_CHUNK_IDS if chunk_ids is None else chunk_ids
+        self.fields = {chunk_id: CHUNK_FIELDS[name] for name, chunk_id in chunk_ids.items()}
+        self._chunk_list = SCI_CAM_CHUNK_LIST()
+        self._attr_ex = SCI_CAM_PAYLOAD_ATTRIBUTE_EX()
+
+    def parse(self, payload, payloadAttribute):
+        """Metadata of a grabbed payload whose attribute has already been read"""
+        meta = FrameMetadata(payloadAttribute.frameID, payloadAttribute.timeStamp, time.perf_counter())
+        if not payloadAttribute.hasChunk:
+            return meta
+
+        # SDK-decoded exposure/gain, overridden below by the raw chunks if present
+        if SciCam_Payload_GetAttributeEx(payload, self._attr_ex) == SCI_CAMERA_OK:
+            if self._attr_ex.exposure > 0:
+                meta.exposure_time = self._attr_ex.exposure
+                meta.gain = self._attr_ex.gain
+
+        chunk_list = self._chunk_list
+        if SciCam_Payload_GetChunkList(payload, chunk_list) != SCI_CAMERA_OK:
+            return meta
+
+        for i in range(min(chunk_list.count, len(chunk_list.chunk))):
+            chunk = chunk_list.chunk[i]
+            if not chunk.data or not chunk.len:
+                continue
+            data = ctypes.string_at(chunk.data, chunk.len)
+            field = self.fields.get(chunk.id)
+            value = _decode(field, data) if field is not None else None
+            if value is None:
+                if meta.extra is None:
+                    meta.extra = {}
+                meta.extra[chunk.id] = data
+            else:
+                setattr(meta, field, value)
+        return meta
+
+
+def enable_chunks(camera, names=tuple(CHUNK_FIELDS)):
+    """Turn on chunk mode and the given ChunkSelector entries (before StartGrabbing).
+
+    Returns (reVal, enabled names); entries the camera rejects are skipped.
+    """
+    reVal = camera.SciCam_SetBoolValue("ChunkModeActive", True)
+    if reVal != SCI_CAMERA_OK:
+        return reVal, []
+
+    enabled = []
+    for name in names:
+        if camera.SciCam_SetEnumValueByString("ChunkSelector", name) != SCI_CAMERA_OK:
+            continue
+        if camera.SciCam_SetBoolValue("ChunkEnable", True) == SCI_CAMERA_OK:
+            enabled.append(name)
+    return SCI_CAMERA_OK, enabled
+
+
+class DeviceClock:
+    """Maps device timestamps onto the host perf_counter clock.
+
+    sync() latches the camera clock (TimestampLatch/TimestampLatchValue)
+    between two host clock reads and keeps the offset; the round trip
+    bounds its error. Re-sync now and then, the two clocks drift apart.
+    """
+
+    def __init__(self, timestamp_hz=1e9):
+        self.timestamp_hz = timestamp_hz
+        self.offset = None  # host seconds minus device seconds
+        self.uncertainty = None
+        self.synced_at = None
+
+    def sync(self, camera):
+        value = SCI_NODE_VAL_INT()
+        before = time.perf_counter()
+        reVal = camera.SciCam_SetCommandValue("TimestampLatch")
+        if reVal == SCI_CAMERA_OK:
+            reVal = camera.SciCam_GetIntValue("TimestampLatchValue", value)
+        after = time.perf_counter()
+        if reVal != SCI_CAMERA_OK:
+            return reVal
+
+        self.offset = (before + after) / 2 - value.nVal / self.timestamp_hz
+        self.uncertainty = (after - before) / 2
+        self.synced_at = after
+        return SCI_CAMERA_OK
+
+    def to_host(self, ticks):
+        """Host perf_counter time of a device timestamp, or None before sync()"""
+        if self.offset is None or ticks is None:
+            return None
+        return ticks / self.timestamp_hz + self.offset
+
+    def latency(self, meta, now=None):
+        """Seconds from the frame's hardware timestamp to now (perf_counter)"""
+        captured = self.to_host(meta.timestamp)
+        if captured is None:
+            return None
+        return (time.perf_counter() if now is None else now) - captured
@@ -0,0 +1,312 @@
+import os
+import time
+import uuid
+import atexit
+import shutil
+import tempfile
+import threading
+import collections
+import numpy as np
+from SciCam_class import *
+from camera_frame import CameraFrame
+
+# What submit() does when the queue or memory budget is full
+WRITE_POLICY_BLOCK = "block"  # wait for the writer to catch up
+WRITE_POLICY_DROP_OLDEST = "drop_oldest"  # discard the oldest queued image
+WRITE_POLICY_SPILL = "spill"  # dump raw pixels to a local spill directory, encode later
+
+IMAGE_FORMATS = ('.bmp', '.png', '.npy')
+
+
+class _WriteJob:
+    __slots__ = ('frame', 'path', 'fmt', 'callback', 'nbytes', 'pixel_type', 'spill_path', 'submitted_at')
+
+    def __init__(self, frame, path, fmt, callback):
+        self.frame = frame
+        self.pixel_type = frame.pixel_type
+        self.path = path
+        self.fmt = fmt
+        self.callback = callback
+        self.nbytes = frame.nbytes
+        self.spill_path = None
+        self.submitted_at = time.perf_counter()
+
+
+class ImageWriter:
+    """Background stage that writes captured frames to disk.
+
+    submit() copies a borrowed frame (an owned one is referenced) and
+    returns at once; worker threads encode and write BMP (SDK), lossless
+    PNG (OpenCV) or raw .npy, picked by file extension. Queued images are
+    bounded by count and by bytes. When either limit is reached the policy
+    decides: block the caller, drop the oldest queued image, or spill the
+    raw pixels to a local directory (fast even when the target is a slow
+    network/OneDrive folder) to be encoded once the queue drains.
+
+    Every submitted image gets exactly one callback(success, message, path)
+    on completion or drop, called on a writer thread.
+    """
+
+    def __init__(self, max_queue=16, memory_budget=256 * 1024 * 1024, policy=WRITE_POLICY_BLOCK,
+                 spill_dir=None, workers=1, png_compression=1):
+        self.max_queue = max_queue
+        self.memory_budget = memory_budget
+        self.policy = policy
+        self.spill_dir = spill_dir or os.path.join(tempfile.gettempdir(), "scicam_spill")
+        self.workers = workers
+        self.png_compression = png_compression  # 0-9, PNG is lossless at every level
+
+        self._cond = threading.Condition()
+        self._queue = collections.deque()  # jobs held in memory
+        self._spilled = collections.deque()  # jobs whose pixels are in spill files
+        self._queued_bytes = 0
+        self._in_flight = 0
+        self._threads = []
+        self._closing = False
+
+        # Statistics
+        self.submitted = 0
+        self.written = 0
+        self.dropped = 0
+        self.spilled = 0
+        self.failed = 0
+        self.bytes_written = 0
+        self.peak_queued_bytes = 0
+        self._write_times = collections.deque(maxlen=100)  # (seconds, bytes)
+        self._completions = collections.deque(maxlen=100)
+
+    # ------------------------------------------------------------ producer
+
+    def submit(self, frame, path, callback=None, timeout=None):
+        """Queue a frame to be written to path. Returns False if it was dropped.
+
+        With the block policy, timeout bounds the wait for queue space.
+        """
+        fmt = os.path.splitext(path)[1].lower()
+        if fmt not in IMAGE_FORMATS:
+            raise ValueError(f"Unsupported image format: {path}")
+
+        job = _WriteJob(frame if frame.owns_buffer else frame.copy(), path, fmt, callback)
+        with self._cond:
+            if self._closing:
+                return self._drop(job, "Image writer closed")
+            self._start_workers()
+            self.submitted += 1
+
+            spill = False
+            if self._is_full(job.nbytes):
+                if self.policy == WRITE_POLICY_BLOCK:
+                    if not self._cond.wait_for(lambda: not self._is_full(job.nbytes) or self._closing, timeout):
+                        return self._drop(job, "Image writer queue full")
+                elif self.policy == WRITE_POLICY_DROP_OLDEST:
+                    while self._queue and self._is_full(job.nbytes):
+                        oldest = self._queue.popleft()
+                        self._queued_bytes -= oldest.nbytes
+                        self._drop(oldest, "Dropped from full image writer queue")
+                elif self.policy == WRITE_POLICY_SPILL:
+                    spill = True
+                    self.spilled += 1
+                    self._in_flight += 1  # flush() waits for the spill file too
+
+            if not spill:
+                self._queue.append(job)
+                self._queued_bytes += job.nbytes
+                self.peak_queued_bytes = max(self.peak_queued_bytes, self._queued_bytes)
+                self._cond.notify_all()
+                return True
+
+        # Spill outside the lock so the workers keep writing meanwhile
+        try:
+            os.makedirs(self.spill_dir, exist_ok=True)
+            job.spill_path = os.path.join(self.spill_dir, f"{uuid.uuid4().hex}.npy")
+            np.save(job.spill_path, job.frame.array)
+        except OSError as e:
+            with self._cond:
+                self._in_flight -= 1
+                self._cond.notify_all()
+                return self._drop(job, f"Spill failed: {e}")
+        job.frame = None
+        with self._cond:
+            self._in_flight -= 1
+            self._spilled.append(job)
+            self._cond.notify_all()
+        return True
+
+    def _is_full(self, nbytes):
+        if not self._queue:
+            return False  # an image larger than the budget still goes through on its own
+        return len(self._queue) >= self.max_queue or self._queued_bytes + nbytes > self.memory_budget
+
+    def _drop(self, job, message):
+        self.dropped += 1
+        self._notify(job, False, message, None)
+        return False
+
+    @staticmethod
+    def _notify(job, success, message, path):
+        """Run the job's callback; a failing callback must not stop the writer"""
+        if not job.callback:
+            return
+        try:
+            job.callback(success, message, path)
+        except Exception as e:
+            print(f"Image writer callback for {job.path} failed: {e}")
+
+    # ------------------------------------------------------------- workers
+
+    def _start_workers(self):
+        self._threads = [t for t in self._threads if t.is_alive()]
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(target=self._run, name=f"image-writer-{len(self._threads)}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _next_job(self):
+        with self._cond:
+            while True:
+                # In-memory images first: they hold the budget
+                if self._queue:
+                    job = self._queue.popleft()
+                    self._queued_bytes -= job.nbytes
+                    break
+                if self._spilled:
+                    job = self._spilled.popleft()
+                    break
+                if self._closing:
+                    return None
+                self._cond.wait()
+            self._in_flight += 1
+            self._cond.notify_all()
+            return job
+
+    def _run(self):
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+
+            start = time.perf_counter()
+            try:
+                success, message = self._write(job)
+            except Exception as e:
+                success, message = False, f"ERROR: Writing {job.path} failed: {e}"
+            elapsed = time.perf_counter() - start
+
+            with self._cond:
+                if success:
+                    self.written += 1
+                    self.bytes_written += job.nbytes
+                    self._write_times.append((elapsed, job.nbytes))
+                    self._completions.append(time.perf_counter())
+                else:
+                    self.failed += 1
+
+            self._notify(job, success, message, job.path if success else None)
+            # flush() returns only after the callback has run
+            with self._cond:
+                self._in_flight -= 1
+                self._cond.notify_all()
+
+    def _write(self, job):
+        if job.spill_path is not None:
+            return self._write_spilled(job)
+
+        frame = job.frame
+        if job.fmt == '.bmp':
+            reVal = SciCam_Payload_SaveImage(job.path, frame.pixel_type, frame.buffer, frame.width, frame.height)
+            if reVal != SCI_CAMERA_OK:
+                return False, f"ERROR: Save image failed, error code: {reVal}"
+        elif job.fmt == '.png':
+            import cv2
+
+            params = [cv2.IMWRITE_PNG_COMPRESSION, self.png_compression]
+            if not cv2.imwrite(job.path, np.ascontiguousarray(frame.as_bgr()), params):
+                return False, f"ERROR: Save image failed: {job.path}"
+        else:
+            np.save(job.path, frame.array)
+        return True, f"Image saved successfully: {job.path}"
+
+    def _write_spilled(self, job):
+        if job.fmt == '.npy':
+            # Already in the target format
+            shutil.move(job.spill_path, job.path)
+            return True, f"Image saved successfully: {job.path}"
+
+        pixels = np.load(job.spill_path)
+        height, width = pixels.shape[:2]
+        buffer = (ctypes.c_ubyte * pixels.nbytes).from_buffer(pixels)
+        job.frame = CameraFrame(buffer, width, height, job.pixel_type)
+        job.spill_path, spill_path = None, job.spill_path
+        try:
+            return self._write(job)
+        finally:
+            os.remove(spill_path)
+
+    # ------------------------------------------------------------- control
+
+    def flush(self, timeout=None):
+        """Wait until every queued image is written. Returns False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self._queue and not self._spilled and not self._in_flight, timeout)
+
+    def close(self, timeout=None):
+        """Write what is queued, then stop the worker threads"""
+        self.flush(timeout)
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        with self._cond:
+            self._closing = False
+
+    def stats(self):
+        """Queue state, counters and write throughput"""
+        with self._cond:
+            write_seconds = sum(t for t, _ in self._write_times)
+            write_bytes = sum(n for _, n in self._write_times)
+            completions = list(self._completions)
+            images_per_s = 0.0
+            if len(completions) > 1 and completions[-1] > completions[0]:
+                images_per_s = (len(completions) - 1) / (completions[-1] - completions[0])
+            return {
+                'queued': len(self._queue),
+                'queued_bytes': self._queued_bytes,
+                'peak_queued_bytes': self.peak_queued_bytes,
+                'spill_pending': len(self._spilled),
+                'in_flight': self._in_flight,
+                'submitted': self.submitted,
+                'written': self.written,
+                'dropped': self.dropped,
+                'spilled': self.spilled,
+                'failed': self.failed,
+                'bytes_written': self.bytes_written,
+                'write_mb_s': write_bytes / write_seconds / 1e6 if write_seconds > 0 else 0.0,
+                'write_ms_mean': write_seconds / len(self._write_times) * 1000 if self._write_times else 0.0,
+                'images_per_s': images_per_s,
+            }
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def get_image_writer():
+    """Return the process-wide image writer, creating it on first use"""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = ImageWriter()
+        return _writer
+
+
+def close_image_writer():
+    """Finish pending writes of the shared image writer"""
+    with _writer_lock:
+        if _writer is not None:
+            _writer.close()
+
+
+atexit.register(close_image_writer)
@@ -19,7 +19,7 @@ from PySide6.QtGui import QPixmap, QFont, QMouseEvent, QPainter, QPen, QColor, Q
 
 # Import camera capture function
 try:
-    from camera import AutoCaptureFlow
+    from camera import AutoCaptureFlow, release_camera_session
 
     CAMERA_AVAILABLE = True
 except ImportError:
@@ -1187,4 +1187,9 @@ class MainWindow(QMainWindow):
         """Clean up connections when closing the application"""
         if self.is_connected:
             self.disconnect_tcp()
+
+        # Close the shared camera session
+        if CAMERA_AVAILABLE:
+            release_camera_session()
+
         event.accept()
\ No newline at end of file
@@ -0,0 +1,68 @@
+import numpy as np
+from SciCam_class import *
+from camera_frame import CameraFrame
+
+# Live view modes of CameraWorker; captures are always full resolution
+PREVIEW_FULL = "Full Resolution"
+PREVIEW_DOWNSAMPLE = "Downsample to View"  # full frames from the camera, decimated before display
+PREVIEW_BINNING = "Sensor Binning"  # camera bins/decimates, full frames only on capture
+
+PREVIEW_MODES = [PREVIEW_FULL, PREVIEW_DOWNSAMPLE, PREVIEW_BINNING]
+
+CAMERA_XML = SciCamDeviceXmlType.SciCam_DeviceXml_Camera
+
+# Sensor-side reduction nodes, in order of preference (binning keeps the light of every pixel)
+BINNING_NODES = [
+    ("BinningHorizontal", "BinningVertical"),
+    ("DecimationHorizontal", "DecimationVertical"),
+]
+
+
+def downsample_factor(zoom, max_factor=8):
+    """Integer decimation that still gives at least one source pixel per screen pixel at zoom"""
+    if zoom <= 0:
+        return 1
+    return max(1, min(max_factor, int(1.0 / zoom)))
+
+
+def downsample_frame(frame, factor):
+    """Owned CameraFrame keeping every factor-th pixel in x and y.
+
+    Plain strided decimation: one vectorized copy of the kept pixels,
+    no filtering. Returns frame itself for factor 1.
+    """
+    if factor <= 1 or frame.array is None:
+        return frame
+    reduced = np.ascontiguousarray(frame.array[::factor, ::factor])
+    height, width = reduced.shape[:2]
+    buffer = (ctypes.c_ubyte * reduced.size).from_buffer(reduced)
+    small = CameraFrame(buffer, width, height, frame.pixel_type, frame.frame_id, frame.timestamp)
+    small.metadata = frame.metadata
+    small.offset_x, small.offset_y = frame.offset_x, frame.offset_y
+    small.preview_factor = factor
+    return small
+
+
+def set_sensor_binning(camera, factor, cache=None):
+    """Set horizontal and vertical binning (or decimation) to factor.
+
+    The camera must not be grabbing; some cameras rescale Width/Height
+    when binning changes, so save the ROI before and restore it after
+    going back to 1. Returns (reVal, node family used or None).
+    """
+    reVal = SCI_ERR_CAMERA_NOT_SUPPORT
+    for horizontal, vertical in BINNING_NODES:
+        val = SCI_NODE_VAL_INT()
+        if camera.SciCam_GetIntValueEx(CAMERA_XML, horizontal, val) != SCI_CAMERA_OK:
+            continue
+        value = max(val.nMin, min(val.nMax, int(factor)))
+        for name in (horizontal, vertical):
+            if cache is not None:
+                reVal, _ = cache.write(name, SciCamNodeType.SciCam_NodeType_Int, value)
+            else:
+                reVal = camera.SciCam_SetIntValueEx(CAMERA_XML, name, value)
+            if reVal != SCI_CAMERA_OK:
+                break
+        if reVal == SCI_CAMERA_OK:
+            return reVal, horizontal[:-len("Horizontal")]
+    return reVal, None
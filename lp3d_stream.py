@@ -0,0 +1,287 @@
+import time
+import threading
+import numpy as np
+from SciCam_class import *
+
+# Contours are read as float32 with NaN marking points where the laser was not found
+CONTOUR_DATA_TYPE = SciCamPayloadDataType.SciCam_Payload_DataType_FLOAT
+INVALID_VALUE = float('nan')
+
+
+class ProfileBuffer:
+    """Preallocated ring of laser profiles.
+
+    `z` is a (capacity, width) float32 array the SDK writes contours into
+    directly; `gray`, `frame_ids`, `indices` and `valid_counts` hold the
+    matching per-profile data. `written` counts every profile ever stored,
+    the newest is at row (written - 1) % capacity.
+    """
+
+    def __init__(self, width, capacity=4096, with_gray=False):
+        self.width = width
+        self.capacity = capacity
+        self.z = np.full((capacity, width), np.nan, dtype=np.float32)
+        self.gray = np.zeros((capacity, width), dtype=np.uint8) if with_gray else None
+        self.frame_ids = np.zeros(capacity, dtype=np.uint64)
+        self.indices = np.zeros(capacity, dtype=np.uint32)
+        self.valid_counts = np.zeros(capacity, dtype=np.int32)
+        self.written = 0
+        self._scratch = None  # batch contours that wrap around the end of the ring
+        self._lock = threading.Lock()
+
+    def _rows(self, lines):
+        """(row slices of the ring, contiguous target array) for the next `lines` profiles"""
+        start = self.written % self.capacity
+        if start + lines <= self.capacity:
+            return [(start, start + lines)], self.z[start:start + lines]
+        if self._scratch is None or len(self._scratch) < lines:
+            self._scratch = np.empty((lines, self.width), dtype=np.float32)
+        first = self.capacity - start
+        return [(start, self.capacity), (0, lines - first)], self._scratch[:lines]
+
+    def store(self, payload, lines, meta):
+        """Read `lines` contours of a payload into the ring. Returns (reVal, z rows)."""
+        with self._lock:
+            if lines > self.capacity:
+                return SCI_ERR_CAMERA_INSUFFICIENT_MEMORY_LENGTH, None
+
+            slices, target = self._rows(lines)
+            contour = (ctypes.c_float * target.size).from_buffer(target)
+            invalid = ctypes.c_float(INVALID_VALUE)
+            reVal = SciCam_Payload_LP3D_GetContour(payload, CONTOUR_DATA_TYPE, contour, invalid)
+            if reVal != SCI_CAMERA_OK:
+                return reVal, None
+
+            gray = None
+            if self.gray is not None:
+                pGray = ctypes.c_void_p()
+                if SciCam_Payload_LP3D_GetGray(payload, pGray) == SCI_CAMERA_OK and pGray.value:
+                    gray = np.frombuffer((ctypes.c_ubyte * target.size).from_address(pGray.value),
+                                         dtype=np.uint8).reshape(lines, self.width)
+
+            valid = np.count_nonzero(~np.isnan(target), axis=1)
+            done = 0
+            for begin, end in slices:
+                count = end - begin
+                if target.base is not self.z:
+                    self.z[begin:end] = target[done:done + count]
+                if gray is not None:
+                    self.gray[begin:end] = gray[done:done + count]
+                self.frame_ids[begin:end] = meta.frameId
+                self.indices[begin:end] = np.arange(meta.index, meta.index + count, dtype=np.uint32) + done
+                self.valid_counts[begin:end] = valid[done:done + count]
+                done += count
+            self.written += lines
+            return SCI_CAMERA_OK, target
+
+    def latest(self, count):
+        """Copy of the newest `count` profiles, oldest first: (z, gray or None, frame_ids)"""
+        with self._lock:
+            count = min(count, self.written, self.capacity)
+            end = self.written % self.capacity
+            rows = np.arange(end - count, end) % self.capacity
+            gray = self.gray[rows] if self.gray is not None else None
+            return self.z[rows], gray, self.frame_ids[rows]
+
+
+class HeightMap:
+    """Height map assembled incrementally, one block of profiles at a time.
+
+    add() copies profile rows in with a single slice assignment; invalid
+    points stay NaN. Storage grows by doubling, so adding a line costs the
+    copy of that line only. x_pitch (mm per point) and y_pitch (mm per
+    profile, i.e. encoder step) are kept for export and measurements.
+    """
+
+    def __init__(self, width, x_pitch=1.0, y_pitch=1.0, initial_lines=1024):
+        self.width = width
+        self.x_pitch = x_pitch
+        self.y_pitch = y_pitch
+        self._data = np.full((initial_lines, width), np.nan, dtype=np.float32)
+        self.lines = 0
+
+    def add(self, rows):
+        rows = np.asarray(rows, dtype=np.float32).reshape(-1, self.width)
+        needed = self.lines + len(rows)
+        if needed > len(self._data):
+            grown = np.full((max(needed, 2 * len(self._data)), self.width), np.nan, dtype=np.float32)
+            grown[:self.lines] = self._data[:self.lines]
+            self._data = grown
+        self._data[self.lines:needed] = rows
+        self.lines = needed
+
+    def reset(self):
+        """Start a new map, keeping the allocation"""
+        self._data[:self.lines] = np.nan
+        self.lines = 0
+
+    @property
+    def data(self):
+        """(lines, width) view of the filled part"""
+        return self._data[:self.lines]
+
+    def valid_ratio(self):
+        if not self.lines:
+            return 0.0
+        return float(np.count_nonzero(~np.isnan(self.data))) / self.data.size
+
+    def to_image(self, z_min=None, z_max=None):
+        return height_image(self.data, z_min, z_max)
+
+
+def height_image(z, z_min=None, z_max=None):
+    """Mono8 rendering of a height array; invalid points are black, z_min..z_max maps to 1..255"""
+    valid = ~np.isnan(z)
+    if not valid.any():
+        return np.zeros(z.shape, dtype=np.uint8)
+    if z_min is None:
+        z_min = float(np.min(z[valid]))
+    if z_max is None:
+        z_max = float(np.max(z[valid]))
+    scale = 254.0 / (z_max - z_min) if z_max > z_min else 0.0
+    image = np.clip((np.nan_to_num(z, nan=z_min) - z_min) * scale + 1.0, 1.0, 255.0).astype(np.uint8)
+    image[~valid] = 0
+    return image
+
+
+class LP3DStream:
+    """Streams contours from a laser profiler (LP3D camera) into NumPy arrays.
+
+    A grab thread puts each contour payload straight into a ProfileBuffer
+    (the SDK writes into the ring, no per-point Python work) and appends it
+    to the HeightMap of the current LP3D frame. When the camera marks a
+    frame finished, on_frame(frame_id, height_map) is called on the grab
+    thread; the map is reused afterwards, so copy height_map.data to keep
+    it. Contour mode delivers one profile per payload, BatchContour a block
+    of profiles.
+
+    The camera must be open and not grabbing; start() selects the LP3D grab
+    type and starts grabbing.
+    """
+
+    def __init__(self, camera, capacity=4096, grab_mode=SciCamLp3dGrabMode.SciCam_GrabMode_LP3D_Contour,
+                 with_gray=False, x_pitch=1.0, y_pitch=1.0, on_frame=None):
+        self.camera = camera
+        self.capacity = capacity
+        self.grab_mode = grab_mode
+        self.with_gray = with_gray
+        self.x_pitch = x_pitch
+        self.y_pitch = y_pitch
+        self.on_frame = on_frame
+
+        self.profiles = None  # ProfileBuffer, sized by the first payload
+        self.height_map = None
+        self.current_frame_id = None
+        self._running = False
+        self._thread = None
+
+        # Statistics
+        self.frames = 0
+        self.errors = 0
+        self._started_at = None
+
+    def start(self):
+        """Switch the camera to LP3D contour grabbing and start streaming. Returns (success, message)."""
+        if self._running:
+            return True, "LP3D stream already running"
+
+        reVal = self.camera.SciCam_LP3D_SetGrabType(self.grab_mode)
+        if reVal != SCI_CAMERA_OK:
+            return False, f"ERROR: Set LP3D grab type failed, error code: {reVal}"
+        reVal = self.camera.SciCam_StartGrabbing()
+        if reVal != SCI_CAMERA_OK:
+            return False, f"ERROR: Start grabbing failed, error code: {reVal}"
+
+        self.frames = 0
+        self.errors = 0
+        self._started_at = time.perf_counter()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="lp3d-stream", daemon=True)
+        self._thread.start()
+        return True, "LP3D stream started"
+
+    def stop(self):
+        if not self._running:
+            return
+        self._running = False
+        self._thread.join()
+        self._thread = None
+        self.camera.SciCam_StopGrabbing()
+        self.camera.SciCam_LP3D_SetGrabType(SciCamLp3dGrabMode.SciCam_GrabMode_LP3D_None)
+
+    def _run(self):
+        ppayload = ctypes.c_void_p()
+        while self._running:
+            reVal = self.camera.SciCam_Grab(ppayload)
+            if reVal != SCI_CAMERA_OK:
+                if reVal != SCI_ERR_CAMERA_GRAB_TIMEOUT:
+                    self.errors += 1
+                continue
+            try:
+                if self._store(ppayload) != SCI_CAMERA_OK:
+                    self.errors += 1
+            finally:
+                self.camera.SciCam_FreePayload(ppayload)
+
+    def _store(self, payload):
+        payloadAttribute = SCI_CAM_PAYLOAD_ATTRIBUTE()
+        reVal = SciCam_Payload_GetAttribute(payload, payloadAttribute)
+        if reVal != SCI_CAMERA_OK:
+            return reVal
+        meta = SCI_CAM_LP3D_META()
+        reVal = SciCam_Payload_LP3D_GetMeta(payload, meta)
+        if reVal != SCI_CAMERA_OK:
+            return reVal
+        points = ctypes.c_uint(0)
+        reVal = SciCam_Payload_LP3D_GetPointCounts(payload, points)
+        if reVal != SCI_CAMERA_OK:
+            return reVal
+
+        width = int(payloadAttribute.imgAttr.width) or points.value
+        if not width or points.value % width:
+            return SCI_ERR_CAMERA_PARAM_INVALID
+        lines = points.value // width
+
+        if self.profiles is None or self.profiles.width != width:
+            self.profiles = ProfileBuffer(width, self.capacity, self.with_gray)
+            self.height_map = HeightMap(width, self.x_pitch, self.y_pitch)
+
+        # A new frameID without a finished flag means profiles of the last frame were lost
+        if self.current_frame_id is not None and meta.frameId != self.current_frame_id:
+            self.height_map.reset()
+        self.current_frame_id = meta.frameId
+
+        reVal, rows = self.profiles.store(payload, lines, meta)
+        if reVal != SCI_CAMERA_OK:
+            return reVal
+        self.height_map.add(rows)
+
+        if meta.finished:
+            self.frames += 1
+            if self.on_frame is not None:
+                self.on_frame(meta.frameId, self.height_map)
+            self.height_map.reset()
+            self.current_frame_id = None
+        return SCI_CAMERA_OK
+
+    def preview(self, lines=512):
+        """Mono8 image of the newest profiles (oldest at the top), or None before the first one"""
+        if self.profiles is None or not self.profiles.written:
+            return None
+        z, _, _ = self.profiles.latest(lines)
+        return height_image(z)
+
+    def stats(self):
+        profiles = self.profiles.written if self.profiles is not None else 0
+        elapsed = time.perf_counter() - self._started_at if self._started_at else 0.0
+        valid_ratio = 0.0
+        if profiles:
+            recent = min(profiles, self.profiles.capacity)
+            valid_ratio = float(self.profiles.valid_counts[:recent].sum()) / (recent * self.profiles.width)
+        return {
+            'profiles': profiles,
+            'frames': self.frames,
+            'errors': self.errors,
+            'profiles_per_s': profiles / elapsed if elapsed > 0 else 0.0,
+            'valid_ratio': valid_ratio,
+        }
@@ -20,14 +20,11 @@ from PySide6.QtGui import QKeySequence, QShortcut, QColor, QPixmap, QTextCursor
 from PySide6.QtCore import Signal, QObject, QTimer, Qt, QRectF, QPointF
 from annotator import AnnotationWidget
 
-# Import camera capture function
-try:
-    from camera import AutoCaptureFlow
+from camera_loader import CameraModuleLoader
 
-    CAMERA_AVAILABLE = True
-except ImportError as e:
-    CAMERA_AVAILABLE = False
-    print(f"Warning: camera module not found. Camera button will be disabled. Error: {e}")
+# The camera module (and the SciCam SDK behind it) is imported in the
+# background once the window is up, or on the first capture if that is sooner
+camera_loader = CameraModuleLoader()
 
 
 class CameraSignals(QObject):
@@ -35,6 +32,17 @@ class CameraSignals(QObject):
     finished = Signal(bool, str, object)  # success, message, image_path
 
 
+class FrameCaptureSignals(QObject):
+    """Signals for in-memory captures"""
+    finished = Signal(bool, str, object, str)  # success, message, CameraFrame, save_path
+    saved = Signal(bool, str, str)  # success, message, save_path (background write finished)
+
+
+class CameraLoaderSignals(QObject):
+    """Signals for the background camera SDK load"""
+    loaded = Signal(bool, str, float)  # success, message, load_seconds
+
+
 class TrainingSignals(QObject):
     """Signals for training thread communication"""
     progress = Signal(int, str, str)  # progress_percentage, status_message, time_remaining
@@ -97,8 +105,15 @@ class MainWindow(QMainWindow):
         self.camera_signals = CameraSignals()
         self.camera_signals.finished.connect(self.on_camera_finished)
 
-        self.camera_signals_2 = CameraSignals()
+        self.camera_signals_2 = FrameCaptureSignals()
         self.camera_signals_2.finished.connect(self.on_camera_finished_predict)
+        self.camera_signals_2.saved.connect(self.on_capture_saved)
+        self.failed_capture_paths = set()  # captures whose BMP could not be written
+        self.captured_frame = None  # last captured frame, kept in memory for prediction
+        self.captured_frame_path = None
+
+        self.camera_loader_signals = CameraLoaderSignals()
+        self.camera_loader_signals.loaded.connect(self.on_camera_sdk_loaded)
 
         # Training related
         self.training_signals = TrainingSignals()
@@ -146,6 +161,9 @@ class MainWindow(QMainWindow):
 
         self.init_ui()
 
+        # Load the camera SDK once the event loop is idle, after the window shows
+        QTimer.singleShot(0, self.preload_camera_sdk)
+
     def init_ui(self):
         """Initialize the main annotation page with TCP functionality"""
         layout = QVBoxLayout()
@@ -160,16 +178,10 @@ class MainWindow(QMainWindow):
 
         self.capture_btn = QPushButton("Capture Image")
         self.capture_btn.clicked.connect(self.capture_from_camera)
-        if not CAMERA_AVAILABLE:
-            self.capture_btn.setEnabled(False)
-            self.capture_btn.setToolTip("Camera module not available")
 
         # Add duplicate button with different function
         self.capture2_btn = QPushButton("Capture & Predict")
         self.capture2_btn.clicked.connect(self.capture_predict)
-        if not CAMERA_AVAILABLE:
-            self.capture2_btn.setEnabled(False)
-            self.capture2_btn.setToolTip("Camera module not available")
 
         prev_btn = QPushButton("◀ Prev")
         prev_btn.clicked.connect(self.prev_image)
@@ -1541,9 +1553,12 @@ class MainWindow(QMainWindow):
 
             self.is_predicting = True
 
+            # A just-captured image is predicted from memory instead of re-decoding the file
+            frame = self.captured_frame if self.captured_frame_path == self.image_path else None
+
             thread = threading.Thread(
                 target=self.run_prediction_with_filter,
-                args=(self.image_path, self.selected_class_for_prediction),
+                args=(self.image_path, self.selected_class_for_prediction, frame),
                 daemon=True
             )
             thread.start()
@@ -1552,8 +1567,12 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Error", f"Failed to start prediction:\n{str(e)}")
             self.is_predicting = False
 
-    def run_prediction_with_filter(self, image_path, class_filter):
-        """Run prediction with class filter - supports both regular and OBB"""
+    def run_prediction_with_filter(self, image_path, class_filter, frame=None):
+        """Run prediction with class filter - supports both regular and OBB
+
+        With a CameraFrame the model runs on its pixels; image_path then only
+        names the outputs.
+        """
         try:
             from ultralytics import YOLO
             import torch
@@ -1585,9 +1604,18 @@ class MainWindow(QMainWindow):
             # Check if model is OBB
             is_obb = hasattr(self.current_model, 'task') and self.current_model.task == 'obb'
 
+            if frame is not None:
+                # Same BGR layout cv2.imread would give for the saved BMP
+                if frame.channels == 1:
+                    source = cv2.cvtColor(frame.array, cv2.COLOR_GRAY2BGR)
+                else:
+                    source = np.ascontiguousarray(frame.as_bgr())
+            else:
+                source = image_path
+
             # Run prediction
             results = self.current_model.predict(
-                source=image_path,
+                source=source,
                 conf=0.25,
                 iou=0.45,
                 device=device,
@@ -1993,7 +2021,11 @@ class MainWindow(QMainWindow):
 
                 self.camera_signals.finished.emit(success, message, image_path)
 
-            AutoCaptureFlow(callback=callback)
+            camera = camera_loader.get()
+            if camera is None:
+                callback(False, camera_loader.message(), None)
+                return
+            camera.AutoCaptureFlow(callback=callback)
 
         thread = threading.Thread(target=run_capture, daemon=True)
         thread.start()
@@ -2138,28 +2170,44 @@ class MainWindow(QMainWindow):
         self.capture2_btn.setText("Capturing...")
 
         def run_capture():
-            def callback(success, message, image_path):
-                if success and image_path:
-                    base_name = os.path.basename(image_path)
-                    save_path = os.path.join(self.capture_folder_2, base_name)
-
-                    count = 1
-                    name, ext = os.path.splitext(base_name)
-                    while os.path.exists(save_path):
-                        save_path = os.path.join(self.capture_folder_2, f"{name}_{count}{ext}")
-                        count += 1
-
-                    os.rename(image_path, save_path)
-                    image_path = save_path
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            save_path = os.path.join(self.capture_folder_2, f"Image_{timestamp}.bmp")
+            count = 1
+            while os.path.exists(save_path):
+                save_path = os.path.join(self.capture_folder_2, f"Image_{timestamp}_{count}.bmp")
+                count += 1
 
+            def callback(success, message, frame):
                 # Use the SECOND camera signal
-                self.camera_signals_2.finished.emit(success, message, image_path)
+                self.camera_signals_2.finished.emit(success, message, frame, save_path)
+
+            def on_saved(success, message, path):
+                # Runs on the image writer thread
+                self.camera_signals_2.saved.emit(success, message, save_path)
 
-            AutoCaptureFlow(callback=callback)
+            camera = camera_loader.get()
+            if camera is None:
+                callback(False, camera_loader.message(), None)
+                return
+            # The frame goes to the viewer and predictor in memory; the BMP is written in the background
+            camera.CaptureFrameFlow(callback=callback, save_path=save_path, on_saved=on_saved)
 
         thread = threading.Thread(target=run_capture, daemon=True)
         thread.start()
 
+    def preload_camera_sdk(self):
+        """Start loading the camera SDK in the background"""
+        camera_loader.add_listener(self.camera_loader_signals.loaded.emit)
+        camera_loader.start()
+
+    def on_camera_sdk_loaded(self, success, message, load_seconds):
+        """Report the SDK load time, or disable capture if it failed"""
+        self.status_label.setText(message)
+        if not success:
+            for btn in (self.capture_btn, self.capture2_btn):
+                btn.setEnabled(False)
+                btn.setToolTip("Camera module not available")
+
     def on_camera_finished(self, success, message, image_path):
         """Handle camera capture completion"""
         self.capture_btn.setEnabled(True)
@@ -2177,24 +2225,35 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Capture Failed",
                                  f"Camera capture failed!\n{message}")
 
-    def on_camera_finished_predict(self, success, message, image_path):
+    def on_camera_finished_predict(self, success, message, frame, image_path):
         """Handle camera capture completion for button 2"""
         self.capture2_btn.setEnabled(True)
         self.capture2_btn.setText("Capture & Predict")
 
-        if success and image_path and os.path.exists(image_path):
-            if image_path not in self.image_files:
+        if success and frame is not None:
+            # The background write may already have failed; show the frame but don't list the file
+            if image_path not in self.image_files and image_path not in self.failed_capture_paths:
                 self.image_files.append(image_path)
                 self.image_files.sort()
 
-            self.current_index = self.image_files.index(image_path)
-            self.load_current_image()
+            if image_path in self.image_files:
+                self.current_index = self.image_files.index(image_path)
+            self.captured_frame = frame
+            self.captured_frame_path = image_path
+
+            # Show the captured frame directly, the BMP may still be being written
+            self.viewer.boxes.clear()
+            self.viewer.load_frame(frame, image_path)
+            self.image_path = image_path
+            self.setWindowTitle(
+                f"BMP Annotation Tool – {os.path.basename(image_path)} "
+                f"({self.current_index + 1}/{len(self.image_files)})"
+            )
+            self.image_info_label.setText(f"{os.path.basename(image_path)} ({self.current_index + 1}/{len(self.image_files)})")
+            self.viewer.update()
 
-            # Auto-run prediction with selected class
-            # You'll need to store the selected_class somewhere
-            # Or pass it through the signal
             # Auto-run prediction with class filter
-            QTimer.singleShot(500, self.predict_current_image_with_filter)
+            QTimer.singleShot(0, self.predict_current_image_with_filter)
 
         else:
             QMessageBox.critical(
@@ -2203,6 +2262,26 @@ class MainWindow(QMainWindow):
                 f"Camera capture failed!\n{message}"
             )
 
+    def on_capture_saved(self, success, message, image_path):
+        """Drop a capture from the image list when its background write failed"""
+        if success:
+            return
+
+        self.failed_capture_paths.add(image_path)
+        if image_path in self.image_files:
+            index = self.image_files.index(image_path)
+            self.image_files.remove(image_path)
+            if self.current_index > index:
+                self.current_index -= 1
+            self.current_index = min(self.current_index, max(0, len(self.image_files) - 1))
+
+        self.status_label.setText(f"Failed to save {os.path.basename(image_path)}: {message}")
+        QMessageBox.warning(
+            self,
+            "Save Failed",
+            f"The captured image could not be written:\n{image_path}\n{message}"
+        )
+
     def get_label_color(self, label):
         return self.label_colors.get(label, QColor(255, 255, 255))
 
@@ -2376,6 +2455,10 @@ class MainWindow(QMainWindow):
         if self.tcp_connected:
             self.disconnect_tcp()
 
+        # Close the shared camera session (never load the SDK just to close it)
+        if camera_loader.is_loaded():
+            camera_loader.module.release_camera_session()
+
         event.accept()
 
     def load_calibration(self):
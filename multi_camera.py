@@ -0,0 +1,316 @@
+import time
+import threading
+import collections
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from SciCam_class import *
+from camera import CameraSession, TRIGGER_SOFTWARE, save_frame_image
+from device_registry import get_device_registry
+
+
+class FrameSet:
+    """Frames captured together, one per camera, keyed by serial number.
+
+    `arrivals` holds the host perf_counter time each frame was received
+    (device timestamps come from unsynchronised camera clocks, so skew is
+    measured on the host). Frames borrow pool buffers: call release().
+    """
+
+    def __init__(self, frames, arrivals):
+        self.frames = frames
+        self.arrivals = arrivals
+        self.timestamp = min(arrivals.values()) if arrivals else None
+
+    @property
+    def skew_ms(self):
+        """Spread between the first and last frame arrival"""
+        if len(self.arrivals) < 2:
+            return 0.0
+        return (max(self.arrivals.values()) - min(self.arrivals.values())) * 1000
+
+    def release(self):
+        for frame in self.frames.values():
+            frame.release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+
+class _RateMeter:
+    """Rolling rate over the last `window` events"""
+
+    def __init__(self, window=120):
+        self._times = collections.deque(maxlen=window)
+
+    def tick(self, when):
+        self._times.append(when)
+
+    def rate(self):
+        if len(self._times) < 2:
+            return 0.0
+        span = self._times[-1] - self._times[0]
+        return (len(self._times) - 1) / span if span > 0 else 0.0
+
+
+class MultiCameraManager:
+    """Opens several cameras and captures from them in parallel.
+
+    Each camera gets its own CameraSession (and SciCamera handle) and its
+    own thread; the SDK calls release the GIL, so grabs and conversions on
+    different cameras overlap. capture() fires all cameras at once and
+    returns a FrameSet. start_streaming() keeps every camera grabbing and
+    latest_set() pairs the frames whose arrival times are closest.
+    """
+
+    def __init__(self, serials=None, count=None, exposure_time=10000, trigger_mode=TRIGGER_SOFTWARE):
+        self.serials = list(serials) if serials else None
+        self.count = count
+        self.exposure_time = exposure_time
+        self.trigger_mode = trigger_mode
+        self.sessions = {}  # serial -> CameraSession
+        self._executor = None
+        self._lock = threading.Lock()
+
+        # Streaming state
+        self._streaming = False
+        self._stream_threads = []
+        self._queues = {}  # serial -> deque of (arrival, frame)
+        self._cond = threading.Condition()
+
+        # Statistics
+        self._camera_rates = {}
+        self._set_rate = _RateMeter()
+        self._skews = collections.deque(maxlen=120)
+        self.sets_captured = 0
+        self.capture_errors = collections.Counter()
+
+    def open(self):
+        """Open every camera concurrently. Returns (success, message)."""
+        with self._lock:
+            if self.sessions:
+                return True, "Cameras already open"
+
+            serials = self.serials
+            if serials is None:
+                registry = get_device_registry()
+                registry.refresh(only_if_stale=True)
+                devices = registry.devices()
+                if self.count is not None:
+                    devices = devices[:self.count]
+                serials = [record.serial for record in devices]
+            if not serials:
+                return False, "ERROR: No devices found!"
+
+            sessions = {serial: CameraSession(exposure_time=self.exposure_time, serial=serial,
+                                              trigger_mode=self.trigger_mode)
+                        for serial in serials}
+            self._executor = ThreadPoolExecutor(max_workers=len(sessions), thread_name_prefix="multi-camera")
+            results = dict(zip(sessions, self._executor.map(lambda s: s.open(), sessions.values())))
+
+            failed = {serial: msg for serial, (ok, msg) in results.items() if not ok}
+            if failed:
+                for serial, session in sessions.items():
+                    session.release()
+                self._executor.shutdown(wait=False)
+                self._executor = None
+                details = "; ".join(f"{serial}: {msg}" for serial, msg in failed.items())
+                return False, f"ERROR: Failed to open {len(failed)} camera(s): {details}"
+
+            self.sessions = sessions
+            self._camera_rates = {serial: _RateMeter() for serial in sessions}
+            return True, f"Opened {len(sessions)} camera(s): {', '.join(sessions)}"
+
+    def close(self):
+        """Stop streaming and release every camera"""
+        self.stop_streaming()
+        with self._lock:
+            for session in self.sessions.values():
+                session.release()
+            self.sessions = {}
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    # ------------------------------------------------------------ one-shot
+
+    def capture(self):
+        """Capture one frame from every camera at once. Returns (success, message, FrameSet or None)."""
+        if not self.sessions:
+            success, message = self.open()
+            if not success:
+                return False, message, None
+
+        sessions = self.sessions
+        # All grab threads leave the barrier together so the triggers go out aligned
+        barrier = threading.Barrier(len(sessions))
+
+        def grab(session):
+            barrier.wait()
+            reVal, frame = session.grab_frame()
+            return reVal, frame, time.perf_counter()
+
+        results = dict(zip(sessions, self._executor.map(grab, sessions.values())))
+
+        frames, arrivals, errors = {}, {}, {}
+        for serial, (reVal, frame, arrival) in results.items():
+            if reVal == SCI_CAMERA_OK:
+                frames[serial] = frame
+                arrivals[serial] = arrival
+                self._camera_rates[serial].tick(arrival)
+            else:
+                errors[serial] = reVal
+                self.capture_errors[serial] += 1
+
+        frame_set = FrameSet(frames, arrivals)
+        if errors:
+            frame_set.release()
+            details = ", ".join(f"{serial}: {reVal}" for serial, reVal in errors.items())
+            return False, f"ERROR: Capture failed ({details})", None
+
+        self._record_set(frame_set)
+        return True, f"Captured {len(frames)} frame(s), skew {frame_set.skew_ms:.2f} ms", frame_set
+
+    # ----------------------------------------------------------- streaming
+
+    def start_streaming(self, depth=4):
+        """Grab continuously on one thread per camera, keeping the last `depth` frames of each"""
+        if self._streaming:
+            return True, "Already streaming"
+        if not self.sessions:
+            success, message = self.open()
+            if not success:
+                return False, message
+
+        self._streaming = True
+        self._queues = {serial: collections.deque() for serial in self.sessions}
+        self._stream_threads = []
+        for serial, session in self.sessions.items():
+            thread = threading.Thread(target=self._stream_loop, args=(serial, session, depth),
+                                      name=f"multi-camera-{serial}", daemon=True)
+            thread.start()
+            self._stream_threads.append(thread)
+        return True, f"Streaming from {len(self.sessions)} camera(s)"
+
+    def stop_streaming(self):
+        if not self._streaming:
+            return
+        self._streaming = False
+        with self._cond:
+            self._cond.notify_all()
+        for thread in self._stream_threads:
+            thread.join()
+        self._stream_threads = []
+        with self._cond:
+            for queue in self._queues.values():
+                while queue:
+                    queue.popleft()[1].release()
+
+    def _stream_loop(self, serial, session, depth):
+        while self._streaming:
+            reVal, frame = session.grab_frame()
+            if reVal != SCI_CAMERA_OK:
+                self.capture_errors[serial] += 1
+                continue
+            arrival = time.perf_counter()
+            self._camera_rates[serial].tick(arrival)
+            with self._cond:
+                queue = self._queues[serial]
+                queue.append((arrival, frame))
+                while len(queue) > depth:
+                    queue.popleft()[1].release()
+                self._cond.notify_all()
+
+    def latest_set(self, tolerance_ms=None, timeout=1.0):
+        """Newest aligned FrameSet while streaming, or None.
+
+        The camera whose newest frame is oldest sets the reference time;
+        every other camera contributes its frame closest to it. With
+        tolerance_ms, sets whose skew exceeds it are rejected. Frames used
+        in a set leave the stream queues.
+        """
+        deadline = time.perf_counter() + timeout
+        with self._cond:
+            while True:
+                if all(self._queues.get(serial) for serial in self.sessions):
+                    break
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0 or not self._streaming:
+                    return None
+                self._cond.wait(remaining)
+
+            reference = min(queue[-1][0] for queue in self._queues.values())
+            frames, arrivals = {}, {}
+            for serial, queue in self._queues.items():
+                best = min(range(len(queue)), key=lambda i: abs(queue[i][0] - reference))
+                # Older frames can never be part of a later set
+                for _ in range(best):
+                    queue.popleft()[1].release()
+                arrival, frame = queue.popleft()
+                frames[serial] = frame
+                arrivals[serial] = arrival
+
+        frame_set = FrameSet(frames, arrivals)
+        if tolerance_ms is not None and frame_set.skew_ms > tolerance_ms:
+            frame_set.release()
+            return None
+        self._record_set(frame_set)
+        return frame_set
+
+    # ---------------------------------------------------------- statistics
+
+    def _record_set(self, frame_set):
+        with self._lock:
+            self.sets_captured += 1
+            self._set_rate.tick(time.perf_counter())
+            self._skews.append(frame_set.skew_ms)
+
+    def stats(self):
+        """Per-camera fps, aggregate frame-set fps and inter-camera skew"""
+        with self._lock:
+            skews = list(self._skews)
+        return {
+            'cameras': {serial: {'fps': meter.rate(), 'errors': self.capture_errors[serial]}
+                        for serial, meter in self._camera_rates.items()},
+            'set_fps': self._set_rate.rate(),
+            'aggregate_fps': sum(meter.rate() for meter in self._camera_rates.values()),
+            'sets_captured': self.sets_captured,
+            'skew_mean_ms': sum(skews) / len(skews) if skews else 0.0,
+            'skew_max_ms': max(skews) if skews else 0.0,
+        }
+
+
+def MultiCaptureFlow(manager, callback=None):
+    """Capture one BMP per camera through a MultiCameraManager.
+
+    Calls callback(success, message, paths) where paths maps serial to file.
+    """
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    success, msg, frame_set = manager.capture()
+    if not success:
+        print(msg + "\n")
+        if callback:
+            callback(False, msg, None)
+        return False
+
+    paths = {}
+    with frame_set:
+        for serial, frame in frame_set.frames.items():
+            path = f"Image_{timestamp}_{serial}.bmp"
+            ok, save_msg = save_frame_image(frame, path)
+            if not ok:
+                print(save_msg + "\n")
+                if callback:
+                    callback(False, save_msg, None)
+                return False
+            paths[serial] = path
+
+    print(msg + "\n")
+    if callback:
+        callback(True, msg, paths)
+    return True
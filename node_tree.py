@@ -0,0 +1,62 @@
+from SciCam_class import *
+
+# Nodes whose value or range follows another node. GenICam XML declares
+# these as invalidators, but GetNodes does not report them.
+NODE_DEPENDENTS = {
+    "Width": ("OffsetX", "PayloadSize"),
+    "Height": ("OffsetY", "PayloadSize"),
+    "OffsetX": ("Width",),
+    "OffsetY": ("Height",),
+    "PixelFormat": ("PayloadSize",),
+    "BinningHorizontal": ("Width", "WidthMax", "OffsetX", "PayloadSize"),
+    "BinningVertical": ("Height", "HeightMax", "OffsetY", "PayloadSize"),
+    "DecimationHorizontal": ("Width", "WidthMax", "OffsetX", "PayloadSize"),
+    "DecimationVertical": ("Height", "HeightMax", "OffsetY", "PayloadSize"),
+    "ExposureTime": ("AcquisitionFrameRate", "ResultingFrameRate"),
+    "AcquisitionFrameRateEnable": ("AcquisitionFrameRate", "ResultingFrameRate"),
+    "AcquisitionFrameRate": ("ResultingFrameRate",),
+    "TriggerSelector": ("TriggerMode", "TriggerSource", "TriggerActivation"),
+    "GainSelector": ("Gain",),
+}
+
+
+def node_parents(nodes, count):
+    """Parent index of each of the first count nodes, -1 for top-level nodes.
+
+    GetNodes lists the tree depth first with a level per node, so the
+    parent is the nearest earlier node with a lower level. A stack of the
+    open ancestors finds it in one pass instead of a backward scan per node.
+    """
+    parents = [-1] * count
+    stack = []  # (index, level) of the open ancestors, levels increasing
+    for i in range(count):
+        level = nodes[i].level
+        while stack and stack[-1][1] >= level:
+            stack.pop()
+        if stack:
+            parents[i] = stack[-1][0]
+        stack.append((i, level))
+    return parents
+
+
+def node_children(parents):
+    """Parent index -> child indices in node order; -1 holds the top-level nodes"""
+    children = {}
+    for i, parent in enumerate(parents):
+        children.setdefault(parent, []).append(i)
+    return children
+
+
+def affected_nodes(index, parents, children, index_by_name, name):
+    """Indices to re-read after writing node index (named name).
+
+    The node itself, its siblings in the same category (features of one
+    category usually constrain each other) and its known dependents.
+    """
+    affected = [index]
+    affected += [i for i in children.get(parents[index], []) if i != index]
+    for dependent in NODE_DEPENDENTS.get(name, ()):
+        i = index_by_name.get(dependent)
+        if i is not None and i not in affected:
+            affected.append(i)
+    return affected
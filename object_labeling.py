@@ -19,7 +19,7 @@ from annotator import AnnotationWidget
 
 # Import camera capture function
 try:
-    from camera import AutoCaptureFlow
+    from camera import AutoCaptureFlow, release_camera_session
 
     CAMERA_AVAILABLE = True
 except ImportError as e:
@@ -941,6 +941,14 @@ class MainWindow(QMainWindow):
         except Exception as e:
             print(f"Error in force_reset_viewer: {e}")
 
+    def closeEvent(self, event):
+        """Handle window close event"""
+        # Close the shared camera session
+        if CAMERA_AVAILABLE:
+            release_camera_session()
+
+        event.accept()
+
 import sys
 from PySide6.QtWidgets import QApplication
 
@@ -0,0 +1,307 @@
+import time
+import numpy as np
+from SciCam_class import *
+
+# numpy dtype of each SciCamPayloadDataType
+DATA_DTYPES = {
+    SciCamPayloadDataType.SciCam_Payload_DataType_UCHAR: np.uint8,
+    SciCamPayloadDataType.SciCam_Payload_DataType_CHAR: np.int8,
+    SciCamPayloadDataType.SciCam_Payload_DataType_USHORT: np.uint16,
+    SciCamPayloadDataType.SciCam_Payload_DataType_SHORT: np.int16,
+    SciCamPayloadDataType.SciCam_Payload_DataType_INT: np.int32,
+    SciCamPayloadDataType.SciCam_Payload_DataType_FLOAT: np.float32,
+    SciCamPayloadDataType.SciCam_Payload_DataType_DOUBLE: np.float64,
+}
+
+TARGETS_3D = (
+    SciCamPayloadSL3DTargetDataType.SciCam_payload_SL_Striped_3D,
+    SciCamPayloadSL3DTargetDataType.SciCam_payload_SL_Speckle_3D,
+)
+
+# 2D image used to color exported points, in order of preference
+COLOR_TARGETS = (
+    SciCamPayloadSL3DTargetDataType.SciCam_payload_SL_Speckle_2D_Color,
+    SciCamPayloadSL3DTargetDataType.SciCam_payload_SL_Striped_2D_Left,
+    SciCamPayloadSL3DTargetDataType.SciCam_payload_SL_Speckle_2D_Left,
+    SciCamPayloadSL3DTargetDataType.SciCam_payload_SL_2D,
+)
+
+
+def target_view(data):
+    """Zero-copy (height, width[, channel]) array over an SCI_CAM_SL3D_DATA buffer, or None"""
+    dtype = DATA_DTYPES.get(data.dataType)
+    if dtype is None or not data.data or not data.width or not data.height:
+        return None
+    itemsize = np.dtype(dtype).itemsize
+    channel = max(1, data.channel)
+    step = data.step or data.width * channel * itemsize
+    raw = (ctypes.c_ubyte * (step * data.height)).from_address(data.data)
+    if channel == 1:
+        shape, strides = (data.height, data.width), (step, itemsize)
+    else:
+        shape, strides = (data.height, data.width, channel), (step, channel * itemsize, itemsize)
+    view = np.ndarray(shape, dtype=dtype, buffer=raw, strides=strides)
+    view.flags.writeable = False
+    return view
+
+
+class SL3DFrame:
+    """Data of one structured-light (SL3D) payload as NumPy arrays.
+
+    SciCam_Payload_SL3D_GetData hands out pointers into the payload, so
+    the arrays are views: nothing is copied while the payload is held.
+    release() returns the payload to the SDK through release_fn and the
+    views become invalid; detach() copies them first, so the frame stays
+    usable and the grab buffer goes back at once. Keep frames short-lived
+    or detach them, the SDK only has as many payloads as grab buffers.
+
+    The 3D target is either an organized XYZ cloud (channel 3) or a range
+    image (channel 1, pixel indices scaled by RangeImageInfo). Points with
+    z == 0 or NaN are invalid. The SDK does not deliver normals; normals()
+    computes them from the organized cloud.
+    """
+
+    def __init__(self, payload, release_fn=None):
+        self._payload = payload
+        self._release_fn = release_fn
+        self.meta = SCI_CAM_SL3D_META()
+        self.infos = {}  # target data type -> SCI_CAM_SL3D_DATA
+        self.arrays = {}  # target data type -> array
+        self._normals = None
+        self._points = None
+        self._detached = False
+
+        reVal = SciCam_Payload_SL3D_GetMeta(payload, self.meta)
+        if reVal != SCI_CAMERA_OK:
+            raise RuntimeError(f"Not an SL3D payload, error code: {reVal}")
+
+        for target in SciCamPayloadSL3DTargetDataType:
+            data = SCI_CAM_SL3D_DATA()
+            if SciCam_Payload_SL3D_GetData(payload, target, data) != SCI_CAMERA_OK:
+                continue
+            view = target_view(data)
+            if view is not None:
+                self.infos[target] = data
+                self.arrays[target] = view
+
+    @classmethod
+    def from_payload(cls, payload, release_fn=None):
+        """Returns (reVal, SL3DFrame or None). On failure the payload is not released."""
+        try:
+            return SCI_CAMERA_OK, cls(payload, release_fn)
+        except RuntimeError:
+            return SCI_ERR_CAMERA_IMAGE_TYPE_NOT_SUPPORT, None
+
+    @property
+    def owns_payload(self):
+        return self._payload is not None
+
+    @property
+    def frame_id(self):
+        return self.meta.frameId
+
+    @property
+    def target_3d(self):
+        for target in TARGETS_3D:
+            if target in self.arrays:
+                return target
+        return None
+
+    def image(self, target):
+        """2D image (or any target) array, None if the payload did not carry it"""
+        return self.arrays.get(target)
+
+    @property
+    def depth(self):
+        """(height, width) z values in the data type of the payload; a view for XYZ clouds"""
+        target = self.target_3d
+        if target is None:
+            return None
+        data = self.arrays[target]
+        return data[..., 2] if data.ndim == 3 else data
+
+    @property
+    def valid_mask(self):
+        depth = self.depth
+        if depth is None:
+            return None
+        if depth.dtype.kind == 'f':
+            return np.isfinite(depth) & (depth != 0)
+        return depth != 0
+
+    @property
+    def points(self):
+        """(height, width, 3) float32 points in mm.
+
+        A view of the payload when the camera delivers float XYZ; integer
+        clouds and range images are scaled with RangeImageInfo (one copy,
+        cached).
+        """
+        target = self.target_3d
+        if target is None:
+            return None
+        data = self.arrays[target]
+        if data.ndim == 3 and data.shape[2] == 3 and data.dtype == np.float32:
+            return data
+        if self._points is None:
+            self._points = self._scaled_points(data, self.infos[target].RangeImageInfo)
+        return self._points
+
+    @staticmethod
+    def _scaled_points(data, info):
+        resolution = np.array([info.resolutionX, info.resolutionY, info.resolutionZ], dtype=np.float32)
+        offset = np.array([info.offsetX, info.offsetY, info.offsetZ], dtype=np.float32)
+        resolution[resolution == 0] = 1.0
+        if data.ndim == 3:
+            points = data[..., :3].astype(np.float32) * resolution + offset
+            points[data[..., 2] == 0] = 0.0
+            return points
+
+        height, width = data.shape
+        points = np.empty((height, width, 3), dtype=np.float32)
+        points[..., 0] = np.arange(width, dtype=np.float32) * resolution[0] + offset[0]
+        points[..., 1] = np.arange(height, dtype=np.float32)[:, None] * resolution[1] + offset[1]
+        points[..., 2] = data * resolution[2] + offset[2]
+        points[data == 0] = 0.0
+        return points
+
+    def normals(self):
+        """(height, width, 3) float32 unit normals facing the camera, zero where undefined"""
+        if self._normals is None:
+            points = self.points
+            if points is None:
+                return None
+            self._normals = organized_normals(points, self.valid_mask)
+        return self._normals
+
+    def detach(self):
+        """Copy the arrays and release the payload; the frame stays usable"""
+        if self._payload is None:
+            return self
+        for target, view in self.arrays.items():
+            copy = view.copy()
+            copy.flags.writeable = False
+            self.arrays[target] = copy
+        self._detached = True
+        self.release()
+        return self
+
+    def release(self):
+        """Give the payload back to the SDK. Views that were not detached become invalid."""
+        if self._payload is None:
+            return
+        if not self._detached:
+            self.arrays = {}
+        payload, self._payload = self._payload, None
+        if self._release_fn is not None:
+            self._release_fn(payload)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+    def save_npy(self, path, valid_only=False):
+        """Save the points as .npy: organized (height, width, 3), or (N, 3) valid points.
+        Returns (success, message)."""
+        points = self.points
+        if points is None:
+            return False, "ERROR: Frame has no 3D data"
+        start = time.perf_counter()
+        if valid_only:
+            points = points[self.valid_mask]
+        try:
+            np.save(path, points)
+        except OSError as e:
+            return False, f"ERROR: Save npy failed: {e}"
+        elapsed = (time.perf_counter() - start) * 1000
+        return True, f"{points.size // 3} point(s) saved to {path} in {elapsed:.1f} ms"
+
+    def save_ply(self, path, with_normals=False, with_color=True):
+        """Save the valid points as a binary little-endian PLY. Returns (success, message)."""
+        points = self.points
+        if points is None:
+            return False, "ERROR: Frame has no 3D data"
+        start = time.perf_counter()
+        mask = self.valid_mask
+        color = self._color_image(points.shape[:2]) if with_color else None
+        normals = self.normals() if with_normals else None
+
+        fields = [('x', '<f4'), ('y', '<f4'), ('z', '<f4')]
+        if normals is not None:
+            fields += [('nx', '<f4'), ('ny', '<f4'), ('nz', '<f4')]
+        if color is not None:
+            fields += [('red', 'u1'), ('green', 'u1'), ('blue', 'u1')]
+
+        # One structured array, filled column-wise, written with a single tofile()
+        vertices = np.empty(int(np.count_nonzero(mask)), dtype=fields)
+        selected = points[mask]
+        vertices['x'], vertices['y'], vertices['z'] = selected[:, 0], selected[:, 1], selected[:, 2]
+        if normals is not None:
+            selected = normals[mask]
+            vertices['nx'], vertices['ny'], vertices['nz'] = selected[:, 0], selected[:, 1], selected[:, 2]
+        if color is not None:
+            selected = color[mask]
+            if selected.ndim == 1:
+                vertices['red'] = vertices['green'] = vertices['blue'] = selected
+            else:
+                vertices['red'], vertices['green'], vertices['blue'] = selected[:, 0], selected[:, 1], selected[:, 2]
+
+        header = ["ply", "format binary_little_endian 1.0", f"element vertex {len(vertices)}"]
+        header += [f"property {'float' if kind == '<f4' else 'uchar'} {name}" for name, kind in fields]
+        header += ["end_header", ""]
+        try:
+            with open(path, "wb") as f:
+                f.write("\n".join(header).encode('ascii'))
+                vertices.tofile(f)
+        except OSError as e:
+            return False, f"ERROR: Save PLY failed: {e}"
+        elapsed = (time.perf_counter() - start) * 1000
+        return True, f"{len(vertices)} point(s) saved to {path} in {elapsed:.1f} ms"
+
+    def _color_image(self, shape):
+        """8-bit image matching the cloud, (h, w) or (h, w, 3), or None"""
+        for target in COLOR_TARGETS:
+            image = self.arrays.get(target)
+            if image is None or image.shape[:2] != shape or image.dtype != np.uint8:
+                continue
+            if image.ndim == 2:
+                return image
+            if image.shape[2] >= 3:
+                return image[..., :3]
+        return None
+
+
+def organized_normals(points, valid=None):
+    """Normals of an organized (height, width, 3) cloud from central differences.
+
+    Points whose four neighbours are not all valid get a zero normal.
+    Normals are oriented towards the sensor origin (negative z).
+    """
+    height, width = points.shape[:2]
+    normals = np.zeros((height, width, 3), dtype=np.float32)
+    if height < 3 or width < 3:
+        return normals
+    if valid is None:
+        valid = np.isfinite(points[..., 2]) & (points[..., 2] != 0)
+
+    # Work on contiguous x/y/z planes; strided (h, w, 3) arithmetic is several times slower
+    x, y, z = np.ascontiguousarray(np.moveaxis(points, 2, 0), dtype=np.float32)
+    dux, duy, duz = (c[1:-1, 2:] - c[1:-1, :-2] for c in (x, y, z))
+    dvx, dvy, dvz = (c[2:, 1:-1] - c[:-2, 1:-1] for c in (x, y, z))
+    nx = duy * dvz - duz * dvy
+    ny = duz * dvx - dux * dvz
+    nz = dux * dvy - duy * dvx
+    length = np.sqrt(nx * nx + ny * ny + nz * nz)
+    usable = (valid[1:-1, 1:-1] & valid[1:-1, 2:] & valid[1:-1, :-2] & valid[2:, 1:-1] & valid[:-2, 1:-1]
+              & (length > 0))
+    # One factor normalizes, flips towards -z and zeroes unusable points
+    with np.errstate(divide='ignore', invalid='ignore'):
+        scale = np.where(usable, np.where(nz > 0, -1.0, 1.0).astype(np.float32) / length, 0.0).astype(np.float32)
+    inner = normals[1:-1, 1:-1]
+    np.multiply(nx, scale, out=inner[..., 0])
+    np.multiply(ny, scale, out=inner[..., 1])
+    np.multiply(nz, scale, out=inner[..., 2])
+    return normals
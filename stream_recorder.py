@@ -0,0 +1,228 @@
+import os
+import time
+import threading
+import collections
+from SciCam_class import *
+
+RECORD_QUALITY_DEFAULT = 80  # SDK compression quality, 1-100
+RECORD_FRAME_RATE_DEFAULT = 25.0  # used when AcquisitionFrameRate cannot be read
+
+
+class StreamRecorder:
+    """Streams grabbed payloads into the SDK AVI recorder on a dedicated thread.
+
+    The acquisition thread hands over each payload with submit() instead of
+    freeing it; the recorder thread calls SciCam_InputOneFrame and frees it
+    afterwards, so encoding never stalls grabbing. SciCam_StartRecord is
+    issued when the first payload arrives, using its width, height and raw
+    pixel type.
+
+    Held payloads are SDK grab buffers: max_backlog must stay below the grab
+    buffer count. When the backlog is full the frame is not taken (the
+    caller frees it) and counted as dropped. With max_fps, frames arriving
+    faster than that rate are skipped, and the AVI plays back at max_fps.
+    """
+
+    def __init__(self, camera, quality=RECORD_QUALITY_DEFAULT, max_fps=None, max_backlog=4):
+        self.camera = camera
+        self.quality = quality
+        self.max_fps = max_fps
+        self.max_backlog = max_backlog
+
+        self._cond = threading.Condition()
+        self._backlog = collections.deque()  # payload addresses
+        self._thread = None
+        self._recording = False
+        self._stopping = False
+        self._started = False  # SciCam_StartRecord issued
+        self._busy = False  # recorder thread inside InputOneFrame
+        self._next_due = None
+        self._record_info = None  # keeps the file path bytes alive
+        self.path = None
+        self.frame_rate = None
+        self.error = None
+        self._reset_stats()
+
+    def _reset_stats(self):
+        self.submitted = 0
+        self.recorded = 0
+        self.dropped = 0
+        self.skipped = 0
+        self.failed = 0
+        self.peak_backlog = 0
+        self.started_at = None
+        self._input_times = collections.deque(maxlen=100)
+
+    @property
+    def is_recording(self):
+        return self._recording
+
+    def start(self, path, frame_rate=None):
+        """Begin a recording to path (.avi). Returns (success, message)."""
+        with self._cond:
+            if self._recording:
+                return False, f"ERROR: Already recording to {self.path}"
+
+            directory = os.path.dirname(os.path.abspath(path))
+            if not os.path.isdir(directory):
+                return False, f"ERROR: Folder does not exist: {directory}"
+
+            if frame_rate is None:
+                value = SCI_NODE_VAL_FLOAT()
+                if self.camera.SciCam_GetFloatValue("AcquisitionFrameRate", value) == SCI_CAMERA_OK and value.dVal > 0:
+                    frame_rate = value.dVal
+                else:
+                    frame_rate = RECORD_FRAME_RATE_DEFAULT
+            if self.max_fps:
+                frame_rate = min(frame_rate, self.max_fps)
+
+            self.path = path
+            self.frame_rate = frame_rate
+            self.error = None
+            self._reset_stats()
+            self._next_due = None
+            self._started = False
+            self._stopping = False
+            self._recording = True
+            self.started_at = time.perf_counter()
+
+            self._thread = threading.Thread(target=self._run, name="stream-recorder", daemon=True)
+            self._thread.start()
+        return True, f"Recording to {path} at {frame_rate:.1f} fps, quality {self.quality}"
+
+    def submit(self, payload):
+        """Offer a grabbed payload. True if the recorder took it (and will free it)."""
+        with self._cond:
+            if not self._recording or self._stopping:
+                return False
+            self.submitted += 1
+
+            now = time.perf_counter()
+            if self.max_fps:
+                period = 1.0 / self.max_fps
+                if self._next_due is not None and now < self._next_due:
+                    self.skipped += 1
+                    return False
+                # Step the schedule so the average rate holds without drifting
+                if self._next_due is None or now - self._next_due > period:
+                    self._next_due = now + period
+                else:
+                    self._next_due += period
+
+            if len(self._backlog) >= self.max_backlog:
+                self.dropped += 1
+                return False
+
+            self._backlog.append(payload.value if isinstance(payload, ctypes.c_void_p) else payload)
+            self.peak_backlog = max(self.peak_backlog, len(self._backlog))
+            self._cond.notify_all()
+            return True
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._backlog or self._stopping)
+                if not self._backlog:
+                    return
+                payload = self._backlog.popleft()
+                self._busy = True
+
+            try:
+                self._record(payload)
+            finally:
+                self.camera.SciCam_FreePayload(payload)
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+    def _record(self, payload):
+        if self.error is not None:
+            self.failed += 1
+            return
+
+        if not self._started:
+            reVal = self._start_sdk_record(payload)
+            if reVal != SCI_CAMERA_OK:
+                self.error = f"ERROR: Start record failed, error code: {reVal}"
+                self.failed += 1
+                return
+            self._started = True
+
+        start = time.perf_counter()
+        reVal = self.camera.SciCam_InputOneFrame(payload)
+        elapsed = time.perf_counter() - start
+        with self._cond:
+            if reVal == SCI_CAMERA_OK:
+                self.recorded += 1
+                self._input_times.append(elapsed)
+            else:
+                self.failed += 1
+
+    def _start_sdk_record(self, payload):
+        payloadAttribute = SCI_CAM_PAYLOAD_ATTRIBUTE()
+        reVal = SciCam_Payload_GetAttribute(payload, payloadAttribute)
+        if reVal != SCI_CAMERA_OK:
+            return reVal
+
+        imgAttr = payloadAttribute.imgAttr
+        info = SCI_RECORD_INFO()
+        info.pixelType = imgAttr.pixelType
+        info.width = imgAttr.width
+        info.height = imgAttr.height
+        info.frameRate = self.frame_rate
+        info.quality = max(1, min(100, int(self.quality)))
+        info.formatType = SciRecordFormatType.SciRecordFormatType_AVI
+        info.strFilePath = self.path.encode('utf-8')
+        self._record_info = info
+        return self.camera.SciCam_StartRecord(info)
+
+    def stop(self, timeout=None):
+        """Record what is in the backlog, then close the file. Returns (success, message)."""
+        with self._cond:
+            if not self._recording:
+                return False, "Not recording"
+            self._stopping = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+        with self._cond:
+            # Payloads left after a timeout still have to go back to the SDK
+            while self._backlog:
+                self.camera.SciCam_FreePayload(self._backlog.popleft())
+                self.failed += 1
+            self._recording = False
+
+        if self._started:
+            reVal = self.camera.SciCam_StopRecord()
+            self._started = False
+            if reVal != SCI_CAMERA_OK:
+                return False, f"ERROR: Stop record failed, error code: {reVal}"
+        if self.error is not None:
+            return False, self.error
+        if not self.recorded:
+            return False, "Recording stopped, no frames recorded"
+        return True, f"Recorded {self.recorded} frame(s) to {self.path}"
+
+    def stats(self):
+        """Backlog, counters and InputOneFrame time"""
+        with self._cond:
+            duration = time.perf_counter() - self.started_at if self._recording and self.started_at else 0.0
+            return {
+                'recording': self._recording,
+                'path': self.path,
+                'backlog': len(self._backlog),
+                'encoding': self._busy,
+                'peak_backlog': self.peak_backlog,
+                'max_backlog': self.max_backlog,
+                'submitted': self.submitted,
+                'recorded': self.recorded,
+                'dropped': self.dropped,
+                'skipped': self.skipped,
+                'failed': self.failed,
+                'duration': duration,
+                'record_fps': self.recorded / duration if duration > 0 else 0.0,
+                'input_ms_mean': sum(self._input_times) / len(self._input_times) * 1000 if self._input_times else 0.0,
+                'error': self.error,
+            }
@@ -0,0 +1,69 @@
+import os
+import sys
+
+os.environ.setdefault("SCICAM_SIMULATE", "1")  # no SDK library needed
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SciCam_class import *
+from camera_frame import CameraFrame
+from frame_buffer import FrameRingBuffer, FrameMailbox
+
+WIDTH, HEIGHT = 4, 2
+
+
+def write_frame(ring, frame_id):
+    reserved = ring.begin_write(WIDTH * HEIGHT)
+    assert reserved is not None
+    index, _ = reserved
+    ring.commit_write(index, {'frame_id': frame_id})
+
+
+def test_mailbox_post_twice_releases_the_skipped_slot():
+    ring = FrameRingBuffer(capacity=4)
+    ring.allocate(WIDTH * HEIGHT)
+    mailbox = FrameMailbox()
+
+    # Same loop shape as CameraWorker.run_callback_consumer: the release
+    # closure must keep the slot of its own frame, not the loop's latest
+    frames = []
+    for frame_id in (1, 2):
+        write_frame(ring, frame_id)
+        index, buffer, meta = ring.acquire_latest(timeout=0)
+        frame = CameraFrame(buffer, WIDTH, HEIGHT, SciCamPixelType.Mono8, meta['frame_id'],
+                            release_fn=lambda index=index: ring.release(index))
+        frames.append(frame)
+        mailbox.post(frame, WIDTH, HEIGHT)  # the first frame is never taken
+    first, second = frames
+
+    # The stale frame gave back its own slot, not the one just leased
+    assert first.released
+    assert ring._leased == [False, True, False, False]
+
+    frame, width, height = mailbox.take()
+    assert frame is second and frame.frame_id == 2
+    assert mailbox.take() is None
+    frame.release()
+    assert not any(ring._leased)
+
+    stats = mailbox.stats()
+    assert (stats['posted'], stats['taken'], stats['skipped'], stats['pending']) == (2, 1, 1, False)
+
+
+def test_producer_keeps_writing_while_the_ui_skips_frames():
+    ring = FrameRingBuffer(capacity=4)
+    ring.allocate(WIDTH * HEIGHT)
+    mailbox = FrameMailbox()
+
+    for frame_id in range(1, 13):
+        write_frame(ring, frame_id)
+        index, buffer, meta = ring.acquire_latest(timeout=0)
+        frame = CameraFrame(buffer, WIDTH, HEIGHT, SciCamPixelType.Mono8, meta['frame_id'],
+                            release_fn=lambda index=index: ring.release(index))
+        mailbox.post(frame, WIDTH, HEIGHT)
+        if frame_id % 3 == 0:
+            mailbox.take()[0].release()
+
+    mailbox.clear()
+    assert not any(ring._leased)
+    assert ring.stats()['written'] == 12
+    assert ring.stats()['drops'] == 0